@@ -25,7 +25,12 @@ AI_CONFIG = {
     'temperature': float(os.getenv('AI_TEMPERATURE', '0.7')),
     'timeout': int(os.getenv('AI_TIMEOUT', '30')),
     'retry_attempts': int(os.getenv('AI_RETRY_ATTEMPTS', '3')),
-    'rate_limit': int(os.getenv('AI_RATE_LIMIT', '10'))  # 분당 요청 수
+    'rate_limit': int(os.getenv('AI_RATE_LIMIT', '10')),  # 분당 요청 수
+    'ensemble_mode': os.getenv('AI_ENSEMBLE_MODE', 'ensemble'),  # ensemble, hedged
+    'accept_confidence': float(os.getenv('AI_ACCEPT_CONFIDENCE', '0.8')),  # 헤지 모드 수용 신뢰도
+    'routing_enabled': os.getenv('AI_ROUTING_ENABLED', 'true').lower() == 'true',  # 작업별 최저 비용 모델 선택
+    'router_state_path': os.getenv('AI_ROUTER_STATE', 'data/model_router_state.json'),
+    'mock_llm_url': os.getenv('AI_MOCK_LLM_URL', '')  # 설정 시 모든 LLM 호출을 로컬 모의 서버로 전송
 }
 
 # 뉴스 소스 설정
@@ -136,7 +141,29 @@ FINANCIAL_CONFIG = {
     'update_interval': int(os.getenv('FINANCIAL_UPDATE_INTERVAL', '300')),  # 5분
     'cache_ttl': int(os.getenv('FINANCIAL_CACHE_TTL', '300')),  # 5분
     'max_retries': int(os.getenv('FINANCIAL_RETRIES', '3')),
-    'timeout': int(os.getenv('FINANCIAL_TIMEOUT', '30'))
+    'timeout': int(os.getenv('FINANCIAL_TIMEOUT', '30')),
+    'bulk_download': os.getenv('FINANCIAL_BULK_DOWNLOAD', 'true').lower() == 'true',
+    'fundamentals_ttl': int(os.getenv('FINANCIAL_FUNDAMENTALS_TTL', '86400')),  # 1일
+    'price_store_path': os.getenv('FINANCIAL_PRICE_STORE', 'data/price_history.db'),
+    'feature_store_path': os.getenv('FINANCIAL_FEATURE_STORE', 'data/features.db'),
+    'feature_history_period': '1y',  # 피처 저장소 지표 계산용 일봉 기간
+    'sentiment_lexicon_path': os.getenv('FINANCIAL_SENTIMENT_LEXICON', ''),  # 사용자 감정 사전 JSON (기본 사전 확장)
+    'sentiment_timeseries_path': os.getenv('FINANCIAL_SENTIMENT_TIMESERIES', 'data/sentiment_timeseries.npz'),
+    'correlation_span': int(os.getenv('FINANCIAL_CORRELATION_SPAN', '7')),  # 온라인 상관관계 EWMA 기간 (일)
+    'correlation_state_path': os.getenv('FINANCIAL_CORRELATION_STATE', 'data/correlation_state.json'),
+    'intraday_monitor': os.getenv('FINANCIAL_INTRADAY_MONITOR', 'true').lower() == 'true',  # 스케줄 실행 중 장중 폴링
+    'intraday_poll_interval': int(os.getenv('FINANCIAL_INTRADAY_POLL_INTERVAL', '60')),  # 1분
+    'intraday_summary_path': os.getenv('FINANCIAL_INTRADAY_SUMMARY', 'data/intraday_summary.json'),
+    # 장중 폴링 거래 시간 (시장: 시간대, 개장, 마감) - 주말/장외에는 폴링과 게시를 건너뜀
+    'intraday_sessions': {
+        'KRX': ('Asia/Seoul', '09:00', '15:30'),
+        'US': ('America/New_York', '09:30', '16:00')
+    },
+    'data_provider': os.getenv('FINANCIAL_DATA_PROVIDER', 'yfinance'),  # yfinance, replay
+    'replay_dir': os.getenv('FINANCIAL_REPLAY_DIR', 'data/replay'),
+    'replay_latency_ms': float(os.getenv('FINANCIAL_REPLAY_LATENCY_MS', '0')),
+    'replay_jitter_ms': float(os.getenv('FINANCIAL_REPLAY_JITTER_MS', '0')),
+    'symbol_aliases': {}  # 종목별 추가 별칭 (예: {'005930.KS': ['삼성']})
 }
 
 # 콘텐츠 생성 설정
@@ -173,7 +200,9 @@ CONTENT_CONFIG = {
         '포트폴리오', '리스크', '수익률', '성장', '가치', '배당'
     ],
     'tone_options': ['professional', 'casual', 'technical', 'educational'],
-    'content_types': ['article', 'summary', 'analysis', 'report']
+    'content_types': ['article', 'summary', 'analysis', 'report'],
+    # 스트리밍 생성 + 목표 길이 도달 시 조기 종료
+    'streaming': os.getenv('CONTENT_STREAMING', 'true').lower() == 'true'
 }
 
 # 업로드 설정
@@ -183,7 +212,8 @@ UPLOAD_CONFIG = {
             'enabled': os.getenv('TISTORY_ENABLED', 'false').lower() == 'true',
             'access_token': os.getenv('TISTORY_ACCESS_TOKEN'),
             'blog_name': os.getenv('TISTORY_BLOG_NAME'),
-            'api_url': 'https://www.tistory.com/apis'
+            # 로컬 모의 서버(core/mock_tistory_server.py)로 바꿔 처리량 테스트 가능
+            'api_url': os.getenv('TISTORY_API_URL', 'https://www.tistory.com/apis')
         },
         'wordpress': {
             'enabled': os.getenv('WORDPRESS_ENABLED', 'false').lower() == 'true',
@@ -200,8 +230,11 @@ UPLOAD_CONFIG = {
         }
     },
     'max_retries': int(os.getenv('UPLOAD_RETRIES', '3')),
-    'retry_delay': int(os.getenv('UPLOAD_RETRY_DELAY', '5')),
+    'retry_delay': float(os.getenv('UPLOAD_RETRY_DELAY', '5')),  # 재시도 백오프 기준 (초)
     'timeout': int(os.getenv('UPLOAD_TIMEOUT', '30')),
+    # 영속 업로드 큐 (멱등 키 / 중단 작업 재개) 및 동시 업로드 수
+    'queue_path': os.getenv('UPLOAD_QUEUE_DB', 'data/upload_queue.db'),
+    'concurrency': int(os.getenv('UPLOAD_CONCURRENCY', '4')),
     'default_platform': os.getenv('UPLOAD_DEFAULT_PLATFORM', 'tistory'),
     'auto_publish': os.getenv('UPLOAD_AUTO_PUBLISH', 'false').lower() == 'true'
 }
@@ -241,6 +274,17 @@ NOTIFICATION_CONFIG = {
         'telegram': int(os.getenv('TELEGRAM_RATE_LIMIT', '30')),  # 분당
         'discord': int(os.getenv('DISCORD_RATE_LIMIT', '50'))  # 시간당
     },
+    # 채널별 동시 전송 수 (모든 HTTP 채널은 하나의 연결 풀 세션 공유)
+    'concurrency': {
+        'email': int(os.getenv('EMAIL_CONCURRENCY', '2')),
+        'slack': int(os.getenv('SLACK_CONCURRENCY', '4')),
+        'telegram': int(os.getenv('TELEGRAM_CONCURRENCY', '10')),
+        'discord': int(os.getenv('DISCORD_CONCURRENCY', '2'))
+    },
+    'email_batch_size': int(os.getenv('EMAIL_BATCH_SIZE', '50')),  # 숨은 참조 묶음당 수신자 수
+    'timeout': int(os.getenv('NOTIFICATION_TIMEOUT', '10')),
+    'max_retries': int(os.getenv('NOTIFICATION_RETRIES', '2')),
+    'retry_delay': float(os.getenv('NOTIFICATION_RETRY_DELAY', '1.0')),
     'templates': {
         'email': """
 <h2>{{title}}</h2>
@@ -299,7 +343,24 @@ PERFORMANCE_CONFIG = {
     'memory_limit': int(os.getenv('MEMORY_LIMIT', '1024')),  # MB
     'cache_size': int(os.getenv('CACHE_SIZE', '100')),  # MB
     'log_retention_days': int(os.getenv('LOG_RETENTION_DAYS', '30')),
-    'backup_retention_days': int(os.getenv('BACKUP_RETENTION_DAYS', '7'))
+    'backup_retention_days': int(os.getenv('BACKUP_RETENTION_DAYS', '7')),
+    # 기사 단위 단계 중첩 파이프라인 (streaming) / 단계별 일괄 처리 (batch)
+    'pipeline_mode': os.getenv('PIPELINE_MODE', 'streaming'),
+    'stage_concurrency': {
+        'fact_check': int(os.getenv('STAGE_CONCURRENCY_FACT_CHECK', '5')),
+        'generate': int(os.getenv('STAGE_CONCURRENCY_GENERATE', '3')),
+        'upload': int(os.getenv('STAGE_CONCURRENCY_UPLOAD', '2'))
+    },
+    'stage_queue_size': int(os.getenv('STAGE_QUEUE_SIZE', '10')),
+    # 단계 출력 체크포인트 (실패 실행 재개 / 동일 입력 단계 건너뛰기)
+    'checkpoint_dir': os.getenv('CHECKPOINT_DIR', 'data/checkpoints'),
+    'checkpoint_retention_days': int(os.getenv('CHECKPOINT_RETENTION_DAYS', '7')),
+    # 이보다 오래된 실패 실행은 자동 재개하지 않음 (수집 단계 출력이 오래된 뉴스/시세가 되므로)
+    'checkpoint_resume_max_age_hours': float(os.getenv('CHECKPOINT_RESUME_MAX_AGE_HOURS', '6')),
+    # 주기 실행 델타 처리 (새 기사/변경된 기사만 비용이 큰 단계로 전달)
+    'delta_processing': os.getenv('DELTA_PROCESSING', 'true').lower() == 'true',
+    'processing_state_path': os.getenv('PROCESSING_STATE_DB', 'data/processing_state.db'),
+    'processing_state_retention_days': int(os.getenv('PROCESSING_STATE_RETENTION_DAYS', '30'))
 }
 
 # 모니터링 설정
@@ -14,6 +14,7 @@ from pathlib import Path
 
 from auto_finance.core.ai_ensemble import ai_ensemble
 from auto_finance.core.market_sentiment_analyzer import sentiment_analyzer
+from auto_finance.core.prompt_builder import prompt_builder
 from auto_finance.utils.logger import setup_logger
 from auto_finance.config.settings import CONTENT_CONFIG
 
@@ -225,6 +226,9 @@ class AdvancedContentGenerator:
             generated_at=datetime.now(),
             metadata={
                 'source': source,
+                # 원본 기사 식별 (델타 처리에서 생성된 기사만 처리 완료로 기록)
+                'url': article.get('url') or article.get('link') or '',
+                'source_title': title,
                 'ai_confidence': ai_response.confidence_score,
                 'processing_time': ai_response.processing_time,
                 'model_contributions': ai_response.model_contributions
@@ -234,7 +238,7 @@ class AdvancedContentGenerator:
     def _create_ai_prompt(self, article: Dict[str, Any], market_sentiment: Any, request: ContentRequest) -> str:
         """AI 프롬프트 생성"""
         title = article.get('title', '')
-        content = article.get('content', '')
+        content = prompt_builder.article_body(article, 'content_generation')
         
         prompt = f"""
         다음 뉴스 기사를 바탕으로 전문적인 투자 분석 글을 작성해주세요:
@@ -260,7 +264,7 @@ class AdvancedContentGenerator:
         전문적이면서도 이해하기 쉬운 톤으로 작성하고, 구체적인 데이터와 근거를 제시해주세요.
         """
         
-        return prompt
+        return prompt_builder.finalize(prompt)
     
     def _get_length_guide(self, length: str) -> str:
         """길이 가이드"""
@@ -1,4 +1,4 @@
-333333333
+"""
 🤖 AI 앙상블 시스템
 다중 AI 모델을 활용한 고도화된 콘텐츠 생성 및 팩트 체크
 """
@@ -6,15 +6,18 @@
 import asyncio
 import json
 import time
+from collections import deque
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import google.generativeai as genai
 import openai
-from anthropic import Anthropic
+from anthropic import AsyncAnthropic
 
 from auto_finance.utils.logger import setup_logger
 from auto_finance.config.settings import AI_CONFIG
+from auto_finance.core.model_router import ModelRouter
+from auto_finance.core.prompt_builder import prompt_builder, token_ledger
 
 logger = setup_logger(__name__)
 
@@ -43,6 +46,8 @@ class AIEnsembleSystem:
     """다중 AI 모델 앙상블 시스템"""
     
     def __init__(self):
+        # 모의 서버용 Gemini REST 전송은 비동기 호출을 지원하지 않아 스레드에서 호출
+        self._gemini_async = not AI_CONFIG.get('mock_llm_url')
         self.models = {
             'gemini': self._init_gemini(),
             'gpt4': self._init_openai(),
@@ -63,18 +68,46 @@ class AIEnsembleSystem:
             'claude': ['detailed_analysis', 'reasoning']
         }
         
+        # 생성 모드 설정 ('ensemble': 전 모델 대기, 'hedged': 첫 수용 응답 반환)
+        self.ensemble_config = {
+            'mode': AI_CONFIG.get('ensemble_mode', 'ensemble'),
+            'accept_confidence': AI_CONFIG.get('accept_confidence', 0.8),  # 수용 신뢰도 임계값
+            'hedge_quantile': 0.95,      # 다음 모델 투입 기준 지연 분위수
+            'default_hedge_delay': 5.0,  # 지연 표본이 부족할 때 기준 (초)
+            'min_latency_samples': 5,
+            'latency_window': 100
+        }
+        self._latencies: Dict[str, deque] = {}
+        
+        # 작업별 비용/지연 인식 라우터 (model_specialties는 관측 전 품질 사전값)
+        self.router = ModelRouter(
+            specialties=self.model_specialties,
+            state_path=AI_CONFIG.get('router_state_path', 'data/model_router_state.json'),
+            accept_confidence=self.ensemble_config['accept_confidence']
+        )
+        self.routing_enabled = AI_CONFIG.get('routing_enabled', True)
+        
         self.stats = {
             'total_requests': 0,
             'successful_requests': 0,
             'failed_requests': 0,
             'total_processing_time': 0.0,
             'total_cost': 0.0,
-            'model_performance': {}
+            'hedged_requests': 0,
+            'hedges_launched': 0,
+            'cancelled_calls': 0,
+            'cancelled_cost': 0.0
         }
     
     def _init_gemini(self):
         """Gemini 모델 초기화"""
         try:
+            mock_url = AI_CONFIG.get('mock_llm_url')
+            if mock_url:
+                # 로컬 모의 서버 (REST 전송만 임의 엔드포인트 지원)
+                genai.configure(api_key=AI_CONFIG.get('api_key') or 'mock', transport='rest',
+                                client_options={'api_endpoint': mock_url})
+                return genai.GenerativeModel(AI_CONFIG.get('model_name', 'gemini-2.0-flash-exp'))
             if AI_CONFIG.get('api_key'):
                 genai.configure(api_key=AI_CONFIG['api_key'])
                 return genai.GenerativeModel(AI_CONFIG.get('model_name', 'gemini-2.0-flash-exp'))
@@ -87,8 +120,11 @@ class AIEnsembleSystem:
         """OpenAI 모델 초기화"""
         try:
             api_key = AI_CONFIG.get('openai_api_key')
+            mock_url = AI_CONFIG.get('mock_llm_url')
+            if mock_url:
+                return openai.AsyncOpenAI(api_key=api_key or 'mock', base_url=f"{mock_url}/v1")
             if api_key:
-                return openai.OpenAI(api_key=api_key)
+                return openai.AsyncOpenAI(api_key=api_key)
             return None
         except Exception as e:
             logger.warning(f"OpenAI 초기화 실패: {e}")
@@ -98,15 +134,22 @@ class AIEnsembleSystem:
         """Anthropic 모델 초기화"""
         try:
             api_key = AI_CONFIG.get('anthropic_api_key')
+            mock_url = AI_CONFIG.get('mock_llm_url')
+            if mock_url:
+                return AsyncAnthropic(api_key=api_key or 'mock', base_url=mock_url)
             if api_key:
-                return Anthropic(api_key=api_key)
+                return AsyncAnthropic(api_key=api_key)
             return None
         except Exception as e:
             logger.warning(f"Anthropic 초기화 실패: {e}")
             return None
     
-    async def generate_content_ensemble(self, prompt: str, task_type: str = 'content_generation') -> EnsembleResult:
-        """앙상블 기반 콘텐츠 생성"""
+    async def generate_content_ensemble(self, prompt: str, task_type: str = 'content_generation',
+                                        mode: Optional[str] = None) -> EnsembleResult:
+        """앙상블 기반 콘텐츠 생성 (mode='hedged'면 첫 수용 응답 반환)"""
+        if (mode or self.ensemble_config['mode']) == 'hedged':
+            return await self.generate_content_hedged(prompt, task_type)
+        
         start_time = time.time()
         self.stats['total_requests'] += 1
         
@@ -117,16 +160,17 @@ class AIEnsembleSystem:
             responses = []
             tasks = []
             
-            for model_name, model in self.models.items():
-                if model is not None:
-                    task = self._generate_with_model(model_name, model, prompt, task_type)
-                    tasks.append(task)
+            for model_name in self._select_models(task_type):
+                task = self._generate_with_model(model_name, self.models[model_name], prompt, task_type)
+                tasks.append(task)
             
             # 병렬 실행
             if tasks:
                 responses = await asyncio.gather(*tasks, return_exceptions=True)
                 responses = [r for r in responses if isinstance(r, AIResponse)]
             
+            self.router.save()
+            
             if not responses:
                 raise Exception("모든 AI 모델이 실패했습니다")
             
@@ -147,50 +191,215 @@ class AIEnsembleSystem:
             logger.error(f"❌ 앙상블 생성 실패: {e}")
             raise
     
+    async def generate_content_hedged(self, prompt: str, task_type: str = 'content_generation') -> EnsembleResult:
+        """지연 최적화 생성 - 가중치 순으로 모델을 투입하고 임계값을 넘는 첫 응답 반환
+        
+        앞선 모델이 p95 지연 안에 응답하지 않거나 실패/미달이면 다음 모델을 투입하고,
+        수용 응답이 나오면 나머지 호출은 취소한다. 투입 기준 시각은 마지막 투입 시점에서 고정되므로
+        다른 모델 응답을 처리하느라 대기가 다시 시작되지 않는다.
+        total_cost에는 취소된 호출의 추정 입력 비용도 포함된다 (이미 전송된 요청은 과금됨).
+        """
+        start_time = time.time()
+        self.stats['total_requests'] += 1
+        self.stats['hedged_requests'] += 1
+        
+        available = self._available_models()
+        if self.routing_enabled:
+            order = self.router.rank(task_type, available)
+        else:
+            order = sorted(available, key=lambda name: self.model_weights.get(name, 0.1), reverse=True)
+        candidates = [(name, self.models[name]) for name in order]
+        threshold = self.ensemble_config['accept_confidence']
+        
+        logger.info(f"⚡ 헤지 콘텐츠 생성 시작: {task_type} (후보 {len(candidates)}개)")
+        
+        loop = asyncio.get_running_loop()
+        pending: Dict[asyncio.Task, str] = {}
+        responses: List[AIResponse] = []
+        accepted: Optional[AIResponse] = None
+        hedge_at = 0.0
+        
+        def launch():
+            nonlocal hedge_at
+            name, model = candidates.pop(0)
+            task = asyncio.create_task(self._generate_with_model(name, model, prompt, task_type))
+            pending[task] = name
+            # 다음 모델 투입 시각 = 마지막 투입 시각 + 해당 모델 p95 지연
+            hedge_at = loop.time() + self._hedge_delay(name)
+        
+        try:
+            if not candidates:
+                raise Exception("사용 가능한 AI 모델이 없습니다")
+            
+            launch()
+            while pending and accepted is None:
+                timeout = max(0.0, hedge_at - loop.time()) if candidates else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                
+                if not done:
+                    # 기준 지연 초과 → 다음 모델 동시 투입
+                    launch()
+                    self.stats['hedges_launched'] += 1
+                    continue
+                
+                for task in done:
+                    pending.pop(task)
+                    if task.exception() is not None:
+                        continue
+                    response = task.result()
+                    responses.append(response)
+                    if response.confidence >= threshold and (
+                            accepted is None or response.confidence > accepted.confidence):
+                        accepted = response
+                
+                # 실패/미달만 돌아왔고 대기 중인 호출도 없으면 즉시 다음 모델 투입
+                if accepted is None and not pending and candidates:
+                    launch()
+            
+            if not responses:
+                raise Exception("모든 AI 모델이 실패했습니다")
+            
+            cancelled_cost = await self._cancel_pending(pending, prompt)
+            best = accepted or max(responses, key=lambda r: r.confidence)
+            processing_time = time.time() - start_time
+            result = EnsembleResult(
+                final_content=best.content,
+                confidence_score=best.confidence,
+                model_contributions={best.model_name: 1.0},
+                processing_time=processing_time,
+                total_cost=sum(r.cost for r in responses) + cancelled_cost,
+                individual_responses=responses
+            )
+            
+            self.stats['successful_requests'] += 1
+            self.stats['total_processing_time'] += processing_time
+            self.stats['total_cost'] += result.total_cost
+            
+            logger.info(f"✅ 헤지 생성 완료: {best.model_name}, {processing_time:.2f}초, "
+                        f"응답 {len(responses)}개, 비용: ${result.total_cost:.4f}")
+            return result
+            
+        except Exception as e:
+            self.stats['failed_requests'] += 1
+            logger.error(f"❌ 헤지 생성 실패: {e}")
+            raise
+        
+        finally:
+            # 오류/취소로 빠져나온 경우에도 남은 호출 정리
+            await self._cancel_pending(pending, prompt)
+            self.router.save()
+    
+    async def _cancel_pending(self, pending: Dict[asyncio.Task, str], prompt: str) -> float:
+        """남은 호출 취소 (비동기 SDK 호출은 HTTP 요청까지 중단됨) 후 취소된 호출의 추정 비용 반환
+        
+        이미 전송된 요청은 입력 토큰이 과금되므로 입력 토큰 추정치로 기록한다 (출력 토큰은 알 수 없어 제외).
+        """
+        if not pending:
+            return 0.0
+        
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        
+        cost = 0.0
+        for task, name in pending.items():
+            if task.cancelled():
+                cost += token_ledger.record('ai_ensemble', name, prompt, '')['cost']
+                self.stats['cancelled_calls'] += 1
+            elif task.exception() is None:
+                # 취소 직전에 끝난 호출 (사용량은 이미 기록됨)
+                cost += task.result().cost
+        
+        self.stats['cancelled_cost'] += cost
+        pending.clear()
+        return cost
+    
+    def _available_models(self) -> List[str]:
+        return [name for name, model in self.models.items() if model is not None]
+    
+    def _select_models(self, task_type: str) -> List[str]:
+        """앙상블 호출 모델 선택 (라우팅 시 품질 목표를 만족하는 최저 비용 조합)"""
+        available = self._available_models()
+        if not self.routing_enabled:
+            return available
+        
+        selected = self.router.route(task_type, available)
+        if len(selected) < len(available):
+            logger.info(f"🧭 모델 라우팅: {task_type} → {', '.join(selected)}")
+        return selected
+    
+    def _record_latency(self, model_name: str, latency: float):
+        """모델 응답 지연 표본 기록"""
+        samples = self._latencies.setdefault(model_name, deque(maxlen=self.ensemble_config['latency_window']))
+        samples.append(latency)
+    
+    def _hedge_delay(self, model_name: str) -> float:
+        """다음 모델 투입 전 대기 시간 (모델 지연 p95, 표본 부족 시 기본값)"""
+        samples = self._latencies.get(model_name)
+        if not samples or len(samples) < self.ensemble_config['min_latency_samples']:
+            return self.ensemble_config['default_hedge_delay']
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.ensemble_config['hedge_quantile']))
+        return ordered[index]
+    
     async def _generate_with_model(self, model_name: str, model, prompt: str, task_type: str) -> AIResponse:
         """개별 모델로 콘텐츠 생성"""
         start_time = time.time()
         
         try:
             if model_name == 'gemini':
-                return await self._generate_with_gemini(model, prompt, task_type)
+                response = await self._generate_with_gemini(model, prompt, task_type)
             elif model_name == 'gpt4':
-                return await self._generate_with_openai(model, prompt, task_type)
+                response = await self._generate_with_openai(model, prompt, task_type)
             elif model_name == 'claude':
-                return await self._generate_with_anthropic(model, prompt, task_type)
+                response = await self._generate_with_anthropic(model, prompt, task_type)
             else:
                 raise ValueError(f"지원하지 않는 모델: {model_name}")
+            
+            latency = time.time() - start_time
+            self._record_latency(model_name, latency)
+            self.router.record(model_name, task_type, latency, response.cost, response.confidence)
+            return response
                 
+        except asyncio.CancelledError:
+            raise
+        
         except Exception as e:
+            self.router.record(model_name, task_type, time.time() - start_time, failed=True)
             logger.error(f"❌ {model_name} 모델 생성 실패: {e}")
             raise
     
     async def _generate_with_gemini(self, model, prompt: str, task_type: str) -> AIResponse:
         """Gemini 모델로 생성"""
+        start_time = time.time()
+        
         try:
             # 태스크별 프롬프트 최적화
-            optimized_prompt = self._optimize_prompt_for_gemini(prompt, task_type)
-            
-            response = await asyncio.to_thread(
-                model.generate_content,
-                optimized_prompt,
-                generation_config={
-                    'temperature': AI_CONFIG.get('temperature', 0.7),
-                    'max_output_tokens': AI_CONFIG.get('max_tokens', 1000)
-                }
-            )
+            optimized_prompt = prompt_builder.finalize(self._optimize_prompt_for_gemini(prompt, task_type))
+            
+            generation_config = {
+                'temperature': AI_CONFIG.get('temperature', 0.7),
+                'max_output_tokens': AI_CONFIG.get('max_tokens', 1000)
+            }
+            if self._gemini_async:
+                response = await model.generate_content_async(optimized_prompt, generation_config=generation_config)
+            else:
+                response = await asyncio.to_thread(
+                    model.generate_content, optimized_prompt, generation_config=generation_config
+                )
             
-            processing_time = time.time()
+            processing_time = time.time() - start_time
             content = response.text
+            usage = token_ledger.record('ai_ensemble', 'gemini', optimized_prompt, content, response)
             
             return AIResponse(
                 model_name='gemini',
                 content=content,
                 confidence=self._calculate_confidence(content, task_type),
                 processing_time=processing_time,
-                tokens_used=len(content.split()),
-                cost=0.0,  # Gemini는 현재 무료
-                metadata={'task_type': task_type}
+                tokens_used=usage['tokens_in'] + usage['tokens_out'],
+                cost=usage['cost'],
+                metadata={'task_type': task_type, **usage}
             )
             
         except Exception as e:
@@ -199,29 +408,31 @@ class AIEnsembleSystem:
     
     async def _generate_with_openai(self, model, prompt: str, task_type: str) -> AIResponse:
         """OpenAI 모델로 생성"""
+        start_time = time.time()
+        
         try:
             # 태스크별 프롬프트 최적화
-            optimized_prompt = self._optimize_prompt_for_openai(prompt, task_type)
+            optimized_prompt = prompt_builder.finalize(self._optimize_prompt_for_openai(prompt, task_type))
             
-            response = await asyncio.to_thread(
-                model.chat.completions.create,
+            response = await model.chat.completions.create(
                 model="gpt-4",
                 messages=[{"role": "user", "content": optimized_prompt}],
                 max_tokens=AI_CONFIG.get('max_tokens', 1000),
                 temperature=AI_CONFIG.get('temperature', 0.7)
             )
             
-            processing_time = time.time()
+            processing_time = time.time() - start_time
             content = response.choices[0].message.content
+            usage = token_ledger.record('ai_ensemble', 'gpt4', optimized_prompt, content, response)
             
             return AIResponse(
                 model_name='gpt4',
                 content=content,
                 confidence=self._calculate_confidence(content, task_type),
                 processing_time=processing_time,
-                tokens_used=response.usage.total_tokens,
-                cost=self._calculate_openai_cost(response.usage),
-                metadata={'task_type': task_type}
+                tokens_used=usage['tokens_in'] + usage['tokens_out'],
+                cost=usage['cost'],
+                metadata={'task_type': task_type, **usage}
             )
             
         except Exception as e:
@@ -230,29 +441,31 @@ class AIEnsembleSystem:
     
     async def _generate_with_anthropic(self, model, prompt: str, task_type: str) -> AIResponse:
         """Anthropic 모델로 생성"""
+        start_time = time.time()
+        
         try:
             # 태스크별 프롬프트 최적화
-            optimized_prompt = self._optimize_prompt_for_anthropic(prompt, task_type)
+            optimized_prompt = prompt_builder.finalize(self._optimize_prompt_for_anthropic(prompt, task_type))
             
-            response = await asyncio.to_thread(
-                model.messages.create,
+            response = await model.messages.create(
                 model="claude-3-sonnet-20240229",
                 max_tokens=AI_CONFIG.get('max_tokens', 1000),
                 temperature=AI_CONFIG.get('temperature', 0.7),
                 messages=[{"role": "user", "content": optimized_prompt}]
             )
             
-            processing_time = time.time()
+            processing_time = time.time() - start_time
             content = response.content[0].text
+            usage = token_ledger.record('ai_ensemble', 'claude', optimized_prompt, content, response)
             
             return AIResponse(
                 model_name='claude',
                 content=content,
                 confidence=self._calculate_confidence(content, task_type),
                 processing_time=processing_time,
-                tokens_used=response.usage.input_tokens + response.usage.output_tokens,
-                cost=self._calculate_anthropic_cost(response.usage),
-                metadata={'task_type': task_type}
+                tokens_used=usage['tokens_in'] + usage['tokens_out'],
+                cost=usage['cost'],
+                metadata={'task_type': task_type, **usage}
             )
             
         except Exception as e:
@@ -371,28 +584,6 @@ class AIEnsembleSystem:
         
         return min(base_confidence, 1.0)
     
-    def _calculate_openai_cost(self, usage) -> float:
-        """OpenAI 비용 계산"""
-        # GPT-4 가격 (2024년 기준)
-        input_cost_per_1k = 0.03
-        output_cost_per_1k = 0.06
-        
-        input_cost = (usage.prompt_tokens / 1000) * input_cost_per_1k
-        output_cost = (usage.completion_tokens / 1000) * output_cost_per_1k
-        
-        return input_cost + output_cost
-    
-    def _calculate_anthropic_cost(self, usage) -> float:
-        """Anthropic 비용 계산"""
-        # Claude-3-Sonnet 가격 (2024년 기준)
-        input_cost_per_1k = 0.003
-        output_cost_per_1k = 0.015
-        
-        input_cost = (usage.input_tokens / 1000) * input_cost_per_1k
-        output_cost = (usage.output_tokens / 1000) * output_cost_per_1k
-        
-        return input_cost + output_cost
-    
     def _create_ensemble_result(self, responses: List[AIResponse], task_type: str) -> EnsembleResult:
         """앙상블 결과 생성"""
         if not responses:
@@ -441,7 +632,17 @@ class AIEnsembleSystem:
             'total_processing_time': self.stats['total_processing_time'],
             'total_cost': self.stats['total_cost'],
             'average_processing_time': (self.stats['total_processing_time'] / self.stats['successful_requests']) if self.stats['successful_requests'] > 0 else 0,
-            'model_performance': self.stats['model_performance']
+            'model_performance': self.router.snapshot(),
+            'routing_decisions': self.router.decisions,
+            'token_usage': token_ledger.summary('ai_ensemble'),
+            'prompt_compression': prompt_builder.get_statistics(),
+            'hedging': {
+                'mode': self.ensemble_config['mode'],
+                'hedged_requests': self.stats['hedged_requests'],
+                'hedges_launched': self.stats['hedges_launched'],
+                'cancelled_calls': self.stats['cancelled_calls'],
+                'hedge_delays': {name: self._hedge_delay(name) for name in self.models}
+            }
         }
     
     def save_statistics(self, file_path: str = "data/ai_ensemble_stats.json"):
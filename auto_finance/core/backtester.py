@@ -0,0 +1,339 @@
+"""
+🧪 예측 로직 백테스터
+저장된 뉴스 감정과 일봉 이력을 배열 연산으로 재생해 예측 성능(적중률, 신뢰도 구간별 정밀도) 측정
+"""
+
+import argparse
+import json
+import os
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+from auto_finance.core.database import Database
+from auto_finance.core.market_analyzer import MARKET_TREND_WEIGHTS, MarketAnalyzer
+from auto_finance.core.price_correlation import PREDICTION_CONFIDENCE, PREDICTION_MODEL, PriceCorrelationAnalyzer
+from auto_finance.core.price_store import price_store
+
+logger = setup_logger(__name__)
+
+CONFIDENCE_BUCKETS = [0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+MOVEMENT_LABELS = {1: '상승', 0: '횡보', -1: '하락'}
+TREND_LABELS = {2: '강한 상승', 1: '상승', 0: '횡보', -1: '하락', -2: '강한 하락'}
+
+def predict_price_arrays(sentiment: np.ndarray, sentiment_std: np.ndarray,
+                         news_count: np.ndarray, change_percent: np.ndarray
+                         ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """predict_price_movement의 일별 벡터 버전
+    
+    Returns:
+        movement: 1(상승) / 0(횡보) / -1(하락)
+        predicted_change: 예측 변동률 (소수)
+        confidence: _calculate_prediction_confidence 신뢰도
+    """
+    model, params = PREDICTION_MODEL, PREDICTION_CONFIDENCE
+    predicted = (sentiment * model['sentiment_coef']
+                 + change_percent / 100 * model['change_coef']
+                 + model['intercept'])
+    movement = np.where(predicted > model['threshold'], 1,
+                        np.where(predicted < -model['threshold'], -1, 0))
+    
+    news_confidence = np.minimum(params['news_cap'], news_count / params['news_scale'])
+    sentiment_confidence = np.maximum(params['component_floor'], 1 - sentiment_std)
+    price_confidence = np.maximum(params['component_floor'],
+                                  1 - np.abs(change_percent) / params['volatility_scale'])
+    confidence = np.clip((news_confidence + sentiment_confidence + price_confidence) / 3,
+                         params['min'], params['max'])
+    
+    return movement, predicted, confidence
+
+def predict_market_arrays(sentiment: np.ndarray, trend_strength: np.ndarray,
+                          market_sentiment: float = 0.5,
+                          weights: Optional[Dict[str, float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """predict_market_trend의 일별 벡터 버전 (점수, 추세 코드 -2~2)"""
+    weights = weights or MARKET_TREND_WEIGHTS
+    score = np.clip(
+        sentiment * weights['sentiment_weight']
+        + trend_strength * weights['price_weight']
+        + market_sentiment * weights['volume_weight'],
+        0, 1
+    )
+    trend = np.select([score > 0.7, score > 0.6, score > 0.4, score > 0.3], [2, 1, 0, -1], default=-2)
+    return score, trend
+
+def _hits(direction: np.ndarray, realized: np.ndarray, flat_band: float) -> np.ndarray:
+    """방향 적중 여부 (횡보는 실현 수익률이 ±flat_band 이내면 적중)"""
+    return np.where(direction > 0, realized > 0,
+                    np.where(direction < 0, realized < 0, np.abs(realized) <= flat_band))
+
+def _backtest_symbol(task: Dict[str, Any]) -> Dict[str, Any]:
+    """단일 종목 백테스트 (프로세스 풀 작업 단위)"""
+    opens, closes = task['open'], task['close']
+    change_percent = np.where(opens > 0, (closes - opens) / opens * 100, 0.0)
+    
+    movement, predicted, confidence = predict_price_arrays(
+        task['sentiment'], task['sentiment_std'], task['news_count'], change_percent
+    )
+    
+    # t일 예측 → t+1일 종가 수익률로 채점 (마지막 날은 결과 없음)
+    realized = closes[1:] / closes[:-1] - 1
+    movement, predicted, confidence = movement[:-1], predicted[:-1], confidence[:-1]
+    valid = ~np.isnan(realized)
+    
+    return {
+        'symbol': task['symbol'],
+        'movement': movement[valid],
+        'confidence': confidence[valid],
+        'hits': _hits(movement[valid], realized[valid], task['flat_band'])
+    }
+
+class Backtester:
+    """예측 로직 과거 재생 백테스터"""
+    
+    def __init__(self, workers: Optional[int] = None, flat_band: float = 0.01):
+        self.workers = workers or os.cpu_count() or 1
+        self.flat_band = flat_band
+    
+    @staticmethod
+    def _article_date(news: Dict[str, Any]) -> Optional[date]:
+        """기사 날짜 ('date' 우선, 없으면 수집 시각)"""
+        value = news.get('date') or news.get('crawled_at')
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    
+    def _load_news(self, news_data: Optional[List[Dict[str, Any]]],
+                   start: date, end: date) -> List[Dict[str, Any]]:
+        if news_data is not None:
+            return news_data
+        return Database().get_articles_between(start.isoformat(), end.isoformat())
+    
+    def _daily_sentiment(self, news_data: List[Dict[str, Any]],
+                         symbols: List[str]) -> Dict[str, Dict[date, np.ndarray]]:
+        """종목 → 날짜 → [감정 합, 감정 제곱합, 기사 수] (기사별 감정은 1회만 계산)"""
+        daily: Dict[str, Dict[date, np.ndarray]] = {symbol: {} for symbol in symbols}
+        
+        for news in news_data:
+            news_date = self._article_date(news)
+            targets = [s for s in PriceCorrelationAnalyzer._linked_symbols(news) if s in daily]
+            if news_date is None or not targets:
+                continue
+            
+            score = PriceCorrelationAnalyzer._calculate_news_sentiment(news)
+            for symbol in targets:
+                bucket = daily[symbol].setdefault(news_date, np.zeros(3))
+                bucket += (score, score * score, 1)
+        
+        return daily
+    
+    def _build_task(self, symbol: str, start: date, end: date,
+                    daily: Dict[date, np.ndarray]) -> Optional[Dict[str, Any]]:
+        hist = price_store.read(symbol, start, end)
+        if len(hist) < 2:
+            return None
+        
+        # 기사가 없는 날은 중립(0.5), 표준편차 기본값 0.5 (_analyze_current_news_sentiment와 동일)
+        stats = np.array([daily.get(d, (0.0, 0.0, 0.0)) for d in hist.index.date], dtype=float)
+        count = stats[:, 2]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, stats[:, 0] / count, 0.5)
+            std = np.where(count > 0, np.sqrt(np.maximum(stats[:, 1] / count - mean ** 2, 0.0)), 0.5)
+        
+        return {
+            'symbol': symbol,
+            'open': hist['Open'].to_numpy(dtype=float),
+            'close': hist['Close'].to_numpy(dtype=float),
+            'sentiment': mean,
+            'sentiment_std': std,
+            'news_count': count,
+            'flat_band': self.flat_band
+        }
+    
+    @staticmethod
+    def _precision_by_bucket(confidence: np.ndarray, hits: np.ndarray) -> Dict[str, Dict[str, Any]]:
+        """신뢰도 구간별 정밀도"""
+        result = {}
+        index = np.digitize(confidence, CONFIDENCE_BUCKETS[1:-1])
+        for i in range(len(CONFIDENCE_BUCKETS) - 1):
+            mask = index == i
+            predictions = int(mask.sum())
+            result[f"{CONFIDENCE_BUCKETS[i]:.1f}-{CONFIDENCE_BUCKETS[i + 1]:.1f}"] = {
+                'predictions': predictions,
+                'hits': int(hits[mask].sum()),
+                'precision': float(hits[mask].mean()) if predictions else None
+            }
+        return result
+    
+    @staticmethod
+    def _precision_by_label(direction: np.ndarray, hits: np.ndarray,
+                            labels: Dict[int, str]) -> Dict[str, Dict[str, Any]]:
+        """예측 방향별 정밀도"""
+        result = {}
+        for code, label in labels.items():
+            mask = direction == code
+            predictions = int(mask.sum())
+            result[label] = {
+                'predictions': predictions,
+                'hits': int(hits[mask].sum()),
+                'precision': float(hits[mask].mean()) if predictions else None
+            }
+        return result
+    
+    def backtest_price_model(self, news_data: Optional[List[Dict[str, Any]]] = None,
+                             symbols: Optional[List[str]] = None,
+                             start: Optional[date] = None,
+                             end: Optional[date] = None) -> Dict[str, Any]:
+        """종목별 뉴스 기반 주가 예측(predict_price_movement) 백테스트"""
+        started = time.perf_counter()
+        symbols = symbols or FINANCIAL_CONFIG.get('stock_symbols', [])
+        end = end or date.today()
+        start = start or end - timedelta(days=365)
+        
+        news_data = self._load_news(news_data, start, end)
+        daily = self._daily_sentiment(news_data, symbols)
+        tasks = [t for t in (self._build_task(s, start, end, daily[s]) for s in symbols) if t]
+        
+        workers = min(self.workers, len(tasks))
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_backtest_symbol, tasks))
+        else:
+            results = [_backtest_symbol(task) for task in tasks]
+        
+        if results:
+            movement = np.concatenate([r['movement'] for r in results])
+            confidence = np.concatenate([r['confidence'] for r in results])
+            hits = np.concatenate([r['hits'] for r in results]).astype(bool)
+        else:
+            movement, confidence, hits = np.zeros(0, int), np.zeros(0), np.zeros(0, bool)
+        
+        runtime = time.perf_counter() - started
+        logger.info(f"🧪 종목 예측 백테스트: {len(results)}개 종목, {len(hits)}건, {runtime:.2f}초")
+        
+        return {
+            'model': 'predict_price_movement',
+            'period': {'start': start.isoformat(), 'end': end.isoformat()},
+            'symbols': len(results),
+            'articles': len(news_data),
+            'predictions': int(len(hits)),
+            'hit_rate': float(hits.mean()) if len(hits) else None,
+            'precision_by_movement': self._precision_by_label(movement, hits, MOVEMENT_LABELS),
+            'precision_by_confidence': self._precision_by_bucket(confidence, hits),
+            'per_symbol': {
+                r['symbol']: {
+                    'predictions': int(len(r['hits'])),
+                    'hit_rate': float(np.mean(r['hits'])) if len(r['hits']) else None
+                }
+                for r in results
+            },
+            'workers': max(workers, 1),
+            'runtime_seconds': runtime,
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    def backtest_market_trend(self, news_data: Optional[List[Dict[str, Any]]] = None,
+                              index_symbols: Optional[List[str]] = None,
+                              start: Optional[date] = None,
+                              end: Optional[date] = None) -> Dict[str, Any]:
+        """시장 트렌드 예측(predict_market_trend) 백테스트 - 다음 날 지수 평균 수익률로 채점"""
+        started = time.perf_counter()
+        index_symbols = index_symbols or FINANCIAL_CONFIG.get('index_symbols', [])
+        end = end or date.today()
+        start = start or end - timedelta(days=365)
+        
+        # 날짜 × 지수 등락률 / 종가 행렬
+        changes, closes = {}, {}
+        for symbol in index_symbols:
+            hist = price_store.read(symbol, start, end)
+            if hist.empty:
+                continue
+            dates = hist.index.date
+            opens = hist['Open'].to_numpy(dtype=float)
+            close = hist['Close'].to_numpy(dtype=float)
+            changes[symbol] = dict(zip(dates, np.where(opens > 0, (close - opens) / opens * 100, np.nan)))
+            closes[symbol] = dict(zip(dates, close))
+        
+        days = sorted({d for series in closes.values() for d in series})
+        if len(days) < 2:
+            return {}
+        
+        change_matrix = np.array([[changes[s].get(d, np.nan) for s in changes] for d in days])
+        close_matrix = np.array([[closes[s].get(d, np.nan) for s in closes] for d in days])
+        
+        # 일별 뉴스 감정 (기사가 없는 날은 중립)
+        by_day: Dict[date, List[Dict[str, Any]]] = {}
+        news_data = self._load_news(news_data, start, end)
+        for news in news_data:
+            news_date = self._article_date(news)
+            if news_date is not None:
+                by_day.setdefault(news_date, []).append(news)
+        sentiment = np.array([MarketAnalyzer._analyze_news_sentiment(by_day.get(d, []))['sentiment_score']
+                              for d in days])
+        
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            # 거래가 없는 날은 NaN으로 남김
+            warnings.simplefilter('ignore', RuntimeWarning)
+            trend_strength = np.nan_to_num(np.nanmean(np.abs(change_matrix) / 5, axis=1), nan=0.5)
+            realized = np.nanmean(close_matrix[1:] / close_matrix[:-1] - 1, axis=1)
+        
+        score, trend = predict_market_arrays(sentiment, trend_strength)
+        score, trend = score[:-1], trend[:-1]
+        valid = ~np.isnan(realized)
+        score, trend, realized = score[valid], trend[valid], realized[valid]
+        hits = _hits(trend, realized, self.flat_band).astype(bool)
+        
+        # _calculate_confidence_level 구간
+        distance = np.abs(score - 0.5)
+        level = np.select([distance > 0.3, distance > 0.2, distance > 0.1], [3, 2, 1], default=0)
+        
+        runtime = time.perf_counter() - started
+        logger.info(f"🧪 시장 예측 백테스트: {len(hits)}일, {runtime:.2f}초")
+        
+        return {
+            'model': 'predict_market_trend',
+            'period': {'start': start.isoformat(), 'end': end.isoformat()},
+            'indices': list(closes),
+            'articles': len(news_data),
+            'predictions': int(len(hits)),
+            'hit_rate': float(hits.mean()) if len(hits) else None,
+            'precision_by_trend': self._precision_by_label(trend, hits, TREND_LABELS),
+            'precision_by_confidence': self._precision_by_label(
+                level, hits, {3: '매우 높음', 2: '높음', 1: '보통', 0: '낮음'}
+            ),
+            'runtime_seconds': runtime,
+            'timestamp': datetime.now().isoformat()
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="저장된 뉴스/일봉으로 예측 로직 백테스트")
+    parser.add_argument('--model', choices=['price', 'market', 'all'], default='all')
+    parser.add_argument('--symbols', nargs='*', default=None, help='종목 목록 (기본: 설정의 종목)')
+    parser.add_argument('--indices', nargs='*', default=None, help='지수 목록 (기본: 설정의 지수)')
+    parser.add_argument('--days', type=int, default=365, help='백테스트 기간 (일)')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--flat-band', type=float, default=0.01, help='횡보 적중 수익률 범위')
+    args = parser.parse_args()
+    
+    backtester = Backtester(workers=args.workers, flat_band=args.flat_band)
+    end = date.today()
+    start = end - timedelta(days=args.days)
+    
+    result = {}
+    if args.model in ('price', 'all'):
+        result['price'] = backtester.backtest_price_model(symbols=args.symbols, start=start, end=end)
+    if args.model in ('market', 'all'):
+        result['market'] = backtester.backtest_market_trend(index_symbols=args.indices, start=start, end=end)
+    print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+💾 파이프라인 단계 체크포인트
+단계 출력을 (단계, 입력 지문)으로 디스크에 저장하고 실행 ID별 매니페스트로 진행 상황을 기록
+- 실패한 실행을 다시 돌리면 마지막으로 완료된 단계 다음부터 재개 (재개 가능 기간 안의 실행만)
+- 입력이 같은 단계(같은 기사 팩트 체크/생성 등)는 다른 실행에서도 저장된 출력을 재사용
+"""
+
+import dataclasses
+import hashlib
+import json
+import pickle
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 지문 범위 - inputs: 입력 내용 기준(실행 간 재사용), run: 실행 ID 기준(재개 시에만 재사용)
+SCOPE_INPUTS = 'inputs'
+SCOPE_RUN = 'run'
+
+def _canonical(value: Any) -> Any:
+    """지문 계산용 정규화 (데이터클래스/날짜/집합 포함)"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _canonical(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(str(v) for v in value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return repr(value)
+
+def fingerprint(*values: Any) -> str:
+    """입력 값들의 안정적인 SHA-256 지문"""
+    payload = json.dumps(_canonical(list(values)), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def article_identity(article: Dict[str, Any]) -> Dict[str, Any]:
+    """기사 지문용 필드 (수집 시각 등 실행마다 바뀌는 값 제외)"""
+    return {
+        'url': article.get('url') or article.get('link'),
+        'title': article.get('title'),
+        'content': article.get('content')
+    }
+
+class CheckpointStore:
+    """단계 출력 체크포인트 저장소"""
+    
+    def __init__(self, base_dir: str = "data/checkpoints", retention_days: int = 7,
+                 resume_max_age_hours: float = 6):
+        self.base_dir = Path(base_dir)
+        self.objects_dir = self.base_dir / "objects"
+        self.runs_dir = self.base_dir / "runs"
+        self.retention_days = retention_days
+        # 자동 재개 대상 실행의 최대 나이 (실행 범위 단계의 수집 결과가 오래되지 않도록)
+        self.resume_max_age_hours = resume_max_age_hours
+        
+        self.run_id: Optional[str] = None
+        self.manifest: Dict[str, Any] = {}
+        
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'saved': 0,
+            'not_saved': 0
+        }
+    
+    def _manifest_path(self, run_id: str) -> Path:
+        return self.runs_dir / f"{run_id}.json"
+    
+    def _object_path(self, stage: str, key: str) -> Path:
+        return self.objects_dir / stage / f"{key}.pkl"
+    
+    def _write_manifest(self):
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest['updated_at'] = datetime.now().isoformat()
+        path = self._manifest_path(self.run_id)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(path)
+    
+    def latest_incomplete_run(self, prefix: str = '') -> Optional[str]:
+        """가장 최근의 미완료(실행 중 중단/실패) 실행 ID (재개 가능 기간이 지났으면 None)"""
+        if not self.runs_dir.exists():
+            return None
+        
+        cutoff = datetime.now() - timedelta(hours=self.resume_max_age_hours)
+        candidates = sorted(self.runs_dir.glob(f"{prefix}*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for path in candidates:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    manifest = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if manifest.get('status') == 'completed':
+                return None
+            try:
+                created_at = datetime.fromisoformat(manifest['created_at'])
+            except (KeyError, TypeError, ValueError):
+                return None
+            if created_at < cutoff:
+                logger.info(f"🆕 재개 가능 기간({self.resume_max_age_hours:g}시간)이 지난 실패 실행은 "
+                            f"이어받지 않음: {manifest['run_id']}")
+                return None
+            return manifest['run_id']
+        return None
+    
+    def start_run(self, prefix: str = 'run', run_id: Optional[str] = None, resume: bool = True) -> str:
+        """실행 시작 - resume이면 직전 미완료 실행을 이어받음"""
+        self.cleanup()
+        if run_id is None and resume:
+            run_id = self.latest_incomplete_run(prefix)
+        
+        manifest = None
+        if run_id and self._manifest_path(run_id).exists():
+            with open(self._manifest_path(run_id), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        
+        if manifest is not None:
+            completed = [name for name, stage in manifest.get('stages', {}).items() if stage.get('status') == 'done']
+            logger.info(f"⏯️ 실행 재개: {run_id} (완료 단계: {', '.join(completed) or '없음'})")
+            manifest['resumed'] = manifest.get('resumed', 0) + 1
+        else:
+            run_id = run_id or f"{prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+            manifest = {'run_id': run_id, 'created_at': datetime.now().isoformat(), 'resumed': 0, 'stages': {}}
+        
+        self.run_id = run_id
+        self.manifest = manifest
+        self.manifest['status'] = 'running'
+        self.stats = dict.fromkeys(self.stats, 0)
+        self._write_manifest()
+        return run_id
+    
+    def finish_run(self, success: bool):
+        """실행 종료 기록 (실패한 실행은 다음 실행에서 재개 대상)"""
+        if self.run_id is None:
+            return
+        self.manifest['status'] = 'completed' if success else 'failed'
+        self._write_manifest()
+    
+    def _load(self, stage: str, key: str) -> Any:
+        path = self._object_path(stage, key)
+        if not path.exists():
+            raise KeyError(key)
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+        # 재사용된 체크포인트는 보관 기간 연장
+        path.touch()
+        return value
+    
+    def _save(self, stage: str, key: str, value: Any):
+        path = self._object_path(stage, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        tmp_path.replace(path)
+    
+    def _record(self, stage: str, key: str, status: str, reused: bool, duration: float):
+        if self.run_id is None:
+            return
+        self.manifest['stages'][stage] = {
+            'fingerprint': key,
+            'status': status,
+            'reused': reused,
+            'duration': duration,
+            'completed_at': datetime.now().isoformat()
+        }
+        self._write_manifest()
+    
+    async def run_stage(self, stage: str, func: Callable[..., Awaitable[Any]], *inputs: Any,
+                        scope: str = SCOPE_INPUTS,
+                        key: Optional[Callable[..., Any]] = None,
+                        valid: Optional[Callable[[Any], bool]] = None,
+                        record: bool = True) -> Any:
+        """저장된 출력이 있으면 재사용, 없으면 실행 후 저장
+        
+        key를 지정하면 입력 대신 key(*inputs)로 지문을 계산한다 (수집 시각 등 가변 필드 제외).
+        valid가 False를 반환하는 출력(빈 결과, 일부 실패 등)은 저장하지 않아 다음 실행에서 다시 시도한다.
+        record=False면 실행 매니페스트에 남기지 않음 (기사 단위 세부 체크포인트용).
+        """
+        if scope == SCOPE_RUN:
+            if self.run_id is None:
+                raise RuntimeError("실행 범위 체크포인트는 start_run 이후에 사용할 수 있습니다")
+            digest = fingerprint(stage, self.run_id)
+        else:
+            digest = fingerprint(stage, key(*inputs) if key else list(inputs))
+        
+        start = time.perf_counter()
+        try:
+            result = self._load(stage, digest)
+            self.stats['hits'] += 1
+            if record:
+                self._record(stage, digest, 'done', True, 0.0)
+                logger.info(f"⏭️ 체크포인트 재사용: {stage} ({digest[:12]})")
+            return result
+        except KeyError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ 체크포인트 로드 실패, 단계 재실행: {stage} - {e}")
+        
+        self.stats['misses'] += 1
+        result = await func(*inputs)
+        duration = time.perf_counter() - start
+        
+        is_valid = bool(result) if valid is None else valid(result)
+        if not is_valid:
+            self.stats['not_saved'] += 1
+            if record:
+                self._record(stage, digest, 'incomplete', False, duration)
+            return result
+        
+        try:
+            self._save(stage, digest, result)
+            self.stats['saved'] += 1
+            if record:
+                self._record(stage, digest, 'done', False, duration)
+        except Exception as e:
+            logger.error(f"❌ 체크포인트 저장 실패: {stage} - {e}")
+        return result
+    
+    def wrap(self, stage: str, func: Callable[..., Awaitable[Any]], scope: str = SCOPE_INPUTS,
+             key: Optional[Callable[..., Any]] = None, valid: Optional[Callable[[Any], bool]] = None,
+             record: bool = True) -> Callable[..., Awaitable[Any]]:
+        """체크포인트를 거치는 단계 함수 (DAG 노드/파이프라인 핸들러용)"""
+        async def checkpointed(*inputs):
+            return await self.run_stage(stage, func, *inputs, scope=scope, key=key, valid=valid, record=record)
+        return checkpointed
+    
+    def cleanup(self) -> int:
+        """보관 기간이 지난 체크포인트/매니페스트 삭제"""
+        if not self.base_dir.exists():
+            return 0
+        
+        cutoff = time.time() - self.retention_days * 86400
+        removed = 0
+        for path in list(self.objects_dir.glob("*/*.pkl")) + list(self.runs_dir.glob("*.json")):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        
+        if removed:
+            logger.info(f"🧹 오래된 체크포인트 {removed}개 삭제")
+        return removed
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """체크포인트 통계 반환"""
+        return {
+            **self.stats,
+            'run_id': self.run_id,
+            'resumed': self.manifest.get('resumed', 0),
+            'stages': self.manifest.get('stages', {}),
+            'base_dir': str(self.base_dir)
+        }
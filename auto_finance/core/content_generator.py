@@ -12,6 +12,9 @@ from dataclasses import dataclass
 from auto_finance.utils.logger import setup_logger
 from auto_finance.utils.error_handler import retry_on_error, ErrorHandler
 from auto_finance.utils.cache_manager import cache_manager
+from auto_finance.core.prompt_builder import prompt_builder, token_ledger, split_sentences
+from auto_finance.core.streaming_generation import stream_generate, StreamingContentParser
+from auto_finance.core.extractive_summarizer import summarize_to_length
 from auto_finance.config.settings import AI_CONFIG, CONTENT_CONFIG
 
 logger = setup_logger(__name__)
@@ -50,6 +53,8 @@ class ContentGenerator:
         self.ai_client = None
         self.model_name = AI_CONFIG.get('model_name', 'gemini-2.0-flash-exp')
         self.api_key = AI_CONFIG.get('api_key')
+        # 스트리밍 생성 (청크 도착 즉시 파싱, 목표 길이 도달 시 조기 종료)
+        self.streaming = CONTENT_CONFIG.get('streaming', True)
         
         # 콘텐츠 생성 통계
         self.stats = {
@@ -57,7 +62,12 @@ class ContentGenerator:
             'successful_generations': 0,
             'failed_generations': 0,
             'average_processing_time': 0.0,
-            'total_words_generated': 0
+            'total_words_generated': 0,
+            'streamed_generations': 0,
+            'early_stops': 0,
+            'average_first_chunk_time': 0.0,
+            'local_length_adjustments': 0,
+            'llm_length_adjustments': 0
         }
         
         # SEO 키워드 가중치
@@ -78,13 +88,19 @@ class ContentGenerator:
     async def initialize(self):
         """AI 클라이언트 초기화"""
         try:
-            if not self.api_key:
+            mock_url = AI_CONFIG.get('mock_llm_url')
+            if not self.api_key and not mock_url:
                 logger.warning("⚠️ AI API 키가 설정되지 않았습니다")
                 return
             
             # Google Gemini API 클라이언트 설정
             import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
+            if mock_url:
+                # 로컬 모의 LLM 서버 (벤치마크용)
+                genai.configure(api_key=self.api_key or 'mock', transport='rest',
+                                client_options={'api_endpoint': mock_url})
+            else:
+                genai.configure(api_key=self.api_key)
             
             # 모델 설정
             self.ai_client = genai.GenerativeModel(self.model_name)
@@ -127,11 +143,15 @@ class ContentGenerator:
             # 프롬프트 생성
             prompt = self._create_content_prompt(request)
             
-            # AI 호출
-            response = await self._call_ai_api(prompt)
-            
-            # 응답 파싱
-            content = self._parse_content_response(response, request)
+            if self.streaming:
+                # 스트리밍 호출 + 증분 파싱
+                content = await self._generate_streaming(prompt, request)
+            else:
+                # AI 호출
+                response = await self._call_ai_api(prompt)
+                
+                # 응답 파싱
+                content = self._parse_content_response(response, request)
             
             if content:
                 # 품질 검증
@@ -160,12 +180,14 @@ class ContentGenerator:
     def _create_content_prompt(self, request: ContentRequest) -> str:
         """콘텐츠 생성 프롬프트 생성"""
         template = self.content_templates.get(request.content_type, "")
+        body = prompt_builder.article_body({'title': request.title, 'content': request.content},
+                                           'content_generation')
         
         prompt = f"""
 다음 뉴스 기사를 바탕으로 {request.content_type} 형식의 콘텐츠를 생성해주세요.
 
 제목: {request.title}
-내용: {request.content}
+내용: {body}
 키워드: {', '.join(request.keywords)}
 목표 길이: {request.target_length}단어
 톤: {request.tone}
@@ -190,18 +212,86 @@ class ContentGenerator:
 4. JSON 형식을 정확히 지켜주세요
 """
         
-        return prompt
+        return prompt_builder.finalize(prompt)
     
     async def _call_ai_api(self, prompt: str) -> str:
         """AI API 호출"""
         try:
             response = self.ai_client.generate_content(prompt)
+            token_ledger.record('content_generator', 'gemini', prompt, response.text, response)
             return response.text
             
         except Exception as e:
             logger.error(f"❌ AI API 호출 실패: {e}")
             raise
     
+    async def _generate_streaming(self, prompt: str, request: ContentRequest) -> Optional[GeneratedContent]:
+        """스트리밍 생성 - 청크마다 본문 추출/섹션 분리/단어 수 계산, 목표 길이 도달 시 나머지 생성 중단"""
+        parser = StreamingContentParser(target_words=request.target_length)
+        stream = stream_generate(self.ai_client, prompt)
+        stopped_early = False
+        start_time = datetime.now()
+        first_chunk_time = None
+        
+        try:
+            async for chunk in stream:
+                if first_chunk_time is None:
+                    first_chunk_time = (datetime.now() - start_time).total_seconds()
+                
+                for section in parser.feed(chunk):
+                    logger.debug(f"🧩 섹션 수신: {section.splitlines()[0][:40]} ({parser.word_count}단어)")
+                
+                if parser.reached_target():
+                    stopped_early = True
+                    break
+        
+        except Exception as e:
+            logger.error(f"❌ AI 스트리밍 호출 실패: {e}")
+            raise
+        
+        finally:
+            await stream.aclose()
+        
+        # 조기 종료 시 사용량 메타데이터가 없으므로 수신한 텍스트로 추정
+        token_ledger.record('content_generator', 'gemini', prompt, parser.buffer)
+        
+        self.stats['streamed_generations'] += 1
+        if stopped_early:
+            self.stats['early_stops'] += 1
+            logger.info(f"✂️ 목표 길이 도달로 생성 조기 종료: {request.title} ({parser.word_count}단어)")
+        if first_chunk_time is not None:
+            count = self.stats['streamed_generations']
+            average = self.stats['average_first_chunk_time']
+            self.stats['average_first_chunk_time'] = (average * (count - 1) + first_chunk_time) / count
+        
+        data = parser.finish(stopped_early)
+        if not data.get('content'):
+            logger.error(f"❌ 스트리밍 응답에서 본문을 찾을 수 없습니다: {parser.buffer[:200]}")
+            return None
+        
+        # 본문 뒤 필드(summary 등)는 조기 종료 시 받지 못하므로 본문으로 보완
+        if not data.get('summary'):
+            sentences = split_sentences(re.sub(r'^#.*$', '', data['content'], flags=re.MULTILINE))
+            data['summary'] = sentences[0][:100] if sentences else ''
+        
+        return self._build_content(data, request)
+    
+    def _build_content(self, data: Dict[str, Any], request: ContentRequest) -> GeneratedContent:
+        """파싱된 응답 필드로 콘텐츠 객체 생성"""
+        return GeneratedContent(
+            title=data.get('title', request.title),
+            content=data.get('content', ''),
+            summary=data.get('summary', ''),
+            keywords=data.get('keywords', request.keywords),
+            seo_score=float(data.get('seo_score', 0.0)),
+            readability_score=float(data.get('readability_score', 0.0)),
+            word_count=len(data.get('content', '').split()),
+            content_type=request.content_type,
+            ai_model=self.model_name,
+            generated_at=datetime.now().isoformat(),
+            processing_time=0.0
+        )
+    
     def _parse_content_response(self, response: str, request: ContentRequest) -> Optional[GeneratedContent]:
         """AI 응답 파싱"""
         try:
@@ -215,21 +305,7 @@ class ContentGenerator:
             data = json.loads(json_str)
             
             # 콘텐츠 객체 생성
-            content = GeneratedContent(
-                title=data.get('title', request.title),
-                content=data.get('content', ''),
-                summary=data.get('summary', ''),
-                keywords=data.get('keywords', request.keywords),
-                seo_score=float(data.get('seo_score', 0.0)),
-                readability_score=float(data.get('readability_score', 0.0)),
-                word_count=len(data.get('content', '').split()),
-                content_type=request.content_type,
-                ai_model=self.model_name,
-                generated_at=datetime.now().isoformat(),
-                processing_time=0.0
-            )
-            
-            return content
+            return self._build_content(data, request)
             
         except json.JSONDecodeError as e:
             logger.error(f"❌ JSON 파싱 실패: {e}")
@@ -341,19 +417,10 @@ class ContentGenerator:
         """콘텐츠 길이 조정"""
         try:
             if content.word_count > target_length * 1.2:
-                # 길이가 너무 길면 요약
-                prompt = f"""
-다음 콘텐츠를 {target_length}단어로 요약해주세요:
-
-{content.content}
-
-원래 제목과 키워드는 유지하면서 핵심 내용만 남겨주세요.
-"""
-                
-                response = await self._call_ai_api(prompt)
-                if response:
-                    content.content = response.strip()
-                    content.word_count = len(content.content.split())
+                # 길이가 너무 길면 로컬 추출 요약 (LLM 재호출 없음)
+                content.content = summarize_to_length(content.content, target_length)
+                content.word_count = len(content.content.split())
+                self.stats['local_length_adjustments'] += 1
             
             elif content.word_count < target_length * 0.8:
                 # 길이가 너무 짧으면 확장
@@ -368,6 +435,7 @@ class ContentGenerator:
 """
                 
                 response = await self._call_ai_api(prompt)
+                self.stats['llm_length_adjustments'] += 1
                 if response:
                     content.content = response.strip()
                     content.word_count = len(content.content.split())
@@ -480,6 +548,9 @@ class ContentGenerator:
             **self.stats,
             'error_statistics': self.error_handler.get_statistics(),
             'model_name': self.model_name,
+            'token_usage': token_ledger.summary('content_generator'),
+            # 로컬 요약으로 대체된 길이 조정 LLM 호출 수
+            'llm_calls_avoided': self.stats['local_length_adjustments'],
             'timestamp': datetime.now().isoformat()
         }
 
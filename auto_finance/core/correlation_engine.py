@@ -0,0 +1,198 @@
+"""
+🔁 온라인 감정-수익률 상관관계 엔진
+종목별 지수가중 공동 적률(Welford/EWMA)을 증분 갱신하고 상태를 저장
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+class CoMomentState:
+    """감정(x)-수익률(y) 가중 공동 적률 (decay=1이면 일반 Welford)"""
+    
+    def __init__(self, decay: float = 1.0):
+        self.decay = decay
+        self.weight = 0.0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.c_xx = 0.0
+        self.c_yy = 0.0
+        self.c_xy = 0.0
+        self.observations = 0
+    
+    def update(self, x: float, y: float):
+        """관측 1건 반영 - O(1)"""
+        self.weight = self.decay * self.weight + 1.0
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.weight
+        self.mean_y += dy / self.weight
+        self.c_xx = self.decay * self.c_xx + dx * (x - self.mean_x)
+        self.c_yy = self.decay * self.c_yy + dy * (y - self.mean_y)
+        self.c_xy = self.decay * self.c_xy + dx * (y - self.mean_y)
+        self.observations += 1
+    
+    @property
+    def correlation(self) -> Optional[float]:
+        if self.observations < 3 or self.c_xx <= 0 or self.c_yy <= 0:
+            return None
+        return max(-1.0, min(1.0, self.c_xy / (self.c_xx * self.c_yy) ** 0.5))
+    
+    @property
+    def sentiment_std(self) -> float:
+        return (self.c_xx / self.weight) ** 0.5 if self.weight > 0 else 0.0
+    
+    @property
+    def volatility(self) -> float:
+        return (self.c_yy / self.weight) ** 0.5 if self.weight > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'CoMomentState':
+        state = cls()
+        state.__dict__.update(data)
+        return state
+
+class OnlineCorrelationEngine:
+    """종목별 롤링 상관관계 / 영향 지수 / 변동성 스트리밍 엔진"""
+    
+    def __init__(self, span: int = 7, state_path: str = "data/correlation_state.json"):
+        self.span = span
+        self.decay = 1.0 - 2.0 / (span + 1.0)
+        self.state_path = Path(state_path)
+        
+        self.states: Dict[str, CoMomentState] = {}
+        self.last_close: Dict[str, float] = {}
+        self.last_bar_date: Dict[str, str] = {}
+        # 종목 → 날짜 → {기사 키: 감정} (해당 날짜 봉이 도착하면 소진, 같은 기사는 한 번만 반영)
+        self.pending: Dict[str, Dict[str, Dict[str, float]]] = {}
+        
+        self.load()
+    
+    def _state(self, symbol: str) -> CoMomentState:
+        if symbol not in self.states:
+            self.states[symbol] = CoMomentState(self.decay)
+        return self.states[symbol]
+    
+    def add_sentiment(self, symbol: str, day: date, score: float,
+                      article_key: Optional[str] = None):
+        """기사 감정 점수 누적 (같은 날짜 봉 도착 시 반영)
+        
+        article_key(URL 등)를 주면 매 수집 주기마다 다시 들어오는 같은 기사는 덮어쓴다.
+        """
+        key = day.isoformat()
+        if key <= self.last_bar_date.get(symbol, ''):
+            # 이미 처리된 날짜의 늦은 기사는 무시
+            return
+        bucket = self.pending.setdefault(symbol, {}).setdefault(key, {})
+        bucket[article_key or f"#{len(bucket)}"] = score
+    
+    def add_bars(self, symbol: str, hist) -> int:
+        """완성된 일봉 DataFrame(DatetimeIndex, Close)을 날짜순으로 반영"""
+        added = 0
+        for index, close in zip(hist.index, hist['Close']):
+            if close == close:  # NaN 제외
+                self.add_bar(symbol, index.date(), float(close))
+                added += 1
+        return added
+    
+    def add_bar(self, symbol: str, day: date, close: float) -> Optional[Dict[str, Any]]:
+        """일봉 종가 반영 - 수익률 계산 후 같은 날짜 평균 감정과 짝지어 갱신"""
+        key = day.isoformat()
+        if key <= self.last_bar_date.get(symbol, ''):
+            return None
+        
+        previous = self.last_close.get(symbol)
+        self.last_close[symbol] = close
+        self.last_bar_date[symbol] = key
+        
+        pending = self.pending.get(symbol, {})
+        bucket = pending.pop(key, None)
+        for stale in [d for d in pending if d < key]:
+            del pending[stale]
+        
+        if previous and bucket:
+            self._state(symbol).update(sum(bucket.values()) / len(bucket), close / previous - 1.0)
+            return self.get(symbol)
+        return None
+    
+    def get(self, symbol: str) -> Dict[str, Any]:
+        """현재 롤링 지표 - O(1)"""
+        state = self.states.get(symbol)
+        if state is None:
+            return {'correlation': None, 'impact_index': 0.0, 'volatility': 0.0,
+                    'sentiment_std': 0.0, 'observations': 0}
+        
+        return {
+            'correlation': state.correlation,
+            # _analyze_news_impact와 동일한 정의 (감정 표준편차 × 가격 변동성)
+            'impact_index': state.sentiment_std * state.volatility,
+            'volatility': state.volatility,
+            'sentiment_std': state.sentiment_std,
+            'observations': state.observations,
+            'last_bar_date': self.last_bar_date.get(symbol)
+        }
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """전 종목 롤링 지표"""
+        return {symbol: self.get(symbol) for symbol in self.states}
+    
+    def save(self):
+        """상태 저장 (재시작 시 전체 재계산 불필요)"""
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                'span': self.span,
+                'states': {s: st.to_dict() for s, st in self.states.items()},
+                'last_close': self.last_close,
+                'last_bar_date': self.last_bar_date,
+                'pending': self.pending,
+                'timestamp': datetime.now().isoformat()
+            }
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            
+            logger.debug(f"💾 상관관계 엔진 상태 저장: {self.state_path}")
+        
+        except Exception as e:
+            logger.error(f"❌ 상관관계 엔진 상태 저장 실패: {e}")
+    
+    def load(self):
+        """저장된 상태 복원"""
+        if not self.state_path.exists():
+            return
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            if data.get('span') != self.span:
+                logger.warning(f"⚠️ 상관관계 엔진 기간 변경({data.get('span')} → {self.span}), 상태 초기화")
+                return
+            
+            self.states = {s: CoMomentState.from_dict(st) for s, st in data.get('states', {}).items()}
+            self.last_close = data.get('last_close', {})
+            self.last_bar_date = data.get('last_bar_date', {})
+            self.pending = {
+                symbol: {day: bucket for day, bucket in days.items() if isinstance(bucket, dict)}
+                for symbol, days in data.get('pending', {}).items()
+            }
+            
+            logger.info(f"📂 상관관계 엔진 상태 복원: {len(self.states)}개 종목")
+        
+        except Exception as e:
+            logger.error(f"❌ 상관관계 엔진 상태 복원 실패: {e}")
+
+# 전역 상관관계 엔진 인스턴스 (시세 수집기가 일봉, 분석기가 기사 감정을 반영)
+correlation_engine = OnlineCorrelationEngine(
+    span=FINANCIAL_CONFIG.get('correlation_span', 7),
+    state_path=FINANCIAL_CONFIG.get('correlation_state_path', "data/correlation_state.json")
+)
@@ -0,0 +1,156 @@
+"""
+🕸️ DAG 단계 실행기
+단계가 입력(선행 단계)을 선언하면 선행 단계가 끝나는 즉시 실행하여 독립 분기를 동시에 처리하고,
+노드별 시작/종료 시각과 임계 경로(전체 소요 시간을 결정한 단계 사슬)를 기록
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+@dataclass
+class DagNode:
+    """DAG 노드 - func는 inputs 순서대로 선행 단계 결과를 인자로 받음"""
+    name: str
+    func: Callable[..., Awaitable[Any]]
+    inputs: List[str] = field(default_factory=list)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    status: str = 'pending'  # pending, running, done, failed, cancelled
+    
+    @property
+    def duration(self) -> float:
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+class DagExecutor:
+    """선언된 의존성에 따라 단계를 동시 실행하는 실행기"""
+    
+    def __init__(self, name: str = 'pipeline'):
+        self.name = name
+        self.nodes: Dict[str, DagNode] = {}
+        self.results: Dict[str, Any] = {}
+        self.total_time = 0.0
+    
+    def add(self, name: str, func: Callable[..., Awaitable[Any]],
+            inputs: Optional[List[str]] = None) -> 'DagExecutor':
+        """노드 추가 (선언 순서와 무관하게 의존성으로 실행 순서 결정)"""
+        if name in self.nodes:
+            raise ValueError(f"중복된 DAG 노드: {name}")
+        self.nodes[name] = DagNode(name, func, list(inputs or []))
+        return self
+    
+    def _validate(self):
+        """미정의 입력 / 순환 의존성 검사 (Kahn 위상 정렬)"""
+        for node in self.nodes.values():
+            missing = [i for i in node.inputs if i not in self.nodes]
+            if missing:
+                raise ValueError(f"DAG 노드 {node.name}의 입력이 정의되지 않았습니다: {missing}")
+        
+        indegree = {name: len(node.inputs) for name, node in self.nodes.items()}
+        ready = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while ready:
+            current = ready.pop()
+            visited += 1
+            for node in self.nodes.values():
+                if current in node.inputs:
+                    indegree[node.name] -= 1
+                    if indegree[node.name] == 0:
+                        ready.append(node.name)
+        
+        if visited != len(self.nodes):
+            cyclic = [name for name, degree in indegree.items() if degree > 0]
+            raise ValueError(f"DAG 순환 의존성: {cyclic}")
+    
+    async def run(self) -> Dict[str, Any]:
+        """전체 DAG 실행 후 노드별 결과 반환 (노드 실패 시 나머지 취소 후 예외 전파)"""
+        self._validate()
+        origin = time.perf_counter()
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        async def run_node(node: DagNode) -> Any:
+            args = [await tasks[name] for name in node.inputs]
+            node.status = 'running'
+            node.started = time.perf_counter() - origin
+            try:
+                result = await node.func(*args)
+            except asyncio.CancelledError:
+                node.status = 'cancelled'
+                raise
+            except Exception:
+                node.status = 'failed'
+                raise
+            finally:
+                node.finished = time.perf_counter() - origin
+            
+            node.status = 'done'
+            self.results[node.name] = result
+            return result
+        
+        tasks.update({name: asyncio.ensure_future(run_node(node)) for name, node in self.nodes.items()})
+        
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            for node in self.nodes.values():
+                if node.status == 'pending':
+                    node.status = 'cancelled'
+            raise
+        finally:
+            self.total_time = time.perf_counter() - origin
+        
+        return self.results
+    
+    def critical_path(self) -> List[str]:
+        """마지막에 끝난 노드에서 시작을 늦춘 입력(가장 늦게 끝난 선행 노드)을 따라 역추적"""
+        finished = [node for node in self.nodes.values() if node.finished is not None]
+        if not finished:
+            return []
+        
+        current = max(finished, key=lambda node: node.finished)
+        path = [current.name]
+        while current.inputs:
+            current = max((self.nodes[name] for name in current.inputs),
+                          key=lambda node: node.finished or 0.0)
+            path.append(current.name)
+        return list(reversed(path))
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """노드별 시작/종료/소요 시간과 임계 경로 요약"""
+        path = self.critical_path()
+        busy = sum(node.duration for node in self.nodes.values())
+        return {
+            'name': self.name,
+            'total_time': self.total_time,
+            'critical_path': path,
+            'critical_path_time': sum(self.nodes[name].duration for name in path),
+            # 1보다 크면 그만큼 단계가 겹쳐 실행됨
+            'parallelism': busy / self.total_time if self.total_time else 0.0,
+            'nodes': {
+                name: {
+                    'inputs': node.inputs,
+                    'status': node.status,
+                    'started': node.started,
+                    'finished': node.finished,
+                    'duration': node.duration,
+                    'on_critical_path': name in path
+                }
+                for name, node in self.nodes.items()
+            }
+        }
+    
+    def log_summary(self):
+        """임계 경로 로그"""
+        path = self.critical_path()
+        steps = ' → '.join(f"{name}({self.nodes[name].duration:.1f}s)" for name in path)
+        logger.info(f"🕸️ [{self.name}] 총 {self.total_time:.1f}초, 임계 경로: {steps}")
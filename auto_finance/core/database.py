@@ -141,6 +141,18 @@ class Database:
             """, (limit,))
             return [dict(row) for row in cursor.fetchall()]
     
+    def get_articles_between(self, start: str, end: Optional[str] = None) -> List[Dict[str, Any]]:
+        """기간 내 크롤링된 기사 조회 (오래된 순)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM crawled_articles
+                WHERE date(crawled_at) >= date(?) AND date(crawled_at) <= date(?)
+                ORDER BY crawled_at
+            """, (start, end or datetime.now().strftime('%Y-%m-%d')))
+            return [dict(row) for row in cursor.fetchall()]
+    
     def get_recent_contents(self, limit: int = 10) -> List[Dict[str, Any]]:
         """최근 생성된 콘텐츠 조회"""
         with sqlite3.connect(self.db_path) as conn:
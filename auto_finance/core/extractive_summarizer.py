@@ -0,0 +1,219 @@
+"""
+✂️ 로컬 추출 요약기
+TF-IDF 문장 벡터 위 TextRank로 문장 중요도를 계산하고, 목표 단어 수에 맞춰
+핵심 문장을 원래 순서/섹션 구조대로 남겨 초과 길이 초안을 LLM 호출 없이 축약
+
+벤치마크:
+    python -m auto_finance.core.extractive_summarizer --drafts 200 --target 800
+"""
+
+import argparse
+import math
+import random
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.core.prompt_builder import split_sentences
+
+logger = setup_logger(__name__)
+
+_WORD_PATTERN = re.compile(r'[가-힣]{2,}|[A-Za-z]{3,}|\d+')
+_HEADING = re.compile(r'^\s*#{1,6}\s')
+
+# 길이 허용 범위 (ContentGenerator 목표 길이 판정과 동일)
+LENGTH_TOLERANCE = 0.2
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+def _parse_blocks(text: str) -> Tuple[List[str], List[Tuple[int, int, str]]]:
+    """본문 → (섹션 제목 목록, (섹션 번호, 단락 번호, 문장) 목록)
+    
+    제목 없는 도입부는 빈 제목의 0번 섹션으로 취급한다.
+    """
+    headings = ['']
+    units = []
+    paragraph = 0
+    for block in re.split(r'\n\s*\n', text):
+        lines = []
+        for line in block.splitlines():
+            if _HEADING.match(line):
+                headings.append(line.strip())
+                paragraph += 1
+            elif line.strip():
+                lines.append(line.strip())
+        for sentence in split_sentences(' '.join(lines)):
+            units.append((len(headings) - 1, paragraph, sentence))
+        paragraph += 1
+    return headings, units
+
+def textrank_scores(sentences: List[str], damping: float = 0.85,
+                    iterations: int = 50, tolerance: float = 1e-6) -> np.ndarray:
+    """TF-IDF 코사인 유사도 그래프 위 TextRank 점수 (합계 1)"""
+    count = len(sentences)
+    if count == 0:
+        return np.zeros(0)
+    
+    tokens = [_WORD_PATTERN.findall(s.lower()) for s in sentences]
+    vocabulary: Dict[str, int] = {}
+    document_frequency: Counter = Counter()
+    for words in tokens:
+        for word in set(words):
+            vocabulary.setdefault(word, len(vocabulary))
+            document_frequency[word] += 1
+    
+    if not vocabulary:
+        return np.full(count, 1.0 / count)
+    
+    matrix = np.zeros((count, len(vocabulary)))
+    for row, words in enumerate(tokens):
+        for word, tf in Counter(words).items():
+            idf = math.log((1 + count) / (1 + document_frequency[word])) + 1.0
+            matrix[row, vocabulary[word]] = tf * idf
+    
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    matrix /= np.where(norms == 0, 1.0, norms)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0.0)
+    
+    # 행 정규화 (연결 없는 문장은 균등 분배)
+    weights = similarity.sum(axis=1, keepdims=True)
+    transition = np.where(weights > 0, similarity / np.where(weights == 0, 1.0, weights), 1.0 / count)
+    
+    scores = np.full(count, 1.0 / count)
+    for _ in range(iterations):
+        updated = (1 - damping) / count + damping * transition.T @ scores
+        if np.abs(updated - scores).sum() < tolerance:
+            scores = updated
+            break
+        scores = updated
+    return scores / scores.sum()
+
+def summarize_to_length(text: str, target_words: int, lead_bonus: float = 0.5) -> str:
+    """목표 단어 수 이하로 핵심 문장만 남긴 본문 (섹션 제목/단락 구분 유지)
+    
+    섹션별 첫 문장에는 가산점을 주어 각 섹션의 도입 문맥이 살아남도록 한다.
+    """
+    if _word_count(text) <= target_words:
+        return text
+    
+    headings, units = _parse_blocks(text)
+    if not units:
+        return text
+    
+    sentences = [sentence for _, _, sentence in units]
+    scores = textrank_scores(sentences)
+    section_starts = {}
+    for index, (section, _, _) in enumerate(units):
+        section_starts.setdefault(section, index)
+    for index in section_starts.values():
+        scores[index] *= 1.0 + lead_bonus
+    
+    # 제목 단어 수도 예산에 포함
+    budget = target_words
+    selected = set()
+    used_sections = set()
+    for index in np.argsort(-scores, kind='stable'):
+        section = units[index][0]
+        cost = _word_count(sentences[index])
+        if section not in used_sections:
+            cost += _word_count(headings[section])
+        if cost <= budget:
+            selected.add(int(index))
+            used_sections.add(section)
+            budget -= cost
+    
+    if not selected:
+        selected.add(0)
+    
+    blocks: List[str] = []
+    current_section, current_paragraph, buffer = None, None, []
+    for index in sorted(selected):
+        section, paragraph, sentence = units[index]
+        if paragraph != current_paragraph and buffer:
+            blocks.append(' '.join(buffer))
+            buffer = []
+        if section != current_section and headings[section]:
+            blocks.append(headings[section])
+        current_section, current_paragraph = section, paragraph
+        buffer.append(sentence)
+    if buffer:
+        blocks.append(' '.join(buffer))
+    
+    return '\n\n'.join(blocks)
+
+def benchmark(drafts: int = 200, target_words: int = 800, seed: Optional[int] = 7) -> Dict[str, Any]:
+    """목표 길이 대비 0.5~2배 초안에서 길이 조정 LLM 호출 수 비교
+    
+    기존 방식은 범위를 벗어난 모든 초안에 LLM을 다시 호출하고,
+    로컬 방식은 너무 짧은 초안만 LLM으로 확장한다.
+    """
+    rng = random.Random(seed)
+    subjects = ['코스피', '코스닥', '반도체 업종', '2차전지 업종', '외국인', '기관', '원/달러 환율', '국채 금리']
+    predicates = ['상승 흐름을 이어가며 투자 심리를 개선했습니다.',
+                  '하락 압력을 받으며 변동성이 확대되었습니다.',
+                  '실적 기대감에 힘입어 거래대금이 증가했습니다.',
+                  '금리 인하 기대에 따라 매수세가 유입되었습니다.',
+                  '수출 지표 발표 이후 방향성을 탐색하고 있습니다.']
+    
+    def draft(words: int) -> str:
+        sections, total = [], 0
+        while total < words:
+            heading = f"## {rng.choice(subjects)} 동향"
+            body = []
+            for _ in range(rng.randint(4, 8)):
+                sentence = f"{rng.choice(subjects)}은(는) {rng.choice(predicates)}"
+                body.append(sentence)
+                total += _word_count(sentence)
+            sections.append(heading + '\n\n' + ' '.join(body))
+        return '\n\n'.join(sections)
+    
+    calls_before = calls_after = 0
+    ratios, elapsed = [], 0.0
+    for _ in range(drafts):
+        text = draft(int(target_words * rng.uniform(0.5, 2.0)))
+        words = _word_count(text)
+        if words > target_words * (1 + LENGTH_TOLERANCE):
+            calls_before += 1
+            start = time.perf_counter()
+            summary = summarize_to_length(text, target_words)
+            elapsed += time.perf_counter() - start
+            ratios.append(_word_count(summary) / target_words)
+        elif words < target_words * (1 - LENGTH_TOLERANCE):
+            calls_before += 1
+            calls_after += 1
+    
+    return {
+        'drafts': drafts,
+        'target_words': target_words,
+        'llm_calls_before': calls_before,
+        'llm_calls_after': calls_after,
+        'llm_calls_avoided': calls_before - calls_after,
+        'local_summaries': len(ratios),
+        'average_local_ms': elapsed / len(ratios) * 1000 if ratios else 0.0,
+        'average_length_ratio': sum(ratios) / len(ratios) if ratios else 0.0,
+        'within_tolerance': sum(1 - LENGTH_TOLERANCE <= r <= 1 + LENGTH_TOLERANCE for r in ratios)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 추출 요약 길이 조정 벤치마크')
+    parser.add_argument('--drafts', type=int, default=200)
+    parser.add_argument('--target', type=int, default=800, help='목표 단어 수')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+    
+    result = benchmark(args.drafts, args.target, args.seed)
+    logger.info(
+        f"📊 길이 조정 LLM 호출 {result['llm_calls_before']}회 → {result['llm_calls_after']}회 "
+        f"({result['llm_calls_avoided']}회 절감, 로컬 요약 평균 {result['average_local_ms']:.1f}ms, "
+        f"목표 대비 {result['average_length_ratio']:.2f}배, 허용 범위 내 "
+        f"{result['within_tolerance']}/{result['local_summaries']})"
+    )
+
+if __name__ == '__main__':
+    main()
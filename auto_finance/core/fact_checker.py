@@ -12,6 +12,7 @@ from dataclasses import dataclass
 from auto_finance.utils.logger import setup_logger
 from auto_finance.utils.error_handler import retry_on_error, ErrorHandler
 from auto_finance.utils.cache_manager import cache_manager
+from auto_finance.core.prompt_builder import prompt_builder, token_ledger
 from auto_finance.config.settings import AI_CONFIG, FACT_CHECK_CONFIG
 
 logger = setup_logger(__name__)
@@ -30,6 +31,7 @@ class FactCheckResult:
     ai_model: str
     checked_at: str
     processing_time: float
+    url: str = ''  # 원본 기사 URL (결과와 기사 대조용)
 
 class FactChecker:
     """고도화된 AI 팩트 체커"""
@@ -67,13 +69,19 @@ class FactChecker:
     async def initialize(self):
         """AI 클라이언트 초기화"""
         try:
-            if not self.api_key:
+            mock_url = AI_CONFIG.get('mock_llm_url')
+            if not self.api_key and not mock_url:
                 logger.warning("⚠️ AI API 키가 설정되지 않았습니다")
                 return
             
             # Google Gemini API 클라이언트 설정
             import google.generativeai as genai
-            genai.configure(api_key=self.api_key)
+            if mock_url:
+                # 로컬 모의 LLM 서버 (벤치마크용)
+                genai.configure(api_key=self.api_key or 'mock', transport='rest',
+                                client_options={'api_endpoint': mock_url})
+            else:
+                genai.configure(api_key=self.api_key)
             
             # 모델 설정
             self.ai_client = genai.GenerativeModel(self.model_name)
@@ -147,7 +155,7 @@ class FactChecker:
     def _create_fact_check_prompt(self, article: Dict[str, Any]) -> str:
         """팩트 체크 프롬프트 생성"""
         title = article.get('title', '')
-        content = article.get('content', '')
+        content = prompt_builder.article_body(article, 'fact_checking')
         
         prompt = f"""
 다음 뉴스 기사의 사실 여부를 검증해주세요.
@@ -175,12 +183,13 @@ class FactChecker:
 4. JSON 형식을 정확히 지켜주세요
 """
         
-        return prompt
+        return prompt_builder.finalize(prompt)
     
     async def _call_ai_api(self, prompt: str) -> str:
         """AI API 호출"""
         try:
             response = self.ai_client.generate_content(prompt)
+            token_ledger.record('fact_checker', 'gemini', prompt, response.text, response)
             return response.text
             
         except Exception as e:
@@ -212,7 +221,8 @@ class FactChecker:
                 reasoning=data.get('reasoning', ''),
                 ai_model=self.model_name,
                 checked_at=datetime.now().isoformat(),
-                processing_time=0.0
+                processing_time=0.0,
+                url=article.get('url') or article.get('link') or ''
             )
             
             return result
@@ -315,6 +325,7 @@ class FactChecker:
             'model_name': self.model_name,
             'confidence_threshold': self.confidence_threshold,
             'score_threshold': self.score_threshold,
+            'token_usage': token_ledger.summary('fact_checker'),
             'timestamp': datetime.now().isoformat()
         }
 
@@ -0,0 +1,303 @@
+"""
+🧮 종목별 일간 피처 저장소
+(종목, 날짜) 단위 감정/뉴스 수/가격·거래량 변동/기술적 지표를 SQLite에 증분 적재
+"""
+
+import hashlib
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+from auto_finance.core.price_store import price_store
+from auto_finance.core.technical_indicators import compute_indicator_series
+from auto_finance.core.ticker_linker import ticker_linker
+
+logger = setup_logger(__name__)
+
+# 종목과 무관하게 전체 기사를 집계하는 시장 행
+MARKET_SYMBOL = 'MARKET'
+
+PRICE_FEATURES = ['open', 'close', 'volume', 'change_percent', 'price_change', 'volume_change',
+                  'sma_20', 'sma_50', 'rsi', 'macd', 'bb_upper', 'bb_lower']
+
+class FeatureStore:
+    """(종목, 날짜) 피처 저장소"""
+    
+    def __init__(self, db_path: str = "data/features.db",
+                 scorer: Optional[Callable[[Dict[str, Any]], float]] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._scorer = scorer
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'articles_added': 0,
+            'articles_skipped': 0,
+            'price_rows_written': 0,
+            'last_update': None
+        }
+        
+        self.init_database()
+        logger.info(f"🧮 피처 저장소 초기화: {self.db_path}")
+    
+    def init_database(self):
+        """테이블 생성"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(f"""
+                CREATE TABLE IF NOT EXISTS daily_features (
+                    symbol TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    sentiment_sum REAL DEFAULT 0,
+                    sentiment_sq_sum REAL DEFAULT 0,
+                    news_count INTEGER DEFAULT 0,
+                    {', '.join(f'{name} REAL' for name in PRICE_FEATURES)},
+                    updated_at TEXT,
+                    PRIMARY KEY (symbol, date)
+                )
+            """)
+            # 이미 반영한 기사 (재실행 시 중복 집계 방지)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS feature_articles (
+                    article_key TEXT PRIMARY KEY,
+                    date TEXT
+                )
+            """)
+            conn.commit()
+    
+    def _score(self, article: Dict[str, Any]) -> float:
+        """기사 감정 점수 (0~1, PriceCorrelationAnalyzer와 동일 기준)"""
+        if self._scorer is None:
+            # price_correlation이 이 모듈을 참조하므로 지연 임포트
+            from auto_finance.core.price_correlation import PriceCorrelationAnalyzer
+            self._scorer = PriceCorrelationAnalyzer._calculate_news_sentiment
+        return self._scorer(article)
+    
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        source = article.get('url') or f"{article.get('title', '')}|{article.get('date', '')}"
+        return hashlib.md5(source.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _article_date(article: Dict[str, Any]) -> date:
+        value = article.get('date') or article.get('crawled_at') or datetime.now().date()
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+    
+    def update_news(self, articles: List[Dict[str, Any]]) -> int:
+        """새 기사만 (종목, 날짜) 감정 합계에 누적"""
+        if not articles:
+            return 0
+        
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            # (종목, 날짜) → [감정 합, 제곱합, 기사 수]
+            deltas: Dict[tuple, List[float]] = {}
+            added = 0
+            
+            for article in articles:
+                news_date = self._article_date(article).isoformat()
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO feature_articles (article_key, date) VALUES (?, ?)",
+                    (self._article_key(article), news_date)
+                )
+                if cursor.rowcount == 0:
+                    self.stats['articles_skipped'] += 1
+                    continue
+                
+                score = self._score(article)
+                symbols = article['symbols'] if 'symbols' in article else ticker_linker.link_article(article)
+                for symbol in [MARKET_SYMBOL] + list(symbols):
+                    delta = deltas.setdefault((symbol, news_date), [0.0, 0.0, 0])
+                    delta[0] += score
+                    delta[1] += score * score
+                    delta[2] += 1
+                added += 1
+            
+            now = datetime.now().isoformat()
+            conn.executemany("""
+                INSERT INTO daily_features (symbol, date, sentiment_sum, sentiment_sq_sum, news_count, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(symbol, date) DO UPDATE SET
+                    sentiment_sum = sentiment_sum + excluded.sentiment_sum,
+                    sentiment_sq_sum = sentiment_sq_sum + excluded.sentiment_sq_sum,
+                    news_count = news_count + excluded.news_count,
+                    updated_at = excluded.updated_at
+            """, [(s, d, *v, now) for (s, d), v in deltas.items()])
+            conn.commit()
+        
+        self.stats['articles_added'] += added
+        return added
+    
+    def _last_price_date(self, conn: sqlite3.Connection, symbol: str) -> Optional[str]:
+        row = conn.execute(
+            "SELECT MAX(date) FROM daily_features WHERE symbol = ? AND close IS NOT NULL", (symbol,)
+        ).fetchone()
+        return row[0] if row else None
+    
+    def update_prices(self, symbols: Optional[List[str]] = None, refresh: bool = False) -> int:
+        """가격 저장소 일봉에서 마지막 적재일 이후 가격 피처만 기록 (refresh=True면 누락 일봉 먼저 수집)"""
+        symbols = symbols or (FINANCIAL_CONFIG.get('stock_symbols', []) + FINANCIAL_CONFIG.get('index_symbols', []))
+        written = 0
+        
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            now = datetime.now().isoformat()
+            
+            for symbol in symbols:
+                if refresh:
+                    price_store.get_history(symbol, FINANCIAL_CONFIG.get('feature_history_period', '1y'))
+                hist = price_store.read(symbol)
+                if hist.empty:
+                    continue
+                
+                # 지표는 전체 이력 기준으로 계산 (EMA가 전 구간에 의존)
+                close = hist['Close']
+                features = compute_indicator_series(close)
+                features['open'] = hist['Open']
+                features['close'] = close
+                features['volume'] = hist['Volume']
+                features['change_percent'] = (close - hist['Open']) / hist['Open'] * 100
+                features['price_change'] = close.pct_change(fill_method=None)
+                features['volume_change'] = hist['Volume'].pct_change(fill_method=None)
+                
+                # 마지막 적재일은 장중 봉이었을 수 있으므로 다시 기록
+                last = self._last_price_date(conn, symbol)
+                dates = [d.isoformat() for d in features.index.date]
+                if last:
+                    features = features[[d >= last for d in dates]]
+                    dates = [d for d in dates if d >= last]
+                
+                values = features[PRICE_FEATURES].replace([np.inf, -np.inf], np.nan)
+                rows = [
+                    (symbol, day, *[None if pd.isna(v) else float(v) for v in row], now)
+                    for day, row in zip(dates, values.itertuples(index=False))
+                ]
+                conn.executemany(f"""
+                    INSERT INTO daily_features (symbol, date, {', '.join(PRICE_FEATURES)}, updated_at)
+                    VALUES (?, ?, {', '.join('?' for _ in PRICE_FEATURES)}, ?)
+                    ON CONFLICT(symbol, date) DO UPDATE SET
+                        {', '.join(f'{name} = excluded.{name}' for name in PRICE_FEATURES)},
+                        updated_at = excluded.updated_at
+                """, rows)
+                written += len(rows)
+            
+            conn.commit()
+        
+        self.stats['price_rows_written'] += written
+        return written
+    
+    def update(self, articles: Optional[List[Dict[str, Any]]] = None,
+               symbols: Optional[List[str]] = None, refresh: bool = False) -> Dict[str, int]:
+        """파이프라인 실행 후 증분 갱신"""
+        result = {
+            'articles_added': self.update_news(articles or []),
+            'price_rows_written': self.update_prices(symbols, refresh=refresh)
+        }
+        self.stats['last_update'] = datetime.now().isoformat()
+        logger.info(f"🧮 피처 저장소 갱신: 기사 {result['articles_added']}건, 가격 {result['price_rows_written']}행")
+        return result
+    
+    @staticmethod
+    def _finalize(df: pd.DataFrame) -> pd.DataFrame:
+        """합계 컬럼을 평균/표준편차로 변환"""
+        count = df['news_count'].fillna(0)
+        mean = df['sentiment_sum'] / count.where(count > 0)
+        variance = (df['sentiment_sq_sum'] / count.where(count > 0) - mean ** 2).clip(lower=0)
+        df = df.drop(columns=['sentiment_sum', 'sentiment_sq_sum'])
+        df.insert(0, 'avg_sentiment', mean)
+        df.insert(1, 'sentiment_std', np.sqrt(variance))
+        df['news_count'] = count.astype(int)
+        return df
+    
+    def get_features(self, symbol: str, days: Optional[int] = None,
+                     start: Optional[date] = None, end: Optional[date] = None) -> pd.DataFrame:
+        """종목 날짜별 피처 (date 인덱스, 오래된 순)"""
+        if days is not None and start is None:
+            start = date.today() - timedelta(days=days)
+        
+        query = "SELECT * FROM daily_features WHERE symbol = ?"
+        params: List[Any] = [symbol]
+        if start:
+            query += " AND date >= ?"
+            params.append(start.isoformat())
+        if end:
+            query += " AND date <= ?"
+            params.append(end.isoformat())
+        query += " ORDER BY date"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            df = pd.read_sql_query(query, conn, params=params)
+        
+        if df.empty:
+            return df
+        
+        df['date'] = pd.to_datetime(df['date']).dt.date
+        return self._finalize(df.drop(columns=['symbol', 'updated_at']).set_index('date'))
+    
+    @staticmethod
+    def last_trading_day(today: Optional[date] = None) -> date:
+        """마지막으로 장이 마감된 거래일 (오늘 이전 가장 최근 평일)"""
+        day = (today or date.today()) - timedelta(days=1)
+        while day.weekday() >= 5:
+            day -= timedelta(days=1)
+        return day
+    
+    def is_fresh(self, day: Any) -> bool:
+        """피처 날짜가 마지막 거래일 이후인지 (오래된 행은 실시간 조회로 대체)"""
+        if isinstance(day, str):
+            day = date.fromisoformat(day)
+        return day is not None and day >= self.last_trading_day()
+    
+    def get_latest(self, symbol: str, with_price: bool = True, fresh: bool = False) -> Dict[str, Any]:
+        """종목 최신 피처 (with_price=True면 가격이 있는 가장 최근 날짜, fresh=True면 마지막 거래일 이전 행은 제외)"""
+        query = "SELECT * FROM daily_features WHERE symbol = ?"
+        if with_price:
+            query += " AND close IS NOT NULL"
+        query += " ORDER BY date DESC LIMIT 1"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            df = pd.read_sql_query(query, conn, params=[symbol])
+        
+        if df.empty or (fresh and not self.is_fresh(df['date'].iloc[0])):
+            return {}
+        
+        row = self._finalize(df.drop(columns=['updated_at'])).iloc[0]
+        return {k: (None if pd.isna(v) else v.item() if hasattr(v, 'item') else v) for k, v in row.items()}
+    
+    def get_snapshot(self, symbols: Optional[List[str]] = None, fresh: bool = False) -> Dict[str, Dict[str, Any]]:
+        """여러 종목 최신 피처"""
+        symbols = symbols or FINANCIAL_CONFIG.get('stock_symbols', [])
+        snapshot = {}
+        for symbol in symbols:
+            latest = self.get_latest(symbol, fresh=fresh)
+            if latest:
+                snapshot[symbol] = latest
+        return snapshot
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """저장소 통계 반환"""
+        with sqlite3.connect(self.db_path) as conn:
+            symbols, rows = conn.execute(
+                "SELECT COUNT(DISTINCT symbol), COUNT(*) FROM daily_features"
+            ).fetchone()
+            articles = conn.execute("SELECT COUNT(*) FROM feature_articles").fetchone()[0]
+        
+        return {
+            **self.stats,
+            'symbols': symbols,
+            'rows': rows,
+            'articles': articles,
+            'db_path': str(self.db_path),
+            'timestamp': datetime.now().isoformat()
+        }
+
+# 전역 피처 저장소 인스턴스
+feature_store = FeatureStore(FINANCIAL_CONFIG.get('feature_store_path', "data/features.db"))
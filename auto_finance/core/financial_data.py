@@ -4,15 +4,19 @@
 """
 
 import asyncio
-import yfinance as yf
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from dataclasses import dataclass
 from auto_finance.utils.logger import setup_logger
 from auto_finance.utils.error_handler import retry_on_error, ErrorHandler
 from auto_finance.utils.cache_manager import cache_manager
+from auto_finance.core.price_store import price_store
+from auto_finance.core.market_data_provider import MarketDataProvider, get_market_data_provider
+from auto_finance.core.technical_indicators import compute_indicator_matrix, indicator_engine
+from auto_finance.core.correlation_engine import correlation_engine
+from auto_finance.core.intraday_monitor import MarketBoard
 from auto_finance.config.settings import FINANCIAL_CONFIG
 
 logger = setup_logger(__name__)
@@ -58,18 +62,28 @@ class EconomicIndicator:
 class FinancialDataCollector:
     """고도화된 금융 데이터 수집기"""
     
-    def __init__(self):
+    def __init__(self, provider: Optional[MarketDataProvider] = None):
         self.error_handler = ErrorHandler()
+        self.provider = provider or get_market_data_provider()
         
         # 설정 로드
         self.stock_symbols = FINANCIAL_CONFIG.get('stock_symbols', [])
         self.index_symbols = FINANCIAL_CONFIG.get('index_symbols', [])
         self.update_interval = FINANCIAL_CONFIG.get('update_interval', 300)  # 5분
+        self.bulk_download = FINANCIAL_CONFIG.get('bulk_download', True)
+        self.fundamentals_ttl = FINANCIAL_CONFIG.get('fundamentals_ttl', 86400)  # 1일
         
         # 데이터 저장소
         self.stock_data: Dict[str, StockData] = {}
         self.index_data: Dict[str, IndexData] = {}
         self.economic_data: Dict[str, EconomicIndicator] = {}
+        self.technical_indicators: Dict[str, Dict[str, float]] = {}
+        
+        # 시세 기준 거래일 (장 마감 후/휴장일에는 수집 시각과 다를 수 있음)
+        self.quote_dates: Dict[str, date] = {}
+        
+        # 증분 시장 요약판 (장중 모니터와 공유)
+        self.market_board = MarketBoard()
         
         # 수집 통계
         self.stats = {
@@ -107,14 +121,16 @@ class FinancialDataCollector:
             
             if cached_data:
                 logger.debug(f"💾 캐시된 주식 데이터 사용: {symbol}")
-                return StockData(**cached_data)
+                return StockData(**self._restore_quote_date(symbol, cached_data))
             
-            # yfinance로 데이터 수집
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
+            # 펀더멘털 (일 단위 캐시)
+            info = await self.get_fundamentals(symbol)
             
             # 실시간 가격 데이터
-            hist = ticker.history(period="1d", interval="1m")
+            loop = asyncio.get_running_loop()
+            hist = await loop.run_in_executor(
+                None, lambda: self.provider.get_history(symbol, period="1d", interval="1m")
+            )
             if hist.empty:
                 raise Exception(f"가격 데이터 없음: {symbol}")
             
@@ -127,21 +143,25 @@ class FinancialDataCollector:
             # 주식 데이터 생성
             stock_data = StockData(
                 symbol=symbol,
-                name=info.get('longName', symbol),
+                name=info.get('name', symbol),
                 price=current_price,
                 change=change,
                 change_percent=change_percent,
                 volume=int(hist['Volume'].iloc[-1]) if 'Volume' in hist.columns else 0,
-                market_cap=info.get('marketCap'),
-                pe_ratio=info.get('trailingPE'),
-                dividend_yield=info.get('dividendYield'),
-                high_52w=info.get('fiftyTwoWeekHigh'),
-                low_52w=info.get('fiftyTwoWeekLow'),
+                market_cap=info.get('market_cap'),
+                pe_ratio=info.get('pe_ratio'),
+                dividend_yield=info.get('dividend_yield'),
+                high_52w=info.get('high_52w'),
+                low_52w=info.get('low_52w'),
                 timestamp=datetime.now().isoformat()
             )
             
+            # 장 마감 후/휴장일에는 마지막 봉 날짜가 수집일과 다름
+            self.quote_dates[symbol] = pd.Timestamp(hist.index[-1]).date()
+            
             # 캐시 저장
-            cache_manager.set(cache_key, stock_data.__dict__, ttl=300)  # 5분
+            cache_manager.set(cache_key, {**stock_data.__dict__, 'quote_date': self.quote_dates[symbol].isoformat()},
+                              ttl=300)  # 5분
             
             self.stats['successful_requests'] += 1
             logger.debug(f"✅ 주식 데이터 수집 완료: {symbol}")
@@ -164,11 +184,13 @@ class FinancialDataCollector:
             
             if cached_data:
                 logger.debug(f"💾 캐시된 지수 데이터 사용: {symbol}")
-                return IndexData(**cached_data)
+                return IndexData(**self._restore_quote_date(symbol, cached_data))
             
-            # yfinance로 지수 데이터 수집
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period="1d", interval="1m")
+            # 지수 1분봉 수집
+            loop = asyncio.get_running_loop()
+            hist = await loop.run_in_executor(
+                None, lambda: self.provider.get_history(symbol, period="1d", interval="1m")
+            )
             
             if hist.empty:
                 raise Exception(f"지수 데이터 없음: {symbol}")
@@ -190,8 +212,11 @@ class FinancialDataCollector:
                 timestamp=datetime.now().isoformat()
             )
             
+            self.quote_dates[symbol] = pd.Timestamp(hist.index[-1]).date()
+            
             # 캐시 저장
-            cache_manager.set(cache_key, index_data.__dict__, ttl=300)  # 5분
+            cache_manager.set(cache_key, {**index_data.__dict__, 'quote_date': self.quote_dates[symbol].isoformat()},
+                              ttl=300)  # 5분
             
             self.stats['successful_requests'] += 1
             logger.debug(f"✅ 지수 데이터 수집 완료: {symbol}")
@@ -204,6 +229,14 @@ class FinancialDataCollector:
             logger.error(f"❌ 지수 데이터 수집 실패 ({symbol}): {e}")
             return None
     
+    def _restore_quote_date(self, symbol: str, cached_data: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시된 시세의 거래일 복원 후 데이터 필드만 반환"""
+        data = dict(cached_data)
+        quote_date = data.pop('quote_date', None)
+        if quote_date:
+            self.quote_dates[symbol] = date.fromisoformat(quote_date)
+        return data
+    
     def _get_index_name(self, symbol: str) -> str:
         """지수명 반환"""
         index_names = {
@@ -221,26 +254,21 @@ class FinancialDataCollector:
     
     async def get_historical_data(self, symbol: str, period: str = "1y", 
                                  interval: str = "1d") -> Optional[pd.DataFrame]:
-        """과거 데이터 수집"""
+        """과거 데이터 수집 (일봉은 로컬 저장소에서 누락 구간만 수집)"""
         try:
-            # 캐시 확인
-            cache_key = f"hist_{symbol}_{period}_{interval}_{datetime.now().strftime('%Y%m%d')}"
-            cached_data = cache_manager.get(cache_key)
+            loop = asyncio.get_running_loop()
             
-            if cached_data:
-                logger.debug(f"💾 캐시된 과거 데이터 사용: {symbol}")
-                return pd.DataFrame(cached_data)
+            if interval == "1d":
+                hist = await loop.run_in_executor(None, price_store.get_history, symbol, period)
+            else:
+                # 분봉 등은 저장소 대상이 아니므로 직접 수집
+                hist = await loop.run_in_executor(
+                    None, lambda: self.provider.get_history(symbol, period=period, interval=interval)
+                )
             
-            # yfinance로 과거 데이터 수집
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period, interval=interval)
-            
-            if hist.empty:
+            if hist is None or hist.empty:
                 raise Exception(f"과거 데이터 없음: {symbol}")
             
-            # 캐시 저장
-            cache_manager.set(cache_key, hist.to_dict('records'), ttl=3600)  # 1시간
-            
             logger.debug(f"✅ 과거 데이터 수집 완료: {symbol}")
             return hist
             
@@ -250,41 +278,111 @@ class FinancialDataCollector:
             return None
     
     def calculate_technical_indicators(self, df: pd.DataFrame) -> Dict[str, float]:
-        """기술적 지표 계산"""
+        """기술적 지표 계산 (데이터가 부족한 지표는 제외)"""
         try:
-            indicators = {}
-            
             if len(df) < 20:
-                return indicators
+                return {}
             
-            # 이동평균
-            indicators['sma_20'] = df['Close'].rolling(window=20).mean().iloc[-1]
-            indicators['sma_50'] = df['Close'].rolling(window=50).mean().iloc[-1]
+            closes = df['Close'].to_numpy(dtype=float)[np.newaxis, :]
+            results = compute_indicator_matrix(closes)
             
-            # RSI
-            delta = df['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            indicators['rsi'] = 100 - (100 / (1 + rs.iloc[-1]))
-            
-            # MACD
-            ema_12 = df['Close'].ewm(span=12).mean()
-            ema_26 = df['Close'].ewm(span=26).mean()
-            indicators['macd'] = ema_12.iloc[-1] - ema_26.iloc[-1]
-            
-            # 볼린저 밴드
-            sma_20 = df['Close'].rolling(window=20).mean()
-            std_20 = df['Close'].rolling(window=20).std()
-            indicators['bb_upper'] = sma_20.iloc[-1] + (std_20.iloc[-1] * 2)
-            indicators['bb_lower'] = sma_20.iloc[-1] - (std_20.iloc[-1] * 2)
-            
-            return indicators
+            return {name: float(values[0]) for name, values in results.items()
+                    if not np.isnan(values[0])}
             
         except Exception as e:
             logger.error(f"❌ 기술적 지표 계산 실패: {e}")
             return {}
     
+    async def calculate_all_technical_indicators(self, period: str = "1y") -> Dict[str, Dict[str, float]]:
+        """전 종목 기술적 지표 일괄 계산 (종목 × 시간 행렬)"""
+        symbols = list(dict.fromkeys(self.stock_symbols + self.index_symbols))
+        loop = asyncio.get_running_loop()
+        
+        histories = await asyncio.gather(
+            *[loop.run_in_executor(None, price_store.get_history, symbol, period) for symbol in symbols],
+            return_exceptions=True
+        )
+        
+        frames = {}
+        for symbol, hist in zip(symbols, histories):
+            if isinstance(hist, Exception):
+                logger.error(f"❌ 과거 데이터 조회 실패 ({symbol}): {hist}")
+            elif hist is not None and not hist.empty:
+                frames[symbol] = hist
+        
+        return indicator_engine.fit(frames)
+    
+    def refresh_indicators_from_quotes(self) -> Dict[str, Dict[str, float]]:
+        """최신 시세로 지표 증분 갱신 (같은 거래일이면 마지막 봉 갱신, 새 거래일이면 봉 추가)"""
+        quotes = [(symbol, stock.price, stock.timestamp) for symbol, stock in self.stock_data.items()]
+        quotes += [(symbol, index.value, index.timestamp) for symbol, index in self.index_data.items()]
+        
+        for symbol, price, timestamp in quotes:
+            if symbol in indicator_engine.states:
+                bar_date = self._quote_date(symbol) or datetime.fromisoformat(timestamp).date()
+                indicator_engine.update(symbol, price, bar_date=bar_date)
+        
+        return indicator_engine.snapshot()
+    
+    async def update_technical_indicators(self) -> Dict[str, Dict[str, float]]:
+        """수집한 시세로 기술적 지표 갱신 (최초 1회만 과거 일봉으로 일괄 계산)"""
+        try:
+            if not indicator_engine.states:
+                self.technical_indicators = await self.calculate_all_technical_indicators()
+            else:
+                self.technical_indicators = self.refresh_indicators_from_quotes()
+        except Exception as e:
+            logger.error(f"❌ 기술적 지표 갱신 실패: {e}")
+        
+        return self.technical_indicators
+    
+    def _quote_date(self, symbol: str) -> Optional[date]:
+        """시세 기준 거래일"""
+        if symbol in self.quote_dates:
+            return self.quote_dates[symbol]
+        stock = self.stock_data.get(symbol)
+        return datetime.fromisoformat(stock.timestamp).date() if stock else None
+    
+    def _feed_correlation_bars(self) -> int:
+        """시세 거래일 이전의 완성된 일봉만 온라인 상관관계 엔진에 반영
+        
+        시세 거래일 이전 날짜까지 이미 받아 둔 종목은 저장소만 읽으므로 거래일당 종목별 최대 1회만 수집한다.
+        """
+        added = 0
+        for symbol in self.stock_symbols:
+            quote_date = self._quote_date(symbol)
+            if quote_date is None:
+                continue
+            
+            last = correlation_engine.last_bar_date.get(symbol)
+            start = (date.fromisoformat(last) + timedelta(days=1) if last
+                     else quote_date - timedelta(days=3 * correlation_engine.span))
+            end = quote_date - timedelta(days=1)
+            if start > end:
+                continue
+            
+            # 시세 거래일 이후에 받은 구간이면 그 이전 봉은 모두 확정된 값
+            _, fetched_end = price_store.get_fetched_range(symbol)
+            if fetched_end is None or fetched_end < quote_date:
+                price_store.update(symbol, start)
+            added += correlation_engine.add_bars(symbol, price_store.read(symbol, start, end))
+        
+        if added:
+            correlation_engine.save()
+        return added
+    
+    async def update_correlation_bars(self) -> int:
+        """수집한 시세 기준으로 상관관계 엔진에 새로 완성된 일봉 반영"""
+        try:
+            loop = asyncio.get_running_loop()
+            added = await loop.run_in_executor(None, self._feed_correlation_bars)
+            if added:
+                logger.info(f"🔁 상관관계 엔진 일봉 반영: {added}개")
+            return added
+        except Exception as e:
+            logger.error(f"❌ 상관관계 엔진 일봉 반영 실패: {e}")
+            return 0
+    
     async def collect_all_stock_data(self) -> Dict[str, StockData]:
         """모든 주식 데이터 수집"""
         logger.info(f"📈 전체 주식 데이터 수집 시작: {len(self.stock_symbols)}개 종목")
@@ -299,6 +397,7 @@ class FinancialDataCollector:
         for i, result in enumerate(results):
             if isinstance(result, StockData):
                 self.stock_data[self.stock_symbols[i]] = result
+                self.market_board.update_stock(result.symbol, result.change_percent)
             elif isinstance(result, Exception):
                 logger.error(f"❌ 주식 데이터 수집 실패 ({self.stock_symbols[i]}): {result}")
         
@@ -307,6 +406,7 @@ class FinancialDataCollector:
         self.stats['processing_time'] = processing_time
         self.stats['last_update'] = datetime.now().isoformat()
         
+        self.market_board.publish()
         logger.info(f"✅ 주식 데이터 수집 완료: {len(self.stock_data)}개 성공")
         return self.stock_data
     
@@ -322,30 +422,152 @@ class FinancialDataCollector:
         for i, result in enumerate(results):
             if isinstance(result, IndexData):
                 self.index_data[self.index_symbols[i]] = result
+                self.market_board.update_index(result.symbol, result.value, result.change_percent)
             elif isinstance(result, Exception):
                 logger.error(f"❌ 지수 데이터 수집 실패 ({self.index_symbols[i]}): {result}")
         
+        self.market_board.publish()
         logger.info(f"✅ 지수 데이터 수집 완료: {len(self.index_data)}개 성공")
         return self.index_data
     
+    async def collect_all_market_data(self) -> Tuple[Dict[str, StockData], Dict[str, IndexData]]:
+        """전체 주식/지수 일괄 수집 (단일 다중 종목 다운로드)"""
+        symbols = list(dict.fromkeys(self.stock_symbols + self.index_symbols))
+        logger.info(f"📦 일괄 시세 수집 시작: {len(symbols)}개 심볼")
+        
+        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        
+        try:
+            # 시세 다운로드와 펀더멘털 조회를 동시에 진행
+            quotes_task = loop.run_in_executor(None, self.provider.download_intraday, symbols)
+            fundamentals_task = asyncio.gather(
+                *[self.get_fundamentals(symbol) for symbol in self.stock_symbols]
+            )
+            frames, fundamentals_list = await asyncio.gather(quotes_task, fundamentals_task)
+            self.stats['total_requests'] += 1
+        except Exception as e:
+            self.stats['failed_requests'] += 1
+            self.error_handler.handle_error(e, "일괄 시세 수집 실패")
+            logger.error(f"❌ 일괄 시세 수집 실패: {e}")
+            return self.stock_data, self.index_data
+        
+        fundamentals = dict(zip(self.stock_symbols, fundamentals_list))
+        timestamp = datetime.now().isoformat()
+        
+        for symbol in self.stock_symbols:
+            quote = self._summarize_intraday(frames.get(symbol))
+            if quote is None:
+                self.stats['failed_requests'] += 1
+                logger.warning(f"⚠️ 일괄 수집 결과에 가격 데이터 없음: {symbol}")
+                continue
+            
+            self.quote_dates[symbol] = quote['date']
+            info = fundamentals.get(symbol) or {}
+            self.stock_data[symbol] = StockData(
+                symbol=symbol,
+                name=info.get('name', symbol),
+                price=quote['price'],
+                change=quote['change'],
+                change_percent=quote['change_percent'],
+                volume=quote['volume'] or 0,
+                market_cap=info.get('market_cap'),
+                pe_ratio=info.get('pe_ratio'),
+                dividend_yield=info.get('dividend_yield'),
+                high_52w=info.get('high_52w'),
+                low_52w=info.get('low_52w'),
+                timestamp=timestamp
+            )
+            self.market_board.update_stock(symbol, quote['change_percent'])
+            self.stats['successful_requests'] += 1
+        
+        for symbol in self.index_symbols:
+            quote = self._summarize_intraday(frames.get(symbol))
+            if quote is None:
+                self.stats['failed_requests'] += 1
+                logger.warning(f"⚠️ 일괄 수집 결과에 지수 데이터 없음: {symbol}")
+                continue
+            
+            self.quote_dates[symbol] = quote['date']
+            self.index_data[symbol] = IndexData(
+                symbol=symbol,
+                name=self._get_index_name(symbol),
+                value=quote['price'],
+                change=quote['change'],
+                change_percent=quote['change_percent'],
+                volume=quote['volume'],
+                timestamp=timestamp
+            )
+            self.market_board.update_index(symbol, quote['price'], quote['change_percent'])
+            self.stats['successful_requests'] += 1
+        
+        # 통계 업데이트
+        self.market_board.publish()
+        
+        processing_time = (datetime.now() - start_time).total_seconds()
+        self.stats['processing_time'] = processing_time
+        self.stats['last_update'] = timestamp
+        
+        logger.info(f"✅ 일괄 시세 수집 완료: {len(self.stock_data)}개 종목, "
+                    f"{len(self.index_data)}개 지수 ({processing_time:.2f}초)")
+        return self.stock_data, self.index_data
+    
+    async def get_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """펀더멘털 데이터 조회 (일 단위 캐시)"""
+        cache_key = f"fundamentals_{symbol}_{datetime.now().strftime('%Y%m%d')}"
+        cached_data = cache_manager.get(cache_key)
+        
+        if cached_data is not None:
+            logger.debug(f"💾 캐시된 펀더멘털 데이터 사용: {symbol}")
+            return cached_data
+        
+        try:
+            loop = asyncio.get_running_loop()
+            fundamentals = await loop.run_in_executor(None, self.provider.get_fundamentals, symbol)
+            cache_manager.set(cache_key, fundamentals, ttl=self.fundamentals_ttl)
+            return fundamentals
+            
+        except Exception as e:
+            logger.warning(f"⚠️ 펀더멘털 데이터 조회 실패 ({symbol}): {e}")
+            return {}
+    
+    def _summarize_intraday(self, hist: Optional[pd.DataFrame]) -> Optional[Dict[str, Any]]:
+        """1분봉 데이터에서 현재가/등락 계산 (get_stock_data와 동일한 기준)"""
+        if hist is None or hist.empty:
+            return None
+        
+        current_price = float(hist['Close'].iloc[-1])
+        prev_close = float(hist['Open'].iloc[0]) if len(hist) > 1 else current_price
+        
+        change = current_price - prev_close
+        change_percent = (change / prev_close) * 100 if prev_close > 0 else 0
+        volume = int(hist['Volume'].iloc[-1]) if 'Volume' in hist.columns and not pd.isna(hist['Volume'].iloc[-1]) else None
+        
+        return {
+            'price': current_price,
+            'change': change,
+            'change_percent': change_percent,
+            'volume': volume,
+            'date': pd.Timestamp(hist.index[-1]).date()
+        }
+    
     def get_market_summary(self) -> Dict[str, Any]:
-        """시장 요약 정보"""
+        """시장 요약 정보 (수집 시 증분 갱신된 요약판 조회)"""
         try:
+            board = self.market_board.summary
+            stocks = board['stocks']
+            
             summary = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': board['timestamp'],
                 'stocks': {
-                    'total_count': len(self.stock_data),
-                    'gainers': len([s for s in self.stock_data.values() if s.change > 0]),
-                    'losers': len([s for s in self.stock_data.values() if s.change < 0]),
-                    'unchanged': len([s for s in self.stock_data.values() if s.change == 0]),
-                    'top_gainers': sorted(self.stock_data.values(), key=lambda x: x.change_percent, reverse=True)[:5],
-                    'top_losers': sorted(self.stock_data.values(), key=lambda x: x.change_percent)[:5]
-                },
-                'indices': {
-                    'total_count': len(self.index_data),
-                    'summary': [{'symbol': k, 'value': v.value, 'change': v.change_percent} 
-                               for k, v in self.index_data.items()]
+                    'total_count': stocks['total_count'],
+                    'gainers': stocks['gainers'],
+                    'losers': stocks['losers'],
+                    'unchanged': stocks['unchanged'],
+                    'top_gainers': [self.stock_data[s] for s in stocks['top_gainers'] if s in self.stock_data],
+                    'top_losers': [self.stock_data[s] for s in stocks['top_losers'] if s in self.stock_data]
                 },
+                'indices': board['indices'],
                 'statistics': self.stats
             }
             
@@ -361,6 +583,7 @@ class FinancialDataCollector:
             data = {
                 'stocks': {k: v.__dict__ for k, v in self.stock_data.items()},
                 'indices': {k: v.__dict__ for k, v in self.index_data.items()},
+                'technical_indicators': self.technical_indicators,
                 'summary': self.get_market_summary(),
                 'timestamp': datetime.now().isoformat()
             }
@@ -0,0 +1,347 @@
+"""
+⏱️ 장중 시세 모니터
+종목별 1분봉 링 버퍼, 폴링 루프, 증분 시장 요약 (상승/하락 집계, 상위 변동 종목)
+"""
+
+import asyncio
+import heapq
+import json
+import os
+from datetime import datetime, time, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+BAR_FIELDS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+# 한국 거래소 심볼 (그 외는 미국 시장 시간 적용)
+KRX_SUFFIXES = ('.KS', '.KQ')
+KRX_INDICES = {'^KS11', '^KQ11'}
+
+def symbol_market(symbol: str) -> str:
+    """심볼의 거래 시장"""
+    return 'KRX' if symbol.endswith(KRX_SUFFIXES) or symbol in KRX_INDICES else 'US'
+
+class BarRingBuffer:
+    """고정 크기 1분봉 링 버퍼"""
+    
+    def __init__(self, capacity: int = 390):
+        self.capacity = capacity
+        self.bars = np.full((capacity, len(BAR_FIELDS)), np.nan)
+        self.head = 0  # 다음에 쓸 위치
+        self.size = 0
+    
+    def append(self, timestamp: float, open_: float, high: float,
+               low: float, close: float, volume: float):
+        """봉 추가 (가득 차면 가장 오래된 봉을 덮어씀)"""
+        self.bars[self.head] = (timestamp, open_, high, low, close, volume)
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        if self.size == 0:
+            return None
+        return float(self.bars[(self.head - 1) % self.capacity, 0])
+    
+    def last(self) -> Optional[Dict[str, float]]:
+        """최신 봉"""
+        if self.size == 0:
+            return None
+        return dict(zip(BAR_FIELDS, self.bars[(self.head - 1) % self.capacity].tolist()))
+    
+    def to_array(self) -> np.ndarray:
+        """시간순 정렬된 봉 배열 (size × 필드)"""
+        if self.size < self.capacity:
+            return self.bars[:self.size].copy()
+        return np.concatenate([self.bars[self.head:], self.bars[:self.head]])
+    
+    def clear(self):
+        """버퍼 초기화 (새 거래일)"""
+        self.bars.fill(np.nan)
+        self.head = 0
+        self.size = 0
+
+class MarketBoard:
+    """등락률 변경분만 반영하는 시장 요약판"""
+    
+    def __init__(self, top_k: int = 5):
+        self.top_k = top_k
+        self.changes: Dict[str, float] = {}
+        self.index_changes: Dict[str, Dict[str, float]] = {}
+        self.counts = {'gainers': 0, 'losers': 0, 'unchanged': 0}
+        
+        # (키, 버전, 종목) 힙 - 오래된 항목은 조회 시 건너뜀
+        self._versions: Dict[str, int] = {}
+        self._gainers_heap: List[Tuple[float, int, str]] = []
+        self._losers_heap: List[Tuple[float, int, str]] = []
+        
+        self._summary: Dict[str, Any] = self._build_summary()
+    
+    @staticmethod
+    def _bucket(change: float) -> str:
+        if change > 0:
+            return 'gainers'
+        if change < 0:
+            return 'losers'
+        return 'unchanged'
+    
+    def update_stock(self, symbol: str, change_percent: float):
+        """종목 등락률 반영 - 집계는 O(1), 힙 삽입은 O(log n)"""
+        previous = self.changes.get(symbol)
+        if previous == change_percent:
+            return
+        
+        if previous is not None:
+            self.counts[self._bucket(previous)] -= 1
+        self.counts[self._bucket(change_percent)] += 1
+        self.changes[symbol] = change_percent
+        
+        version = self._versions.get(symbol, 0) + 1
+        self._versions[symbol] = version
+        heapq.heappush(self._gainers_heap, (-change_percent, version, symbol))
+        heapq.heappush(self._losers_heap, (change_percent, version, symbol))
+        
+        # 오래된 항목이 과도하게 쌓이면 압축
+        if len(self._gainers_heap) > 4 * max(len(self.changes), self.top_k):
+            self._compact()
+    
+    def update_index(self, symbol: str, value: float, change_percent: float):
+        """지수 변동 반영"""
+        self.index_changes[symbol] = {'value': value, 'change': change_percent}
+    
+    def remove_stock(self, symbol: str):
+        """종목 제거"""
+        previous = self.changes.pop(symbol, None)
+        if previous is not None:
+            self.counts[self._bucket(previous)] -= 1
+            self._versions[symbol] = self._versions.get(symbol, 0) + 1
+    
+    def _compact(self):
+        """최신 버전 항목만 남기고 힙 재구성"""
+        self._gainers_heap = [(-c, self._versions[s], s) for s, c in self.changes.items()]
+        self._losers_heap = [(c, self._versions[s], s) for s, c in self.changes.items()]
+        heapq.heapify(self._gainers_heap)
+        heapq.heapify(self._losers_heap)
+    
+    def _top(self, gainers: bool) -> List[str]:
+        """힙에서 최신 버전 상위 k개 종목"""
+        heap = self._gainers_heap if gainers else self._losers_heap
+        
+        # 루트의 오래된 항목 제거
+        while heap and heap[0][1] != self._versions.get(heap[0][2]):
+            heapq.heappop(heap)
+        
+        result = []
+        for _, version, symbol in heapq.nsmallest(self.top_k * 4, heap):
+            if version == self._versions.get(symbol) and symbol in self.changes:
+                result.append(symbol)
+                if len(result) == self.top_k:
+                    break
+        
+        if len(result) < min(self.top_k, len(self.changes)):
+            # 오래된 항목이 많아 후보가 부족한 경우
+            self._compact()
+            heap = self._gainers_heap if gainers else self._losers_heap
+            return [s for _, _, s in heapq.nsmallest(self.top_k, heap)]
+        return result
+    
+    def _build_summary(self) -> Dict[str, Any]:
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'stocks': {
+                'total_count': len(self.changes),
+                **self.counts,
+                'top_gainers': self._top(gainers=True) if self.changes else [],
+                'top_losers': self._top(gainers=False) if self.changes else []
+            },
+            'indices': {
+                'total_count': len(self.index_changes),
+                'summary': [{'symbol': k, **v} for k, v in self.index_changes.items()]
+            }
+        }
+    
+    def publish(self) -> Dict[str, Any]:
+        """현재 상태로 요약 갱신 (폴링 주기마다 1회)"""
+        self._summary = self._build_summary()
+        return self._summary
+    
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """마지막으로 게시된 요약 - O(1)"""
+        return self._summary
+
+class IntradayMonitor:
+    """장중 1분봉 폴링 모니터"""
+    
+    def __init__(self, collector, capacity: int = 390,
+                 poll_interval: Optional[int] = None,
+                 summary_path: Optional[str] = None):
+        self.collector = collector
+        self.capacity = capacity
+        self.poll_interval = poll_interval or FINANCIAL_CONFIG.get('intraday_poll_interval', 60)
+        self.summary_path = summary_path or FINANCIAL_CONFIG.get('intraday_summary_path', "data/intraday_summary.json")
+        self.sessions = {
+            market: (ZoneInfo(tz), time.fromisoformat(open_), time.fromisoformat(close))
+            for market, (tz, open_, close) in FINANCIAL_CONFIG.get('intraday_sessions', {}).items()
+        }
+        
+        self.buffers: Dict[str, BarRingBuffer] = {}
+        self.day_open: Dict[str, float] = {}
+        self.board = getattr(collector, 'market_board', None) or MarketBoard()
+        self._running = False
+        
+        self.stats = {
+            'polls': 0,
+            'bars_appended': 0,
+            'failed_polls': 0,
+            'skipped_polls': 0,
+            'last_poll': None
+        }
+    
+    @property
+    def symbols(self) -> List[str]:
+        return list(dict.fromkeys(self.collector.stock_symbols + self.collector.index_symbols))
+    
+    def is_market_open(self, market: str, now: Optional[datetime] = None) -> bool:
+        """시장 거래 시간 여부 (평일 개장~마감, 휴장일은 고려하지 않음 - 새 봉이 없으면 게시하지 않음)"""
+        session = self.sessions.get(market)
+        if session is None:
+            return True
+        
+        tz, open_time, close_time = session
+        local = (now or datetime.now(timezone.utc)).astimezone(tz)
+        return local.weekday() < 5 and open_time <= local.time() <= close_time
+    
+    def open_symbols(self, now: Optional[datetime] = None) -> List[str]:
+        """거래 시간 중인 시장의 심볼"""
+        return [s for s in self.symbols if self.is_market_open(symbol_market(s), now)]
+    
+    def _buffer(self, symbol: str) -> BarRingBuffer:
+        if symbol not in self.buffers:
+            self.buffers[symbol] = BarRingBuffer(self.capacity)
+        return self.buffers[symbol]
+    
+    def ingest(self, symbol: str, hist: pd.DataFrame) -> int:
+        """다운로드한 1분봉 중 새 봉만 버퍼에 추가"""
+        if hist is None or hist.empty:
+            return 0
+        
+        buffer = self._buffer(symbol)
+        first_ts = pd.Timestamp(hist.index[0]).timestamp()
+        
+        # 새 거래일 시작 시 버퍼 초기화
+        if buffer.size and (pd.Timestamp(first_ts, unit='s').date()
+                            != pd.Timestamp(buffer.last_timestamp, unit='s').date()):
+            buffer.clear()
+        
+        self.day_open[symbol] = float(hist['Open'].iloc[0])
+        last_ts = buffer.last_timestamp
+        
+        appended = 0
+        for index, row in hist.iterrows():
+            ts = pd.Timestamp(index).timestamp()
+            if last_ts is not None and ts <= last_ts:
+                continue
+            buffer.append(ts, row['Open'], row['High'], row['Low'], row['Close'],
+                          row.get('Volume', np.nan))
+            appended += 1
+        
+        if appended:
+            self._apply_latest(symbol)
+        
+        return appended
+    
+    def _apply_latest(self, symbol: str):
+        """최신 봉으로 요약판 갱신 (get_stock_data와 동일한 등락 기준)"""
+        bar = self._buffer(symbol).last()
+        open_price = self.day_open.get(symbol)
+        if bar is None or not open_price:
+            return
+        
+        change_percent = (bar['close'] - open_price) / open_price * 100
+        if symbol in self.collector.index_symbols:
+            self.board.update_index(symbol, bar['close'], change_percent)
+        else:
+            self.board.update_stock(symbol, change_percent)
+    
+    async def poll_once(self, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """1회 폴링: 장중 심볼 일괄 1분봉 다운로드 → 새 봉 추가 → 요약 게시
+        
+        장외 시간에는 다운로드하지 않고, 새 봉이 없으면 게시하지 않는다
+        (요약 시각이 갱신되면 대시보드가 일별 수집 결과 대신 지난 장중 요약을 사용하므로).
+        """
+        symbols = self.open_symbols(now)
+        if not symbols:
+            self.stats['skipped_polls'] += 1
+            return self.board.summary
+        
+        loop = asyncio.get_running_loop()
+        appended = 0
+        try:
+            frames = await loop.run_in_executor(None, self.collector.provider.download_intraday, symbols)
+            appended = sum(self.ingest(symbol, hist) for symbol, hist in frames.items())
+            
+            self.stats['polls'] += 1
+            self.stats['bars_appended'] += appended
+            self.stats['last_poll'] = datetime.now().isoformat()
+        
+        except Exception as e:
+            self.stats['failed_polls'] += 1
+            logger.error(f"❌ 장중 시세 폴링 실패: {e}")
+        
+        if not appended:
+            return self.board.summary
+        
+        summary = self.board.publish()
+        self.save_summary()
+        return summary
+    
+    async def run(self, max_polls: Optional[int] = None):
+        """폴링 루프"""
+        self._running = True
+        logger.info(f"⏱️ 장중 모니터 시작: {len(self.symbols)}개 심볼, {self.poll_interval}초 간격")
+        
+        polls = 0
+        while self._running and (max_polls is None or polls < max_polls):
+            await self.poll_once()
+            polls += 1
+            await asyncio.sleep(self.poll_interval)
+        
+        logger.info("⏹️ 장중 모니터 종료")
+    
+    def stop(self):
+        """폴링 루프 중지"""
+        self._running = False
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """현재 시장 요약 - O(1)"""
+        return self.board.summary
+    
+    def get_bars(self, symbol: str) -> pd.DataFrame:
+        """종목 1분봉 (시간순)"""
+        if symbol not in self.buffers:
+            return pd.DataFrame(columns=BAR_FIELDS[1:])
+        
+        bars = self.buffers[symbol].to_array()
+        df = pd.DataFrame(bars[:, 1:], columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        df.index = pd.to_datetime(bars[:, 0], unit='s')
+        return df
+    
+    def save_summary(self):
+        """대시보드용 요약 저장 (대시보드가 쓰는 도중의 파일을 읽지 않도록 임시 파일 후 교체)"""
+        try:
+            tmp_path = f"{self.summary_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({**self.board.summary, 'changes': self.board.changes, 'statistics': self.stats},
+                          f, ensure_ascii=False, indent=2, default=str)
+            os.replace(tmp_path, self.summary_path)
+        except Exception as e:
+            logger.error(f"❌ 장중 요약 저장 실패: {e}")
@@ -8,6 +8,15 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 from auto_finance.core.financial_data import FinancialDataCollector
+from auto_finance.core.feature_store import feature_store
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+# 시장 트렌드 예측 가중치 (백테스터도 같은 값을 사용)
+MARKET_TREND_WEIGHTS = {
+    'sentiment_weight': 0.4,       # 감정 분석 가중치
+    'price_weight': 0.3,           # 가격 변동 가중치
+    'volume_weight': 0.3           # 거래량 가중치
+}
 
 class MarketAnalyzer:
     def __init__(self):
@@ -16,9 +25,7 @@ class MarketAnalyzer:
         # 분석 설정
         self.analysis_config = {
             'correlation_threshold': 0.3,  # 상관관계 임계값
-            'sentiment_weight': 0.4,       # 감정 분석 가중치
-            'price_weight': 0.3,           # 가격 변동 가중치
-            'volume_weight': 0.3           # 거래량 가중치
+            **MARKET_TREND_WEIGHTS
         }
     
     def analyze_news_market_correlation(self, news_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -247,7 +254,8 @@ class MarketAnalyzer:
             'total_news_count': total_news
         }
     
-    def _analyze_news_sentiment(self, news_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    @staticmethod
+    def _analyze_news_sentiment(news_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """뉴스 감정 분석"""
         # 간단한 감정 분석 (실제로는 감정 분석 모델 사용)
         positive_count = 0
@@ -282,12 +290,15 @@ class MarketAnalyzer:
         """기술적 지표 계산"""
         # 간단한 기술적 지표 (실제로는 더 복잡한 계산 필요)
         indices = market_data.get('market_overview', {}).get('indices', {})
+        if not indices:
+            # 시장 데이터가 없으면 피처 저장소의 최신 지수 피처 사용
+            indices = feature_store.get_snapshot(FINANCIAL_CONFIG.get('index_symbols', []))
         
         technical_indicators = {}
         
         for index_name, index_data in indices.items():
-            change_percent = index_data.get('change_percent', 0)
-            volume = index_data.get('volume', 0)
+            change_percent = index_data.get('change_percent') or 0
+            volume = index_data.get('volume') or 0
             
             # 모멘텀 지표
             momentum = '강한 상승' if change_percent > 2 else '상승' if change_percent > 0 else '하락' if change_percent < -2 else '약한 하락'
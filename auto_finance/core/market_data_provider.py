@@ -0,0 +1,258 @@
+"""
+🔌 시세 데이터 제공자
+yfinance 구현과 오프라인 재생(replay) 구현을 공통 인터페이스로 제공
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import pandas as pd
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+FUNDAMENTAL_FIELDS = {
+    'name': 'longName',
+    'market_cap': 'marketCap',
+    'pe_ratio': 'trailingPE',
+    'dividend_yield': 'dividendYield',
+    'high_52w': 'fiftyTwoWeekHigh',
+    'low_52w': 'fiftyTwoWeekLow'
+}
+
+def period_to_days(period: str) -> int:
+    """yfinance 기간 문자열을 일수로 변환"""
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        return 365
+    
+    value, unit = int(match.group(1)), match.group(2)
+    return value * {'d': 1, 'wk': 7, 'mo': 31, 'y': 365}[unit]
+
+class MarketDataProvider:
+    """시세 데이터 제공자 기본 클래스 (동기 API - executor에서 호출)"""
+    
+    name = 'base'
+    
+    def get_history(self, symbol: str, period: Optional[str] = None,
+                    start: Optional[date] = None, end: Optional[date] = None,
+                    interval: str = "1d") -> pd.DataFrame:
+        """OHLCV 이력 (DatetimeIndex, Open/High/Low/Close/Volume)"""
+        raise NotImplementedError
+    
+    def download_intraday(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        """다중 종목 당일 1분봉"""
+        raise NotImplementedError
+    
+    def get_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        """펀더멘털 (name, market_cap, pe_ratio, dividend_yield, high_52w, low_52w)"""
+        raise NotImplementedError
+
+class YFinanceProvider(MarketDataProvider):
+    """yfinance 기반 제공자"""
+    
+    name = 'yfinance'
+    
+    def __init__(self):
+        import yfinance as yf
+        self.yf = yf
+    
+    def get_history(self, symbol: str, period: Optional[str] = None,
+                    start: Optional[date] = None, end: Optional[date] = None,
+                    interval: str = "1d") -> pd.DataFrame:
+        ticker = self.yf.Ticker(symbol)
+        if start is not None:
+            # yfinance의 end는 배타적이므로 하루 더함
+            end = (end or date.today()) + timedelta(days=1)
+            return ticker.history(start=start.isoformat(), end=end.isoformat(), interval=interval)
+        return ticker.history(period=period or "1y", interval=interval)
+    
+    def download_intraday(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        if not symbols:
+            return {}
+        
+        data = self.yf.download(
+            tickers=symbols,
+            period="1d",
+            interval="1m",
+            group_by='ticker',
+            threads=True,
+            progress=False
+        )
+        
+        if data is None or data.empty:
+            return {}
+        
+        # 단일 종목이면 컬럼이 MultiIndex가 아님
+        if not isinstance(data.columns, pd.MultiIndex):
+            return {symbols[0]: data}
+        
+        frames = {}
+        available = set(data.columns.get_level_values(0))
+        for symbol in symbols:
+            if symbol in available:
+                frames[symbol] = data[symbol].dropna(how='all')
+        return frames
+    
+    def get_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        info = self.yf.Ticker(symbol).info
+        fundamentals = {key: info.get(field) for key, field in FUNDAMENTAL_FIELDS.items()}
+        fundamentals['name'] = fundamentals['name'] or symbol
+        return fundamentals
+
+class ReplayProvider(MarketDataProvider):
+    """녹화된 파일 기반 오프라인 제공자
+    
+    디렉토리 구조:
+        history/{symbol}.csv    일봉 (Date, Open, High, Low, Close, Volume)
+        intraday/{symbol}.csv   1분봉 (Datetime, Open, High, Low, Close, Volume)
+        fundamentals.json       {symbol: {name, market_cap, ...}}
+    """
+    
+    name = 'replay'
+    
+    def __init__(self, data_dir: str = "data/replay", latency_ms: float = 0.0,
+                 jitter_ms: float = 0.0, seed: int = 42):
+        self.data_dir = Path(data_dir)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._fundamentals: Optional[Dict[str, Dict[str, Any]]] = None
+        
+        self.stats = {
+            'requests': 0,
+            'misses': 0,
+            'simulated_latency': 0.0
+        }
+        
+        logger.info(f"📼 재생 제공자 초기화: {self.data_dir} (지연 {latency_ms}±{jitter_ms}ms)")
+    
+    def _simulate_latency(self):
+        """설정된 지연 재현 (시드 고정으로 재현 가능)"""
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)
+            delay = max(delay, 0.0) / 1000
+            self.stats['simulated_latency'] += delay
+        
+        if delay:
+            time.sleep(delay)
+    
+    def _load(self, kind: str, symbol: str) -> pd.DataFrame:
+        """CSV 로드 (메모리 캐시)"""
+        key = f"{kind}/{symbol}"
+        if key not in self._frames:
+            path = self.data_dir / kind / f"{symbol}.csv"
+            if path.exists():
+                df = pd.read_csv(path, index_col=0)
+                # 거래소 현지 시각 그대로 사용 (UTC로 바꾸면 KST 일봉이 전날 날짜가 됨)
+                df.index = pd.DatetimeIndex([pd.Timestamp(value).tz_localize(None) for value in df.index])
+                self._frames[key] = df
+            else:
+                self.stats['misses'] += 1
+                self._frames[key] = pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        return self._frames[key]
+    
+    def get_history(self, symbol: str, period: Optional[str] = None,
+                    start: Optional[date] = None, end: Optional[date] = None,
+                    interval: str = "1d") -> pd.DataFrame:
+        self._simulate_latency()
+        df = self._load('history' if interval == "1d" else 'intraday', symbol)
+        if df.empty:
+            return df.copy()
+        
+        dates = df.index.date
+        if start is not None:
+            mask = dates >= start
+            if end is not None:
+                mask &= dates <= end
+            return df[mask].copy()
+        
+        first = dates[-1] - timedelta(days=period_to_days(period or "1y"))
+        return df[dates > first].copy()
+    
+    def download_intraday(self, symbols: List[str]) -> Dict[str, pd.DataFrame]:
+        # 일괄 다운로드는 1회 요청으로 간주
+        self._simulate_latency()
+        frames = {}
+        for symbol in symbols:
+            df = self._load('intraday', symbol)
+            if not df.empty:
+                frames[symbol] = df.copy()
+        return frames
+    
+    def get_fundamentals(self, symbol: str) -> Dict[str, Any]:
+        self._simulate_latency()
+        if self._fundamentals is None:
+            path = self.data_dir / 'fundamentals.json'
+            self._fundamentals = {}
+            if path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._fundamentals = json.load(f)
+        
+        fundamentals = {key: None for key in FUNDAMENTAL_FIELDS}
+        fundamentals.update(self._fundamentals.get(symbol, {}))
+        fundamentals['name'] = fundamentals['name'] or symbol
+        return fundamentals
+
+def record_replay_data(provider: MarketDataProvider, symbols: List[str],
+                       data_dir: str = "data/replay", period: str = "1y") -> Dict[str, int]:
+    """실제 제공자 응답을 재생용 파일로 녹화"""
+    root = Path(data_dir)
+    (root / 'history').mkdir(parents=True, exist_ok=True)
+    (root / 'intraday').mkdir(parents=True, exist_ok=True)
+    
+    recorded = {'history': 0, 'intraday': 0, 'fundamentals': 0}
+    fundamentals = {}
+    
+    for symbol in symbols:
+        try:
+            hist = provider.get_history(symbol, period=period)
+            if not hist.empty:
+                hist.to_csv(root / 'history' / f"{symbol}.csv")
+                recorded['history'] += 1
+            fundamentals[symbol] = provider.get_fundamentals(symbol)
+            recorded['fundamentals'] += 1
+        except Exception as e:
+            logger.warning(f"⚠️ 녹화 실패 ({symbol}): {e}")
+    
+    for symbol, frame in provider.download_intraday(symbols).items():
+        frame.to_csv(root / 'intraday' / f"{symbol}.csv")
+        recorded['intraday'] += 1
+    
+    with open(root / 'fundamentals.json', 'w', encoding='utf-8') as f:
+        json.dump(fundamentals, f, ensure_ascii=False, indent=2, default=str)
+    
+    logger.info(f"📼 재생 데이터 녹화 완료: {root} {recorded}")
+    return recorded
+
+_provider: Optional[MarketDataProvider] = None
+
+def get_market_data_provider() -> MarketDataProvider:
+    """설정(FINANCIAL_CONFIG['data_provider'])에 따른 공용 제공자"""
+    global _provider
+    if _provider is None:
+        if FINANCIAL_CONFIG.get('data_provider', 'yfinance') == 'replay':
+            _provider = ReplayProvider(
+                data_dir=FINANCIAL_CONFIG.get('replay_dir', 'data/replay'),
+                latency_ms=FINANCIAL_CONFIG.get('replay_latency_ms', 0.0),
+                jitter_ms=FINANCIAL_CONFIG.get('replay_jitter_ms', 0.0)
+            )
+        else:
+            _provider = YFinanceProvider()
+    return _provider
+
+def set_market_data_provider(provider: MarketDataProvider):
+    """공용 제공자 교체 (벤치마크/테스트용)"""
+    global _provider
+    _provider = provider
@@ -4,23 +4,64 @@
 """
 
 import asyncio
+import atexit
+import hashlib
 import json
+import os
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import numpy as np
 import pandas as pd
 from textblob import TextBlob
-import yfinance as yf
 import requests
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from auto_finance.utils.logger import setup_logger
+from auto_finance.core.market_data_provider import MarketDataProvider, get_market_data_provider
+from auto_finance.core.feature_store import feature_store
+from auto_finance.core.sentiment_lexicon import korean_lexicon
+from auto_finance.core.sentiment_timeseries import sentiment_timeseries
 from auto_finance.config.settings import FINANCIAL_CONFIG
 
 logger = setup_logger(__name__)
 
+# 워커 프로세스별 VADER 분석기 (풀 초기화 시 생성)
+_worker_vader: Optional[SentimentIntensityAnalyzer] = None
+
+def _init_sentiment_worker():
+    global _worker_vader
+    _worker_vader = SentimentIntensityAnalyzer()
+
+def _korean_sentiment(text: str) -> float:
+    """한국어 가중치 사전 감정 분석 (-1~1)"""
+    total_words = len(text.split())
+    if total_words == 0:
+        return 0.0
+    
+    # 가중 순감정을 단어 수로 나눈 뒤 -1에서 1 사이로 정규화
+    sentiment_score = korean_lexicon.score(text).net / total_words
+    return max(-1.0, min(1.0, sentiment_score * 10))
+
+def _raw_text_scores(text: str, vader: SentimentIntensityAnalyzer) -> Tuple[float, ...]:
+    """(VADER pos, neg, neu, compound, TextBlob 극성, 한국어 점수)"""
+    vader_scores = vader.polarity_scores(text)
+    return (
+        vader_scores['pos'],
+        vader_scores['neg'],
+        vader_scores['neu'],
+        vader_scores['compound'],
+        TextBlob(text).sentiment.polarity,
+        _korean_sentiment(text)
+    )
+
+def _score_text_chunk(texts: List[str]) -> List[Tuple[float, ...]]:
+    """프로세스 풀 작업 단위 (청크 단위로 전달해 직렬화 비용 상쇄)"""
+    return [_raw_text_scores(text, _worker_vader) for text in texts]
+
 @dataclass
 class SentimentScore:
     """감정 점수 데이터 클래스"""
@@ -57,20 +98,12 @@ class NewsSentiment:
 class MarketSentimentAnalyzer:
     """시장 감정 분석 시스템"""
     
-    def __init__(self):
+    def __init__(self, provider: Optional[MarketDataProvider] = None):
         self.vader_analyzer = SentimentIntensityAnalyzer()
+        self._provider = provider
         
-        # 한국어 감정 사전 확장
-        self.korean_sentiment_words = {
-            'positive': [
-                '상승', '급등', '호재', '성장', '실적', '수익', '이익', '증가', '개선', '회복',
-                '강세', '돌파', '상향', '긍정', '낙관', '기대', '희망', '성공', '돌파', '신기록'
-            ],
-            'negative': [
-                '하락', '급락', '악재', '손실', '감소', '악화', '위험', '우려', '불안', '공포',
-                '약세', '하향', '부정', '비관', '실망', '실패', '위기', '폭락', '침체', '파산'
-            ]
-        }
+        # 한국어 가중치 감정 사전 (워커 프로세스도 같은 전역 사전 사용)
+        self.lexicon = korean_lexicon
         
         # 감정 분석 가중치
         self.sentiment_weights = {
@@ -80,6 +113,18 @@ class MarketSentimentAnalyzer:
             'market_indicators': 0.2
         }
         
+        # 일괄 분석 설정 (텍스트 해시 → 원시 점수 LRU 캐시)
+        self.batch_config = {
+            'chunk_size': 256,
+            'workers': os.cpu_count() or 1,
+            'cache_size': 50000
+        }
+        self._score_cache: 'OrderedDict[str, Tuple[float, ...]]' = OrderedDict()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        
+        # 기사 감정 시계열 집계기
+        self.timeseries = sentiment_timeseries
+        
         self.stats = {
             'total_analyses': 0,
             'successful_analyses': 0,
@@ -89,7 +134,11 @@ class MarketSentimentAnalyzer:
                 'positive': 0,
                 'neutral': 0,
                 'negative': 0
-            }
+            },
+            'texts_requested': 0,
+            'texts_scored': 0,
+            'cache_hits': 0,
+            'texts_per_second': 0.0
         }
     
     async def analyze_news_sentiment(self, articles: List[Dict[str, Any]]) -> List[NewsSentiment]:
@@ -100,10 +149,19 @@ class MarketSentimentAnalyzer:
         start_time = time.time()
         
         try:
+            # 전체 제목/본문을 한 번에 일괄 분석
+            texts = []
             for article in articles:
+                texts.append(article.get('title', ''))
+                texts.append(article.get('content', ''))
+            scores = await self.analyze_texts_batch(texts)
+            
+            scored_articles = []
+            for i, article in enumerate(articles):
                 try:
-                    sentiment = await self._analyze_single_article(article)
+                    sentiment = self._build_news_sentiment(article, scores[2 * i], scores[2 * i + 1])
                     results.append(sentiment)
+                    scored_articles.append(article)
                     self.stats['successful_analyses'] += 1
                     
                 except Exception as e:
@@ -111,6 +169,10 @@ class MarketSentimentAnalyzer:
                     self.stats['failed_analyses'] += 1
                     continue
             
+            # 분/시간/일 버킷 시계열에 누적 (대시보드/상관관계 분석기는 버킷만 조회)
+            self.timeseries.add_articles(scored_articles, [r.overall_sentiment.compound for r in results])
+            self.timeseries.save()
+            
             processing_time = time.time() - start_time
             self.stats['total_analyses'] += len(articles)
             self.stats['average_processing_time'] = processing_time / len(articles) if articles else 0
@@ -124,16 +186,18 @@ class MarketSentimentAnalyzer:
     
     async def _analyze_single_article(self, article: Dict[str, Any]) -> NewsSentiment:
         """단일 기사 감정 분석"""
+        title_sentiment, content_sentiment = await self.analyze_texts_batch(
+            [article.get('title', ''), article.get('content', '')]
+        )
+        return self._build_news_sentiment(article, title_sentiment, content_sentiment)
+    
+    def _build_news_sentiment(self, article: Dict[str, Any], title_sentiment: SentimentScore,
+                              content_sentiment: SentimentScore) -> NewsSentiment:
+        """제목/본문 점수로 기사 감정 구성"""
         article_id = article.get('id', str(hash(article.get('title', ''))))
         title = article.get('title', '')
         content = article.get('content', '')
         
-        # 제목 감정 분석
-        title_sentiment = await self._analyze_text_sentiment(title)
-        
-        # 본문 감정 분석
-        content_sentiment = await self._analyze_text_sentiment(content)
-        
         # 전체 감정 점수 계산
         overall_sentiment = self._calculate_overall_sentiment(title_sentiment, content_sentiment)
         
@@ -155,18 +219,90 @@ class MarketSentimentAnalyzer:
     
     async def _analyze_text_sentiment(self, text: str) -> SentimentScore:
         """텍스트 감정 분석"""
-        if not text or len(text.strip()) < 10:
-            return SentimentScore(0.0, 0.0, 1.0, 0.0, 0.0, 'empty_text', datetime.now())
+        return (await self.analyze_texts_batch([text]))[0]
+    
+    @staticmethod
+    def _is_empty_text(text: str) -> bool:
+        return not text or len(text.strip()) < 10
+    
+    @staticmethod
+    def _text_key(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.batch_config['workers'],
+                initializer=_init_sentiment_worker
+            )
+            # close()가 호출되지 않아도 인터프리터 종료 시 워커 정리
+            atexit.register(self.close)
+        return self._pool
+    
+    async def analyze_texts_batch(self, texts: List[str]) -> List[SentimentScore]:
+        """텍스트 일괄 감정 분석 (해시 메모이제이션 + 청크 단위 프로세스 병렬)"""
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        
+        # 캐시에 없는 고유 텍스트만 분석 (이번 배치 점수는 캐시 정리와 무관하게 따로 보관)
+        keys = [None if self._is_empty_text(text) else self._text_key(text) for text in texts]
+        batch_scores: Dict[str, Tuple[float, ...]] = {}
+        pending: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key is None or key in pending or key in batch_scores:
+                continue
+            if key in self._score_cache:
+                self._score_cache.move_to_end(key)
+                batch_scores[key] = self._score_cache[key]
+                self.stats['cache_hits'] += 1
+            else:
+                pending[key] = text
+        
+        if pending:
+            misses = list(pending.values())
+            chunk_size = self.batch_config['chunk_size']
+            
+            if len(misses) <= chunk_size or self.batch_config['workers'] <= 1:
+                # 소량은 풀 오버헤드 없이 스레드에서 처리 (이벤트 루프 비차단)
+                raw_scores = await loop.run_in_executor(None, lambda: [
+                    _raw_text_scores(text, self.vader_analyzer) for text in misses
+                ])
+            else:
+                pool = self._get_pool()
+                chunks = await asyncio.gather(*[
+                    loop.run_in_executor(pool, _score_text_chunk, misses[i:i + chunk_size])
+                    for i in range(0, len(misses), chunk_size)
+                ])
+                raw_scores = [raw for chunk in chunks for raw in chunk]
+            
+            for key, raw in zip(pending, raw_scores):
+                batch_scores[key] = raw
+                self._score_cache[key] = raw
+            while len(self._score_cache) > self.batch_config['cache_size']:
+                self._score_cache.popitem(last=False)
+        
+        results = [
+            SentimentScore(0.0, 0.0, 1.0, 0.0, 0.0, 'empty_text', datetime.now()) if key is None
+            else self._build_sentiment_score(text, batch_scores[key])
+            for key, text in zip(keys, texts)
+        ]
         
-        # VADER 감정 분석
-        vader_scores = self.vader_analyzer.polarity_scores(text)
+        elapsed = time.time() - start_time
+        self.stats['texts_requested'] += len(texts)
+        self.stats['texts_scored'] += len(pending)
+        if elapsed > 0 and texts:
+            self.stats['texts_per_second'] = len(texts) / elapsed
         
-        # TextBlob 감정 분석
-        blob = TextBlob(text)
-        textblob_sentiment = blob.sentiment.polarity
+        if len(texts) > self.batch_config['chunk_size']:
+            logger.info(f"⚡ 일괄 감정 분석: {len(texts)}개 텍스트 (신규 {len(pending)}개), "
+                        f"{len(texts) / elapsed if elapsed > 0 else 0:.0f} texts/sec")
         
-        # 한국어 커스텀 감정 분석
-        korean_sentiment = self._analyze_korean_sentiment(text)
+        return results
+    
+    def _build_sentiment_score(self, text: str, raw: Tuple[float, ...]) -> SentimentScore:
+        """원시 점수로 앙상블 감정 점수 구성"""
+        pos, neg, neu, vader_compound, textblob_sentiment, korean_sentiment = raw
+        vader_scores = {'pos': pos, 'neg': neg, 'neu': neu, 'compound': vader_compound}
         
         # 가중 평균 계산
         compound_score = (
@@ -190,26 +326,7 @@ class MarketSentimentAnalyzer:
     
     def _analyze_korean_sentiment(self, text: str) -> float:
         """한국어 커스텀 감정 분석"""
-        positive_count = 0
-        negative_count = 0
-        
-        for word in self.korean_sentiment_words['positive']:
-            if word in text:
-                positive_count += 1
-        
-        for word in self.korean_sentiment_words['negative']:
-            if word in text:
-                negative_count += 1
-        
-        total_words = len(text.split())
-        if total_words == 0:
-            return 0.0
-        
-        # 감정 점수 계산
-        sentiment_score = (positive_count - negative_count) / total_words
-        
-        # -1에서 1 사이로 정규화
-        return max(-1.0, min(1.0, sentiment_score * 10))
+        return _korean_sentiment(text)
     
     def _calculate_sentiment_confidence(self, text: str, vader_scores: Dict, textblob_sentiment: float) -> float:
         """감정 분석 신뢰도 계산"""
@@ -361,9 +478,14 @@ class MarketSentimentAnalyzer:
         
         return weighted_sum / total_weight if total_weight > 0 else 0.0
     
+    @property
+    def provider(self) -> MarketDataProvider:
+        return self._provider or get_market_data_provider()
+    
     async def _collect_market_indicators(self) -> Dict[str, Any]:
         """시장 지표 수집"""
         indicators = {}
+        loop = asyncio.get_running_loop()
         
         try:
             # 주요 지수 데이터
@@ -371,8 +493,20 @@ class MarketSentimentAnalyzer:
             
             for index in indices:
                 try:
-                    ticker = yf.Ticker(index)
-                    hist = ticker.history(period='5d')
+                    # 피처 저장소에 마지막 거래일까지 적재돼 있으면 우선 사용, 오래됐으면 실시간 조회
+                    latest = feature_store.get_latest(index, fresh=True)
+                    if latest.get('price_change') is not None:
+                        change_pct = latest['price_change'] * 100
+                        indicators[index] = {
+                            'current_price': latest['close'],
+                            'change_pct': change_pct,
+                            'trend': 'up' if change_pct > 0 else 'down' if change_pct < 0 else 'flat'
+                        }
+                        continue
+                    
+                    hist = await loop.run_in_executor(
+                        None, lambda symbol=index: self.provider.get_history(symbol, period='5d')
+                    )
                     
                     if not hist.empty:
                         current_price = hist['Close'].iloc[-1]
@@ -391,12 +525,19 @@ class MarketSentimentAnalyzer:
             
             # VIX 지수 (변동성)
             try:
-                vix = yf.Ticker('^VIX')
-                vix_hist = vix.history(period='5d')
-                if not vix_hist.empty:
+                vix_latest = feature_store.get_latest('^VIX', fresh=True)
+                if vix_latest:
+                    vix_value = vix_latest['close']
+                else:
+                    vix_hist = await loop.run_in_executor(
+                        None, lambda: self.provider.get_history('^VIX', period='5d')
+                    )
+                    vix_value = None if vix_hist.empty else vix_hist['Close'].iloc[-1]
+                
+                if vix_value is not None:
                     indicators['vix'] = {
-                        'current_value': vix_hist['Close'].iloc[-1],
-                        'trend': 'high' if vix_hist['Close'].iloc[-1] > 20 else 'low'
+                        'current_value': vix_value,
+                        'trend': 'high' if vix_value > 20 else 'low'
                     }
             except Exception as e:
                 logger.warning(f"VIX 데이터 수집 실패: {e}")
@@ -480,6 +621,14 @@ class MarketSentimentAnalyzer:
             'failed_analyses': self.stats['failed_analyses'],
             'success_rate': (self.stats['successful_analyses'] / self.stats['total_analyses'] * 100) if self.stats['total_analyses'] > 0 else 0,
             'average_processing_time': self.stats['average_processing_time'],
+            'batch': {
+                'texts_requested': self.stats['texts_requested'],
+                'texts_scored': self.stats['texts_scored'],
+                'cache_hits': self.stats['cache_hits'],
+                'cache_size': len(self._score_cache),
+                'texts_per_second': self.stats['texts_per_second']
+            },
+            'rolling_sentiment': self.timeseries.rolling_windows(),
             'sentiment_distribution': {
                 'positive': (self.stats['sentiment_trends']['positive'] / total_trends * 100) if total_trends > 0 else 0,
                 'neutral': (self.stats['sentiment_trends']['neutral'] / total_trends * 100) if total_trends > 0 else 0,
@@ -487,6 +636,12 @@ class MarketSentimentAnalyzer:
             }
         }
     
+    def close(self):
+        """프로세스 풀 종료"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
     def save_statistics(self, file_path: str = "data/sentiment_analysis_stats.json"):
         """통계 저장"""
         try:
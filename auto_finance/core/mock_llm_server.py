@@ -0,0 +1,467 @@
+"""
+🧪 로컬 모의 LLM 서버
+Gemini / OpenAI / Anthropic 요청 형식을 그대로 받아 스키마에 맞는 고정 응답을 반환
+지연 분포, 오류율, 레이트 리밋(429)을 설정해 실제 비용 없이 처리량/동시성 벤치마크
+
+사용:
+    python -m auto_finance.core.mock_llm_server --port 8765 --latency 0.8 --error-rate 0.02
+    AI_MOCK_LLM_URL=http://127.0.0.1:8765 python main_advanced.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.core.prompt_builder import count_tokens
+
+logger = setup_logger(__name__)
+
+# 스트리밍 응답 청크 크기 (문자)
+STREAM_CHUNK_CHARS = 64
+
+@dataclass
+class MockProfile:
+    """제공자별 모의 응답 특성"""
+    latency_mean: float = 0.8          # 평균 지연 (초)
+    latency_sigma: float = 0.4         # 로그정규 분포 형태 (0이면 고정 지연)
+    error_rate: float = 0.0            # 5xx 오류 비율
+    rate_limit_per_minute: int = 0     # 분당 허용 요청 수 (0이면 제한 없음)
+    tokens_per_second: float = 0.0     # 출력 토큰 생성 속도 (0이면 지연에 포함)
+    
+    def sample_latency(self, output_tokens: int = 0) -> float:
+        """평균이 latency_mean인 로그정규 지연 표본"""
+        latency = self.latency_mean
+        if self.latency_sigma > 0 and self.latency_mean > 0:
+            mu = -0.5 * self.latency_sigma ** 2
+            latency = self.latency_mean * random.lognormvariate(mu, self.latency_sigma)
+        if self.tokens_per_second > 0:
+            latency += output_tokens / self.tokens_per_second
+        return latency
+
+@dataclass
+class ProviderState:
+    """제공자별 레이트 리밋 창 / 통계"""
+    window: Deque[float] = field(default_factory=deque)
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    streams: int = 0
+    streams_cancelled: int = 0
+
+def _fact_check_response() -> str:
+    return json.dumps({
+        'fact_check_score': round(random.uniform(0.6, 0.95), 2),
+        'confidence': round(random.uniform(0.7, 0.95), 2),
+        'verification_status': 'verified',
+        'evidence': ['공시 자료와 수치가 일치합니다', '복수 매체에서 동일한 내용을 보도했습니다'],
+        'reasoning': '기사에 언급된 수치와 일정이 공개 자료와 일치해 사실로 판단됩니다.'
+    }, ensure_ascii=False)
+
+def _article_body(words: int) -> str:
+    paragraphs = [
+        '## 시장 현황 분석\n주요 지수는 외국인 순매수에 힘입어 상승 흐름을 이어가고 있습니다. 거래대금 데이터도 증가세를 보였습니다.',
+        '## 핵심 포인트 분석\n실적 개선 근거로 반도체 업황 회복과 환율 안정이 꼽힙니다. 구체적인 수치는 공시 자료에서 확인됩니다.',
+        '## 투자자 관점에서의 인사이트\n단기 변동성보다 이익 추정치 변화에 주목할 필요가 있습니다. 분할 매수 전략이 유효합니다.',
+        '## 리스크 요인\n금리 경로와 글로벌 수요 둔화는 여전히 불확실성 요인입니다.',
+        '## 향후 전망\n하반기 실적 발표를 앞두고 업종별 차별화가 진행될 전망입니다.'
+    ]
+    text = '\n\n'.join(paragraphs)
+    while len(text.split()) < words:
+        text += '\n\n' + random.choice(paragraphs).split('\n', 1)[1]
+    return text
+
+def _content_response(words: int) -> str:
+    body = _article_body(words)
+    return json.dumps({
+        'title': '시장 분석: 외국인 순매수와 실적 개선 기대',
+        'content': body,
+        'summary': '외국인 순매수와 실적 개선 기대가 지수 상승을 이끌었습니다.',
+        'keywords': ['주식', '투자', '시장 분석'],
+        'seo_score': 0.82,
+        'readability_score': 0.78
+    }, ensure_ascii=False)
+
+def canned_completion(prompt: str, max_tokens: int = 1000) -> str:
+    """프롬프트 유형에 맞는 스키마 준수 고정 응답"""
+    words = max(100, min(max_tokens // 2, 600))
+    if 'fact_check_score' in prompt:
+        return _fact_check_response()
+    if 'seo_score' in prompt and 'readability_score' in prompt:
+        return _content_response(words)
+    if 'Fact Status' in prompt or '사실 여부' in prompt:
+        return ('- 사실 여부: 확인됨 (Verified)\n- 신뢰도 점수: 85\n'
+                '- 근거: 공시 데이터와 복수 매체 보도가 일치합니다 (evidence)\n- 결론: 기사 내용은 사실로 판단됩니다.')
+    return _article_body(words)
+
+class MockLLMServer:
+    """Gemini / OpenAI / Anthropic 호환 모의 서버"""
+    
+    PROVIDERS = ('gemini', 'openai', 'anthropic')
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 8765,
+                 profiles: Optional[Dict[str, MockProfile]] = None, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.profiles = {name: MockProfile() for name in self.PROVIDERS}
+        self.profiles.update(profiles or {})
+        self.states = {name: ProviderState() for name in self.PROVIDERS}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._runner: Optional[web.AppRunner] = None
+        
+        if seed is not None:
+            random.seed(seed)
+        
+        self.app = web.Application()
+        self.app.router.add_post('/v1/chat/completions', self.handle_openai)
+        self.app.router.add_post('/v1/messages', self.handle_anthropic)
+        self.app.router.add_post(r'/{version}/models/{model}:generateContent', self.handle_gemini)
+        self.app.router.add_post(r'/{version}/models/{model}:streamGenerateContent', self.handle_gemini_stream)
+        self.app.router.add_get('/stats', self.handle_stats)
+        self.app.router.add_post('/reset', self.handle_reset)
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    async def _simulate(self, provider: str, prompt: str, max_tokens: int,
+                        stream: bool = False) -> Tuple[Optional[web.Response], str, int, int]:
+        """지연/레이트 리밋/오류 모의 후 (오류 응답 또는 None, 본문, 입력 토큰, 출력 토큰)
+        
+        stream=True면 첫 토큰까지의 지연만 대기하고 출력 토큰은 전송한 만큼 호출자가 집계
+        """
+        profile, state = self.profiles[provider], self.states[provider]
+        state.requests += 1
+        
+        # 고정 60초 창 레이트 리밋
+        now = time.monotonic()
+        while state.window and now - state.window[0] > 60:
+            state.window.popleft()
+        if profile.rate_limit_per_minute and len(state.window) >= profile.rate_limit_per_minute:
+            state.rate_limited += 1
+            retry_after = max(1, int(60 - (now - state.window[0])) + 1)
+            return self._error(provider, 429, 'rate limit exceeded', retry_after), '', 0, 0
+        state.window.append(now)
+        
+        text = canned_completion(prompt, max_tokens)
+        tokens_in, tokens_out = count_tokens(prompt), min(count_tokens(text), max_tokens)
+        
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(profile.sample_latency(0 if stream else tokens_out))
+        finally:
+            self.in_flight -= 1
+        
+        if random.random() < profile.error_rate:
+            state.errors += 1
+            return self._error(provider, 503, 'service temporarily unavailable'), '', 0, 0
+        
+        state.tokens_in += tokens_in
+        if not stream:
+            state.tokens_out += tokens_out
+        return None, text, tokens_in, tokens_out
+    
+    @staticmethod
+    def _error(provider: str, status: int, message: str, retry_after: Optional[int] = None) -> web.Response:
+        """제공자별 오류 본문 형식"""
+        if provider == 'gemini':
+            code = 'RESOURCE_EXHAUSTED' if status == 429 else 'UNAVAILABLE'
+            body = {'error': {'code': status, 'message': message, 'status': code}}
+        elif provider == 'anthropic':
+            kind = 'rate_limit_error' if status == 429 else 'overloaded_error'
+            body = {'type': 'error', 'error': {'type': kind, 'message': message}}
+        else:
+            kind = 'rate_limit_exceeded' if status == 429 else 'server_error'
+            body = {'error': {'message': message, 'type': kind, 'code': kind}}
+        
+        headers = {'retry-after': str(retry_after)} if retry_after else None
+        return web.json_response(body, status=status, headers=headers)
+    
+    async def handle_openai(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        prompt = '\n'.join(str(m.get('content', '')) for m in payload.get('messages', []))
+        error, text, tokens_in, tokens_out = await self._simulate(
+            'openai', prompt, int(payload.get('max_tokens') or 1000))
+        if error is not None:
+            return error
+        
+        return web.json_response({
+            'id': f"chatcmpl-{uuid.uuid4().hex[:24]}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': payload.get('model', 'gpt-4'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': text},
+                'finish_reason': 'stop'
+            }],
+            'usage': {
+                'prompt_tokens': tokens_in,
+                'completion_tokens': tokens_out,
+                'total_tokens': tokens_in + tokens_out
+            }
+        })
+    
+    async def handle_anthropic(self, request: web.Request) -> web.Response:
+        payload = await request.json()
+        prompt = '\n'.join(
+            m['content'] if isinstance(m.get('content'), str)
+            else ' '.join(block.get('text', '') for block in m.get('content', []))
+            for m in payload.get('messages', [])
+        )
+        error, text, tokens_in, tokens_out = await self._simulate(
+            'anthropic', prompt, int(payload.get('max_tokens') or 1000))
+        if error is not None:
+            return error
+        
+        return web.json_response({
+            'id': f"msg_{uuid.uuid4().hex[:24]}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': payload.get('model', 'claude-3-sonnet-20240229'),
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'stop_sequence': None,
+            'usage': {'input_tokens': tokens_in, 'output_tokens': tokens_out}
+        })
+    
+    @staticmethod
+    def _gemini_request(payload: Dict[str, Any]) -> Tuple[str, int]:
+        prompt = '\n'.join(
+            part.get('text', '')
+            for content in payload.get('contents', [])
+            for part in content.get('parts', [])
+        )
+        config = payload.get('generationConfig') or payload.get('generation_config') or {}
+        max_tokens = int(config.get('maxOutputTokens') or config.get('max_output_tokens') or 1000)
+        return prompt, max_tokens
+    
+    async def handle_gemini(self, request: web.Request) -> web.Response:
+        prompt, max_tokens = self._gemini_request(await request.json())
+        error, text, tokens_in, tokens_out = await self._simulate('gemini', prompt, max_tokens)
+        if error is not None:
+            return error
+        
+        return web.json_response({
+            'candidates': [{
+                'content': {'parts': [{'text': text}], 'role': 'model'},
+                'finishReason': 'STOP',
+                'index': 0,
+                'safetyRatings': []
+            }],
+            'usageMetadata': {
+                'promptTokenCount': tokens_in,
+                'candidatesTokenCount': tokens_out,
+                'totalTokenCount': tokens_in + tokens_out
+            },
+            'modelVersion': request.match_info['model']
+        })
+    
+    async def handle_gemini_stream(self, request: web.Request) -> web.StreamResponse:
+        """streamGenerateContent - 출력 토큰 속도에 맞춰 청크 전송 (alt=sse 또는 JSON 배열)
+        
+        클라이언트가 조기 종료로 연결을 끊으면 남은 청크는 생성하지 않은 것으로 집계
+        """
+        prompt, max_tokens = self._gemini_request(await request.json())
+        error, text, tokens_in, _ = await self._simulate('gemini', prompt, max_tokens, stream=True)
+        if error is not None:
+            return error
+        
+        profile, state = self.profiles['gemini'], self.states['gemini']
+        state.streams += 1
+        sse = request.query.get('alt') == 'sse'
+        response = web.StreamResponse(
+            headers={'Content-Type': 'text/event-stream' if sse else 'application/json'})
+        await response.prepare(request)
+        
+        pieces = [text[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(text), STREAM_CHUNK_CHARS)]
+        sent_tokens = 0
+        try:
+            for index, piece in enumerate(pieces):
+                piece_tokens = count_tokens(piece)
+                if profile.tokens_per_second > 0:
+                    await asyncio.sleep(piece_tokens / profile.tokens_per_second)
+                
+                last = index == len(pieces) - 1
+                chunk = {
+                    'candidates': [{
+                        'content': {'parts': [{'text': piece}], 'role': 'model'},
+                        'index': 0,
+                        **({'finishReason': 'STOP'} if last else {})
+                    }],
+                    'usageMetadata': {
+                        'promptTokenCount': tokens_in,
+                        'candidatesTokenCount': sent_tokens + piece_tokens,
+                        'totalTokenCount': tokens_in + sent_tokens + piece_tokens
+                    },
+                    'modelVersion': request.match_info['model']
+                }
+                body = json.dumps(chunk, ensure_ascii=False)
+                if sse:
+                    frame = f"data: {body}\r\n\r\n"
+                else:
+                    frame = ('[' if index == 0 else ',\r\n') + body + (']' if last else '')
+                await response.write(frame.encode('utf-8'))
+                sent_tokens += piece_tokens
+            
+            await response.write_eof()
+        
+        except ConnectionResetError:
+            # 클라이언트 조기 종료 - 정상 흐름
+            state.streams_cancelled += 1
+        
+        except asyncio.CancelledError:
+            state.streams_cancelled += 1
+            raise
+        
+        finally:
+            state.tokens_out += sent_tokens
+        
+        return response
+    
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_statistics())
+    
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        self.states = {name: ProviderState() for name in self.PROVIDERS}
+        self.max_in_flight = 0
+        return web.json_response({'reset': True})
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """제공자별 요청/오류/토큰 통계"""
+        return {
+            'providers': {
+                name: {
+                    'requests': state.requests,
+                    'errors': state.errors,
+                    'rate_limited': state.rate_limited,
+                    'tokens_in': state.tokens_in,
+                    'tokens_out': state.tokens_out,
+                    'streams': state.streams,
+                    'streams_cancelled': state.streams_cancelled
+                }
+                for name, state in self.states.items()
+            },
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight
+        }
+    
+    async def start(self):
+        """현재 이벤트 루프에서 서버 시작"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            # 임의 포트로 띄운 경우 실제 바인딩된 포트
+            self.port = self._runner.addresses[0][1]
+        logger.info(f"🧪 모의 LLM 서버 시작: {self.url}")
+    
+    async def stop(self):
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            logger.info("🧹 모의 LLM 서버 종료")
+
+async def run_benchmark(requests: int = 50, concurrency: int = 10,
+                        task_type: str = 'content_generation',
+                        profile: Optional[MockProfile] = None) -> Dict[str, Any]:
+    """모의 서버를 띄워 AI 앙상블 처리량/지연 측정"""
+    from auto_finance.config.settings import AI_CONFIG
+    
+    server = MockLLMServer(port=0, profiles={name: profile or MockProfile() for name in MockLLMServer.PROVIDERS})
+    await server.start()
+    
+    previous = AI_CONFIG.get('mock_llm_url')
+    AI_CONFIG['mock_llm_url'] = server.url
+    try:
+        # 설정을 바꾼 뒤 생성해야 클라이언트가 모의 서버를 가리킴
+        from auto_finance.core.ai_ensemble import AIEnsembleSystem
+        ensemble = AIEnsembleSystem()
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        failures = 0
+        
+        async def one(index: int):
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    await ensemble.generate_content_ensemble(f"벤치마크 기사 {index}: 코스피 상승 마감", task_type)
+                    latencies.append(time.perf_counter() - start)
+                except Exception:
+                    failures += 1
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+        
+        latencies.sort()
+        result = {
+            'requests': requests,
+            'concurrency': concurrency,
+            'failures': failures,
+            'elapsed_seconds': elapsed,
+            'throughput_rps': requests / elapsed if elapsed > 0 else 0.0,
+            'latency_p50': latencies[len(latencies) // 2] if latencies else None,
+            'latency_p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else None,
+            'server': server.get_statistics(),
+            'ensemble': ensemble.get_statistics()
+        }
+        logger.info(f"📊 벤치마크: {requests}건, 동시성 {concurrency}, {result['throughput_rps']:.1f} req/s")
+        return result
+    
+    finally:
+        AI_CONFIG['mock_llm_url'] = previous
+        await server.stop()
+
+async def _serve(server: MockLLMServer):
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 모의 LLM 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.8, help='평균 지연 (초)')
+    parser.add_argument('--sigma', type=float, default=0.4, help='로그정규 지연 분포 형태')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=0, help='제공자별 분당 허용 요청 수')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--benchmark', type=int, default=0, help='N건 벤치마크 실행 후 종료')
+    parser.add_argument('--concurrency', type=int, default=10)
+    args = parser.parse_args()
+    
+    profile = MockProfile(args.latency, args.sigma, args.error_rate, args.rate_limit)
+    if args.benchmark:
+        if args.seed is not None:
+            random.seed(args.seed)
+        result = asyncio.run(run_benchmark(args.benchmark, args.concurrency, profile=profile))
+        logger.info(f"📊 벤치마크 결과:\n{json.dumps(result, ensure_ascii=False, indent=2, default=str)}")
+        return
+    
+    server = MockLLMServer(args.host, args.port, {name: profile for name in MockLLMServer.PROVIDERS}, args.seed)
+    try:
+        asyncio.run(_serve(server))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""
+🧪 로컬 모의 티스토리 API 서버
+티스토리 Open API 글쓰기/목록/읽기(/apis/post/write, list, read) 요청 형식을 그대로 받아 결과를 반환
+지연 분포, 오류율, 레이트 리밋(429)을 설정해 실제 블로그 없이 업로드 처리량/중복 게시 측정
+
+사용:
+    python -m auto_finance.core.mock_tistory_server --port 8766 --latency 0.5 --error-rate 0.05
+    TISTORY_API_URL=http://127.0.0.1:8766/apis TISTORY_ACCESS_TOKEN=test python main.py
+    python -m auto_finance.core.mock_tistory_server --benchmark 100 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import Counter, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from aiohttp import web
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.core.mock_llm_server import MockProfile
+
+logger = setup_logger(__name__)
+
+class MockTistoryServer:
+    """티스토리 글쓰기 API 호환 모의 서버"""
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 8766,
+                 profile: Optional[MockProfile] = None, seed: Optional[int] = None):
+        self.host = host
+        self.port = port
+        self.profile = profile or MockProfile(latency_mean=0.5, latency_sigma=0.3)
+        self._runner: Optional[web.AppRunner] = None
+        
+        if seed is not None:
+            random.seed(seed)
+        
+        self.app = web.Application()
+        self.app.router.add_post('/apis/post/write', self.handle_write)
+        self.app.router.add_get('/apis/post/list', self.handle_list)
+        self.app.router.add_get('/apis/post/read', self.handle_read)
+        self.app.router.add_get('/stats', self.handle_stats)
+        self.app.router.add_post('/reset', self.handle_reset)
+        self._reset()
+    
+    def _reset(self):
+        self.posts: List[Dict[str, Any]] = []
+        self.contents: Dict[str, str] = {}
+        self.fingerprints: Counter = Counter()
+        self.window: Deque[float] = deque()
+        self.requests = 0
+        self.errors = 0
+        self.rate_limited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    @property
+    def api_url(self) -> str:
+        """UPLOAD_CONFIG['platforms']['tistory']['api_url']로 지정할 주소"""
+        return f"{self.url}/apis"
+    
+    @staticmethod
+    def _error(status: int, message: str, retry_after: Optional[int] = None) -> web.Response:
+        headers = {'retry-after': str(retry_after)} if retry_after else None
+        return web.json_response({'tistory': {'status': str(status), 'error_message': message}},
+                                 status=status, headers=headers)
+    
+    async def handle_write(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        self.requests += 1
+        
+        if not form.get('access_token'):
+            return self._error(401, 'access_token is required')
+        if not form.get('blogName') or not form.get('title'):
+            return self._error(400, 'blogName and title are required')
+        
+        # 고정 60초 창 레이트 리밋
+        now = time.monotonic()
+        while self.window and now - self.window[0] > 60:
+            self.window.popleft()
+        if self.profile.rate_limit_per_minute and len(self.window) >= self.profile.rate_limit_per_minute:
+            self.rate_limited += 1
+            return self._error(429, 'rate limit exceeded', max(1, int(60 - (now - self.window[0])) + 1))
+        self.window.append(now)
+        
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.profile.sample_latency())
+        finally:
+            self.in_flight -= 1
+        
+        if random.random() < self.profile.error_rate:
+            self.errors += 1
+            return self._error(503, 'service temporarily unavailable')
+        
+        # 같은 글이 여러 번 게시되었는지 확인하기 위한 지문
+        digest = hashlib.sha256(f"{form['title']}\n{form.get('content', '')}".encode('utf-8')).hexdigest()
+        self.fingerprints[digest] += 1
+        
+        post_id = str(len(self.posts) + 1)
+        url = f"https://{form['blogName']}.tistory.com/{post_id}"
+        self.posts.append({'id': post_id, 'title': form['title'], 'postUrl': url,
+                           'visibility': form.get('visibility'), 'date': time.strftime('%Y-%m-%d %H:%M:%S')})
+        self.contents[post_id] = form.get('content', '')
+        return web.json_response({'tistory': {'status': '200', 'postId': post_id, 'url': url}})
+    
+    async def handle_list(self, request: web.Request) -> web.Response:
+        """글 목록 (최신순, 페이지당 10개)"""
+        if not request.query.get('access_token'):
+            return self._error(401, 'access_token is required')
+        
+        page = max(1, int(request.query.get('page', '1')))
+        newest = list(reversed(self.posts))
+        return web.json_response({'tistory': {'status': '200', 'item': {
+            'page': str(page),
+            'count': '10',
+            'totalCount': str(len(newest)),
+            'posts': newest[(page - 1) * 10:page * 10]
+        }}})
+    
+    async def handle_read(self, request: web.Request) -> web.Response:
+        """글 읽기 (본문 포함)"""
+        if not request.query.get('access_token'):
+            return self._error(401, 'access_token is required')
+        
+        post_id = request.query.get('postId', '')
+        post = next((p for p in self.posts if p['id'] == post_id), None)
+        if post is None:
+            return self._error(404, 'post not found')
+        return web.json_response({'tistory': {'status': '200', 'item': {
+            **post, 'content': self.contents.get(post_id, '')
+        }}})
+    
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_statistics())
+    
+    async def handle_reset(self, request: web.Request) -> web.Response:
+        self._reset()
+        return web.json_response({'reset': True})
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """요청/게시/중복 게시 통계"""
+        return {
+            'requests': self.requests,
+            'posts': len(self.posts),
+            'duplicate_posts': sum(count - 1 for count in self.fingerprints.values()),
+            'errors': self.errors,
+            'rate_limited': self.rate_limited,
+            'in_flight': self.in_flight,
+            'max_in_flight': self.max_in_flight
+        }
+    
+    async def start(self):
+        """현재 이벤트 루프에서 서버 시작"""
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        if self.port == 0:
+            # 임의 포트로 띄운 경우 실제 바인딩된 포트
+            self.port = self._runner.addresses[0][1]
+        logger.info(f"🧪 모의 티스토리 서버 시작: {self.url}")
+    
+    async def stop(self):
+        """서버 종료"""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            logger.info("🧹 모의 티스토리 서버 종료")
+
+async def run_benchmark(uploads: int = 100, concurrency: int = 8,
+                        profile: Optional[MockProfile] = None,
+                        queue_path: str = "data/benchmark_upload_queue.db") -> Dict[str, Any]:
+    """모의 서버를 띄워 UploadManager 다중 업로드 처리량과 재실행 시 중복 게시 여부 측정"""
+    from auto_finance.config.settings import UPLOAD_CONFIG
+    from auto_finance.core.upload_manager import UploadManager, UploadRequest
+    from auto_finance.core.upload_queue import UploadQueue
+    
+    server = MockTistoryServer(port=0, profile=profile)
+    await server.start()
+    
+    tistory = UPLOAD_CONFIG['platforms']['tistory']
+    previous = dict(tistory), UPLOAD_CONFIG.get('concurrency')
+    tistory.update({'enabled': True, 'access_token': 'benchmark', 'blog_name': 'benchmark',
+                    'api_url': server.api_url})
+    UPLOAD_CONFIG['concurrency'] = concurrency
+    Path(queue_path).unlink(missing_ok=True)
+    try:
+        requests = [
+            UploadRequest(title=f"벤치마크 기사 {index}", content=f"코스피 상승 마감 분석 본문 {index}",
+                          category="주식뉴스", tags=['벤치마크'])
+            for index in range(uploads)
+        ]
+        
+        async with UploadManager(queue=UploadQueue(queue_path)) as manager:
+            started = time.perf_counter()
+            results = await manager.upload_multiple_contents(requests)
+            elapsed = time.perf_counter() - started
+            
+            # 같은 요청을 다시 보내도 게시는 늘지 않아야 함
+            rerun = await manager.upload_multiple_contents(requests)
+            queue_stats = manager.queue.get_statistics()
+        
+        result = {
+            'uploads': uploads,
+            'concurrency': concurrency,
+            'successful': sum(1 for r in results if r.get('success')),
+            'elapsed_seconds': elapsed,
+            'throughput_ups': uploads / elapsed if elapsed > 0 else 0.0,
+            'rerun_replayed': sum(1 for r in rerun if r.get('replayed')),
+            'queue': queue_stats,
+            'server': server.get_statistics()
+        }
+        logger.info(f"📊 업로드 벤치마크: {uploads}건, 동시성 {concurrency}, "
+                    f"{result['throughput_ups']:.1f} 건/초, 중복 게시 {result['server']['duplicate_posts']}건")
+        return result
+    
+    finally:
+        tistory.clear()
+        tistory.update(previous[0])
+        UPLOAD_CONFIG['concurrency'] = previous[1]
+        Path(queue_path).unlink(missing_ok=True)
+        await server.stop()
+
+async def _serve(server: MockTistoryServer):
+    await server.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 모의 티스토리 API 서버")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--latency', type=float, default=0.5, help='평균 지연 (초)')
+    parser.add_argument('--sigma', type=float, default=0.3, help='로그정규 지연 분포 형태')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=int, default=0, help='분당 허용 요청 수')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--benchmark', type=int, default=0, help='N건 업로드 벤치마크 실행 후 종료')
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+    
+    profile = MockProfile(args.latency, args.sigma, args.error_rate, args.rate_limit)
+    if args.benchmark:
+        if args.seed is not None:
+            random.seed(args.seed)
+        result = asyncio.run(run_benchmark(args.benchmark, args.concurrency, profile=profile))
+        logger.info(f"📊 벤치마크 결과:\n{json.dumps(result, ensure_ascii=False, indent=2, default=str)}")
+        return
+    
+    server = MockTistoryServer(args.host, args.port, profile, args.seed)
+    try:
+        asyncio.run(_serve(server))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+🧭 비용/지연 인식 AI 모델 라우터
+(모델, 작업 유형)별 지연/실패율/비용/신뢰도를 지수가중 평균으로 기록하고
+작업 품질 목표를 만족하는 가장 저렴한 모델(또는 모델 쌍)을 선택
+"""
+
+import json
+from datetime import datetime
+from itertools import combinations
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 작업 유형별 품질 목표 (수용 가능한 응답을 얻을 확률)
+TASK_QUALITY_TARGETS: Dict[str, float] = {
+    'fact_checking': 0.85,
+    'analysis': 0.8,
+    'detailed_analysis': 0.8,
+    'content_generation': 0.75,
+    'creative_writing': 0.75,
+    'reasoning': 0.8,
+    'summarization': 0.65
+}
+DEFAULT_QUALITY_TARGET = 0.75
+
+# 관측 전 모델별 호출당 예상 비용 ($, 입력 1k + 출력 0.5k 토큰 기준)
+PRIOR_COSTS: Dict[str, float] = {
+    'gemini': 0.0,
+    'gpt4': 0.06,
+    'claude': 0.0105
+}
+
+# 관측 전 예상 지연 (초)
+PRIOR_LATENCY = 5.0
+
+# 관측 전 품질 (특화 작업 / 그 외)
+PRIOR_QUALITY_SPECIALTY = 0.85
+PRIOR_QUALITY_DEFAULT = 0.7
+
+class RouteStats:
+    """(모델, 작업 유형) 지수가중 성능 통계"""
+    
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.latency = 0.0
+        self.cost = 0.0
+        self.confidence = 0.0
+        self.failure_rate = 0.0
+        self.acceptance_rate = 0.0
+        self.successes = 0
+        self.failures = 0
+    
+    @property
+    def observations(self) -> int:
+        return self.successes + self.failures
+    
+    def _ewma(self, current: float, value: float, count: int) -> float:
+        # 초기 표본이 적을 때는 산술 평균으로 시작
+        alpha = max(self.alpha, 1.0 / count)
+        return current + alpha * (value - current)
+    
+    def record_success(self, latency: float, cost: float, confidence: float, accepted: bool):
+        self.successes += 1
+        count = self.observations
+        self.latency = self._ewma(self.latency, latency, self.successes)
+        self.cost = self._ewma(self.cost, cost, self.successes)
+        self.confidence = self._ewma(self.confidence, confidence, self.successes)
+        self.acceptance_rate = self._ewma(self.acceptance_rate, 1.0 if accepted else 0.0, count)
+        self.failure_rate = self._ewma(self.failure_rate, 0.0, count)
+    
+    def record_failure(self, latency: float):
+        self.failures += 1
+        count = self.observations
+        self.failure_rate = self._ewma(self.failure_rate, 1.0, count)
+        self.acceptance_rate = self._ewma(self.acceptance_rate, 0.0, count)
+        if not self.successes:
+            self.latency = self._ewma(self.latency, latency, self.failures)
+    
+    def to_dict(self) -> Dict[str, float]:
+        return dict(self.__dict__)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> 'RouteStats':
+        stats = cls()
+        stats.__dict__.update(data)
+        return stats
+
+class ModelRouter:
+    """작업별 품질 목표를 만족하는 최저 비용 모델 선택기"""
+    
+    def __init__(self, specialties: Optional[Dict[str, List[str]]] = None,
+                 state_path: str = "data/model_router_state.json",
+                 accept_confidence: float = 0.8,
+                 latency_cost_per_second: float = 0.001,
+                 min_observations: int = 5,
+                 max_models: int = 2):
+        self.specialties = specialties or {}
+        self.state_path = Path(state_path)
+        self.accept_confidence = accept_confidence
+        # 지연 1초를 비용으로 환산한 값 (같은 비용이면 빠른 모델 우선)
+        self.latency_cost_per_second = latency_cost_per_second
+        self.min_observations = min_observations
+        self.max_models = max_models
+        
+        self.routes: Dict[str, Dict[str, RouteStats]] = {}
+        self.decisions: Dict[str, Dict[str, int]] = {}
+        
+        self.load()
+    
+    def _stats(self, model: str, task_type: str) -> RouteStats:
+        return self.routes.setdefault(task_type, {}).setdefault(model, RouteStats())
+    
+    def record(self, model: str, task_type: str, latency: float, cost: float = 0.0,
+               confidence: Optional[float] = None, failed: bool = False):
+        """호출 결과 반영 - O(1)"""
+        stats = self._stats(model, task_type)
+        if failed or confidence is None:
+            stats.record_failure(latency)
+        else:
+            stats.record_success(latency, cost, confidence, confidence >= self.accept_confidence)
+    
+    def quality(self, model: str, task_type: str) -> float:
+        """수용 가능한 응답을 얻을 추정 확률 (관측 부족 시 사전값과 혼합)"""
+        prior = (PRIOR_QUALITY_SPECIALTY if task_type in self.specialties.get(model, [])
+                 else PRIOR_QUALITY_DEFAULT)
+        stats = self.routes.get(task_type, {}).get(model)
+        if stats is None or stats.observations == 0:
+            return prior
+        
+        weight = min(1.0, stats.observations / self.min_observations)
+        return weight * stats.acceptance_rate + (1.0 - weight) * prior
+    
+    def expected_cost(self, model: str, task_type: str) -> float:
+        """호출당 예상 비용 + 지연 환산 비용"""
+        stats = self.routes.get(task_type, {}).get(model)
+        if stats is None or not stats.successes:
+            cost, latency = PRIOR_COSTS.get(model, max(PRIOR_COSTS.values())), PRIOR_LATENCY
+        else:
+            cost, latency = stats.cost, stats.latency
+        return cost + latency * self.latency_cost_per_second
+    
+    def rank(self, task_type: str, available: Iterable[str]) -> List[str]:
+        """헤지 투입 순서 - 품질 목표 달성 모델을 비용순으로 먼저, 나머지는 품질순"""
+        target = TASK_QUALITY_TARGETS.get(task_type, DEFAULT_QUALITY_TARGET)
+        return sorted(
+            available,
+            key=lambda m: (self.quality(m, task_type) < target,
+                           self.expected_cost(m, task_type) if self.quality(m, task_type) >= target
+                           else -self.quality(m, task_type))
+        )
+    
+    def route(self, task_type: str, available: Iterable[str]) -> List[str]:
+        """품질 목표를 만족하는 최저 비용 모델 조합 (없으면 전체 모델)"""
+        available = list(available)
+        if len(available) <= 1:
+            return available
+        
+        target = TASK_QUALITY_TARGETS.get(task_type, DEFAULT_QUALITY_TARGET)
+        quality = {m: self.quality(m, task_type) for m in available}
+        cost = {m: self.expected_cost(m, task_type) for m in available}
+        
+        best: Optional[List[str]] = None
+        best_cost = float('inf')
+        for size in range(1, min(self.max_models, len(available)) + 1):
+            for combo in combinations(available, size):
+                # 조합 중 하나 이상이 수용 응답을 낼 확률 (모델 간 독립 가정)
+                miss = 1.0
+                for model in combo:
+                    miss *= 1.0 - quality[model]
+                combo_cost = sum(cost[m] for m in combo)
+                # 비용이 같으면 먼저 본 작은 조합 유지
+                if 1.0 - miss >= target and combo_cost < best_cost:
+                    best, best_cost = list(combo), combo_cost
+        
+        selected = best or available
+        key = '+'.join(sorted(selected))
+        decisions = self.decisions.setdefault(task_type, {})
+        decisions[key] = decisions.get(key, 0) + 1
+        return selected
+    
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """작업 유형 → 모델 → 성능 요약"""
+        return {
+            task_type: {
+                model: {
+                    'latency': stats.latency,
+                    'cost': stats.cost,
+                    'confidence': stats.confidence,
+                    'failure_rate': stats.failure_rate,
+                    'quality': self.quality(model, task_type),
+                    'observations': stats.observations
+                }
+                for model, stats in models.items()
+            }
+            for task_type, models in self.routes.items()
+        }
+    
+    def save(self):
+        """라우팅 통계 저장 (재시작 후에도 학습 결과 유지)"""
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                'routes': {t: {m: s.to_dict() for m, s in models.items()} for t, models in self.routes.items()},
+                'decisions': self.decisions,
+                'timestamp': datetime.now().isoformat()
+            }
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            
+            logger.debug(f"💾 모델 라우터 상태 저장: {self.state_path}")
+        
+        except Exception as e:
+            logger.error(f"❌ 모델 라우터 상태 저장 실패: {e}")
+    
+    def load(self):
+        """저장된 라우팅 통계 복원"""
+        if not self.state_path.exists():
+            return
+        
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            self.routes = {
+                t: {m: RouteStats.from_dict(s) for m, s in models.items()}
+                for t, models in data.get('routes', {}).items()
+            }
+            self.decisions = data.get('decisions', {})
+            
+            logger.info(f"📂 모델 라우터 상태 복원: {len(self.routes)}개 작업 유형")
+        
+        except Exception as e:
+            logger.error(f"❌ 모델 라우터 상태 복원 실패: {e}")
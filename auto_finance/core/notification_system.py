@@ -6,19 +6,47 @@
 import asyncio
 import json
 import smtplib
-import requests
+import aiohttp
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from auto_finance.utils.logger import setup_logger
-from auto_finance.utils.error_handler import retry_on_error, ErrorHandler
+from auto_finance.utils.error_handler import ErrorHandler
 from auto_finance.utils.cache_manager import cache_manager
 from auto_finance.config.settings import NOTIFICATION_CONFIG
 
 logger = setup_logger(__name__)
 
+async def _post_json(session: aiohttp.ClientSession, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """공유 세션으로 JSON POST - 429 응답이면 서버가 알려준 대기 시간을 함께 반환
+    
+    429/5xx/네트워크 오류만 재시도 대상이고, 나머지 4xx(잘못된 웹훅/토큰 등)는 retryable=False로 표시한다.
+    """
+    try:
+        async with session.post(url, json=payload) as response:
+            if response.status < 400:
+                return {'success': True}
+            
+            text = await response.text()
+            retry_after = response.headers.get('retry-after')
+            if response.status == 429 and retry_after is None:
+                # 디스코드/텔레그램은 본문에 대기 시간을 담음
+                try:
+                    body = json.loads(text)
+                    retry_after = body.get('retry_after') or body.get('parameters', {}).get('retry_after')
+                except (ValueError, AttributeError):
+                    retry_after = None
+            return {
+                'success': False,
+                'error': f"HTTP {response.status}: {text[:200]}",
+                'retryable': response.status == 429 or response.status >= 500,
+                'retry_after': float(retry_after) if retry_after else None
+            }
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        return {'success': False, 'error': str(e)}
+
 @dataclass
 class NotificationMessage:
     """알림 메시지"""
@@ -62,8 +90,16 @@ class NotificationSystem:
             'priority_stats': {}
         }
         
-        # 채널별 클라이언트
+        # 채널별 클라이언트 (HTTP 채널은 하나의 연결 풀 세션을 공유)
         self.clients = {}
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # 채널별 동시 전송 제한 / 재시도
+        self.concurrency = NOTIFICATION_CONFIG.get('concurrency', {})
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.max_retries = NOTIFICATION_CONFIG.get('max_retries', 2)
+        self.retry_delay = NOTIFICATION_CONFIG.get('retry_delay', 1.0)
+        self.email_batch_size = NOTIFICATION_CONFIG.get('email_batch_size', 50)
         
         # 알림 큐
         self.notification_queue = asyncio.Queue()
@@ -82,12 +118,17 @@ class NotificationSystem:
     async def initialize(self):
         """알림 시스템 초기화"""
         try:
+            timeout = aiohttp.ClientTimeout(total=NOTIFICATION_CONFIG.get('timeout', 10))
+            connector = aiohttp.TCPConnector(limit=max(1, sum(self.concurrency.values()) or 10))
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+            
             # 채널별 클라이언트 초기화
             for channel, config in self.channels.items():
                 if config.get('enabled', False):
                     client = await self._create_channel_client(channel, config)
                     if client:
                         self.clients[channel] = client
+                        self.semaphores[channel] = asyncio.Semaphore(max(1, self.concurrency.get(channel, 4)))
                         logger.info(f"✅ {channel} 클라이언트 초기화 완료")
             
             # 알림 처리 태스크 시작
@@ -107,6 +148,9 @@ class NotificationSystem:
                 if hasattr(client, 'close'):
                     await client.close()
             
+            if self.session is not None and not self.session.closed:
+                await self.session.close()
+            
             logger.info("🧹 알림 시스템 정리 완료")
             
         except Exception as e:
@@ -142,20 +186,24 @@ class NotificationSystem:
                     self.password = config.get('password')
                     self.from_email = config.get('from_email')
                 
+                def _send(self, to_emails, subject, content):
+                    msg = MIMEMultipart()
+                    msg['From'] = self.from_email
+                    # 여러 수신자는 숨은 참조로 한 번에 전송 (수신자끼리 주소 비공개)
+                    msg['To'] = to_emails[0] if len(to_emails) == 1 else self.from_email
+                    msg['Subject'] = subject
+                    
+                    msg.attach(MIMEText(content, 'html'))
+                    
+                    with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                        server.starttls()
+                        server.login(self.username, self.password)
+                        server.send_message(msg, to_addrs=to_emails)
+                
                 async def send_message(self, to_email, subject, content):
                     try:
-                        msg = MIMEMultipart()
-                        msg['From'] = self.from_email
-                        msg['To'] = to_email
-                        msg['Subject'] = subject
-                        
-                        msg.attach(MIMEText(content, 'html'))
-                        
-                        with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                            server.starttls()
-                            server.login(self.username, self.password)
-                            server.send_message(msg)
-                        
+                        to_emails = [to_email] if isinstance(to_email, str) else list(to_email)
+                        await asyncio.to_thread(self._send, to_emails, subject, content)
                         return {'success': True}
                     except Exception as e:
                         return {'success': False, 'error': str(e)}
@@ -173,35 +221,30 @@ class NotificationSystem:
         """슬랙 클라이언트 생성"""
         try:
             class SlackClient:
-                def __init__(self, config):
+                def __init__(self, config, session):
                     self.webhook_url = config.get('webhook_url')
                     self.channel = config.get('channel', '#general')
+                    self.session = session
                 
-                async def send_message(self, content, title=None):
-                    try:
-                        payload = {
-                            'channel': self.channel,
-                            'text': content
-                        }
-                        
-                        if title:
-                            payload['attachments'] = [{
-                                'title': title,
-                                'text': content,
-                                'color': 'good'
-                            }]
-                        
-                        response = requests.post(self.webhook_url, json=payload)
-                        response.raise_for_status()
-                        
-                        return {'success': True}
-                    except Exception as e:
-                        return {'success': False, 'error': str(e)}
+                async def send_message(self, content, title=None, channel=None):
+                    payload = {
+                        'channel': channel or self.channel,
+                        'text': content
+                    }
+                    
+                    if title:
+                        payload['attachments'] = [{
+                            'title': title,
+                            'text': content,
+                            'color': 'good'
+                        }]
+                    
+                    return await _post_json(self.session, self.webhook_url, payload)
                 
                 async def close(self):
                     pass
             
-            return SlackClient(config)
+            return SlackClient(config, self.session)
             
         except Exception as e:
             logger.error(f"❌ 슬랙 클라이언트 생성 실패: {e}")
@@ -211,32 +254,27 @@ class NotificationSystem:
         """텔레그램 클라이언트 생성"""
         try:
             class TelegramClient:
-                def __init__(self, config):
+                def __init__(self, config, session):
                     self.bot_token = config.get('bot_token')
                     self.chat_id = config.get('chat_id')
-                    self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
+                    self.api_url = config.get('api_url') or f"https://api.telegram.org/bot{self.bot_token}"
+                    self.session = session
                 
-                async def send_message(self, content, title=None):
-                    try:
-                        message = f"**{title}**\n\n{content}" if title else content
-                        
-                        payload = {
-                            'chat_id': self.chat_id,
-                            'text': message,
-                            'parse_mode': 'Markdown'
-                        }
-                        
-                        response = requests.post(f"{self.api_url}/sendMessage", json=payload)
-                        response.raise_for_status()
-                        
-                        return {'success': True}
-                    except Exception as e:
-                        return {'success': False, 'error': str(e)}
+                async def send_message(self, content, title=None, chat_id=None):
+                    message = f"**{title}**\n\n{content}" if title else content
+                    
+                    payload = {
+                        'chat_id': chat_id or self.chat_id,
+                        'text': message,
+                        'parse_mode': 'Markdown'
+                    }
+                    
+                    return await _post_json(self.session, f"{self.api_url}/sendMessage", payload)
                 
                 async def close(self):
                     pass
             
-            return TelegramClient(config)
+            return TelegramClient(config, self.session)
             
         except Exception as e:
             logger.error(f"❌ 텔레그램 클라이언트 생성 실패: {e}")
@@ -246,112 +284,147 @@ class NotificationSystem:
         """디스코드 클라이언트 생성"""
         try:
             class DiscordClient:
-                def __init__(self, config):
+                def __init__(self, config, session):
                     self.webhook_url = config.get('webhook_url')
                     self.username = config.get('username', 'Auto Finance Bot')
+                    self.session = session
                 
                 async def send_message(self, content, title=None):
-                    try:
-                        payload = {
-                            'username': self.username,
-                            'content': content
-                        }
-                        
-                        if title:
-                            payload['embeds'] = [{
-                                'title': title,
-                                'description': content,
-                                'color': 0x00ff00
-                            }]
-                        
-                        response = requests.post(self.webhook_url, json=payload)
-                        response.raise_for_status()
-                        
-                        return {'success': True}
-                    except Exception as e:
-                        return {'success': False, 'error': str(e)}
+                    payload = {
+                        'username': self.username,
+                        'content': content
+                    }
+                    
+                    if title:
+                        payload['embeds'] = [{
+                            'title': title,
+                            'description': content,
+                            'color': 0x00ff00
+                        }]
+                    
+                    return await _post_json(self.session, self.webhook_url, payload)
                 
                 async def close(self):
                     pass
             
-            return DiscordClient(config)
+            return DiscordClient(config, self.session)
             
         except Exception as e:
             logger.error(f"❌ 디스코드 클라이언트 생성 실패: {e}")
             return None
     
     async def send_notification(self, message: NotificationMessage) -> List[NotificationResult]:
-        """알림 전송"""
-        results = []
+        """알림 전송 - 채널/대상별 묶음을 동시에 전송 (채널별 동시 전송 수 제한)
         
+        같은 대상으로 가는 수신자는 한 번에 보낸다 (웹훅 채널은 대상 채널당 1회, 이메일은 숨은 참조).
+        결과는 기존과 같이 (채널, 수신자)마다 하나씩 반환한다.
+        """
+        tasks = []
         for channel in message.channels:
             if channel not in self.clients:
                 logger.warning(f"⚠️ 채널 클라이언트 없음: {channel}")
                 continue
             
-            client = self.clients[channel]
-            
-            for recipient in message.recipients:
-                result = await self._send_to_channel(
-                    client, channel, message, recipient
-                )
-                results.append(result)
+            for target, recipients in self._group_recipients(channel, message.recipients):
+                tasks.append(self._send_batch(channel, target, recipients, message))
         
-        return results
+        batches = await asyncio.gather(*tasks)
+        return [result for batch in batches for result in batch]
     
-    @retry_on_error(max_retries=3, delay=2.0)
-    async def _send_to_channel(self, client, channel: str, message: NotificationMessage, 
-                              recipient: str) -> NotificationResult:
-        """채널별 알림 전송"""
-        start_time = datetime.now()
+    def _group_recipients(self, channel: str, recipients: List[str]) -> List[Tuple[Any, List[str]]]:
+        """수신자를 실제 전송 대상별로 묶음 - [(대상, 수신자 목록)]"""
+        config = self.channels.get(channel, {})
         
-        try:
-            # 템플릿 적용
-            content = self._apply_template(message, channel)
-            
-            # 채널별 전송
-            if channel == "email":
-                result = await client.send_message(
-                    recipient, message.title, content
-                )
+        if channel == "email":
+            addresses = list(dict.fromkeys(r for r in recipients if '@' in r and not r.startswith('@')))
+            if not addresses:
+                # 주소가 아닌 수신자("default", "#general" 등)뿐이면 설정된 기본 수신자에게 한 번에 보내고
+                # 결과는 메시지의 수신자 기준으로 보고 (기본 수신자가 없으면 대상 None → 실패로 보고)
+                defaults = list(dict.fromkeys(r for r in config.get('to_emails', []) if r))
+                return [(defaults or None, list(dict.fromkeys(recipients)) or ['default'])]
+            return [
+                (addresses[i:i + self.email_batch_size], addresses[i:i + self.email_batch_size])
+                for i in range(0, len(addresses), max(1, self.email_batch_size))
+            ]
+        
+        if channel == "discord":
+            # 웹훅이 가리키는 채널 하나로만 전송 가능
+            return [(None, list(recipients))] if recipients else []
+        
+        groups: Dict[Any, List[str]] = {}
+        for recipient in recipients:
+            if channel == "slack":
+                target = recipient if recipient.startswith(('#', '@')) else None
+            elif channel == "telegram":
+                is_chat = recipient.lstrip('-').isdigit() or (recipient.startswith('@') and '.' not in recipient)
+                target = recipient if is_chat else None
             else:
-                result = await client.send_message(content, message.title)
-            
-            # 결과 생성
-            processing_time = (datetime.now() - start_time).total_seconds()
+                target = None
+            groups.setdefault(target, []).append(recipient)
+        return list(groups.items())
+    
+    async def _send_batch(self, channel: str, target: Any, recipients: List[str],
+                          message: NotificationMessage) -> List[NotificationResult]:
+        """대상 하나로 한 번 전송 (재시도 가능한 실패만 지수 백오프 재시도, 429면 서버가 알려준 시간 대기)"""
+        start_time = datetime.now()
+        client = self.clients[channel]
+        
+        async with self.semaphores[channel]:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    # 템플릿 적용
+                    content = self._apply_template(message, channel)
+                    
+                    # 채널별 전송
+                    if channel == "email":
+                        if target:
+                            result = await client.send_message(target, message.title, content)
+                        else:
+                            result = {'success': False, 'error': "이메일 수신 주소 없음 (to_emails 미설정)",
+                                      'retryable': False}
+                    elif channel == "slack":
+                        result = await client.send_message(content, message.title, channel=target)
+                    elif channel == "telegram":
+                        result = await client.send_message(content, message.title, chat_id=target)
+                    else:
+                        result = await client.send_message(content, message.title)
+                except Exception as e:
+                    self.error_handler.handle_error(e, f"알림 전송 실패 ({channel})")
+                    result = {'success': False, 'error': str(e)}
+                
+                if result.get('success') or not result.get('retryable', True) or attempt == self.max_retries:
+                    break
+                
+                delay = max(self.retry_delay * 2 ** attempt, result.get('retry_after') or 0)
+                logger.warning(f"⚠️ 알림 재시도 ({attempt + 1}/{self.max_retries}, {delay:.1f}초 후): "
+                               f"{channel} - {result.get('error')}")
+                await asyncio.sleep(delay)
+        
+        # 결과 생성
+        processing_time = (datetime.now() - start_time).total_seconds()
+        sent_at = datetime.now().isoformat()
+        results = []
+        for recipient in recipients:
             notification_result = NotificationResult(
                 message_id=f"{message.created_at}_{channel}_{recipient}",
                 channel=channel,
                 success=result.get('success', False),
                 recipient=recipient,
-                sent_at=datetime.now().isoformat(),
+                sent_at=sent_at,
                 error_message=result.get('error'),
                 processing_time=processing_time
             )
             
             # 통계 업데이트
             self._update_statistics(notification_result, message.priority)
-            
-            if notification_result.success:
-                logger.info(f"✅ 알림 전송 완료: {channel} → {recipient}")
-            else:
-                logger.error(f"❌ 알림 전송 실패: {channel} → {recipient}")
-            
-            return notification_result
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, f"알림 전송 실패 ({channel})")
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            return NotificationResult(
-                message_id=f"{message.created_at}_{channel}_{recipient}",
-                channel=channel,
-                success=False,
-                recipient=recipient,
-                sent_at=datetime.now().isoformat(),
-                error_message=str(e),
-                processing_time=processing_time
-            )
+            results.append(notification_result)
+        
+        if result.get('success'):
+            logger.info(f"✅ 알림 전송 완료: {channel} → {', '.join(recipients)}")
+        else:
+            logger.error(f"❌ 알림 전송 실패: {channel} → {', '.join(recipients)} - {result.get('error')}")
+        
+        return results
     
     def _apply_template(self, message: NotificationMessage, channel: str) -> str:
         """템플릿 적용"""
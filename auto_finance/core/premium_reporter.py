@@ -14,6 +14,8 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
 from auto_finance.core.notifier import Notifier
+from auto_finance.core.feature_store import feature_store, MARKET_SYMBOL
+from auto_finance.config.settings import FINANCIAL_CONFIG
 
 class PremiumReporter:
     def __init__(self):
@@ -232,7 +234,32 @@ class PremiumReporter:
             }
     
     def _get_market_summary(self) -> Dict[str, Any]:
-        """시장 요약 데이터 (예시)"""
+        """시장 요약 데이터 (피처 저장소 최신 행 조회, 적재 전이면 예시)"""
+        snapshot = feature_store.get_snapshot(fresh=True)
+        stale = [s for s in FINANCIAL_CONFIG.get('stock_symbols', []) if s not in snapshot]
+        if stale:
+            # 마지막 거래일 행이 없는 종목은 누락 일봉을 수집해 다시 적재
+            feature_store.update_prices(stale, refresh=True)
+            snapshot = feature_store.get_snapshot()
+        changes = {s: f['change_percent'] for s, f in snapshot.items() if f.get('change_percent') is not None}
+        if changes:
+            market = feature_store.get_latest(MARKET_SYMBOL, with_price=False)
+            sentiment = market.get('avg_sentiment')
+            avg_change = sum(changes.values()) / len(changes)
+            trend = '상승' if avg_change > 0.5 else '하락' if avg_change < -0.5 else '중립'
+            gainers = sorted(changes, key=changes.get, reverse=True)[:3]
+            losers = sorted(changes, key=changes.get)[:3]
+            
+            return {
+                'trend': trend,
+                'overall_trend': (f"관심 종목 평균 {avg_change:+.2f}%, "
+                                  f"상승 {sum(c > 0 for c in changes.values())} / 하락 {sum(c < 0 for c in changes.values())}"
+                                  + (f", 뉴스 감정 {sentiment:.2f} ({market.get('news_count', 0)}건)" if sentiment is not None else '')),
+                'key_issues': (f"강세 {', '.join(f'{s} {changes[s]:+.1f}%' for s in gainers)} / "
+                               f"약세 {', '.join(f'{s} {changes[s]:+.1f}%' for s in losers)}"),
+                'strategy': {'상승': '적극적 매수 전략 권장', '하락': '리스크 관리 및 비중 축소 권장'}.get(trend, '관망 전략 권장')
+            }
+        
         return {
             'trend': '상승',
             'overall_trend': '긍정적인 뉴스가 우세하며 시장 분위기 개선',
@@ -3,12 +3,38 @@
 뉴스 감정과 주가 변동 간의 상관관계 분석 및 예측
 """
 
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 from auto_finance.core.financial_data import FinancialDataCollector
 from auto_finance.core.news_crawler import NewsCrawler
+from auto_finance.core.price_store import price_store
+from auto_finance.core.feature_store import feature_store
+from auto_finance.core.correlation_engine import correlation_engine
+from auto_finance.core.ticker_linker import ticker_linker
+from auto_finance.core.sentiment_lexicon import korean_lexicon
+from auto_finance.core.sentiment_timeseries import sentiment_timeseries, ROLLING_WINDOWS, MARKET_SYMBOL
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+# 종목 예측 모델 파라미터 (백테스터도 같은 값을 사용)
+PREDICTION_MODEL = {
+    'sentiment_coef': 0.3,   # 뉴스 감정 계수
+    'change_coef': 0.5,      # 최근 등락률(소수) 계수
+    'intercept': 0.2,        # 기타 요인
+    'threshold': 0.02        # 상승/하락 판정 임계값
+}
+
+# 예측 신뢰도 파라미터
+PREDICTION_CONFIDENCE = {
+    'news_cap': 0.8,          # 뉴스 수량 신뢰도 상한
+    'news_scale': 10,         # 이 기사 수에서 상한 근처 도달
+    'component_floor': 0.3,   # 감정 일관성/가격 변동성 신뢰도 하한
+    'volatility_scale': 10,   # 등락률(%) 정규화
+    'min': 0.3,
+    'max': 0.9
+}
 
 class PriceCorrelationAnalyzer:
     def __init__(self):
@@ -21,8 +47,12 @@ class PriceCorrelationAnalyzer:
             'min_correlation': 0.3,  # 최소 상관관계 임계값
             'sentiment_weight': 0.4,  # 감정 분석 가중치
             'volume_weight': 0.3,     # 거래량 가중치
-            'price_weight': 0.3       # 가격 변동 가중치
+            'price_weight': 0.3,      # 가격 변동 가중치
+            'max_lag': 3              # 뉴스(t) 대비 수익률(t+k) 최대 시차 (일)
         }
+        
+        # 온라인 롤링 상관관계 엔진 (상태는 디스크에 유지, 일봉은 시세 수집기가 반영)
+        self.correlation_engine = correlation_engine
     
     def analyze_news_price_correlation(self, stock_symbol: str, 
                                      news_data: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -31,6 +61,9 @@ class PriceCorrelationAnalyzer:
             # 주가 데이터 수집
             price_data = self._get_historical_price_data(stock_symbol)
             
+            # 해당 종목이 언급된 기사만 분석
+            news_data = ticker_linker.filter(news_data, stock_symbol)
+            
             # 뉴스 감정 분석
             news_sentiment = self._analyze_news_sentiment_timeline(news_data)
             
@@ -56,12 +89,98 @@ class PriceCorrelationAnalyzer:
             print(f"❌ 뉴스-주가 상관관계 분석 실패 ({stock_symbol}): {e}")
             return {}
     
+    def analyze_universe_correlation(self, news_data: List[Dict[str, Any]],
+                                     symbols: Optional[List[str]] = None,
+                                     max_lag: Optional[int] = None) -> Dict[str, Any]:
+        """전 종목 뉴스-주가 상관관계 일괄 분석 (시차 포함)"""
+        try:
+            symbols = symbols or FINANCIAL_CONFIG.get('stock_symbols', [])
+            max_lag = self.correlation_config['max_lag'] if max_lag is None else max_lag
+            lags = list(range(max_lag + 1))
+            
+            # 날짜 × 종목 수익률 / 감정 행렬
+            returns = self._build_return_matrix(symbols, self.correlation_config['time_window'] + max_lag)
+            if returns.empty:
+                return {}
+            symbols = list(returns.columns)
+            sentiment = self._build_sentiment_matrix(news_data, symbols).reindex(returns.index)
+            
+            own, cross, counts = self._lagged_correlation(
+                sentiment.to_numpy(dtype=float), returns.to_numpy(dtype=float), lags
+            )
+            
+            correlation_by_lag = {
+                symbol: {lag: self._nan_to_none(own[i, j]) for i, lag in enumerate(lags)}
+                for j, symbol in enumerate(symbols)
+            }
+            
+            best_lag = {}
+            for j, symbol in enumerate(symbols):
+                column = np.abs(np.nan_to_num(own[:, j], nan=0.0))
+                i = int(column.argmax())
+                best_lag[symbol] = {'lag': lags[i], 'correlation': self._nan_to_none(own[i, j])}
+            
+            return {
+                'symbols': symbols,
+                'lags': lags,
+                'dates': [d.isoformat() for d in returns.index],
+                'correlation_by_lag': correlation_by_lag,
+                'best_lag': best_lag,
+                'cross_correlation': {
+                    lag: [[self._nan_to_none(v) for v in row] for row in cross[i]]
+                    for i, lag in enumerate(lags)
+                },
+                'observations': {symbol: int(counts[0, j]) for j, symbol in enumerate(symbols)},
+                'analysis_period': self.correlation_config['time_window'],
+                'timestamp': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            print(f"❌ 전 종목 상관관계 분석 실패: {e}")
+            return {}
+    
+    def update_online_correlation(self, news_data: List[Dict[str, Any]],
+                                  symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """뉴스 감정을 온라인 엔진에 반영 (완성된 일봉은 FinancialDataCollector.update_correlation_bars가 반영)"""
+        try:
+            symbols = symbols or FINANCIAL_CONFIG.get('stock_symbols', [])
+            engine = self.correlation_engine
+            
+            for news in news_data:
+                news_date = news.get('date', datetime.now().date())
+                if isinstance(news_date, str):
+                    news_date = datetime.strptime(news_date, '%Y-%m-%d').date()
+                
+                targets = [s for s in self._linked_symbols(news) if s in symbols]
+                if not targets:
+                    continue
+                
+                score = self._calculate_news_sentiment(news)
+                for symbol in targets:
+                    # 같은 기사가 다음 주기에 다시 수집돼도 한 번만 반영
+                    engine.add_sentiment(symbol, news_date, score, news.get('url') or news.get('title'))
+            
+            engine.save()
+            return engine.snapshot()
+            
+        except Exception as e:
+            print(f"❌ 온라인 상관관계 갱신 실패: {e}")
+            return {}
+    
+    def get_rolling_correlation(self, stock_symbol: str) -> Dict[str, Any]:
+        """현재 롤링 상관관계 / 영향 지수 / 변동성 (O(1) 조회)"""
+        return self.correlation_engine.get(stock_symbol)
+    
+    def get_rolling_sentiment(self, stock_symbol: str) -> Dict[str, Dict[str, Any]]:
+        """최근 1시간/24시간/7일 종목 감정 (버킷 합계 조회, 기사 재스캔 없음)"""
+        return sentiment_timeseries.rolling_windows(stock_symbol)
+    
     def predict_price_movement(self, stock_symbol: str, 
                              current_news: List[Dict[str, Any]]) -> Dict[str, Any]:
         """뉴스 기반 주가 변동 예측"""
         try:
             # 현재 뉴스 감정 분석
-            current_sentiment = self._analyze_current_news_sentiment(current_news)
+            current_sentiment = self._analyze_current_news_sentiment(current_news, stock_symbol)
             
             # 최근 주가 데이터
             recent_price_data = self._get_recent_price_data(stock_symbol)
@@ -81,6 +200,7 @@ class PriceCorrelationAnalyzer:
                 'predicted_movement': prediction,
                 'confidence': confidence,
                 'current_sentiment': current_sentiment,
+                'rolling_correlation': self.get_rolling_correlation(stock_symbol),
                 'prediction_timestamp': datetime.now().isoformat()
             }
             
@@ -129,10 +249,22 @@ class PriceCorrelationAnalyzer:
     def _get_historical_price_data(self, stock_symbol: str) -> pd.DataFrame:
         """과거 주가 데이터 수집"""
         try:
-            # Yahoo Finance에서 과거 데이터 조회
-            import yfinance as yf
-            ticker = yf.Ticker(stock_symbol)
-            hist = ticker.history(period=f"{self.correlation_config['time_window']}d")
+            # 피처 저장소에 마지막 거래일까지 적재된 일간 피처 우선 사용
+            features = feature_store.get_features(stock_symbol, days=self.correlation_config['time_window'])
+            if not features.empty:
+                features = features[features['close'].notna()]
+            if not features.empty and feature_store.is_fresh(features.index[-1]):
+                return pd.DataFrame({
+                    'Open': features['open'],
+                    'Close': features['close'],
+                    'Volume': features['volume'],
+                    'Date': features.index,
+                    'Price_Change': features['price_change'],
+                    'Volume_Change': features['volume_change']
+                }, index=features.index)
+            
+            # 로컬 일봉 저장소에서 조회 (누락 구간만 수집)
+            hist = price_store.get_history(stock_symbol, f"{self.correlation_config['time_window']}d")
             
             if hist.empty:
                 return pd.DataFrame()
@@ -149,6 +281,107 @@ class PriceCorrelationAnalyzer:
             print(f"❌ 과거 주가 데이터 수집 실패: {e}")
             return pd.DataFrame()
     
+    def _build_return_matrix(self, symbols: List[str], days: int) -> pd.DataFrame:
+        """날짜 × 종목 일간 수익률 행렬"""
+        closes = {}
+        for symbol in symbols:
+            hist = price_store.get_history(symbol, f"{days}d")
+            if not hist.empty:
+                closes[symbol] = pd.Series(hist['Close'].to_numpy(), index=hist.index.date)
+        
+        if not closes:
+            return pd.DataFrame()
+        
+        close_matrix = pd.DataFrame(closes).sort_index()
+        return close_matrix.pct_change(fill_method=None).iloc[1:]
+    
+    def _build_sentiment_matrix(self, news_data: List[Dict[str, Any]],
+                                symbols: List[str]) -> pd.DataFrame:
+        """날짜 × 종목 평균 감정 행렬 (기사별 감정은 1회만 계산)"""
+        column = {symbol: j for j, symbol in enumerate(symbols)}
+        sums: Dict[Any, np.ndarray] = {}
+        counts: Dict[Any, np.ndarray] = {}
+        
+        for news in news_data:
+            news_date = news.get('date', datetime.now().date())
+            if isinstance(news_date, str):
+                news_date = datetime.strptime(news_date, '%Y-%m-%d').date()
+            
+            # 기사에 언급된 종목에만 반영
+            targets = [column[s] for s in self._linked_symbols(news) if s in column]
+            if not targets:
+                continue
+            
+            score = self._calculate_news_sentiment(news)
+            if news_date not in sums:
+                sums[news_date] = np.zeros(len(symbols))
+                counts[news_date] = np.zeros(len(symbols))
+            sums[news_date][targets] += score
+            counts[news_date][targets] += 1
+        
+        if not sums:
+            return pd.DataFrame(columns=symbols, dtype=float)
+        
+        dates = sorted(sums)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = np.array([sums[d] for d in dates]) / np.array([counts[d] for d in dates])
+        return pd.DataFrame(values, index=dates, columns=symbols)
+    
+    @staticmethod
+    def _lagged_correlation(sentiment: np.ndarray, returns: np.ndarray,
+                            lags: List[int]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """시차별 감정(t)–수익률(t+k) 상관계수를 한 번에 계산
+        
+        Returns:
+            own: (시차 × 종목) 종목별 자기 상관계수
+            cross: (시차 × 종목 × 종목) 감정_i(t)–수익률_j(t+k) 교차 상관계수
+            counts: (시차 × 종목) 유효 관측 수
+        """
+        days, n_symbols = returns.shape
+        x = np.full((len(lags), days, n_symbols), np.nan)
+        y = np.full((len(lags), days, n_symbols), np.nan)
+        for i, lag in enumerate(lags):
+            if lag < days:
+                x[i, :days - lag] = sentiment[:days - lag]
+                y[i, :days - lag] = returns[lag:]
+        
+        with np.errstate(divide='ignore', invalid='ignore'), warnings.catch_warnings():
+            # 관측이 없는 종목은 NaN으로 남김
+            warnings.simplefilter('ignore', RuntimeWarning)
+            
+            # 감정_i(t)–수익률_j(t+k) 쌍이 모두 관측된 날짜만으로 평균/분산/공분산 계산 (pairwise-complete)
+            # 평균을 먼저 빼 두면 원적률 차이로 계산해도 자릿수 손실이 작다
+            x_valid, y_valid = (~np.isnan(x)).astype(float), (~np.isnan(y)).astype(float)
+            x0 = np.nan_to_num(x - np.nanmean(x, axis=1, keepdims=True))
+            y0 = np.nan_to_num(y - np.nanmean(y, axis=1, keepdims=True))
+            
+            pair_counts = np.einsum('lds,ldt->lst', x_valid, y_valid)
+            sum_x = np.einsum('lds,ldt->lst', x0, y_valid)
+            sum_y = np.einsum('lds,ldt->lst', x_valid, y0)
+            sum_xx = np.einsum('lds,ldt->lst', x0 ** 2, y_valid)
+            sum_yy = np.einsum('lds,ldt->lst', x_valid, y0 ** 2)
+            var_x = sum_xx - sum_x ** 2 / pair_counts
+            var_y = sum_yy - sum_y ** 2 / pair_counts
+            cov = np.einsum('lds,ldt->lst', x0, y0) - sum_x * sum_y / pair_counts
+            cross = cov / np.sqrt(var_x * var_y)
+        
+        # 관측 부족 또는 분산이 (반올림 오차 수준으로) 0인 쌍은 상관계수 없음
+        cross[(pair_counts < 3) | ~(var_x > 1e-12 * sum_xx) | ~(var_y > 1e-12 * sum_yy)] = np.nan
+        own = np.diagonal(cross, axis1=1, axis2=2).copy()
+        counts = np.diagonal(pair_counts, axis1=1, axis2=2).astype(int)
+        return own, cross, counts
+    
+    @staticmethod
+    def _linked_symbols(news: Dict[str, Any]) -> List[str]:
+        """기사 관련 종목 ('symbols' 태그 우선, 없으면 별칭 매칭)"""
+        if 'symbols' in news:
+            return news['symbols']
+        return ticker_linker.link_article(news)
+    
+    @staticmethod
+    def _nan_to_none(value: float) -> Optional[float]:
+        return None if value is None or np.isnan(value) else float(value)
+    
     def _analyze_news_sentiment_timeline(self, news_data: List[Dict[str, Any]]) -> pd.DataFrame:
         """뉴스 감정 분석 (시간순)"""
         try:
@@ -185,25 +418,15 @@ class PriceCorrelationAnalyzer:
             print(f"❌ 뉴스 감정 분석 실패: {e}")
             return pd.DataFrame()
     
-    def _calculate_news_sentiment(self, news: Dict[str, Any]) -> float:
+    @staticmethod
+    def _calculate_news_sentiment(news: Dict[str, Any]) -> float:
         """개별 뉴스 감정 점수 계산"""
         title = news.get('title', '')
         content = news.get('content', '')
         text = f"{title} {content}"
         
-        # 긍정 키워드
-        positive_words = ['상승', '급등', '호재', '성장', '개선', '돌파', '신기록', '급증']
-        # 부정 키워드
-        negative_words = ['하락', '급락', '악재', '위험', '우려', '폭락', '하향', '부진']
-        
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
-        
-        total_count = positive_count + negative_count
-        if total_count == 0:
-            return 0.5  # 중립
-        
-        return positive_count / total_count
+        # 가중치 감정 사전 1회 스캔 → 긍정 비율 (감정 용어가 없으면 0.5 중립)
+        return korean_lexicon.score(text).ratio
     
     def _extract_keywords(self, news: Dict[str, Any]) -> List[str]:
         """뉴스에서 키워드 추출"""
@@ -211,14 +434,16 @@ class PriceCorrelationAnalyzer:
         content = news.get('content', '')
         text = f"{title} {content}"
         
-        # 주요 키워드 목록
+        # 주요 테마 키워드 목록
         keywords = [
             'AI', '반도체', '전기차', '바이오', '게임', '금융', '부동산',
-            '금리', '환율', '원유', '금', '달러', '엔화', '위안',
-            '삼성전자', 'SK하이닉스', 'NAVER', '카카오', 'LG에너지솔루션'
+            '금리', '환율', '원유', '금', '달러', '엔화', '위안'
         ]
         
-        return [kw for kw in keywords if kw in text]
+        # 종목은 별칭 인덱스로 매칭해 대표명으로 표기
+        companies = [ticker_linker.names[s] for s in ticker_linker.link_article(news)]
+        
+        return [kw for kw in keywords if kw in text] + companies
     
     def _calculate_correlation(self, price_data: pd.DataFrame, 
                              sentiment_data: pd.DataFrame) -> Dict[str, Any]:
@@ -333,18 +558,32 @@ class PriceCorrelationAnalyzer:
     def _get_recent_price_data(self, stock_symbol: str) -> Dict[str, Any]:
         """최근 주가 데이터 조회"""
         try:
-            price_data = self.financial_collector.get_stock_price(stock_symbol, '5d')
-            return price_data
+            # 피처 저장소 최신 행 (change_percent, price_change, 지표 등)
+            latest = feature_store.get_latest(stock_symbol, fresh=True)
+            if not latest:
+                # 마지막 거래일 행이 없으면 누락 일봉을 수집해 다시 적재
+                feature_store.update_prices([stock_symbol], refresh=True)
+                latest = feature_store.get_latest(stock_symbol)
+            return latest
             
         except Exception as e:
             print(f"❌ 최근 주가 데이터 조회 실패: {e}")
             return {}
     
-    def _analyze_current_news_sentiment(self, current_news: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """현재 뉴스 감정 분석"""
+    def _analyze_current_news_sentiment(self, current_news: List[Dict[str, Any]],
+                                        stock_symbol: Optional[str] = None) -> Dict[str, Any]:
+        """현재 뉴스 감정 분석 (뉴스가 없으면 감정 시계열의 최근 24시간 버킷 사용)"""
         try:
             if not current_news:
-                return {'sentiment_score': 0.5, 'news_count': 0}
+                window = sentiment_timeseries.rolling(ROLLING_WINDOWS['24h'], stock_symbol or MARKET_SYMBOL)
+                if window['count'] == 0:
+                    return {'sentiment_score': 0.5, 'news_count': 0}
+                # compound(-1~1) → 0~1 척도
+                return {
+                    'sentiment_score': (window['avg_sentiment'] + 1) / 2,
+                    'sentiment_std': window['sentiment_std'] / 2,
+                    'news_count': window['count']
+                }
             
             sentiment_scores = []
             for news in current_news:
@@ -370,16 +609,17 @@ class PriceCorrelationAnalyzer:
             
             # 간단한 예측 (실제로는 더 복잡한 모델 사용)
             predicted_change = (
-                sentiment_score * 0.3 +
-                price_change * 0.5 +
-                0.2  # 기타 요인
+                sentiment_score * PREDICTION_MODEL['sentiment_coef'] +
+                price_change * PREDICTION_MODEL['change_coef'] +
+                PREDICTION_MODEL['intercept']
             )
             
             # 예측 결과 해석
-            if predicted_change > 0.02:
+            threshold = PREDICTION_MODEL['threshold']
+            if predicted_change > threshold:
                 movement = '상승'
                 confidence = min(0.8, predicted_change * 10)
-            elif predicted_change < -0.02:
+            elif predicted_change < -threshold:
                 movement = '하락'
                 confidence = min(0.8, abs(predicted_change) * 10)
             else:
@@ -401,21 +641,22 @@ class PriceCorrelationAnalyzer:
         """예측 신뢰도 계산"""
         try:
             # 뉴스 수량 기반 신뢰도
+            params = PREDICTION_CONFIDENCE
             news_count = current_sentiment.get('news_count', 0)
-            news_confidence = min(0.8, news_count / 10)
+            news_confidence = min(params['news_cap'], news_count / params['news_scale'])
             
             # 감정 일관성 기반 신뢰도
             sentiment_std = current_sentiment.get('sentiment_std', 0.5)
-            sentiment_confidence = max(0.3, 1 - sentiment_std)
+            sentiment_confidence = max(params['component_floor'], 1 - sentiment_std)
             
             # 가격 변동성 기반 신뢰도
             price_change = abs(recent_price_data.get('change_percent', 0))
-            price_confidence = max(0.3, 1 - (price_change / 10))
+            price_confidence = max(params['component_floor'], 1 - (price_change / params['volatility_scale']))
             
             # 종합 신뢰도
             total_confidence = (news_confidence + sentiment_confidence + price_confidence) / 3
             
-            return min(0.9, max(0.3, total_confidence))
+            return min(params['max'], max(params['min'], total_confidence))
             
         except Exception as e:
             print(f"❌ 신뢰도 계산 실패: {e}")
@@ -0,0 +1,227 @@
+"""
+🗃️ 일봉 OHLCV 로컬 저장소
+SQLite 기반 종목별 일봉 저장 및 누락 구간만 증분 수집
+"""
+
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.core.market_data_provider import MarketDataProvider, get_market_data_provider, period_to_days
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+class PriceStore:
+    """종목별 일봉 OHLCV 저장소"""
+    
+    def __init__(self, db_path: str = "data/price_history.db",
+                 provider: Optional[MarketDataProvider] = None):
+        self.db_path = Path(db_path)
+        self._provider = provider
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'reads': 0,
+            'fetches': 0,
+            'rows_appended': 0,
+            'last_update': None
+        }
+        
+        self.init_database()
+        logger.info(f"🗃️ 가격 저장소 초기화: {self.db_path}")
+    
+    def init_database(self):
+        """테이블 생성"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS ohlcv (
+                    symbol TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    open REAL,
+                    high REAL,
+                    low REAL,
+                    close REAL,
+                    volume REAL,
+                    PRIMARY KEY (symbol, date)
+                )
+            """)
+            # 제공자에 요청을 마친 구간 (주말/휴장/상장 전 구간은 봉이 없어도 다시 요청하지 않음)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS fetched_ranges (
+                    symbol TEXT PRIMARY KEY,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    fetched_at TEXT
+                )
+            """)
+            conn.commit()
+    
+    @property
+    def provider(self) -> MarketDataProvider:
+        return self._provider or get_market_data_provider()
+    
+    def get_history(self, symbol: str, period: str = "1y", refresh: bool = True) -> pd.DataFrame:
+        """기간 내 일봉 조회 (필요 시 누락 구간만 수집 후 반환)"""
+        start = date.today() - timedelta(days=self.period_to_days(period))
+        
+        if refresh:
+            self.update(symbol, start)
+        
+        return self.read(symbol, start)
+    
+    def read(self, symbol: str, start: Optional[date] = None,
+             end: Optional[date] = None) -> pd.DataFrame:
+        """저장된 일봉 조회 (DatetimeIndex, OHLCV 컬럼)"""
+        query = "SELECT date, open, high, low, close, volume FROM ohlcv WHERE symbol = ?"
+        params = [symbol]
+        
+        if start:
+            query += " AND date >= ?"
+            params.append(start.isoformat())
+        if end:
+            query += " AND date <= ?"
+            params.append(end.isoformat())
+        query += " ORDER BY date"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(query, params).fetchall()
+        
+        self.stats['reads'] += 1
+        
+        df = pd.DataFrame(rows, columns=['Date'] + OHLCV_COLUMNS)
+        df['Date'] = pd.to_datetime(df['Date'])
+        return df.set_index('Date')
+    
+    def get_range(self, symbol: str) -> Tuple[Optional[date], Optional[date]]:
+        """저장된 첫/마지막 거래일"""
+        with sqlite3.connect(self.db_path) as conn:
+            first, last = conn.execute(
+                "SELECT MIN(date), MAX(date) FROM ohlcv WHERE symbol = ?", (symbol,)
+            ).fetchone()
+        
+        if first is None:
+            return None, None
+        return date.fromisoformat(first), date.fromisoformat(last)
+    
+    def get_fetched_range(self, symbol: str) -> Tuple[Optional[date], Optional[date]]:
+        """제공자에 요청을 마친 구간"""
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute(
+                "SELECT start_date, end_date FROM fetched_ranges WHERE symbol = ?", (symbol,)
+            ).fetchone()
+        
+        if row is None:
+            return None, None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+    
+    def _record_fetched(self, symbol: str, start: date, end: date):
+        """요청 구간 기록 (기존 구간과 합침)"""
+        fetched_start, fetched_end = self.get_fetched_range(symbol)
+        if fetched_start is not None:
+            start, end = min(start, fetched_start), max(end, fetched_end)
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO fetched_ranges (symbol, start_date, end_date, fetched_at)
+                VALUES (?, ?, ?, ?)
+            """, (symbol, start.isoformat(), end.isoformat(), datetime.now().isoformat()))
+            conn.commit()
+    
+    def update(self, symbol: str, start: date) -> int:
+        """start 이후 누락된 구간만 수집해서 추가
+        
+        마지막 저장 봉은 장중 부분 봉일 수 있으므로 매번 그 날짜부터 다시 받아 덮어쓴다.
+        """
+        with self._lock:
+            today = date.today()
+            first, last = self.get_range(symbol)
+            fetched_start, _ = self.get_fetched_range(symbol)
+            
+            gaps = []
+            if first is None and fetched_start is None:
+                gaps.append((start, today))
+            else:
+                covered_start = min(d for d in (first, fetched_start) if d is not None)
+                if start < covered_start:
+                    gaps.append((start, covered_start - timedelta(days=1)))
+                # 저장된 봉이 없으면(요청 구간 전체가 휴장 등) 요청 시작일부터 다시 확인
+                tail_start = last if last is not None else max(start, covered_start)
+                gaps.append((tail_start, today))
+            
+            appended = 0
+            for gap_start, gap_end in gaps:
+                if gap_start > gap_end:
+                    continue
+                try:
+                    hist = self._fetch(symbol, gap_start, gap_end)
+                    appended += self.append(symbol, hist)
+                    self._record_fetched(symbol, gap_start, gap_end)
+                except Exception as e:
+                    logger.warning(f"⚠️ 일봉 수집 실패 ({symbol}, {gap_start}~{gap_end}): {e}")
+            
+            if appended:
+                self.stats['last_update'] = datetime.now().isoformat()
+                logger.debug(f"✅ 일봉 증분 저장: {symbol} {appended}행")
+            
+            return appended
+    
+    def append(self, symbol: str, hist: pd.DataFrame) -> int:
+        """일봉 DataFrame 저장 (같은 날짜는 덮어씀)"""
+        if hist is None or hist.empty:
+            return 0
+        
+        rows = [
+            (
+                symbol,
+                pd.Timestamp(index).date().isoformat(),
+                *[None if pd.isna(row[col]) else float(row[col]) for col in OHLCV_COLUMNS]
+            )
+            for index, row in hist[OHLCV_COLUMNS].iterrows()
+        ]
+        
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO ohlcv (symbol, date, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        
+        self.stats['rows_appended'] += len(rows)
+        return len(rows)
+    
+    def _fetch(self, symbol: str, start: date, end: date) -> pd.DataFrame:
+        """제공자에서 [start, end] 구간 일봉 수집"""
+        self.stats['fetches'] += 1
+        return self.provider.get_history(symbol, start=start, end=end, interval="1d")
+    
+    @staticmethod
+    def period_to_days(period: str) -> int:
+        """yfinance 기간 문자열을 일수로 변환"""
+        return period_to_days(period)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """저장소 통계 반환"""
+        with sqlite3.connect(self.db_path) as conn:
+            symbols, rows = conn.execute(
+                "SELECT COUNT(DISTINCT symbol), COUNT(*) FROM ohlcv"
+            ).fetchone()
+        
+        return {
+            **self.stats,
+            'symbols': symbols,
+            'rows': rows,
+            'db_path': str(self.db_path),
+            'timestamp': datetime.now().isoformat()
+        }
+
+# 전역 가격 저장소 인스턴스
+price_store = PriceStore(FINANCIAL_CONFIG.get('price_store_path', "data/price_history.db"))
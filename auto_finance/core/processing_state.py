@@ -0,0 +1,169 @@
+"""
+🧾 기사 처리 상태 저장소 (델타 처리)
+단계별로 처리한 기사를 (URL, 정규화 본문 지문)으로 SQLite에 기록하여
+주기 실행 시 처음 보거나 내용이 실질적으로 바뀐 기사만 비용이 큰 단계로 전달
+"""
+
+import hashlib
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import PERFORMANCE_CONFIG
+
+logger = setup_logger(__name__)
+
+class ProcessingState:
+    """단계별 기사 처리 이력"""
+    
+    def __init__(self, db_path: str = "data/processing_state.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        
+        # 최근 델타 결과 (단계 → 처리/건너뜀 건수)
+        self.last_delta: Dict[str, Dict[str, int]] = {}
+        
+        self.init_database()
+        logger.info(f"🧾 처리 상태 저장소 초기화: {self.db_path}")
+    
+    def init_database(self):
+        """테이블 생성"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_articles (
+                    stage TEXT NOT NULL,
+                    article_key TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    title TEXT,
+                    processed_at TEXT,  -- 마지막 처리 또는 건너뜀 확인 시각
+                    PRIMARY KEY (stage, article_key)
+                )
+            """)
+            conn.commit()
+    
+    @staticmethod
+    def article_key(article: Dict[str, Any]) -> str:
+        """기사 식별자 (URL 우선, 없으면 제목)"""
+        source = article.get('url') or article.get('link') or f"title:{article.get('title', '')}"
+        return hashlib.md5(source.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def content_hash(article: Dict[str, Any]) -> str:
+        """정규화한 제목+본문 지문 (공백/대소문자/구두점만 다른 수정은 같은 내용으로 취급)"""
+        text = f"{article.get('title', '')}\n{article.get('content', '')}".lower()
+        text = re.sub(r'[^\w]+', ' ', text).strip()
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def filter_pending(self, stage: str, articles: List[Dict[str, Any]]
+                       ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """(처리할 기사, 건너뛸 기사) - 처음 보거나 본문이 바뀐 기사만 처리 대상"""
+        if not articles:
+            self.last_delta[stage] = {'processed': 0, 'skipped': 0, 'changed': 0}
+            return [], []
+        
+        keys = [self.article_key(article) for article in articles]
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            seen = {}
+            # SQLite 변수 개수 제한을 피하기 위해 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = conn.execute(
+                    f"SELECT article_key, content_hash FROM processed_articles "
+                    f"WHERE stage = ? AND article_key IN ({','.join('?' * len(chunk))})",
+                    [stage, *chunk]
+                ).fetchall()
+                seen.update(rows)
+        
+        pending, skipped, changed = [], [], 0
+        for article, key in zip(articles, keys):
+            previous = seen.get(key)
+            if previous == self.content_hash(article):
+                skipped.append(article)
+                continue
+            if previous is not None:
+                changed += 1
+            pending.append(article)
+        
+        # 아직 크롤링되는 기사는 건너뛰어도 확인 시각을 갱신해 보관 기간 정리 대상에서 제외
+        self._touch(stage, [self.article_key(article) for article in skipped])
+        
+        self.last_delta[stage] = {'processed': len(pending), 'skipped': len(skipped), 'changed': changed}
+        logger.info(f"🧾 [{stage}] 델타: 처리 {len(pending)}개 (변경 {changed}개), 건너뜀 {len(skipped)}개")
+        return pending, skipped
+    
+    def _touch(self, stage: str, keys: List[str]):
+        """건너뛴 기사의 확인 시각 갱신"""
+        if not keys:
+            return
+        
+        now = datetime.now().isoformat()
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                "UPDATE processed_articles SET processed_at = ? WHERE stage = ? AND article_key = ?",
+                [(now, stage, key) for key in keys]
+            )
+            conn.commit()
+    
+    def mark_processed(self, stage: str, articles: List[Dict[str, Any]]) -> int:
+        """단계 처리 완료 기록 (단계가 성공한 기사만 호출)"""
+        if not articles:
+            return 0
+        
+        now = datetime.now().isoformat()
+        rows = [
+            (stage, self.article_key(article), self.content_hash(article), article.get('title', ''), now)
+            for article in articles
+        ]
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            conn.executemany("""
+                INSERT OR REPLACE INTO processed_articles
+                (stage, article_key, content_hash, title, processed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+        return len(rows)
+    
+    def mark_returned(self, stage: str, articles: List[Dict[str, Any]],
+                      sources: List[Dict[str, Any]]) -> int:
+        """결과가 돌아온 기사만 처리 완료 기록
+        
+        sources는 단계 결과별 원본 기사 식별 필드(url/link/title)로, 기사별로 실패를 건너뛰는 단계에서
+        실패한 기사가 처리 완료로 기록되어 재시도되지 않는 일을 막는다.
+        """
+        returned = {self.article_key(source) for source in sources}
+        return self.mark_processed(stage, [a for a in articles if self.article_key(a) in returned])
+    
+    def prune(self, max_age_days: int = 30) -> int:
+        """max_age_days 동안 처리/확인되지 않은 이력 삭제 (크롤링 범위를 벗어난 기사)"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            removed = conn.execute(
+                "DELETE FROM processed_articles WHERE processed_at < ?", (cutoff,)
+            ).rowcount
+            conn.commit()
+        
+        if removed:
+            logger.info(f"🧹 오래된 처리 이력 {removed}건 삭제")
+        return removed
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """저장소 통계 반환"""
+        with sqlite3.connect(self.db_path) as conn:
+            by_stage = dict(conn.execute(
+                "SELECT stage, COUNT(*) FROM processed_articles GROUP BY stage"
+            ).fetchall())
+        
+        return {
+            'articles_by_stage': by_stage,
+            'last_delta': self.last_delta,
+            'db_path': str(self.db_path),
+            'timestamp': datetime.now().isoformat()
+        }
+
+# 전역 처리 상태 저장소
+processing_state = ProcessingState(PERFORMANCE_CONFIG.get('processing_state_path', "data/processing_state.db"))
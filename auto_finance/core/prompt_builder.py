@@ -0,0 +1,265 @@
+"""
+🧾 공용 프롬프트 빌더 / 토큰 회계
+전송 전 토큰 수 계산, 작업별 예산에 맞춘 기사 본문 압축, 중복 지시문 제거,
+호출별 입력/출력 토큰과 실제 사용량 기반 비용 기록
+"""
+
+import re
+import textwrap
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 작업별 기사 본문 토큰 예산
+BODY_TOKEN_BUDGETS: Dict[str, int] = {
+    'fact_checking': 900,
+    'content_generation': 1500,
+    'analysis': 1500,
+    'summarization': 1200
+}
+DEFAULT_BODY_BUDGET = 1200
+
+# 모델별 1k 토큰당 가격 ($, 입력/출력)
+MODEL_PRICING: Dict[str, Tuple[float, float]] = {
+    'gemini': (0.0, 0.0),   # 현재 무료 티어
+    'gpt4': (0.03, 0.06),
+    'claude': (0.003, 0.015)
+}
+
+# 본문 압축 시 제거할 기사 상투 문구 (줄 전체가 일치할 때만 제거 - 본문 문장은 유지)
+BOILERPLATE_PATTERNS = [
+    re.compile(r'\s*(?:ⓒ|©|\(c\)|Copyright|저작권자).{0,60}'),
+    re.compile(r'.{0,40}(?:무단\s*전재|재배포\s*금지).{0,40}'),
+    re.compile(r'\s*[\[(]?\s*(?:[가-힣]{2,4}\s*기자)?\s*[\])]?\s*(?:[\w.+-]+@[\w-]+\.[\w.]+)?\s*'),
+    re.compile(r'\s*(?:기사\s*제보|구독하기|좋아요|댓글)(?:\s*[\d,]+)?(?:\s*[|·]\s*(?:기사\s*제보|구독하기|좋아요|댓글)(?:\s*[\d,]+)?)*\s*')
+]
+
+_TOKEN_PATTERN = re.compile(r'[A-Za-z]+|\d+(?:[.,]\d+)*|[가-힣]{1,2}|[^\sA-Za-z\d가-힣]')
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?。])\s+|\n+')
+_SENTENCE_END = re.compile(r'(?<=[.!?。])\s+')
+_BLOCK_SPLIT = re.compile(r'\n[ \t]*\n')
+
+def count_tokens(text: str) -> int:
+    """토큰 수 추정 (영문 단어/숫자 1개, 한글 1~2음절, 기호 1개를 1토큰으로 계산)"""
+    if not text:
+        return 0
+    return len(_TOKEN_PATTERN.findall(text))
+
+def split_sentences(text: str) -> List[str]:
+    """문장 단위 분리 (빈 문장 제거)"""
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text or '') if s and s.strip()]
+
+def _is_boilerplate(line: str) -> bool:
+    """줄 전체가 저작권/기자 서명/구독 안내 등 상투 문구인지"""
+    return bool(line.strip()) and any(pattern.fullmatch(line) for pattern in BOILERPLATE_PATTERNS)
+
+def _join_units(units: List[Tuple[int, int, str]], keep: List[int]) -> str:
+    """선택된 문장을 원래 문단/줄 구조대로 다시 합침"""
+    paragraphs: Dict[int, Dict[int, List[str]]] = {}
+    for index in sorted(keep):
+        paragraph, line, sentence = units[index]
+        paragraphs.setdefault(paragraph, {}).setdefault(line, []).append(sentence)
+    
+    return '\n\n'.join(
+        '\n'.join(' '.join(sentences) for sentences in lines.values())
+        for lines in paragraphs.values()
+    )
+
+def compress_body(body: str, budget: int, title: str = '') -> str:
+    """기사 본문을 토큰 예산에 맞게 압축
+    
+    예산 안이면 본문을 그대로 돌려준다. 넘으면 상투 문구 줄과 중복 문장을 제거하고,
+    그래도 넘으면 리드 문장을 유지한 채 제목/본문 핵심어와 많이 겹치는 문장을 원래 순서대로 골라 채운다.
+    문단/줄 구분은 남은 문장 기준으로 유지한다.
+    """
+    body = body or ''
+    if count_tokens(body) <= budget:
+        return body
+    
+    # (문단, 줄, 문장) 단위로 분해
+    units: List[Tuple[int, int, str]] = []
+    seen = set()
+    for paragraph_index, paragraph in enumerate(_BLOCK_SPLIT.split(body.strip())):
+        for line_index, line in enumerate(paragraph.splitlines()):
+            if _is_boilerplate(line):
+                continue
+            for sentence in _SENTENCE_END.split(line.strip()):
+                key = re.sub(r'\s+', '', sentence)
+                if not key or key in seen:
+                    continue
+                seen.add(key)
+                units.append((paragraph_index, line_index, sentence.strip()))
+    
+    if not units:
+        return ''
+    
+    sentences = [unit[2] for unit in units]
+    costs = [count_tokens(s) for s in sentences]
+    if sum(costs) <= budget:
+        return _join_units(units, list(range(len(units))))
+    
+    # 문장 점수: 본문 빈출 단어 + 제목 단어 가중
+    words = [re.findall(r'[가-힣]{2,}|[A-Za-z]{3,}|\d+', s) for s in sentences]
+    frequency = Counter(w for ws in words for w in set(ws))
+    title_words = set(re.findall(r'[가-힣]{2,}|[A-Za-z]{3,}|\d+', title))
+    scores = [
+        sum(frequency[w] - 1 for w in set(ws)) / (len(ws) ** 0.5 if ws else 1.0)
+        + 2.0 * len(title_words & set(ws))
+        for ws in words
+    ]
+    
+    # 리드 문장은 항상 유지 (기사 핵심이 첫 문장에 오는 경우가 대부분)
+    selected = [0]
+    used = costs[0]
+    for index in sorted(range(1, len(sentences)), key=lambda i: scores[i], reverse=True):
+        if used + costs[index] <= budget:
+            selected.append(index)
+            used += costs[index]
+    
+    return _join_units(units, selected)
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip())
+
+def dedupe_instructions(prompt: str) -> str:
+    """문단별 공통 들여쓰기 정리 및 반복 지시문 문단 제거 (래퍼가 같은 지시를 덧붙인 경우)
+    
+    상대 들여쓰기와 줄 구조는 유지하고, 앞서 나온 문단과 내용이 같은 문단만 제거한다.
+    """
+    blocks = []
+    seen = set()
+    for block in _BLOCK_SPLIT.split(prompt):
+        lines = [line.rstrip() for line in block.splitlines() if line.strip()]
+        if not lines:
+            continue
+        # f-string 치환으로 첫 줄에만 남은 바깥 들여쓰기 제거
+        if len(lines) > 1 and _indent(lines[0]) > max(_indent(line) for line in lines[1:]):
+            lines[0] = lines[0].lstrip()
+        text = textwrap.dedent('\n'.join(lines))
+        
+        # 짧은 문단(구분자, 괄호 등)은 반복되어도 유지
+        key = re.sub(r'\s+', ' ', text).strip()
+        if len(key) > 12:
+            if key in seen:
+                continue
+            seen.add(key)
+        blocks.append(text)
+    
+    return '\n\n'.join(blocks)
+
+class PromptBuilder:
+    """작업별 예산 기반 프롬프트 구성기"""
+    
+    def __init__(self, budgets: Optional[Dict[str, int]] = None):
+        self.budgets = dict(BODY_TOKEN_BUDGETS if budgets is None else budgets)
+        self.stats = {
+            'prompts_built': 0,
+            'bodies_compressed': 0,
+            'tokens_before': 0,
+            'tokens_after': 0
+        }
+    
+    def budget_for(self, task_type: str) -> int:
+        return self.budgets.get(task_type, DEFAULT_BODY_BUDGET)
+    
+    def article_body(self, article: Dict[str, Any], task_type: str) -> str:
+        """예산에 맞춘 기사 본문"""
+        body = article.get('content', '') or ''
+        compressed = compress_body(body, self.budget_for(task_type), article.get('title', ''))
+        
+        before, after = count_tokens(body), count_tokens(compressed)
+        self.stats['tokens_before'] += before
+        self.stats['tokens_after'] += after
+        if after < before:
+            self.stats['bodies_compressed'] += 1
+        return compressed
+    
+    def finalize(self, prompt: str) -> str:
+        """전송 직전 정리 (들여쓰기/중복 지시문 제거)"""
+        self.stats['prompts_built'] += 1
+        return dedupe_instructions(prompt)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        saved = self.stats['tokens_before'] - self.stats['tokens_after']
+        return {
+            **self.stats,
+            'tokens_saved': saved,
+            'compression_ratio': (self.stats['tokens_after'] / self.stats['tokens_before'])
+            if self.stats['tokens_before'] else 1.0
+        }
+
+def extract_usage(response: Any) -> Tuple[Optional[int], Optional[int]]:
+    """SDK 응답 객체의 실제 입력/출력 토큰 (Gemini, OpenAI, Anthropic 형식)"""
+    usage = getattr(response, 'usage_metadata', None)
+    if usage is not None:
+        return getattr(usage, 'prompt_token_count', None), getattr(usage, 'candidates_token_count', None)
+    
+    usage = getattr(response, 'usage', None)
+    if usage is not None:
+        if hasattr(usage, 'prompt_tokens'):
+            return usage.prompt_tokens, usage.completion_tokens
+        if hasattr(usage, 'input_tokens'):
+            return usage.input_tokens, usage.output_tokens
+    
+    return None, None
+
+class TokenLedger:
+    """호출별 토큰/비용 기록부"""
+    
+    def __init__(self, pricing: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.pricing = dict(MODEL_PRICING if pricing is None else pricing)
+        self._lock = threading.Lock()
+        # 호출자 → 모델 → 누적
+        self.usage: Dict[str, Dict[str, Dict[str, float]]] = {}
+    
+    def cost(self, model: str, tokens_in: int, tokens_out: int) -> float:
+        input_price, output_price = self.pricing.get(model, (0.0, 0.0))
+        return tokens_in / 1000 * input_price + tokens_out / 1000 * output_price
+    
+    def record(self, caller: str, model: str, prompt: str, completion: str,
+               response: Any = None) -> Dict[str, Any]:
+        """호출 1건 기록 - 응답에 사용량이 있으면 실측값, 없으면 추정값"""
+        tokens_in, tokens_out = extract_usage(response)
+        estimated = tokens_in is None or tokens_out is None
+        if tokens_in is None:
+            tokens_in = count_tokens(prompt)
+        if tokens_out is None:
+            tokens_out = count_tokens(completion)
+        cost = self.cost(model, tokens_in, tokens_out)
+        
+        with self._lock:
+            entry = self.usage.setdefault(caller, {}).setdefault(model, {
+                'calls': 0, 'tokens_in': 0, 'tokens_out': 0, 'cost': 0.0, 'estimated_calls': 0
+            })
+            entry['calls'] += 1
+            entry['tokens_in'] += tokens_in
+            entry['tokens_out'] += tokens_out
+            entry['cost'] += cost
+            entry['estimated_calls'] += int(estimated)
+        
+        return {'tokens_in': tokens_in, 'tokens_out': tokens_out, 'cost': cost, 'estimated': estimated}
+    
+    def summary(self, caller: Optional[str] = None) -> Dict[str, Any]:
+        """호출자별(또는 전체) 토큰/비용 합계"""
+        callers = [caller] if caller else list(self.usage)
+        totals = {'calls': 0, 'tokens_in': 0, 'tokens_out': 0, 'cost': 0.0, 'estimated_calls': 0}
+        by_model: Dict[str, Dict[str, float]] = {}
+        
+        with self._lock:
+            for name in callers:
+                for model, entry in self.usage.get(name, {}).items():
+                    merged = by_model.setdefault(model, dict.fromkeys(totals, 0))
+                    for key, value in entry.items():
+                        merged[key] += value
+                        totals[key] += value
+        
+        return {**totals, 'by_model': by_model, 'timestamp': datetime.now().isoformat()}
+
+# 전역 인스턴스
+prompt_builder = PromptBuilder()
+token_ledger = TokenLedger()
@@ -0,0 +1,234 @@
+"""
+📖 가중치 한국어 금융 감정 사전
+용어별 가중치, 어간 변형, 부정(해소/완화/않) 및 강조(급/대폭) 처리
+Aho-Corasick 오토마톤으로 문서 1회 스캔 (사전 크기와 무관한 비용)
+"""
+
+import json
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+# 용어별 가중치 (양수: 긍정, 음수: 부정)
+DEFAULT_TERMS: Dict[str, float] = {
+    # 긍정
+    '상승': 1.0, '급등': 1.8, '폭등': 2.0, '강세': 1.0, '반등': 1.0, '회복': 0.8,
+    '호재': 1.5, '호조': 1.2, '호실적': 1.5, '성장': 0.8, '개선': 0.8, '증가': 0.6,
+    '실적': 0.3, '수익': 0.5, '이익': 0.5, '흑자': 1.2, '흑자전환': 1.8,
+    '돌파': 1.2, '신고가': 1.5, '신기록': 1.2, '최대 실적': 1.8, '상향': 1.0,
+    '목표가 상향': 1.5, '매수': 0.6, '순매수': 0.8, '긍정': 0.8, '낙관': 1.0,
+    '기대': 0.5, '기대감': 0.6, '희망': 0.5, '성공': 0.8, '수혜': 1.0, '훈풍': 1.0,
+    '배당 확대': 1.0, '자사주 매입': 1.0, '어닝 서프라이즈': 1.8,
+    # 부정
+    '하락': -1.0, '급락': -1.8, '폭락': -2.0, '약세': -1.0, '조정': -0.5, '반락': -1.0,
+    '악재': -1.5, '부진': -1.2, '손실': -1.0, '적자': -1.2, '적자전환': -1.8,
+    '감소': -0.6, '악화': -1.0, '위험': -0.8, '리스크': -0.6, '우려': -0.8,
+    '불안': -0.8, '공포': -1.2, '하향': -1.0, '목표가 하향': -1.5, '매도': -0.6,
+    '순매도': -0.8, '부정': -0.8, '비관': -1.0, '실망': -1.0, '실패': -0.8,
+    '위기': -1.2, '침체': -1.2, '파산': -2.0, '신저가': -1.5, '경고': -0.8,
+    '둔화': -0.8, '쇼크': -1.5, '어닝 쇼크': -1.8, '폭탄': -1.0, '한파': -1.0
+}
+
+# 어간 → 활용형 (기본형과 같은 가중치)
+STEM_VARIANTS: Dict[str, List[str]] = {
+    '오르': ['올랐', '올라', '오른', '오름'],
+    '내리': ['내렸', '내려', '내린', '내림'],
+    '떨어지': ['떨어졌', '떨어져', '떨어진'],
+    '치솟': ['치솟았', '치솟아', '치솟은'],
+    '뛰': ['뛰었', '뛰어'],
+    '밀리': ['밀렸', '밀려', '밀린'],
+    '늘': ['늘었', '늘어', '늘어난'],
+    '줄': ['줄었', '줄어', '줄어든']
+}
+STEM_WEIGHTS: Dict[str, float] = {
+    '오르': 1.0, '내리': -1.0, '떨어지': -1.0, '치솟': 1.5,
+    '뛰': 0.8, '밀리': -0.8, '늘': 0.5, '줄': -0.5
+}
+
+# 앞선 감정 용어의 극성을 뒤집는 후행 부정어 (한국어는 부정이 뒤에 옴: "하락 우려 해소")
+NEGATORS = ['해소', '완화', '진정', '불식', '벗어나', '벗어났', '제한적', '않', '없', '아니', '못했']
+
+# 뒤따르는 감정 용어의 강도를 조절하는 선행 수식어
+INTENSIFIERS: Dict[str, float] = {
+    '대폭': 1.6, '크게': 1.5, '큰 폭': 1.5, '급격히': 1.6, '사상 최대': 1.8, '사상 최고': 1.8,
+    '매우': 1.4, '강하게': 1.4, '연일': 1.3, '소폭': 0.5, '다소': 0.6, '약간': 0.5, '일부': 0.7
+}
+
+# 부정/강조 적용 범위 (용어 사이 최대 문자 수)
+NEGATION_SCOPE = 8
+INTENSIFIER_SCOPE = 4
+CLAUSE_BREAKS = set('.,!?;\n')
+
+TERM, NEGATOR, INTENSIFIER = 0, 1, 2
+
+@dataclass
+class LexiconScore:
+    """문서 감정 집계"""
+    positive: float = 0.0
+    negative: float = 0.0
+    hits: int = 0
+    
+    @property
+    def net(self) -> float:
+        return self.positive - self.negative
+    
+    @property
+    def ratio(self) -> float:
+        """긍정 비율 (0~1, 감정 용어가 없으면 0.5)"""
+        total = self.positive + self.negative
+        return self.positive / total if total > 0 else 0.5
+
+class SentimentLexicon:
+    """Aho-Corasick 기반 가중치 감정 사전"""
+    
+    def __init__(self, terms: Optional[Dict[str, float]] = None,
+                 negators: Optional[Iterable[str]] = None,
+                 intensifiers: Optional[Dict[str, float]] = None):
+        self.terms: Dict[str, float] = dict(DEFAULT_TERMS if terms is None else terms)
+        if terms is None:
+            for stem, variants in STEM_VARIANTS.items():
+                for variant in variants:
+                    self.terms.setdefault(variant, STEM_WEIGHTS[stem])
+        
+        self.negators = list(NEGATORS if negators is None else negators)
+        self.intensifiers = dict(INTENSIFIERS if intensifiers is None else intensifiers)
+        
+        self._build()
+        logger.info(f"📖 감정 사전 컴파일: 용어 {len(self.terms)}개, 부정어 {len(self.negators)}개, "
+                    f"수식어 {len(self.intensifiers)}개, 상태 {len(self._goto)}개")
+    
+    def _build(self):
+        """트라이 + 실패 링크 구성"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 상태별 (종류, 패턴 길이, 값) - 가장 긴 패턴 하나만 보관
+        self._output: List[Optional[Tuple[int, int, float]]] = [None]
+        
+        entries = [(t, TERM, w) for t, w in self.terms.items()]
+        entries += [(n, NEGATOR, -1.0) for n in self.negators]
+        entries += [(i, INTENSIFIER, m) for i, m in self.intensifiers.items()]
+        
+        for pattern, kind, value in entries:
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append(None)
+                state = nxt
+            self._output[state] = (kind, len(pattern), value)
+        
+        # BFS로 실패 링크 설정, 출력은 실패 경로에서 상속 (접미 패턴 매칭)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                if self._output[nxt] is None:
+                    self._output[nxt] = self._output[self._fail[nxt]]
+    
+    def _matches(self, text: str) -> List[Tuple[int, int, int, float]]:
+        """(시작, 끝, 종류, 값) - 겹치면 먼저 시작하는 긴 패턴 우선"""
+        goto, fail, output = self._goto, self._fail, self._output
+        found = []
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            hit = output[state]
+            if hit is not None:
+                found.append((end - hit[1], end, hit[0], hit[2]))
+        
+        # 같은 끝 위치에서는 가장 긴 패턴만 보고되므로, 시작 위치 기준으로 겹침 제거
+        found.sort(key=lambda m: (m[0], -(m[1] - m[0])))
+        selected = []
+        last_end = 0
+        for match in found:
+            if match[0] >= last_end:
+                selected.append(match)
+                last_end = match[1]
+        return selected
+    
+    def score(self, text: str) -> LexiconScore:
+        """문서 1회 스캔 감정 집계"""
+        result = LexiconScore()
+        if not text:
+            return result
+        
+        hits: List[List[float]] = []  # [끝 위치, 가중치, 시작 위치]
+        multiplier, multiplier_end = 1.0, -1
+        negation_end = 0  # 이미 부정 처리된 구간 끝 (이중 반전 방지)
+        
+        for start, end, kind, value in self._matches(text):
+            if kind == INTENSIFIER:
+                multiplier, multiplier_end = value, end
+            elif kind == TERM:
+                weight = value
+                if multiplier_end >= 0 and start - multiplier_end <= INTENSIFIER_SCOPE:
+                    weight *= multiplier
+                multiplier_end = -1
+                hits.append([end, weight, start])
+            else:
+                # 부정어: 같은 절 안에서 이어지는 직전 감정 용어들의 극성 반전
+                boundary = start
+                for hit in reversed(hits):
+                    gap = text[hit[0]:boundary]
+                    if hit[2] < negation_end:
+                        break
+                    if len(gap) > NEGATION_SCOPE or CLAUSE_BREAKS & set(gap):
+                        break
+                    hit[1] = -hit[1]
+                    boundary = int(hit[2])
+                negation_end = end
+        
+        for _, weight, _ in hits:
+            if weight > 0:
+                result.positive += weight
+            else:
+                result.negative -= weight
+        result.hits = len(hits)
+        return result
+    
+    def add_terms(self, terms: Dict[str, float]):
+        """용어 추가 후 재컴파일"""
+        self.terms.update(terms)
+        self._build()
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'SentimentLexicon':
+        """JSON 사전 파일({"terms": {...}, "negators": [...], "intensifiers": {...}})로 기본 사전 확장"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        lexicon = cls()
+        lexicon.terms.update(data.get('terms', {}))
+        lexicon.negators.extend(n for n in data.get('negators', []) if n not in lexicon.negators)
+        lexicon.intensifiers.update(data.get('intensifiers', {}))
+        lexicon._build()
+        return lexicon
+
+def _load_default_lexicon() -> SentimentLexicon:
+    path = FINANCIAL_CONFIG.get('sentiment_lexicon_path')
+    if path and Path(path).exists():
+        try:
+            return SentimentLexicon.from_file(path)
+        except Exception as e:
+            logger.warning(f"⚠️ 감정 사전 파일 로드 실패, 기본 사전 사용 ({path}): {e}")
+    return SentimentLexicon()
+
+# 전역 감정 사전
+korean_lexicon = _load_default_lexicon()
@@ -0,0 +1,317 @@
+"""
+⏱️ 시장 감정 시계열 집계기
+기사별 감정 점수를 (출처, 종목)별 분/시간/일 버킷 링 버퍼(고정 크기 배열)에 누적하고
+최근 1시간/24시간/7일 롤링 구간을 기사 재스캔 없이 조회
+"""
+
+import hashlib
+import math
+import os
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+from auto_finance.core.ticker_linker import ticker_linker
+
+logger = setup_logger(__name__)
+
+# 전체 출처 / 전체 시장 집계 키
+ALL_SOURCES = 'ALL'
+MARKET_SYMBOL = 'MARKET'
+
+# 해상도 → (버킷 폭(초), 슬롯 수)
+RESOLUTIONS: Dict[str, Tuple[int, int]] = {
+    'minute': (60, 24 * 60),      # 24시간
+    'hour': (3600, 8 * 24),       # 8일
+    'day': (86400, 90)            # 90일
+}
+
+# 대시보드 기본 롤링 구간 (초)
+ROLLING_WINDOWS: Dict[str, int] = {
+    '1h': 3600,
+    '24h': 24 * 3600,
+    '7d': 7 * 24 * 3600
+}
+
+class BucketRing:
+    """고정 폭 버킷 링 버퍼 (슬롯마다 버킷 번호를 기록해 만료 슬롯 자동 재사용)"""
+    
+    def __init__(self, width: int, slots: int):
+        self.width = width
+        self.slots = slots
+        self.bucket_ids = np.full(slots, -1, dtype=np.int64)
+        self.sums = np.zeros(slots)
+        self.sq_sums = np.zeros(slots)
+        self.counts = np.zeros(slots, dtype=np.int64)
+        self.latest = -1
+    
+    def add(self, ts: float, score: float) -> bool:
+        """점수 1건 누적 - O(1) (보관 범위보다 오래된 점수는 버림)"""
+        bucket = int(ts // self.width)
+        if bucket <= self.latest - self.slots:
+            return False
+        
+        slot = bucket % self.slots
+        if self.bucket_ids[slot] != bucket:
+            if self.bucket_ids[slot] > bucket:
+                # 더 최신 버킷이 이미 차지한 슬롯
+                return False
+            self.bucket_ids[slot] = bucket
+            self.sums[slot] = 0.0
+            self.sq_sums[slot] = 0.0
+            self.counts[slot] = 0
+        
+        self.sums[slot] += score
+        self.sq_sums[slot] += score * score
+        self.counts[slot] += 1
+        self.latest = max(self.latest, bucket)
+        return True
+    
+    def _mask(self, first: int, last: int) -> np.ndarray:
+        return (self.bucket_ids >= first) & (self.bucket_ids <= last)
+    
+    def window(self, seconds: int, now: float) -> Tuple[float, float, int]:
+        """최근 seconds 구간 (합, 제곱합, 건수)"""
+        last = int(now // self.width)
+        first = last - math.ceil(seconds / self.width) + 1
+        mask = self._mask(first, last)
+        return float(self.sums[mask].sum()), float(self.sq_sums[mask].sum()), int(self.counts[mask].sum())
+    
+    def series(self, seconds: int, now: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """최근 seconds 구간 버킷별 (시작 시각, 평균, 건수) - 빈 버킷 제외, 오래된 순"""
+        last = int(now // self.width)
+        first = last - math.ceil(seconds / self.width) + 1
+        mask = self._mask(first, last) & (self.counts > 0)
+        order = np.argsort(self.bucket_ids[mask])
+        
+        buckets = self.bucket_ids[mask][order]
+        counts = self.counts[mask][order]
+        means = self.sums[mask][order] / counts
+        return buckets * self.width, means, counts
+
+class SentimentSeries:
+    """단일 (출처, 종목) 키의 분/시간/일 링 버퍼 묶음"""
+    
+    def __init__(self):
+        self.rings = {name: BucketRing(width, slots) for name, (width, slots) in RESOLUTIONS.items()}
+    
+    def add(self, ts: float, score: float):
+        for ring in self.rings.values():
+            ring.add(ts, score)
+    
+    def ring_for(self, seconds: int) -> BucketRing:
+        """구간을 덮는 가장 세밀한 해상도"""
+        for ring in self.rings.values():
+            if seconds <= ring.width * (ring.slots - 1):
+                return ring
+        return self.rings['day']
+
+class SentimentTimeSeries:
+    """(출처, 종목)별 감정 버킷 집계기"""
+    
+    def __init__(self, state_path: str = "data/sentiment_timeseries.npz"):
+        self.state_path = Path(state_path)
+        self.series: Dict[Tuple[str, str], SentimentSeries] = {}
+        # 누적한 기사 키 → 기사 시각 (같은 기사가 다시 수집돼도 한 번만 누적)
+        self.seen: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'scores_added': 0,
+            'articles_skipped': 0,
+            'last_update': None
+        }
+        
+        self.load()
+    
+    @staticmethod
+    def _timestamp(value: Any) -> float:
+        """기사 시각 → epoch 초 (해석 불가 시 현재 시각)"""
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, datetime):
+            return value.timestamp()
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day).timestamp()
+        if isinstance(value, str) and value:
+            try:
+                return datetime.fromisoformat(value.strip()[:19]).timestamp()
+            except ValueError:
+                pass
+        return time.time()
+    
+    def _series(self, source: str, symbol: str) -> SentimentSeries:
+        key = (source, symbol)
+        if key not in self.series:
+            self.series[key] = SentimentSeries()
+        return self.series[key]
+    
+    def add(self, score: float, timestamp: Any = None, source: Optional[str] = None,
+            symbols: Iterable[str] = ()):
+        """점수 1건을 전체/출처별/종목별 키에 누적"""
+        ts = self._timestamp(timestamp)
+        keys = {(ALL_SOURCES, MARKET_SYMBOL)}
+        if source:
+            keys.add((source, MARKET_SYMBOL))
+        for symbol in symbols:
+            keys.add((ALL_SOURCES, symbol))
+            if source:
+                keys.add((source, symbol))
+        
+        with self._lock:
+            for source_key, symbol_key in keys:
+                self._series(source_key, symbol_key).add(ts, score)
+            self.stats['scores_added'] += 1
+            self.stats['last_update'] = datetime.now().isoformat()
+    
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        """기사 식별 키 (피처 저장소와 같은 기준: URL, 없으면 제목+날짜)"""
+        source = article.get('url') or f"{article.get('title', '')}|{article.get('date', '')}"
+        return hashlib.md5(source.encode('utf-8')).hexdigest()
+    
+    def add_articles(self, articles: List[Dict[str, Any]], scores: List[float]):
+        """기사 목록과 같은 순서의 감정 점수 누적 (이미 누적한 기사는 건너뜀)"""
+        for article, score in zip(articles, scores):
+            key = self._article_key(article)
+            if key in self.seen:
+                self.stats['articles_skipped'] += 1
+                continue
+            
+            symbols = article['symbols'] if 'symbols' in article else ticker_linker.link_article(article)
+            timestamp = article.get('published_at') or article.get('crawled_at') or article.get('date')
+            self.add(score, timestamp, article.get('source'), symbols)
+            self.seen[key] = self._timestamp(timestamp)
+    
+    def _prune_seen(self, now: Optional[float] = None):
+        """가장 긴 보관 범위를 벗어난 기사 키 정리"""
+        width, slots = RESOLUTIONS['day']
+        cutoff = (now or time.time()) - width * slots
+        self.seen = {key: ts for key, ts in self.seen.items() if ts >= cutoff}
+    
+    def rolling(self, seconds: int, symbol: str = MARKET_SYMBOL, source: str = ALL_SOURCES,
+                now: Optional[float] = None) -> Dict[str, Any]:
+        """최근 seconds 구간 평균/표준편차/건수"""
+        series = self.series.get((source, symbol))
+        if series is None:
+            return {'avg_sentiment': None, 'sentiment_std': None, 'count': 0}
+        
+        with self._lock:
+            total, sq_total, count = series.ring_for(seconds).window(seconds, now or time.time())
+        
+        if count == 0:
+            return {'avg_sentiment': None, 'sentiment_std': None, 'count': 0}
+        
+        mean = total / count
+        return {
+            'avg_sentiment': mean,
+            'sentiment_std': max(sq_total / count - mean * mean, 0.0) ** 0.5,
+            'count': count
+        }
+    
+    def rolling_windows(self, symbol: str = MARKET_SYMBOL, source: str = ALL_SOURCES,
+                        now: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """기본 롤링 구간(1h/24h/7d) 요약"""
+        return {name: self.rolling(seconds, symbol, source, now) for name, seconds in ROLLING_WINDOWS.items()}
+    
+    def get_series(self, seconds: int, symbol: str = MARKET_SYMBOL, source: str = ALL_SOURCES,
+                   resolution: Optional[str] = None, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """차트용 버킷 시계열 (resolution 미지정 시 구간에 맞는 가장 세밀한 해상도)"""
+        series = self.series.get((source, symbol))
+        if series is None:
+            return []
+        
+        ring = series.rings[resolution] if resolution else series.ring_for(seconds)
+        with self._lock:
+            starts, means, counts = ring.series(seconds, now or time.time())
+        
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(int(start)).isoformat(),
+                'avg_sentiment': float(mean),
+                'count': int(count)
+            }
+            for start, mean, count in zip(starts, means, counts)
+        ]
+    
+    def keys(self) -> List[Tuple[str, str]]:
+        """집계 중인 (출처, 종목) 키"""
+        return sorted(self.series)
+    
+    def save(self):
+        """링 버퍼 상태 저장 (재시작 시 기사 재스캔 불필요)"""
+        try:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            arrays = {}
+            with self._lock:
+                self._prune_seen()
+                arrays['seen_keys'] = np.array(list(self.seen), dtype=str)
+                arrays['seen_timestamps'] = np.array(list(self.seen.values()), dtype=float)
+                for (source, symbol), series in self.series.items():
+                    for name, ring in series.rings.items():
+                        prefix = f"{source}\x1f{symbol}\x1f{name}"
+                        arrays[f"{prefix}\x1fids"] = ring.bucket_ids
+                        arrays[f"{prefix}\x1fsums"] = ring.sums
+                        arrays[f"{prefix}\x1fsq_sums"] = ring.sq_sums
+                        arrays[f"{prefix}\x1fcounts"] = ring.counts
+            
+            # 저장 도중 중단돼도 이전 상태 파일이 남도록 임시 파일에 쓴 뒤 교체
+            tmp_path = self.state_path.with_name(self.state_path.name + '.tmp')
+            with open(tmp_path, 'wb') as f:
+                np.savez_compressed(f, **arrays)
+            os.replace(tmp_path, self.state_path)
+            logger.debug(f"💾 감정 시계열 상태 저장: {self.state_path}")
+        
+        except Exception as e:
+            logger.error(f"❌ 감정 시계열 상태 저장 실패: {e}")
+    
+    def load(self):
+        """저장된 링 버퍼 복원 (해상도 설정이 바뀐 링은 무시)"""
+        if not self.state_path.exists():
+            return
+        
+        try:
+            with np.load(self.state_path) as data:
+                if 'seen_keys' in data.files:
+                    self.seen = dict(zip(data['seen_keys'].tolist(), data['seen_timestamps'].tolist()))
+                
+                for key in data.files:
+                    if '\x1f' not in key:
+                        continue
+                    source, symbol, name, field = key.split('\x1f')
+                    if name not in RESOLUTIONS or len(data[key]) != RESOLUTIONS[name][1]:
+                        continue
+                    ring = self._series(source, symbol).rings[name]
+                    attr = 'bucket_ids' if field == 'ids' else field
+                    setattr(ring, attr, data[key].copy())
+            
+            for series in self.series.values():
+                for ring in series.rings.values():
+                    ring.latest = int(ring.bucket_ids.max())
+            
+            logger.info(f"📂 감정 시계열 상태 복원: {len(self.series)}개 키")
+        
+        except Exception as e:
+            logger.error(f"❌ 감정 시계열 상태 복원 실패: {e}")
+            self.series = {}
+            self.seen = {}
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """집계기 통계 반환"""
+        return {
+            **self.stats,
+            'series': len(self.series),
+            'resolutions': {name: {'width_seconds': w, 'slots': s} for name, (w, s) in RESOLUTIONS.items()},
+            'state_path': str(self.state_path)
+        }
+
+# 전역 감정 시계열 집계기
+sentiment_timeseries = SentimentTimeSeries(
+    FINANCIAL_CONFIG.get('sentiment_timeseries_path', "data/sentiment_timeseries.npz")
+)
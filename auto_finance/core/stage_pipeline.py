@@ -0,0 +1,157 @@
+"""
+🚰 단계 중첩 스트리밍 파이프라인
+유한 크기 asyncio 큐로 연결된 생산자/소비자 단계 - 항목은 준비되는 즉시 다음 단계로 흐르고,
+단계별 동시 실행 수 제한과 큐 배압으로 느린 단계 앞에서 앞 단계가 자동으로 속도를 맞춤
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_DONE = object()
+
+@dataclass
+class Stage:
+    """파이프라인 단계 정의
+    
+    handler가 None을 반환하면 해당 항목은 다음 단계로 넘기지 않는다.
+    limit을 지정하면 그 수만큼 처리한 뒤 나머지 항목은 건너뛴다 (API 비용 상한).
+    """
+    name: str
+    handler: Callable[[Any], Awaitable[Any]]
+    concurrency: int = 1
+    queue_size: int = 10
+    limit: Optional[int] = None
+
+@dataclass
+class StageStats:
+    """단계별 처리 통계"""
+    received: int = 0
+    processed: int = 0
+    dropped: int = 0
+    failed: int = 0
+    skipped: int = 0
+    started: int = 0
+    busy_time: float = 0.0
+    first_output: Optional[float] = None
+    max_queue_depth: int = 0
+    outputs: List[Any] = field(default_factory=list)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'received': self.received,
+            'processed': self.processed,
+            'dropped': self.dropped,
+            'failed': self.failed,
+            'skipped': self.skipped,
+            'busy_time': self.busy_time,
+            'first_output': self.first_output,
+            'max_queue_depth': self.max_queue_depth
+        }
+
+class StagePipeline:
+    """유한 큐 기반 단계 중첩 파이프라인"""
+    
+    def __init__(self, stages: List[Stage]):
+        if not stages:
+            raise ValueError("파이프라인 단계가 없습니다")
+        self.stages = stages
+        self.stats: Dict[str, StageStats] = {stage.name: StageStats() for stage in stages}
+        self.processing_time = 0.0
+    
+    async def run(self, source: AsyncIterable[Any]) -> Dict[str, List[Any]]:
+        """소스 항목을 모든 단계에 흘려보내고 단계별 출력 반환"""
+        start = time.perf_counter()
+        queues = [asyncio.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        tasks = [asyncio.create_task(self._feed(source, queues[0]))]
+        
+        for index, stage in enumerate(self.stages):
+            out_queue = queues[index + 1] if index + 1 < len(queues) else None
+            workers = [
+                asyncio.create_task(self._worker(stage, queues[index], out_queue, start))
+                for _ in range(max(1, stage.concurrency))
+            ]
+            next_stage = self.stages[index + 1] if out_queue is not None else None
+            tasks.append(asyncio.create_task(self._close_when_done(workers, out_queue, next_stage)))
+            tasks.extend(workers)
+        
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        finally:
+            self.processing_time = time.perf_counter() - start
+        
+        return {stage.name: self.stats[stage.name].outputs for stage in self.stages}
+    
+    async def _feed(self, source: AsyncIterable[Any], queue: asyncio.Queue):
+        """소스 → 첫 단계 큐 (큐가 차면 소스 소비가 대기)"""
+        try:
+            async for item in source:
+                await queue.put(item)
+        finally:
+            for _ in range(max(1, self.stages[0].concurrency)):
+                await queue.put(_DONE)
+    
+    @staticmethod
+    async def _close_when_done(workers: List[asyncio.Task], out_queue: Optional[asyncio.Queue],
+                               next_stage: Optional[Stage]):
+        """단계 작업자가 모두 끝나면 다음 단계 작업자 수만큼 종료 신호 전달"""
+        await asyncio.gather(*workers, return_exceptions=True)
+        if out_queue is None:
+            return
+        for _ in range(max(1, next_stage.concurrency)):
+            await out_queue.put(_DONE)
+    
+    async def _worker(self, stage: Stage, in_queue: asyncio.Queue,
+                      out_queue: Optional[asyncio.Queue], start: float):
+        stats = self.stats[stage.name]
+        while True:
+            item = await in_queue.get()
+            if item is _DONE:
+                return
+            
+            stats.received += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, in_queue.qsize() + 1)
+            if stage.limit is not None and stats.started >= stage.limit:
+                stats.skipped += 1
+                continue
+            stats.started += 1
+            
+            began = time.perf_counter()
+            try:
+                result = await stage.handler(item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                stats.failed += 1
+                logger.error(f"❌ [{stage.name}] 단계 처리 실패: {e}")
+                continue
+            finally:
+                stats.busy_time += time.perf_counter() - began
+            
+            if result is None:
+                stats.dropped += 1
+                continue
+            
+            stats.processed += 1
+            stats.outputs.append(result)
+            if stats.first_output is None:
+                stats.first_output = time.perf_counter() - start
+            if out_queue is not None:
+                await out_queue.put(result)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """단계별 통계 (first_output: 시작 후 첫 결과까지 걸린 시간)"""
+        return {
+            'stages': {name: stats.to_dict() for name, stats in self.stats.items()},
+            'processing_time': self.processing_time
+        }
@@ -0,0 +1,215 @@
+"""
+🌊 스트리밍 LLM 생성
+SDK 스트림 응답을 비동기 청크로 변환하고, 청크가 도착하는 즉시 JSON 본문 추출 /
+섹션 분리 / 단어 수 계산을 수행해 목표 길이에 도달하면 생성을 조기 종료
+"""
+
+import asyncio
+import json
+import re
+import threading
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_SENTINEL = object()
+_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+_SECTION_HEADING = re.compile(r'^#{1,3}\s+\S', re.MULTILINE)
+_SENTENCE_END = re.compile(r'[.!?。](?=\s|$)')
+
+async def stream_generate(client: Any, prompt: str, **kwargs) -> AsyncIterator[str]:
+    """동기 SDK 스트림(generate_content(stream=True))을 비동기 텍스트 청크로 변환
+    
+    소비자가 반복을 멈추면(조기 종료) 백그라운드 스레드도 다음 청크에서 중단한다.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for chunk in client.generate_content(prompt, stream=True, **kwargs):
+                if stop.is_set():
+                    break
+                text = getattr(chunk, 'text', '') or ''
+                if text:
+                    loop.call_soon_threadsafe(queue.put_nowait, text)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _SENTINEL)
+    
+    worker = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _SENTINEL:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        # 스레드는 다음 청크 수신 시 종료되므로 기다리지 않음
+        worker.add_done_callback(lambda f: f.exception())
+
+class StreamingContentParser:
+    """JSON 콘텐츠 응답 증분 파서
+    
+    응답이 {"title": ..., "content": "...", ...} 형식이면 content 문자열을 도착하는 대로 디코딩하고,
+    JSON이 아니면 전체 텍스트를 본문으로 취급한다.
+    """
+    
+    def __init__(self, target_words: Optional[int] = None, content_key: str = 'content'):
+        self.target_words = target_words
+        self.content_key = content_key
+        self.buffer = ''
+        self.content = ''
+        self.sections: List[str] = []
+        self.chunks = 0
+        self.stopped_early = False
+        
+        self._mode: Optional[str] = None       # 'json' | 'text'
+        self._cursor: Optional[int] = None     # content 문자열 내부 디코딩 위치
+        self._content_closed = False
+        self._section_start = 0
+        self._key_pattern = re.compile(r'"%s"\s*:\s*"' % re.escape(content_key))
+    
+    @property
+    def word_count(self) -> int:
+        return len(self.content.split())
+    
+    def feed(self, chunk: str) -> List[str]:
+        """청크 반영 후 새로 완성된 섹션 반환"""
+        self.chunks += 1
+        self.buffer += chunk
+        
+        if self._mode is None:
+            stripped = self.buffer.lstrip()
+            if not stripped:
+                return []
+            # 코드펜스(```json) 뒤 JSON 도 허용
+            self._mode = 'json' if stripped[0] in '{`' else 'text'
+        
+        if self._mode == 'text':
+            self.content = self.buffer
+        elif not self._content_closed:
+            self._decode_content()
+        
+        return self._split_sections()
+    
+    def _decode_content(self):
+        """content 문자열 값을 이스케이프 해석하며 이어서 디코딩"""
+        if self._cursor is None:
+            match = self._key_pattern.search(self.buffer)
+            if not match:
+                return
+            self._cursor = match.end()
+        
+        buffer, i, out = self.buffer, self._cursor, []
+        while i < len(buffer):
+            char = buffer[i]
+            if char == '"':
+                self._content_closed = True
+                i += 1
+                break
+            if char == '\\':
+                if i + 1 >= len(buffer):
+                    break
+                code = buffer[i + 1]
+                if code == 'u':
+                    if i + 6 > len(buffer):
+                        break
+                    unit = int(buffer[i + 2:i + 6], 16)
+                    if 0xD800 <= unit <= 0xDBFF:
+                        # 서로게이트 쌍(이모지 등)은 뒤따르는 하위 서로게이트와 합쳐 한 문자로 디코딩
+                        if i + 12 > len(buffer):
+                            break
+                        if buffer[i + 6:i + 8] == '\\u':
+                            low = int(buffer[i + 8:i + 12], 16)
+                            if 0xDC00 <= low <= 0xDFFF:
+                                out.append(chr(0x10000 + ((unit - 0xD800) << 10) + (low - 0xDC00)))
+                                i += 12
+                                continue
+                        out.append('\ufffd')
+                    elif 0xDC00 <= unit <= 0xDFFF:
+                        out.append('\ufffd')
+                    else:
+                        out.append(chr(unit))
+                    i += 6
+                    continue
+                out.append(_ESCAPES.get(code, code))
+                i += 2
+                continue
+            out.append(char)
+            i += 1
+        
+        self._cursor = i
+        self.content += ''.join(out)
+    
+    def _split_sections(self) -> List[str]:
+        """제목(#)으로 시작하는 새 섹션이 열리면 직전 섹션을 완성으로 처리"""
+        completed = []
+        for match in _SECTION_HEADING.finditer(self.content, self._section_start + 1):
+            section = self.content[self._section_start:match.start()].strip()
+            if section:
+                completed.append(section)
+            self._section_start = match.start()
+        self.sections.extend(completed)
+        return completed
+    
+    def reached_target(self) -> bool:
+        """목표 단어 수 도달 여부 (본문이 이미 끝났으면 나머지 필드를 받도록 계속 진행)"""
+        if self._content_closed or not self.target_words:
+            return False
+        return self.word_count >= self.target_words
+    
+    def _trim_to_sentence(self):
+        """조기 종료 시 마지막 청크의 미완성 문장과 본문 없이 남은 제목 제거"""
+        ends = [m.end() for m in _SENTENCE_END.finditer(self.content)]
+        if ends:
+            self.content = self.content[:ends[-1]]
+        
+        lines = self.content.rstrip().split('\n')
+        while lines and (not lines[-1].strip() or _SECTION_HEADING.match(lines[-1])):
+            lines.pop()
+        self.content = '\n'.join(lines)
+        self._section_start = min(self._section_start, len(self.content))
+    
+    def finish(self, stopped_early: bool = False) -> Dict[str, Any]:
+        """최종 결과 - 완전한 JSON이면 그대로, 조기 종료/잘린 JSON이면 확보한 필드로 구성"""
+        self.stopped_early = stopped_early
+        if stopped_early:
+            self._trim_to_sentence()
+        tail = self.content[self._section_start:].strip()
+        if tail:
+            self.sections.append(tail)
+            self._section_start = len(self.content)
+        
+        if self._mode == 'json' and not stopped_early:
+            match = re.search(r'\{.*\}', self.buffer, re.DOTALL)
+            if match:
+                try:
+                    return json.loads(match.group())
+                except json.JSONDecodeError:
+                    pass
+        
+        data: Dict[str, Any] = {self.content_key: self.content.strip()}
+        # content 앞에 완성된 문자열 필드 (예: title) 회수
+        for key, value in re.findall(r'"(\w+)"\s*:\s*"((?:[^"\\]|\\.)*)"', self.buffer):
+            if key != self.content_key and key not in data:
+                try:
+                    data[key] = json.loads(f'"{value}"')
+                except json.JSONDecodeError:
+                    data[key] = value
+        return data
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            'chunks': self.chunks,
+            'sections': len(self.sections),
+            'word_count': self.word_count,
+            'stopped_early': self.stopped_early
+        }
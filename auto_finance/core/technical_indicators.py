@@ -0,0 +1,294 @@
+"""
+📐 기술적 지표 엔진
+종목 × 시간 행렬 기반 일괄 계산 및 신규 봉 O(1) 증분 업데이트
+"""
+
+import math
+from collections import deque
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# 지표 파라미터 (calculate_technical_indicators와 동일)
+SMA_SHORT = 20
+SMA_LONG = 50
+RSI_PERIOD = 14
+EMA_FAST = 12
+EMA_SLOW = 26
+BB_WIDTH = 2.0
+
+def build_close_matrix(frames: Dict[str, pd.DataFrame],
+                       column: str = 'Close') -> Tuple[List[str], np.ndarray]:
+    """종목별 종가를 우측 정렬한 (종목 × 봉) 행렬 생성 (짧은 종목은 앞쪽 NaN)"""
+    symbols = [s for s, df in frames.items() if df is not None and not df.empty]
+    series = [frames[s][column].dropna().to_numpy(dtype=float) for s in symbols]
+    length = max((len(v) for v in series), default=0)
+    
+    matrix = np.full((len(symbols), length), np.nan)
+    for row, values in enumerate(series):
+        if len(values):
+            matrix[row, length - len(values):] = values
+    
+    return symbols, matrix
+
+def _window_mean(matrix: np.ndarray, window: int) -> np.ndarray:
+    """마지막 window개 봉 평균 (봉이 부족하면 NaN)"""
+    if matrix.shape[1] < window:
+        return np.full(matrix.shape[0], np.nan)
+    # NaN이 하나라도 있으면 결과도 NaN → 데이터 부족 종목 자동 제외
+    return matrix[:, -window:].mean(axis=1)
+
+def _ema_state(matrix: np.ndarray, span: int) -> Tuple[np.ndarray, np.ndarray]:
+    """pandas ewm(span, adjust=True)과 동일한 가중합 상태 (분자, 분모)"""
+    decay = 1.0 - 2.0 / (span + 1.0)
+    numerator = np.zeros(matrix.shape[0])
+    denominator = np.zeros(matrix.shape[0])
+    
+    for t in range(matrix.shape[1]):
+        column = matrix[:, t]
+        valid = ~np.isnan(column)
+        numerator[valid] = column[valid] + decay * numerator[valid]
+        denominator[valid] = 1.0 + decay * denominator[valid]
+    
+    return numerator, denominator
+
+def compute_indicator_matrix(matrix: np.ndarray) -> Dict[str, np.ndarray]:
+    """(종목 × 봉) 종가 행렬에서 최신 지표를 종목별 벡터로 일괄 계산"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sma_20 = _window_mean(matrix, SMA_SHORT)
+        sma_50 = _window_mean(matrix, SMA_LONG)
+        
+        # 볼린저 밴드 (표본 표준편차)
+        if matrix.shape[1] >= SMA_SHORT:
+            std_20 = matrix[:, -SMA_SHORT:].std(axis=1, ddof=1)
+        else:
+            std_20 = np.full(matrix.shape[0], np.nan)
+        
+        # RSI (단순 이동평균 방식)
+        if matrix.shape[1] > RSI_PERIOD:
+            delta = np.diff(matrix[:, -(RSI_PERIOD + 1):], axis=1)
+            gain = np.where(delta > 0, delta, 0.0).mean(axis=1)
+            loss = np.where(delta < 0, -delta, 0.0).mean(axis=1)
+            gain[np.isnan(delta).any(axis=1)] = np.nan
+            rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+        else:
+            rsi = np.full(matrix.shape[0], np.nan)
+        
+        # MACD
+        fast_num, fast_den = _ema_state(matrix, EMA_FAST)
+        slow_num, slow_den = _ema_state(matrix, EMA_SLOW)
+        macd = fast_num / fast_den - slow_num / slow_den
+    
+    return {
+        'sma_20': sma_20,
+        'sma_50': sma_50,
+        'rsi': rsi,
+        'macd': macd,
+        'bb_upper': sma_20 + std_20 * BB_WIDTH,
+        'bb_lower': sma_20 - std_20 * BB_WIDTH
+    }
+
+def compute_indicator_series(close: pd.Series) -> pd.DataFrame:
+    """단일 종목 날짜별 지표 (각 행은 해당 봉까지의 compute_indicator_matrix 결과와 동일)"""
+    sma_20 = close.rolling(SMA_SHORT).mean()
+    std_20 = close.rolling(SMA_SHORT).std(ddof=1)
+    
+    delta = close.diff()
+    gain = delta.clip(lower=0).rolling(RSI_PERIOD).mean()
+    loss = (-delta).clip(lower=0).rolling(RSI_PERIOD).mean()
+    
+    return pd.DataFrame({
+        'sma_20': sma_20,
+        'sma_50': close.rolling(SMA_LONG).mean(),
+        'rsi': 100.0 - 100.0 / (1.0 + gain / loss),
+        'macd': close.ewm(span=EMA_FAST).mean() - close.ewm(span=EMA_SLOW).mean(),
+        'bb_upper': sma_20 + std_20 * BB_WIDTH,
+        'bb_lower': sma_20 - std_20 * BB_WIDTH
+    }, index=close.index)
+
+class RollingWindow:
+    """고정 길이 윈도우의 합/분산 (Welford 추가·제거)"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self.values = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+    
+    def _add(self, value: float):
+        self.values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(self.values)
+        self.m2 += delta * (value - self.mean)
+    
+    def _remove(self, value: float):
+        count = len(self.values)
+        if count == 0:
+            self.mean, self.m2 = 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.mean -= delta / count
+        self.m2 -= delta * (value - self.mean)
+    
+    def push(self, value: float):
+        """새 값 추가 (윈도우 초과 시 가장 오래된 값 제거)"""
+        self._add(value)
+        if len(self.values) > self.size:
+            self._remove(self.values.popleft())
+    
+    def replace_last(self, value: float):
+        """마지막 값 교체 (진행 중인 봉 갱신)"""
+        if not self.values:
+            self.push(value)
+            return
+        self._remove(self.values.pop())
+        self._add(value)
+    
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+    
+    @property
+    def variance(self) -> float:
+        count = len(self.values)
+        return max(self.m2, 0.0) / (count - 1) if count > 1 else float('nan')
+
+class IndicatorState:
+    """단일 종목 지표 증분 상태"""
+    
+    def __init__(self):
+        self.window_short = RollingWindow(SMA_SHORT)
+        self.window_long = RollingWindow(SMA_LONG)
+        self.gains = RollingWindow(RSI_PERIOD)
+        self.losses = RollingWindow(RSI_PERIOD)
+        self.ema = {EMA_FAST: [0.0, 0.0], EMA_SLOW: [0.0, 0.0]}
+        self.prev_ema = {EMA_FAST: [0.0, 0.0], EMA_SLOW: [0.0, 0.0]}
+        self.prev_close: Optional[float] = None
+        self.last_close: Optional[float] = None
+        self.last_date: Optional[date] = None
+        self.bars = 0
+    
+    @classmethod
+    def from_history(cls, closes: np.ndarray) -> 'IndicatorState':
+        """과거 종가로 상태 초기화"""
+        state = cls()
+        for close in closes[~np.isnan(closes)]:
+            state.update(float(close))
+        return state
+    
+    def update(self, close: float, replace_last: bool = False) -> Dict[str, float]:
+        """새 봉 반영 (replace_last=True면 진행 중인 마지막 봉 갱신)"""
+        if replace_last and self.last_close is not None:
+            self.window_short.replace_last(close)
+            self.window_long.replace_last(close)
+            if self.prev_close is not None:
+                delta = close - self.prev_close
+                self.gains.replace_last(max(delta, 0.0))
+                self.losses.replace_last(max(-delta, 0.0))
+            self.ema = {span: list(values) for span, values in self.prev_ema.items()}
+        else:
+            self.window_short.push(close)
+            self.window_long.push(close)
+            if self.last_close is not None:
+                delta = close - self.last_close
+                self.gains.push(max(delta, 0.0))
+                self.losses.push(max(-delta, 0.0))
+            self.prev_close = self.last_close
+            self.prev_ema = {span: list(values) for span, values in self.ema.items()}
+            self.bars += 1
+        
+        for span, values in self.ema.items():
+            decay = 1.0 - 2.0 / (span + 1.0)
+            values[0] = close + decay * values[0]
+            values[1] = 1.0 + decay * values[1]
+        
+        self.last_close = close
+        return self.indicators()
+    
+    def indicators(self) -> Dict[str, float]:
+        """현재 지표 (데이터가 부족한 지표는 제외)"""
+        indicators = {}
+        
+        if self.window_short.full:
+            sma_20 = self.window_short.mean
+            std_20 = math.sqrt(self.window_short.variance)
+            indicators['sma_20'] = sma_20
+            indicators['bb_upper'] = sma_20 + std_20 * BB_WIDTH
+            indicators['bb_lower'] = sma_20 - std_20 * BB_WIDTH
+        
+        if self.window_long.full:
+            indicators['sma_50'] = self.window_long.mean
+        
+        if self.gains.full:
+            gain, loss = self.gains.mean, self.losses.mean
+            if loss > 0:
+                indicators['rsi'] = 100.0 - 100.0 / (1.0 + gain / loss)
+            elif gain > 0:
+                indicators['rsi'] = 100.0
+        
+        if self.bars:
+            fast, slow = self.ema[EMA_FAST], self.ema[EMA_SLOW]
+            indicators['macd'] = fast[0] / fast[1] - slow[0] / slow[1]
+        
+        return indicators
+
+class TechnicalIndicatorEngine:
+    """전 종목 기술적 지표 엔진"""
+    
+    def __init__(self):
+        self.states: Dict[str, IndicatorState] = {}
+        self.latest: Dict[str, Dict[str, float]] = {}
+        self.last_fit: Optional[str] = None
+    
+    def fit(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """과거 일봉 전체로 지표 일괄 계산 및 증분 상태 초기화"""
+        symbols, matrix = build_close_matrix(frames)
+        if not symbols:
+            return {}
+        
+        results = compute_indicator_matrix(matrix)
+        
+        for row, symbol in enumerate(symbols):
+            self.states[symbol] = IndicatorState.from_history(matrix[row])
+            self.states[symbol].last_date = pd.Timestamp(frames[symbol].index[-1]).date()
+            self.latest[symbol] = {
+                name: float(values[row])
+                for name, values in results.items()
+                if not np.isnan(values[row])
+            }
+        
+        self.last_fit = datetime.now().isoformat()
+        logger.info(f"📐 기술적 지표 일괄 계산: {len(symbols)}개 종목 × {matrix.shape[1]}봉")
+        return self.latest
+    
+    def update(self, symbol: str, close: float, replace_last: bool = False,
+               bar_date: Optional[date] = None) -> Dict[str, float]:
+        """신규 봉(또는 진행 중인 봉) 반영 - O(1)
+        
+        bar_date를 주면 마지막 봉보다 새 날짜일 때만 봉을 추가하고, 같은 날짜면 마지막 봉을 갱신한다.
+        """
+        state = self.states.setdefault(symbol, IndicatorState())
+        if bar_date is not None:
+            if state.last_date is not None and bar_date < state.last_date:
+                return self.latest.get(symbol, {})
+            replace_last = state.last_date is not None and bar_date == state.last_date
+            state.last_date = bar_date
+        self.latest[symbol] = state.update(close, replace_last=replace_last)
+        return self.latest[symbol]
+    
+    def get(self, symbol: str) -> Dict[str, float]:
+        """종목 최신 지표"""
+        return self.latest.get(symbol, {})
+    
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """전 종목 최신 지표"""
+        return dict(self.latest)
+
+# 전역 지표 엔진 인스턴스
+indicator_engine = TechnicalIndicatorEngine()
@@ -0,0 +1,112 @@
+"""
+🔗 기사-종목 연결 인덱스
+회사명/약칭/영문명/종목코드 별칭 사전을 단일 정규식으로 컴파일해 기사당 1회 스캔으로 종목 매칭
+"""
+
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import FINANCIAL_CONFIG
+
+logger = setup_logger(__name__)
+
+# 기본 별칭 사전 (FINANCIAL_CONFIG['symbol_aliases']로 확장/재정의)
+DEFAULT_SYMBOL_ALIASES = {
+    '005930.KS': ['삼성전자', '삼전', 'Samsung Electronics', '005930'],
+    '000660.KS': ['SK하이닉스', '하이닉스', 'SK Hynix', '000660'],
+    '035420.KS': ['NAVER', '네이버', '035420'],
+    '035720.KS': ['카카오', 'Kakao', '035720'],
+    '373220.KS': ['LG에너지솔루션', 'LG엔솔', 'LG Energy Solution', 'LGES', '373220'],
+    'AAPL': ['애플', 'Apple', 'AAPL'],
+    'MSFT': ['마이크로소프트', 'Microsoft', 'MSFT'],
+    'GOOGL': ['구글', '알파벳', 'Google', 'Alphabet', 'GOOGL'],
+    'TSLA': ['테슬라', 'Tesla', 'TSLA'],
+    'NVDA': ['엔비디아', 'NVIDIA', 'NVDA']
+}
+
+# 한글 별칭 뒤에 붙어도 같은 단어로 보는 조사/접미어 ('카카오가'는 매칭, '카카오뱅크'는 제외)
+KOREAN_SUFFIXES = [
+    '에서는', '으로는', '에게서', '까지', '부터', '보다', '처럼', '에서', '에게', '에는', '으로', '이나',
+    '이랑', '과의', '와의', '이다', '이며', '은', '는', '이', '가', '을', '를', '의', '에', '와', '과',
+    '도', '만', '로', '나', '랑', '다', '며', '측', '주'
+]
+
+class TickerLinker:
+    """별칭 → 종목 매칭기"""
+    
+    def __init__(self, aliases: Optional[Dict[str, List[str]]] = None,
+                 symbols: Optional[List[str]] = None):
+        aliases = aliases or {**DEFAULT_SYMBOL_ALIASES, **FINANCIAL_CONFIG.get('symbol_aliases', {})}
+        symbols = symbols or FINANCIAL_CONFIG.get('stock_symbols', [])
+        
+        self.alias_to_symbol: Dict[str, str] = {}
+        self.names: Dict[str, str] = {}
+        for symbol in symbols:
+            symbol_aliases = aliases.get(symbol, [])
+            # 대표명은 첫 번째 별칭
+            self.names[symbol] = symbol_aliases[0] if symbol_aliases else symbol
+            for alias in list(symbol_aliases) + [symbol]:
+                self.alias_to_symbol[alias.lower()] = symbol
+        
+        self.pattern = self._compile(self.alias_to_symbol)
+        logger.info(f"🔗 종목 연결 인덱스 초기화: {len(self.names)}개 종목, {len(self.alias_to_symbol)}개 별칭")
+    
+    @staticmethod
+    def _compile(alias_to_symbol: Dict[str, str]) -> Optional['re.Pattern']:
+        """긴 별칭 우선 단일 정규식 (한글/영문/숫자 단어 경계 적용)"""
+        if not alias_to_symbol:
+            return None
+        
+        suffixes = '|'.join(KOREAN_SUFFIXES)
+        parts = []
+        for alias in sorted(alias_to_symbol, key=len, reverse=True):
+            # '애플'이 '파인애플' 안에서, 'AAPL'이 'XAAPL' 안에서 매칭되지 않도록
+            escaped = rf'(?<![0-9a-z가-힣]){re.escape(alias)}'
+            if alias[-1].isascii():
+                # 'AAPL'이 'AAPLX' 안에서 매칭되지 않도록 (한글 조사는 허용: 'NAVER는')
+                escaped += r'(?![0-9a-z])'
+            else:
+                # 한글로 끝나는 별칭은 조사만 붙을 수 있음 ('카카오뱅크' 제외)
+                escaped += rf'(?=(?:{suffixes})?(?![0-9a-z가-힣]))'
+            parts.append(escaped)
+        
+        return re.compile('|'.join(parts), re.IGNORECASE)
+    
+    def link(self, text: str) -> Counter:
+        """텍스트 내 종목별 언급 횟수"""
+        if not text or self.pattern is None:
+            return Counter()
+        return Counter(self.alias_to_symbol[m.group(0).lower()] for m in self.pattern.finditer(text))
+    
+    def link_article(self, article: Dict[str, Any]) -> List[str]:
+        """기사에 언급된 종목 (언급 많은 순)"""
+        counts = self.link(f"{article.get('title', '')} {article.get('content', '')}")
+        return [symbol for symbol, _ in counts.most_common()]
+    
+    def tag_articles(self, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """'symbols' 필드를 부여한 기사 사본 목록 (이미 있으면 유지, 원본은 변경하지 않음)"""
+        tagged = []
+        for article in articles:
+            if 'symbols' not in article:
+                article = {**article, 'symbols': self.link_article(article)}
+            else:
+                article = dict(article)
+            tagged.append(article)
+        return tagged
+    
+    def route(self, articles: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """종목 → 관련 기사 목록 인덱스"""
+        index: Dict[str, List[Dict[str, Any]]] = {symbol: [] for symbol in self.names}
+        for article in self.tag_articles(articles):
+            for symbol in article['symbols']:
+                index.setdefault(symbol, []).append(article)
+        return index
+    
+    def filter(self, articles: Iterable[Dict[str, Any]], symbol: str) -> List[Dict[str, Any]]:
+        """특정 종목 관련 기사만 선택"""
+        return [a for a in self.tag_articles(articles) if symbol in a['symbols']]
+
+# 전역 종목 연결 인덱스
+ticker_linker = TickerLinker()
@@ -4,20 +4,36 @@
 """
 
 import asyncio
+import html
 import json
+import re
 import time
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from pathlib import Path
 
+import aiohttp
+
 # 유틸리티 임포트
 from auto_finance.utils.logger import setup_logger
 from auto_finance.utils.error_handler import ErrorHandler
 from auto_finance.utils.file_manager import file_manager
+from auto_finance.config.settings import UPLOAD_CONFIG
+from auto_finance.core.upload_queue import UploadError, UploadQueue, idempotency_key, upload_queue
 
 logger = setup_logger(__name__)
 
+# 게시 여부 확인 시 허용하는 서버/로컬 시각 차이
+RECONCILE_CLOCK_SKEW = timedelta(minutes=5)
+# 게시 여부 확인 시 비교하는 본문 앞부분 길이 (플랫폼이 뒷부분 서식을 바꿔도 일치하도록)
+RECONCILE_CONTENT_PREFIX = 200
+
+def _plain_text(content: str) -> str:
+    """HTML 태그/엔티티와 공백 차이를 제거한 본문"""
+    return re.sub(r'\s+', '', html.unescape(re.sub(r'<[^>]+>', ' ', content or '')))
+
 @dataclass
 class UploadRequest:
     """업로드 요청 데이터 클래스"""
@@ -35,12 +51,22 @@ class UploadRequest:
 class UploadManager:
     """업로드 관리자 클래스"""
     
-    def __init__(self):
+    # 이 관리자가 게시할 수 있는 플랫폼
+    PLATFORMS = ('tistory',)
+    
+    def __init__(self, queue: Optional[UploadQueue] = None):
         self.error_handler = ErrorHandler()
+        self.config = UPLOAD_CONFIG
+        
+        # 영속 업로드 큐 (멱등 키 / 재시도 / 중단 작업 재개)
+        self.queue = queue or upload_queue
+        self._session: Optional[aiohttp.ClientSession] = None
+        
         self.stats = {
             'total_uploads': 0,
             'successful_uploads': 0,
             'failed_uploads': 0,
+            'replayed_uploads': 0,
             'processing_time': 0.0,
             'last_upload': None
         }
@@ -59,75 +85,240 @@ class UploadManager:
         await self.cleanup()
     
     async def upload_content(self, request: UploadRequest) -> Dict[str, Any]:
-        """단일 콘텐츠 업로드"""
+        """단일 콘텐츠 업로드 (이미 게시된 콘텐츠는 다시 올리지 않고 저장된 결과 반환)"""
+        return (await self._upload_batch([request], resume=False))[0]
+    
+    async def upload_multiple_contents(self, requests: List[UploadRequest],
+                                       resume: bool = True) -> List[Dict[str, Any]]:
+        """다중 콘텐츠 동시 업로드 (요청 순서대로 결과 반환)
+        
+        resume이면 이전 실행에서 중단되어 큐에 남은 업로드도 함께 처리한다.
+        """
+        logger.info(f"📤 다중 콘텐츠 업로드 시작: {len(requests)}개 (동시 {self.config.get('concurrency', 4)}개)")
+        
+        results = await self._upload_batch(requests, resume)
+        
+        replayed = sum(1 for result in results if result.get('replayed'))
+        logger.info(f"✅ 다중 업로드 완료: {len(results)}개 (기존 게시 재사용 {replayed}개)")
+        return results
+    
+    async def _upload_batch(self, requests: List[UploadRequest], resume: bool) -> List[Dict[str, Any]]:
+        """요청을 멱등 키로 큐에 등록한 뒤 제한된 동시 작업자로 처리"""
+        # 이전 프로세스가 처리 중에 중단된 작업 복구 (큐가 프로세스당 한 번만 수행)
+        self.queue.recover()
+        
+        keys = []
+        for request in requests:
+            platform = self._queue_platform(request.platform)
+            key = idempotency_key(platform, request.title, request.content)
+            self.queue.enqueue(key, platform, request.title, asdict(request))
+            keys.append(key)
+        
+        leftovers = []
+        if resume:
+            # 이 관리자가 처리하는 플랫폼 작업만 재개 (Uploader의 파일 저장 작업 등은 제외)
+            requested = set(keys)
+            platforms = [self._queue_platform(platform) for platform in self.PLATFORMS]
+            leftovers = [key for key in self.queue.pending_keys(platforms) if key not in requested]
+            if leftovers:
+                logger.info(f"⏯️ 이전 실행에서 남은 업로드 {len(leftovers)}개 재개")
+        
+        results = await self.queue.process(
+            keys + leftovers, self._publish,
+            concurrency=self.config.get('concurrency', 4),
+            max_retries=self.config.get('max_retries', 3),
+            retry_delay=self.config.get('retry_delay', 5),
+            reconcile=self._find_published
+        )
+        
+        for key in dict.fromkeys(keys + leftovers):
+            self._record_result(results[key])
+        return [results[key] for key in keys]
+    
+    def _simulated(self, platform: str) -> bool:
+        """API 토큰이 없어 시뮬레이션으로 처리하는 플랫폼인지"""
+        settings = self.config['platforms'].get(platform, {})
+        return not (settings.get('enabled') and settings.get('access_token'))
+    
+    def _queue_platform(self, platform: str) -> str:
+        """큐 작업 플랫폼 이름 - 시뮬레이션 결과가 실제 게시 결과로 재사용되지 않도록 분리"""
+        return f"{platform}-sim" if self._simulated(platform) else platform
+    
+    async def _publish(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """큐 작업 처리기 - 실패 시 UploadError로 재시도 여부 전달"""
+        try:
+            request = UploadRequest(**payload)
+        except TypeError as e:
+            raise UploadError(f"잘못된 업로드 작업: {e}", retryable=False)
         start_time = time.time()
+        logger.info(f"📤 콘텐츠 업로드 시작: {request.title}")
+        
+        # 플랫폼별 업로드 처리
+        if request.platform == "tistory":
+            result = await self._upload_to_tistory(request)
+        else:
+            raise UploadError(f"지원하지 않는 플랫폼: {request.platform}", retryable=False)
+        
+        result['processing_time'] = time.time() - start_time
+        result['timestamp'] = datetime.now().isoformat()
+        logger.info(f"✅ 업로드 완료: {request.title}")
+        return result
+    
+    def _record_result(self, result: Dict[str, Any]):
+        """업로드 결과 통계 반영 (기존 게시 재사용은 업로드로 세지 않음)"""
+        if result.get('replayed'):
+            self.stats['replayed_uploads'] += 1
+            return
+        
+        success = bool(result.get('success'))
+        self._update_stats(success, result.get('processing_time', 0.0))
+        if not success:
+            self.error_handler.handle_error(UploadError(result.get('error', '')),
+                                            f"업로드 실패: {result.get('title')}")
+            result.setdefault('timestamp', datetime.now().isoformat())
+            return
+        self.upload_results.append(result)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """업로드 전용 공유 세션 (동시 업로드 수만큼 연결 재사용)"""
+        if self._session is None or self._session.closed:
+            timeout = aiohttp.ClientTimeout(total=self.config.get('timeout', 30))
+            connector = aiohttp.TCPConnector(limit=max(1, self.config.get('concurrency', 4)))
+            self._session = aiohttp.ClientSession(timeout=timeout, connector=connector)
+        return self._session
+    
+    async def _find_published(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """이전 시도가 응답 없이 끊긴 업로드가 실제로 게시되었는지 티스토리 최근 글 목록에서 확인
+        
+        티스토리 API는 멱등 키를 지원하지 않으므로 제목이 같고, 작업 등록 이후에 작성되었고,
+        본문 앞부분이 같은 글만 이 작업의 게시 결과로 본다 (같은 제목의 예전 글/다른 글 제외).
+        """
+        payload = job['payload']
+        tistory = self.config['platforms']['tistory']
+        if payload.get('platform') != 'tistory' or not (tistory.get('enabled') and tistory.get('access_token')):
+            return None
         
+        params = {
+            'access_token': tistory['access_token'],
+            'output': 'json',
+            'blogName': tistory.get('blog_name') or '',
+            'page': '1'
+        }
+        session = await self._get_session()
         try:
-            logger.info(f"📤 콘텐츠 업로드 시작: {request.title}")
-            
-            # 플랫폼별 업로드 처리
-            if request.platform == "tistory":
-                result = await self._upload_to_tistory(request)
-            else:
-                raise ValueError(f"지원하지 않는 플랫폼: {request.platform}")
-            
-            # 통계 업데이트
-            processing_time = time.time() - start_time
-            self._update_stats(True, processing_time)
-            
-            # 결과 저장
-            result['processing_time'] = processing_time
-            result['timestamp'] = datetime.now().isoformat()
-            self.upload_results.append(result)
-            
-            logger.info(f"✅ 업로드 완료: {request.title}")
-            return result
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            self._update_stats(False, processing_time)
-            self.error_handler.handle_error(e, f"업로드 실패: {request.title}")
-            logger.error(f"❌ 업로드 실패: {request.title} - {e}")
+            async with session.get(f"{tistory['api_url']}/post/list", params=params) as response:
+                if response.status != 200:
+                    return None
+                body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"⚠️ 게시 여부 확인 실패, 다시 업로드: {payload.get('title')} - {e}")
+            return None
+        
+        since = datetime.fromisoformat(job['created_at']) - RECONCILE_CLOCK_SKEW
+        posts = ((body or {}).get('tistory', {}).get('item') or {}).get('posts') or []
+        for post in posts:
+            if post.get('title') != payload.get('title'):
+                continue
+            try:
+                if datetime.strptime(post.get('date') or '', '%Y-%m-%d %H:%M:%S') < since:
+                    continue
+            except ValueError:
+                continue
+            if not await self._same_content(session, tistory, post.get('id'), payload.get('content')):
+                continue
             
             return {
-                'success': False,
-                'error': str(e),
-                'title': request.title,
-                'processing_time': processing_time,
+                'success': True,
+                'platform': 'tistory',
+                'title': payload.get('title'),
+                'url': post.get('postUrl'),
+                'post_id': post.get('id'),
+                'category': payload.get('category'),
+                'tags': payload.get('tags'),
+                'publish_status': payload.get('publish_status'),
+                'reconciled': True,
                 'timestamp': datetime.now().isoformat()
             }
+        return None
     
-    async def upload_multiple_contents(self, requests: List[UploadRequest]) -> List[Dict[str, Any]]:
-        """다중 콘텐츠 업로드"""
-        logger.info(f"📤 다중 콘텐츠 업로드 시작: {len(requests)}개")
-        
-        results = []
-        for request in requests:
-            result = await self.upload_content(request)
-            results.append(result)
-            
-            # API 제한을 위한 대기
-            await asyncio.sleep(1)
+    async def _same_content(self, session: aiohttp.ClientSession, tistory: Dict[str, Any],
+                            post_id: Optional[str], content: Optional[str]) -> bool:
+        """게시글 본문 앞부분이 업로드하려던 본문과 같은지 (조회 실패 시 다시 업로드하도록 False)"""
+        params = {
+            'access_token': tistory['access_token'],
+            'output': 'json',
+            'blogName': tistory.get('blog_name') or '',
+            'postId': post_id or ''
+        }
+        try:
+            async with session.get(f"{tistory['api_url']}/post/read", params=params) as response:
+                if response.status != 200:
+                    return False
+                body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"⚠️ 게시글 본문 확인 실패 ({post_id}): {e}")
+            return False
         
-        logger.info(f"✅ 다중 업로드 완료: {len(results)}개")
-        return results
+        posted = ((body or {}).get('tistory', {}).get('item') or {}).get('content')
+        expected = _plain_text(content)[:RECONCILE_CONTENT_PREFIX]
+        return bool(expected) and _plain_text(posted)[:RECONCILE_CONTENT_PREFIX] == expected
     
     async def _upload_to_tistory(self, request: UploadRequest) -> Dict[str, Any]:
-        """티스토리에 업로드"""
-        # 실제 구현에서는 티스토리 API를 사용
-        # 현재는 시뮬레이션으로 처리
+        """티스토리에 업로드 (API 토큰이 없으면 시뮬레이션)"""
+        tistory = self.config['platforms']['tistory']
+        if self._simulated('tistory'):
+            logger.info(f"📝 티스토리 업로드 시뮬레이션: {request.title}")
+            
+            # 업로드 성공 시뮬레이션
+            await asyncio.sleep(0.5)
+            
+            post_id = uuid.uuid4().hex[:12]
+            return {
+                'success': True,
+                'platform': 'tistory',
+                'title': request.title,
+                'url': f"https://example.tistory.com/entry/{post_id}",
+                'post_id': f"post_{post_id}",
+                'category': request.category,
+                'tags': request.tags,
+                'publish_status': request.publish_status,
+                'simulated': True
+            }
+        
+        data = {
+            'access_token': tistory['access_token'],
+            'output': 'json',
+            'blogName': tistory.get('blog_name') or '',
+            'title': request.title,
+            'content': request.content,
+            'visibility': '3' if request.publish_status == 'publish' else '0',
+            'category': request.category,
+            'tag': ','.join(request.tags or [])
+        }
         
-        logger.info(f"📝 티스토리 업로드 시뮬레이션: {request.title}")
+        session = await self._get_session()
+        try:
+            async with session.post(f"{tistory['api_url']}/post/write", data=data) as response:
+                status = response.status
+                retry_after = response.headers.get('retry-after')
+                body = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            raise UploadError(f"티스토리 API 요청 실패: {e}")
         
-        # 업로드 성공 시뮬레이션
-        await asyncio.sleep(0.5)
+        info = (body or {}).get('tistory', {})
+        if status != 200 or str(info.get('status')) != '200':
+            message = info.get('error_message') or f"HTTP {status}"
+            # 레이트 리밋/서버 오류만 재시도 (인증/요청 오류는 재시도해도 같은 결과)
+            raise UploadError(f"티스토리 API 오류: {message}",
+                              retryable=status == 429 or status >= 500,
+                              retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None)
         
         return {
             'success': True,
             'platform': 'tistory',
             'title': request.title,
-            'url': f"https://example.tistory.com/entry/{int(time.time())}",
-            'post_id': f"post_{int(time.time())}",
+            'url': info.get('url'),
+            'post_id': info.get('postId'),
             'category': request.category,
             'tags': request.tags,
             'publish_status': request.publish_status
@@ -170,6 +361,8 @@ class UploadManager:
     
     async def cleanup(self):
         """정리 작업"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
         logger.info("🧹 업로드 관리자 정리 작업 완료")
     
     def get_statistics(self) -> Dict[str, Any]:
@@ -179,5 +372,6 @@ class UploadManager:
             'success_rate': (self.stats['successful_uploads'] / self.stats['total_uploads'] * 100) 
                            if self.stats['total_uploads'] > 0 else 0,
             'average_processing_time': (self.stats['processing_time'] / self.stats['total_uploads'])
-                                      if self.stats['total_uploads'] > 0 else 0
+                                      if self.stats['total_uploads'] > 0 else 0,
+            'queue': self.queue.get_statistics()
         } 
\ No newline at end of file
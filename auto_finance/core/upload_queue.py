@@ -0,0 +1,306 @@
+"""
+📮 영속 업로드 큐
+콘텐츠 지문으로 만든 멱등 키로 업로드 작업을 SQLite에 기록하고,
+제한된 동시 작업자 / 지수 백오프 재시도로 처리
+- 이미 게시된 콘텐츠는 다시 올리지 않고 저장된 결과를 반환
+- 처리 도중 중단(크래시)된 작업은 다음 실행에서 이어서 처리
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from auto_finance.utils.logger import setup_logger
+from auto_finance.config.settings import UPLOAD_CONFIG
+
+logger = setup_logger(__name__)
+
+# 작업 상태
+PENDING = 'pending'
+IN_PROGRESS = 'in_progress'
+DONE = 'done'
+FAILED = 'failed'
+
+class UploadError(Exception):
+    """업로드 실패 - retryable=False면 재시도하지 않음 (인증/요청 형식 오류 등)
+    
+    retry_after는 서버가 알려준 최소 대기 시간(초, 429 응답의 Retry-After)으로 백오프보다 우선한다.
+    """
+    
+    def __init__(self, message: str, retryable: bool = True, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+def idempotency_key(platform: str, title: str, content: str) -> str:
+    """플랫폼 + 정규화한 제목/본문 지문 (공백만 다른 재생성 결과는 같은 글로 취급)"""
+    normalized = re.sub(r'\s+', ' ', f"{title}\n{content}").strip()
+    return hashlib.sha256(f"{platform}\n{normalized}".encode('utf-8')).hexdigest()
+
+class UploadQueue:
+    """멱등 키 기반 영속 업로드 큐"""
+    
+    def __init__(self, db_path: str = "data/upload_queue.db"):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        
+        self.stats = {
+            'enqueued': 0,
+            'replayed': 0,
+            'uploaded': 0,
+            'retries': 0,
+            'failed': 0,
+            'recovered': 0,
+            'reconciled': 0
+        }
+        self._recovered = False
+        
+        self.init_database()
+    
+    def init_database(self):
+        """테이블 생성"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS upload_jobs (
+                    idempotency_key TEXT PRIMARY KEY,
+                    platform TEXT NOT NULL,
+                    title TEXT,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    next_attempt_at REAL DEFAULT 0,
+                    last_error TEXT,
+                    result TEXT,
+                    created_at TEXT,
+                    updated_at TEXT
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_upload_jobs_status ON upload_jobs(status)")
+            conn.commit()
+    
+    def _execute(self, query: str, params: tuple = ()) -> int:
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            rowcount = conn.execute(query, params).rowcount
+            conn.commit()
+        return rowcount
+    
+    def enqueue(self, key: str, platform: str, title: str, payload: Dict[str, Any]) -> str:
+        """작업 등록 후 현재 상태 반환 (같은 키가 이미 있으면 기존 작업 유지)
+        
+        실패로 끝난 작업은 다시 대기 상태로 돌려 재시도 횟수를 초기화한다.
+        """
+        now = datetime.now().isoformat()
+        with self._lock, sqlite3.connect(self.db_path) as conn:
+            inserted = conn.execute("""
+                INSERT OR IGNORE INTO upload_jobs
+                (idempotency_key, platform, title, payload, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (key, platform, title, json.dumps(payload, ensure_ascii=False, default=str),
+                  PENDING, now, now)).rowcount
+            if not inserted:
+                conn.execute("""
+                    UPDATE upload_jobs SET status = ?, attempts = 0, next_attempt_at = 0, updated_at = ?
+                    WHERE idempotency_key = ? AND status = ?
+                """, (PENDING, now, key, FAILED))
+            status = conn.execute(
+                "SELECT status FROM upload_jobs WHERE idempotency_key = ?", (key,)
+            ).fetchone()[0]
+            conn.commit()
+        
+        if inserted:
+            self.stats['enqueued'] += 1
+        return status
+    
+    def recover(self) -> int:
+        """이전 실행에서 처리 중에 중단된 작업을 대기 상태로 복구
+        
+        큐 인스턴스(프로세스)당 한 번만 수행한다. 이후의 처리 중 작업은 이 프로세스의 작업자가 처리하고 있는 것이다.
+        """
+        with self._lock:
+            if self._recovered:
+                return 0
+            self._recovered = True
+        
+        recovered = self._execute(
+            "UPDATE upload_jobs SET status = ?, updated_at = ? WHERE status = ?",
+            (PENDING, datetime.now().isoformat(), IN_PROGRESS)
+        )
+        if recovered:
+            self.stats['recovered'] += recovered
+            logger.info(f"⏯️ 중단된 업로드 작업 {recovered}개 복구")
+        return recovered
+    
+    def pending_keys(self, platforms: Optional[List[str]] = None) -> List[str]:
+        """대기 중인 작업 키 (등록 순, platforms를 지정하면 해당 플랫폼 작업만)"""
+        query = "SELECT idempotency_key FROM upload_jobs WHERE status = ?"
+        params: List[Any] = [PENDING]
+        if platforms is not None:
+            query += f" AND platform IN ({','.join('?' * len(platforms))})"
+            params.extend(platforms)
+        query += " ORDER BY created_at"
+        
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [row[0] for row in rows]
+    
+    def get_job(self, key: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (payload/result는 역직렬화)"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.row_factory = sqlite3.Row
+            row = conn.execute("SELECT * FROM upload_jobs WHERE idempotency_key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        job = dict(row)
+        job['payload'] = json.loads(job['payload'])
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+    
+    def _claim(self, key: str) -> Optional[Dict[str, Any]]:
+        """대기 중인 작업을 처리 중으로 전환 (다른 작업자가 이미 가져갔으면 None)"""
+        claimed = self._execute(
+            "UPDATE upload_jobs SET status = ?, attempts = attempts + 1, updated_at = ? "
+            "WHERE idempotency_key = ? AND status = ?",
+            (IN_PROGRESS, datetime.now().isoformat(), key, PENDING)
+        )
+        return self.get_job(key) if claimed else None
+    
+    def _complete(self, key: str, result: Dict[str, Any]):
+        self._execute(
+            "UPDATE upload_jobs SET status = ?, result = ?, last_error = NULL, updated_at = ? "
+            "WHERE idempotency_key = ?",
+            (DONE, json.dumps(result, ensure_ascii=False, default=str), datetime.now().isoformat(), key)
+        )
+    
+    def _fail(self, key: str, error: str, retry_at: Optional[float]):
+        """실패 기록 - retry_at이 있으면 그 시각 이후 재시도할 대기 작업으로 되돌림"""
+        self._execute(
+            "UPDATE upload_jobs SET status = ?, last_error = ?, next_attempt_at = ?, updated_at = ? "
+            "WHERE idempotency_key = ?",
+            (PENDING if retry_at is not None else FAILED, error, retry_at or 0,
+             datetime.now().isoformat(), key)
+        )
+    
+    async def process(self, keys: List[str], handler: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                      concurrency: int = 4, max_retries: int = 3, retry_delay: float = 5.0,
+                      reconcile: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]] = None
+                      ) -> Dict[str, Dict[str, Any]]:
+        """작업들을 동시 처리하고 키별 결과 반환
+        
+        handler는 payload를 받아 결과 dict를 반환하고, 실패 시 예외(UploadError 등)를 던진다.
+        이미 완료된 키는 호출 없이 저장된 결과를 그대로 돌려준다 (replayed=True).
+        reconcile은 이전 시도가 있었던 작업(타임아웃/중단으로 게시 여부를 모르는 경우)을 다시 올리기 전에
+        작업(payload, created_at 등)을 받아 플랫폼에 이미 게시되었는지 확인해 게시 결과를 반환한다 (없으면 None).
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        queue: asyncio.Queue = asyncio.Queue()
+        for key in dict.fromkeys(keys):
+            queue.put_nowait(key)
+        
+        async def worker():
+            while True:
+                try:
+                    key = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                results[key] = await self._run_job(key, handler, max_retries, retry_delay, reconcile)
+        
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, queue.qsize())))))
+        return results
+    
+    async def _run_job(self, key: str, handler: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+                       max_retries: int, retry_delay: float,
+                       reconcile: Optional[Callable[[Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]]
+                       ) -> Dict[str, Any]:
+        while True:
+            job = self.get_job(key)
+            if job is None:
+                return {'success': False, 'error': 'unknown upload job', 'idempotency_key': key}
+            if job['status'] == DONE:
+                self.stats['replayed'] += 1
+                return {**job['result'], 'replayed': True}
+            if job['status'] == FAILED:
+                return {'success': False, 'error': job['last_error'], 'title': job['title'],
+                        'attempts': job['attempts'], 'idempotency_key': key}
+            
+            # 백오프 대기 시각이 남아 있으면 기다린 뒤 시도
+            wait = job['next_attempt_at'] - time.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            job = self._claim(key)
+            if job is None:
+                # 같은 키를 다른 작업자가 처리 중
+                await asyncio.sleep(0.1)
+                continue
+            
+            try:
+                result = None
+                if reconcile is not None and job['attempts'] > 1:
+                    result = await reconcile(job)
+                    if result is not None:
+                        self.stats['reconciled'] += 1
+                        logger.info(f"🔎 이전 시도에서 이미 게시된 업로드 확인: {job['title']}")
+                if result is None:
+                    result = await handler(job['payload'])
+            except asyncio.CancelledError:
+                # 중단된 작업은 다음 실행에서 재개되도록 대기 상태로 복귀
+                self._fail(key, 'cancelled', time.time())
+                raise
+            except Exception as e:
+                # 작업 내용 자체가 잘못된 경우(payload 형식 오류 등)는 재시도해도 같은 결과
+                retryable = getattr(e, 'retryable', not isinstance(e, (TypeError, KeyError)))
+                if retryable and job['attempts'] <= max_retries:
+                    delay = retry_delay * 2 ** (job['attempts'] - 1) * random.uniform(0.8, 1.2)
+                    delay = max(delay, getattr(e, 'retry_after', None) or 0)
+                    self.stats['retries'] += 1
+                    logger.warning(f"🔁 업로드 재시도 예정 ({job['attempts']}/{max_retries + 1}, "
+                                   f"{delay:.1f}초 후): {job['title']} - {e}")
+                    self._fail(key, str(e), time.time() + delay)
+                    continue
+                
+                self.stats['failed'] += 1
+                self._fail(key, str(e), None)
+                logger.error(f"❌ 업로드 최종 실패 ({job['attempts']}회 시도): {job['title']} - {e}")
+                return {'success': False, 'error': str(e), 'title': job['title'],
+                        'attempts': job['attempts'], 'idempotency_key': key}
+            
+            result = {**result, 'idempotency_key': key, 'attempts': job['attempts']}
+            self._complete(key, result)
+            self.stats['uploaded'] += 1
+            return result
+    
+    def prune(self, max_age_days: int = 30) -> int:
+        """오래된 완료/실패 작업 삭제"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        removed = self._execute(
+            "DELETE FROM upload_jobs WHERE status IN (?, ?) AND updated_at < ?", (DONE, FAILED, cutoff)
+        )
+        if removed:
+            logger.info(f"🧹 오래된 업로드 작업 {removed}건 삭제")
+        return removed
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """큐 통계 반환"""
+        with sqlite3.connect(self.db_path) as conn:
+            by_status = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM upload_jobs GROUP BY status"
+            ).fetchall())
+        
+        return {
+            **self.stats,
+            'jobs_by_status': by_status,
+            'db_path': str(self.db_path)
+        }
+
+# 전역 업로드 큐
+upload_queue = UploadQueue(UPLOAD_CONFIG.get('queue_path', "data/upload_queue.db"))
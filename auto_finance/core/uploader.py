@@ -5,17 +5,24 @@
 
 import os
 import json
+import asyncio
 import requests
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from config.settings import settings
+from auto_finance.core.upload_queue import UploadError, idempotency_key, upload_queue
 
 class Uploader:
     def __init__(self):
         self.tistory_token = os.getenv('TISTORY_ACCESS_TOKEN')
         self.blog_name = os.getenv('TISTORY_BLOG_NAME', 'your-blog-name')
         self.api_available = bool(self.tistory_token)
+        self.api_url = os.getenv('TISTORY_API_URL', 'https://www.tistory.com/apis')
+        self.concurrency = int(os.getenv('UPLOAD_CONCURRENCY', '4'))
+        self.max_retries = int(os.getenv('UPLOAD_RETRIES', '3'))
+        self.retry_delay = float(os.getenv('UPLOAD_RETRY_DELAY', '5'))
+        self.queue = upload_queue
         
         if self.api_available:
             print(f"✅ 티스토리 API 활성화: {self.blog_name}")
@@ -25,28 +32,43 @@ class Uploader:
     async def upload_articles(self, contents: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         기사들을 티스토리에 업로드하거나 파일로 저장
+        
+        영속 업로드 큐를 거쳐 동시에 처리하며, 이미 게시된 기사(같은 제목/본문)는
+        다시 올리지 않고 저장된 결과를 반환한다. 중단된 업로드는 다음 호출에서 재개된다.
         """
-        results = []
+        platform = "tistory" if self.api_available else "file"
+        self.queue.recover()
         
+        keys = []
         for content in contents:
-            try:
-                if self.api_available:
-                    # 티스토리 API 업로드
-                    result = await self._upload_to_tistory(content)
-                else:
-                    # 파일 저장
-                    result = await self._save_to_file(content)
-                
-                results.append(result)
-                
-            except Exception as e:
-                print(f"❌ 업로드 실패: {e}")
-                results.append({
-                    "success": False,
-                    "error": str(e),
-                    "title": content.get('title', 'Unknown')
-                })
+            key = idempotency_key(platform, content.get('title', ''), content.get('body', ''))
+            self.queue.enqueue(key, platform, content.get('title', 'Unknown'), content)
+            keys.append(key)
+        
+        async def publish(payload: Dict[str, Any]) -> Dict[str, Any]:
+            if self.api_available:
+                # 티스토리 API 업로드
+                result = await self._upload_to_tistory(payload)
+            else:
+                # 파일 저장
+                result = await self._save_to_file(payload)
+            if not result.get('success'):
+                raise UploadError(result.get('error', 'Unknown error'), retryable=result.get('retryable', True))
+            return result
         
+        # 이전 호출에서 중단되어 남은 같은 플랫폼 작업도 함께 처리 (결과는 이번 요청분만 반환)
+        requested = set(keys)
+        leftovers = [key for key in self.queue.pending_keys([platform]) if key not in requested]
+        if leftovers:
+            print(f"⏯️ 이전 실행에서 남은 업로드 {len(leftovers)}개 재개")
+        
+        outcomes = await self.queue.process(keys + leftovers, publish, concurrency=self.concurrency,
+                                            max_retries=self.max_retries, retry_delay=self.retry_delay)
+        
+        results = [outcomes[key] for key in keys]
+        for result in results:
+            if not result.get('success'):
+                print(f"❌ 업로드 실패: {result.get('error')}")
         return results
     
     async def _upload_to_tistory(self, content: Dict[str, Any]) -> Dict[str, Any]:
@@ -56,8 +78,8 @@ class Uploader:
             body = content.get('body', '')
             
             # 티스토리 API 요청
-            url = f"https://www.tistory.com/apis/post/write"
             params = {
+                'output': 'json',
                 'access_token': self.tistory_token,
                 'blogName': self.blog_name,
                 'title': title,
@@ -67,7 +89,16 @@ class Uploader:
                 'tag': '주식,뉴스,자동화'
             }
             
-            response = requests.post(url, data=params)
+            url = f"{self.api_url}/post/write"
+            # 동시 업로드 중 이벤트 루프를 막지 않도록 스레드에서 요청
+            response = await asyncio.to_thread(requests.post, url, data=params, timeout=30)
+            if response.status_code in (400, 401, 403):
+                return {
+                    "success": False,
+                    "error": response.json().get('tistory', {}).get('error_message', f"HTTP {response.status_code}"),
+                    "retryable": False,
+                    "title": title
+                }
             response.raise_for_status()
             
             result = response.json()
@@ -83,7 +114,7 @@ class Uploader:
             else:
                 return {
                     "success": False,
-                    "error": result.get('tistory', {}).get('error_msg', 'Unknown error'),
+                    "error": result.get('tistory', {}).get('error_message', 'Unknown error'),
                     "title": title
                 }
                 
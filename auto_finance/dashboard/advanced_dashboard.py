@@ -21,6 +21,7 @@ import time
 # Auto Finance 모듈 임포트
 from auto_finance.core.ai_ensemble import ai_ensemble
 from auto_finance.core.market_sentiment_analyzer import sentiment_analyzer
+from auto_finance.core.sentiment_timeseries import sentiment_timeseries, ROLLING_WINDOWS
 from auto_finance.core.advanced_content_generator import advanced_content_generator
 from auto_finance.utils.logger import setup_logger
 
@@ -319,8 +320,15 @@ class AdvancedDashboard:
                     line=dict(color='#1f77b4', width=2)
                 ))
                 
+                # 롤링 구간 평균 (버킷 합계만 조회)
+                windows = sentiment_timeseries.rolling_windows()
+                summary = ' / '.join(
+                    f"{name} {window['avg_sentiment']:+.2f}"
+                    for name, window in windows.items() if window['count']
+                )
+                
                 fig.update_layout(
-                    title="시장 감정 트렌드",
+                    title=f"시장 감정 트렌드 ({summary})" if summary else "시장 감정 트렌드",
                     xaxis_title="시간",
                     yaxis_title="감정 점수",
                     yaxis_range=[-1, 1],
@@ -514,15 +522,17 @@ class AdvancedDashboard:
     def load_recent_sentiment_data(self) -> List[Dict[str, Any]]:
         """최근 감정 데이터 로드"""
         try:
-            # 실제로는 데이터베이스나 파일에서 로드
-            # 여기서는 샘플 데이터 반환
+            # 분석 프로세스가 저장한 버킷 상태를 다시 읽어 최근 24시간 시간별 평균 조회
+            sentiment_timeseries.load()
             return [
                 {
-                    'timestamp': (datetime.now() - timedelta(hours=i)).isoformat(),
-                    'overall_sentiment': 0.1 + (i * 0.05),
-                    'sentiment_trend': 'positive' if i % 2 == 0 else 'negative'
+                    'timestamp': bucket['timestamp'],
+                    'overall_sentiment': bucket['avg_sentiment'],
+                    'news_count': bucket['count'],
+                    'sentiment_trend': 'positive' if bucket['avg_sentiment'] > 0.1 else
+                                       'negative' if bucket['avg_sentiment'] < -0.1 else 'neutral'
                 }
-                for i in range(24, 0, -1)
+                for bucket in sentiment_timeseries.get_series(ROLLING_WINDOWS['24h'], resolution='hour')
             ]
         except Exception as e:
             logger.error(f"감정 데이터 로드 실패: {e}")
@@ -252,19 +252,22 @@ class DashboardApp:
             """금융 데이터 차트 업데이트"""
             try:
                 data = self._load_financial_data()
+                intraday = self._load_intraday_summary()
                 
-                if not data or 'stocks' not in data:
-                    return go.Figure()
+                # 장중 모니터 요약이 마지막 수집보다 새로우면 장중 등락률 사용
+                if intraday.get('changes') and intraday.get('timestamp', '') > data.get('timestamp', ''):
+                    stock_changes = intraday['changes']
+                else:
+                    stock_changes = {k: v.get('change_percent', 0) for k, v in data.get('stocks', {}).items()}
                 
-                stocks = data['stocks']
-                if not stocks:
+                if not stock_changes:
                     return go.Figure()
                 
                 # 상위 5개 종목의 변동률
-                top_stocks = sorted(stocks.items(), key=lambda x: x[1].get('change_percent', 0), reverse=True)[:5]
+                top_stocks = sorted(stock_changes.items(), key=lambda x: x[1], reverse=True)[:5]
                 
                 symbols = [stock[0] for stock in top_stocks]
-                changes = [stock[1].get('change_percent', 0) for stock in top_stocks]
+                changes = [stock[1] for stock in top_stocks]
                 colors = ['#27ae60' if change >= 0 else '#e74c3c' for change in changes]
                 
                 fig = go.Figure(data=[go.Bar(
@@ -430,6 +433,18 @@ class DashboardApp:
             logger.error(f"❌ 금융 데이터 로드 실패: {e}")
             return {}
     
+    def _load_intraday_summary(self) -> Dict[str, Any]:
+        """장중 모니터 요약 로드"""
+        try:
+            file_path = "data/intraday_summary.json"
+            if os.path.exists(file_path):
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            return {}
+        except Exception as e:
+            logger.error(f"❌ 장중 요약 로드 실패: {e}")
+            return {}
+    
     def _load_notification_stats(self) -> Dict[str, Any]:
         """알림 통계 로드"""
         try:
@@ -480,6 +495,17 @@ class DashboardApp:
             'message': f"{len(financial_data.get('stocks', {}))}개 종목 데이터"
         }
         
+        # 장중 모니터 상태
+        intraday = self._load_intraday_summary()
+        if intraday:
+            intraday_stats = intraday.get('statistics', {})
+            intraday_stocks = intraday.get('stocks', {})
+            status['장중 모니터'] = {
+                'healthy': intraday_stats.get('polls', 0) > intraday_stats.get('failed_polls', 0),
+                'message': (f"상승 {intraday_stocks.get('gainers', 0)} / 하락 {intraday_stocks.get('losers', 0)} "
+                            f"(최근 폴링 {intraday_stats.get('last_poll') or '-'})")
+            }
+        
         # 알림 시스템 상태
         notification_stats = self._load_notification_stats()
         status['알림 시스템'] = {
@@ -7,16 +7,20 @@ import asyncio
 import json
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
 # 핵심 모듈 임포트
 from auto_finance.core.news_crawler import NewsCrawler
 from auto_finance.core.fact_checker import FactChecker
 from auto_finance.core.financial_data import FinancialDataCollector
+from auto_finance.core.feature_store import feature_store
 from auto_finance.core.content_generator import ContentGenerator, ContentRequest
 from auto_finance.core.upload_manager import UploadManager, UploadRequest
 from auto_finance.core.notification_system import NotificationSystem, NotificationMessage
+from auto_finance.core.stage_pipeline import Stage, StagePipeline
+from auto_finance.core.dag_executor import DagExecutor
+from auto_finance.core.checkpoint_store import CheckpointStore, SCOPE_RUN, article_identity
 
 # 유틸리티 임포트
 from auto_finance.utils.logger import setup_logger
@@ -28,7 +32,7 @@ from auto_finance.utils.file_manager import file_manager
 # 설정 임포트
 from auto_finance.config.settings import (
     NEWS_SOURCES, AI_CONFIG, FINANCIAL_CONFIG, 
-    CONTENT_CONFIG, UPLOAD_CONFIG, NOTIFICATION_CONFIG
+    CONTENT_CONFIG, UPLOAD_CONFIG, NOTIFICATION_CONFIG, PERFORMANCE_CONFIG
 )
 
 logger = setup_logger(__name__)
@@ -59,43 +63,36 @@ class AutoFinanceSystem:
         self.generated_contents = []
         self.upload_results = []
         
+        # 단계 출력 체크포인트 (실패 실행 재개 / 동일 입력 단계 건너뛰기)
+        self.checkpoints = CheckpointStore(
+            PERFORMANCE_CONFIG.get('checkpoint_dir', 'data/checkpoints'),
+            PERFORMANCE_CONFIG.get('checkpoint_retention_days', 7),
+            PERFORMANCE_CONFIG.get('checkpoint_resume_max_age_hours', 6)
+        )
+        
         logger.info("🚀 Auto Finance 시스템 초기화 완료")
     
-    async def run_full_pipeline(self) -> Dict[str, Any]:
-        """전체 파이프라인 실행"""
+    async def run_full_pipeline(self, run_id: Optional[str] = None, resume: bool = True) -> Dict[str, Any]:
+        """전체 파이프라인 실행
+        
+        resume이면 재개 가능 기간 안의 직전 실패 실행에서 완료된 단계는 건너뛴다.
+        run_id를 지정하면 기간과 관계없이 그 실행을 이어받는다.
+        """
         start_time = datetime.now()
         self.is_running = True
         
-        logger.info("🎯 전체 파이프라인 실행 시작")
+        run_id = self.checkpoints.start_run('full', run_id, resume)
+        logger.info(f"🎯 전체 파이프라인 실행 시작: {run_id}")
         
         try:
-            # 1단계: 뉴스 크롤링
-            logger.info("📰 1단계: 뉴스 크롤링 시작")
-            articles = await self._run_crawler()
-            self.crawled_articles = articles
-            
-            # 2단계: AI 팩트 체크
-            logger.info("🔍 2단계: AI 팩트 체크 시작")
-            fact_check_results = await self._run_fact_checker(articles)
-            self.fact_check_results = fact_check_results
-            
-            # 3단계: 금융 데이터 수집
-            logger.info("📈 3단계: 금융 데이터 수집 시작")
-            financial_data = await self._run_financial_collector()
-            
-            # 4단계: 콘텐츠 생성
-            logger.info("✍️ 4단계: 콘텐츠 생성 시작")
-            contents = await self._run_content_generator(articles, fact_check_results)
-            self.generated_contents = contents
-            
-            # 5단계: 업로드
-            logger.info("📤 5단계: 업로드 시작")
-            upload_results = await self._run_upload_manager(contents)
-            self.upload_results = upload_results
+            streaming = PERFORMANCE_CONFIG.get('pipeline_mode', 'streaming') == 'streaming'
+            logger.info(f"🕸️ 단계 DAG 실행 시작 ({'스트리밍' if streaming else '일괄'} 모드)")
+            dag = self._build_pipeline_dag(streaming)
+            await dag.run()
+            dag.log_summary()
             
-            # 6단계: 알림 전송
-            logger.info("🔔 6단계: 알림 전송 시작")
-            notification_results = await self._run_notification_system()
+            articles, fact_check_results = self.crawled_articles, self.fact_check_results
+            contents, upload_results = self.generated_contents, self.upload_results
             
             # 통계 업데이트
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -105,6 +102,10 @@ class AutoFinanceSystem:
             summary = self._generate_execution_summary(
                 articles, fact_check_results, contents, upload_results, processing_time
             )
+            summary['execution_graph'] = dag.get_summary()
+            summary['run_id'] = run_id
+            summary['checkpoints'] = self.checkpoints.get_statistics()
+            self.checkpoints.finish_run(True)
             
             logger.info(f"✅ 전체 파이프라인 완료: {processing_time:.2f}초")
             return summary
@@ -112,6 +113,7 @@ class AutoFinanceSystem:
         except Exception as e:
             processing_time = (datetime.now() - start_time).total_seconds()
             self._update_execution_stats(False, processing_time)
+            self.checkpoints.finish_run(False)
             self.error_handler.handle_error(e, "전체 파이프라인 실행 실패")
             logger.error(f"❌ 전체 파이프라인 실행 실패: {e}")
             raise
@@ -119,6 +121,167 @@ class AutoFinanceSystem:
         finally:
             self.is_running = False
     
+    def _build_pipeline_dag(self, streaming: bool) -> DagExecutor:
+        """파이프라인 단계 DAG 구성
+        
+        금융 데이터 수집은 기사 처리와 독립이므로 크롤링과 동시에 시작하고,
+        피처 저장소 갱신은 크롤링 직후 팩트 체크/생성과 나란히 실행한다.
+        """
+        def keep(attr: str, func):
+            # 결과를 시스템 속성에도 보관 (알림 단계에서 참조)
+            async def node(*args):
+                result = await func(*args)
+                setattr(self, attr, result)
+                return result
+            return node
+        
+        checkpoint = self.checkpoints.wrap
+        all_articles = lambda articles, *_: [article_identity(a) for a in articles]
+        all_uploaded = lambda results: bool(results) and all(r.get('success') for r in results)
+        
+        dag = DagExecutor('full_pipeline')
+        dag.add('financial_collector', checkpoint('financial_collector', self._run_financial_collector, SCOPE_RUN))
+        
+        if streaming:
+            async def article_stages():
+                stages = await self._run_streaming_stages()
+                (self.crawled_articles, self.fact_check_results,
+                 self.generated_contents, self.upload_results) = stages
+                return stages
+            
+            dag.add('article_stages', article_stages)
+            dag.add('feature_store', lambda stages: self._update_feature_store(stages[0]), ['article_stages'])
+            last_stage = 'article_stages'
+        
+        else:
+            # 크롤링은 재개 시에만, 팩트 체크/생성/업로드는 입력이 같으면 실행 간에도 재사용
+            dag.add('crawler', keep('crawled_articles', checkpoint('crawler', self._run_crawler, SCOPE_RUN)))
+            dag.add('fact_checker', keep('fact_check_results', checkpoint(
+                'fact_checker', self._run_fact_checker, key=all_articles)), ['crawler'])
+            dag.add('feature_store', self._update_feature_store, ['crawler'])
+            dag.add('content_generator', keep('generated_contents', checkpoint(
+                'content_generator', self._run_content_generator, key=all_articles)), ['crawler', 'fact_checker'])
+            dag.add('upload_manager', keep('upload_results', checkpoint(
+                'upload_manager', self._run_upload_manager, valid=all_uploaded)), ['content_generator'])
+            last_stage = 'upload_manager'
+        
+        dag.add('notification_system', lambda _: self._run_notification_system(), [last_stage])
+        return dag
+    
+    async def _run_streaming_stages(self) -> Tuple[List[Dict[str, Any]], List[Any], List[Any], List[Any]]:
+        """크롤링 → 팩트 체크 → 콘텐츠 생성 → 업로드 단계 중첩 실행
+        
+        소스별 크롤링이 끝나는 대로 기사가 유한 큐로 흘러가므로, 가장 느린 소스나 팩트 체크를
+        기다리지 않고 첫 기사가 게시된다. 팩트 체크 10건 / 생성 5건 상한은 일괄 모드와 동일.
+        """
+        concurrency = PERFORMANCE_CONFIG.get('stage_concurrency', {})
+        queue_size = PERFORMANCE_CONFIG.get('stage_queue_size', 10)
+        articles: List[Dict[str, Any]] = []
+        
+        async with NewsCrawler() as crawler, FactChecker() as fact_checker, \
+                ContentGenerator() as generator, UploadManager() as upload_manager:
+            
+            async def crawl():
+                tasks = [asyncio.create_task(crawler.crawl_source(source)) for source in NEWS_SOURCES]
+                try:
+                    for finished in asyncio.as_completed(tasks):
+                        try:
+                            batch = await finished
+                        except Exception as e:
+                            logger.error(f"❌ 소스 크롤링 실패: {e}")
+                            continue
+                        for article in batch:
+                            # 소스 간 중복 제거 (일괄 모드의 remove_duplicates와 같은 기준)
+                            if crawler._is_duplicate(article, articles):
+                                continue
+                            articles.append(article)
+                            yield article
+                finally:
+                    for task in tasks:
+                        task.cancel()
+            
+            async def generate_article(article):
+                content = await generator.generate_content(ContentRequest(
+                    title=article['title'],
+                    content=article.get('content', article['title']),
+                    keywords=article.get('keywords', []),
+                    content_type="article",
+                    target_length=800,
+                    tone="professional"
+                ))
+                if content is not None:
+                    generator.save_content(content)
+                return content
+            
+            async def upload_content(content):
+                return await upload_manager.upload_content(UploadRequest(
+                    title=content.title,
+                    content=content.content,
+                    category="주식뉴스",
+                    tags=content.keywords
+                ))
+            
+            # 기사 단위 체크포인트 - 재실행 시 같은 기사의 LLM 호출/업로드를 반복하지 않음
+            checkpoint = self.checkpoints.wrap
+            check_article = checkpoint('fact_check_article', fact_checker.check_fact, key=article_identity,
+                                       valid=lambda result: result is not None, record=False)
+            generate_cached = checkpoint('generate_article', generate_article, key=article_identity,
+                                         valid=lambda content: content is not None, record=False)
+            upload_once = checkpoint('upload_article', upload_content, key=lambda c: (c.title, c.content),
+                                     valid=lambda result: bool(result.get('success')), record=False)
+            
+            async def fact_check(article):
+                return {'article': article, 'fact_check': await check_article(article)}
+            
+            async def generate(item):
+                content = await generate_cached(item['article'])
+                return {**item, 'content': content} if content is not None else None
+            
+            async def upload(item):
+                return {**item, 'upload': await upload_once(item['content'])}
+            
+            pipeline = StagePipeline([
+                Stage('fact_check', fact_check, concurrency.get('fact_check', 5), queue_size, limit=10),
+                Stage('generate', generate, concurrency.get('generate', 3), queue_size, limit=5),
+                Stage('upload', upload, concurrency.get('upload', 2), queue_size)
+            ])
+            outputs = await pipeline.run(crawl())
+            
+            crawler.save_statistics()
+            fact_check_results = [i['fact_check'] for i in outputs['fact_check'] if i['fact_check']]
+            fact_checker.save_results(fact_check_results)
+            contents = [i['content'] for i in outputs['generate']]
+            upload_results = [i['upload'] for i in outputs['upload']]
+            upload_manager.save_results(upload_results)
+        
+        successful_uploads = len([r for r in upload_results if r.get('success')])
+        components = self.execution_stats['components']
+        components['crawler'] = {
+            'articles_collected': len(articles),
+            'processing_time': crawler.stats.get('processing_time', 0),
+            'success_rate': len(articles) / len(NEWS_SOURCES) * 100 if NEWS_SOURCES else 0
+        }
+        components['fact_checker'] = {
+            'articles_checked': len(fact_check_results),
+            'average_score': fact_checker.stats.get('average_score', 0)
+        }
+        components['content_generator'] = {
+            'contents_generated': len(contents),
+            'total_words': sum(c.word_count for c in contents)
+        }
+        components['upload_manager'] = {
+            'uploads_attempted': len(upload_results),
+            'successful_uploads': successful_uploads
+        }
+        components['stage_pipeline'] = pipeline.get_statistics()
+        
+        logger.info(
+            f"✅ 스트리밍 파이프라인 완료: 기사 {len(articles)}개, 팩트 체크 {len(fact_check_results)}개, "
+            f"생성 {len(contents)}개, 업로드 {successful_uploads}개 성공 "
+            f"(첫 업로드 {pipeline.stats['upload'].first_output or 0:.1f}초)"
+        )
+        return articles, fact_check_results, contents, upload_results
+    
     async def _run_crawler(self) -> List[Dict[str, Any]]:
         """뉴스 크롤러 실행"""
         try:
@@ -176,11 +339,21 @@ class AutoFinanceSystem:
         """금융 데이터 수집기 실행"""
         try:
             async with FinancialDataCollector() as collector:
-                # 주식 데이터 수집
-                stocks = await collector.collect_all_stock_data()
+                if collector.bulk_download:
+                    # 주식/지수 일괄 수집
+                    stocks, indices = await collector.collect_all_market_data()
+                else:
+                    # 주식 데이터 수집
+                    stocks = await collector.collect_all_stock_data()
+                    
+                    # 지수 데이터 수집
+                    indices = await collector.collect_all_index_data()
+                
+                # 기술적 지표 갱신 (최초 일괄 계산 후 시세로 증분 갱신)
+                await collector.update_technical_indicators()
                 
-                # 지수 데이터 수집
-                indices = await collector.collect_all_index_data()
+                # 완성된 일봉을 온라인 상관관계 엔진에 반영
+                await collector.update_correlation_bars()
                 
                 # 데이터 저장
                 collector.save_data()
@@ -199,6 +372,18 @@ class AutoFinanceSystem:
             logger.error(f"❌ 금융 데이터 수집기 실행 실패: {e}")
             return {}
     
+    async def _update_feature_store(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+        """(종목, 날짜) 피처 저장소 증분 갱신"""
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, lambda: feature_store.update(articles, refresh=True))
+            self.execution_stats['components']['feature_store'] = result
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 피처 저장소 갱신 실패: {e}")
+            return {}
+    
     async def _run_content_generator(self, articles: List[Dict[str, Any]], 
                                    fact_check_results: List[Any]) -> List[Any]:
         """콘텐츠 생성기 실행"""
@@ -255,14 +440,9 @@ class AutoFinanceSystem:
                 requests = []
                 
                 for content in contents:
-                    # 파일 경로 생성
-                    file_path = f"data/generated/{content.title.replace(' ', '_')[:50]}.md"
-                    
                     request = UploadRequest(
-                        content_id=f"content_{hash(content.title)}",
                         title=content.title,
                         content=content.content,
-                        file_path=file_path,
                         platform="tistory",  # 기본 플랫폼
                         tags=content.keywords,
                         category="주식뉴스"
@@ -275,13 +455,15 @@ class AutoFinanceSystem:
                 upload_manager.save_results(results)
                 
                 # 컴포넌트 통계 업데이트
+                successful = len([r for r in results if r.get('success')])
                 self.execution_stats['components']['upload_manager'] = {
                     'uploads_attempted': len(results),
-                    'successful_uploads': len([r for r in results if r.success]),
-                    'success_rate': len([r for r in results if r.success]) / len(results) * 100 if results else 0
+                    'successful_uploads': successful,
+                    'replayed_uploads': len([r for r in results if r.get('replayed')]),
+                    'success_rate': successful / len(results) * 100 if results else 0
                 }
                 
-                logger.info(f"✅ 업로드 완료: {len([r for r in results if r.success])}개 성공")
+                logger.info(f"✅ 업로드 완료: {successful}개 성공")
                 return results
                 
         except Exception as e:
@@ -357,7 +539,7 @@ class AutoFinanceSystem:
                 },
                 'upload_manager': {
                     'uploads_attempted': len(upload_results),
-                    'successful_uploads': len([r for r in upload_results if r.success])
+                    'successful_uploads': len([r for r in upload_results if r.get('success')])
                 }
             },
             'overall_stats': self.execution_stats,
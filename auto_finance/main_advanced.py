@@ -16,11 +16,16 @@ import pandas as pd
 from auto_finance.core.news_crawler import NewsCrawler
 from auto_finance.core.fact_checker import FactChecker
 from auto_finance.core.financial_data import FinancialDataCollector
+from auto_finance.core.intraday_monitor import IntradayMonitor
+from auto_finance.core.feature_store import feature_store
+from auto_finance.core.price_correlation import PriceCorrelationAnalyzer
 from auto_finance.core.ai_ensemble import ai_ensemble
 from auto_finance.core.market_sentiment_analyzer import sentiment_analyzer
 from auto_finance.core.advanced_content_generator import advanced_content_generator, ContentRequest
 from auto_finance.core.upload_manager import UploadManager, UploadRequest
 from auto_finance.core.notification_system import NotificationSystem, NotificationMessage
+from auto_finance.core.dag_executor import DagExecutor
+from auto_finance.core.processing_state import processing_state
 
 # 유틸리티 임포트
 from auto_finance.utils.logger import setup_logger
@@ -32,7 +37,7 @@ from auto_finance.utils.file_manager import file_manager
 # 설정 임포트
 from auto_finance.config.settings import (
     NEWS_SOURCES, AI_CONFIG, FINANCIAL_CONFIG, 
-    CONTENT_CONFIG, UPLOAD_CONFIG, NOTIFICATION_CONFIG
+    CONTENT_CONFIG, UPLOAD_CONFIG, NOTIFICATION_CONFIG, PERFORMANCE_CONFIG
 )
 
 logger = setup_logger(__name__)
@@ -68,6 +73,10 @@ class AdvancedAutoFinanceSystem:
         self.generated_contents = []
         self.upload_results = []
         self.market_data = {}
+        self.correlation_results = {}
+        
+        # 뉴스-주가 상관관계 분석기
+        self.correlation_analyzer = PriceCorrelationAnalyzer()
         
         # 성능 모니터링
         self.performance_metrics = {
@@ -80,8 +89,8 @@ class AdvancedAutoFinanceSystem:
         
         logger.info("🚀 고도화된 Auto Finance 시스템 초기화 완료")
     
-    async def run_advanced_pipeline(self) -> Dict[str, Any]:
-        """고도화된 전체 파이프라인 실행"""
+    async def run_advanced_pipeline(self, delta: bool = False) -> Dict[str, Any]:
+        """고도화된 전체 파이프라인 실행 (delta면 이전 실행에서 처리한 기사는 비용이 큰 단계에서 제외)"""
         start_time = datetime.now()
         self.is_running = True
         self.start_time = start_time
@@ -89,45 +98,16 @@ class AdvancedAutoFinanceSystem:
         logger.info("🎯 고도화된 전체 파이프라인 실행 시작")
         
         try:
-            # 1단계: 뉴스 크롤링
-            logger.info("📰 1단계: 뉴스 크롤링 시작")
-            articles = await self._run_advanced_crawler()
-            self.crawled_articles = articles
-            
-            # 2단계: AI 앙상블 팩트 체크
-            logger.info("🔍 2단계: AI 앙상블 팩트 체크 시작")
-            fact_check_results = await self._run_advanced_fact_checker(articles)
-            self.fact_check_results = fact_check_results
-            
-            # 3단계: 시장 감정 분석
-            logger.info("📊 3단계: 시장 감정 분석 시작")
-            sentiment_results = await self._run_sentiment_analyzer(articles)
-            self.sentiment_results = sentiment_results
-            
-            # 4단계: 금융 데이터 수집
-            logger.info("📈 4단계: 금융 데이터 수집 시작")
-            financial_data = await self._run_financial_collector()
-            self.market_data = financial_data
-            
-            # 5단계: 고급 콘텐츠 생성
-            logger.info("✍️ 5단계: 고급 콘텐츠 생성 시작")
-            contents = await self._run_advanced_content_generator(
-                articles, fact_check_results, sentiment_results, financial_data
-            )
-            self.generated_contents = contents
-            
-            # 6단계: 업로드
-            logger.info("📤 6단계: 업로드 시작")
-            upload_results = await self._run_upload_manager(contents)
-            self.upload_results = upload_results
+            # 크롤링 ‖ 금융 데이터 수집, 크롤링 후 팩트 체크 ‖ 감정 분석 ‖ 피처 저장소 동시 실행
+            logger.info("🕸️ 단계 DAG 실행 시작")
+            processing_state.last_delta = {}
+            dag = self._build_pipeline_dag(delta)
+            await dag.run()
+            dag.log_summary()
             
-            # 7단계: 고급 알림 전송
-            logger.info("🔔 7단계: 고급 알림 전송 시작")
-            notification_results = await self._run_advanced_notification_system()
-            
-            # 8단계: 성능 분석 및 최적화
-            logger.info("⚡ 8단계: 성능 분석 및 최적화")
-            await self._run_performance_analysis()
+            articles, fact_check_results = self.crawled_articles, self.fact_check_results
+            sentiment_results = self.sentiment_results
+            contents, upload_results = self.generated_contents, self.upload_results
             
             # 통계 업데이트
             processing_time = (datetime.now() - start_time).total_seconds()
@@ -138,6 +118,10 @@ class AdvancedAutoFinanceSystem:
                 articles, fact_check_results, sentiment_results, 
                 contents, upload_results, processing_time
             )
+            summary['execution_graph'] = dag.get_summary()
+            if delta:
+                # 단계별 처리/건너뜀 기사 수
+                summary['delta'] = dict(processing_state.last_delta)
             
             logger.info(f"✅ 고도화된 전체 파이프라인 완료: {processing_time:.2f}초")
             return summary
@@ -153,6 +137,64 @@ class AdvancedAutoFinanceSystem:
             self.is_running = False
             self.last_execution = datetime.now()
     
+    def _build_pipeline_dag(self, delta: bool = False) -> DagExecutor:
+        """고급 파이프라인 단계 DAG 구성
+        
+        금융 데이터 수집은 크롤링과 독립이고, 팩트 체크/감정 분석/피처 저장소 갱신은
+        크롤링 결과만 필요하므로 서로 기다리지 않는다. 콘텐츠 생성은 네 결과가 모두 모이면 시작.
+        delta면 각 단계에는 해당 단계에서 아직 처리하지 않았거나 본문이 바뀐 기사만 전달한다.
+        감정 분석은 시장 감정을 전체 기사 기준으로 집계해야 하므로 전체 기사를 받되,
+        이미 처리한 기사는 분석기의 텍스트 점수 캐시를 재사용해 새 기사만 채점한다.
+        """
+        def keep(attr: str, func):
+            # 결과를 시스템 속성에도 보관 (알림/성능 분석 단계에서 참조)
+            async def node(*args):
+                result = await func(*args)
+                setattr(self, attr, result)
+                return result
+            return node
+        
+        def only_new(stage: str, func, empty: Any, sources=None, full_window: bool = False):
+            # 델타 처리 - 결과가 돌아온 기사만 처리 완료 기록 (실패한 기사는 다음 주기에 재시도)
+            # sources는 단계 결과에서 기사별 원본 식별 필드를 꺼냄 (없으면 결과가 있을 때 전체 기록)
+            if not delta:
+                return func
+            
+            async def node(articles, *rest):
+                pending, _ = processing_state.filter_pending(stage, articles)
+                if not pending and not full_window:
+                    return empty
+                result = await func(articles if full_window else pending, *rest)
+                if sources is not None:
+                    processing_state.mark_returned(stage, pending, sources(result))
+                elif result:
+                    processing_state.mark_processed(stage, pending)
+                return result
+            return node
+        
+        dag = DagExecutor('advanced_pipeline')
+        dag.add('crawler', keep('crawled_articles', self._run_advanced_crawler))
+        dag.add('financial_collector', keep('market_data', self._run_financial_collector))
+        # 팩트 체커는 상위 15개만 검사하고 기사별 실패는 건너뛰므로 결과가 나온 기사만 기록
+        dag.add('fact_checker', keep('fact_check_results', only_new(
+            'fact_checker', self._run_advanced_fact_checker, [],
+            sources=lambda results: [{'url': r.url, 'title': r.title} for r in results])), ['crawler'])
+        dag.add('sentiment_analyzer', keep('sentiment_results', only_new(
+            'sentiment_analyzer', self._run_sentiment_analyzer, {}, full_window=True)), ['crawler'])
+        dag.add('feature_store', self._update_feature_store, ['crawler'])
+        # 금융 데이터 수집으로 일봉 저장소가 갱신된 뒤 전 종목 시차 상관관계 계산
+        dag.add('price_correlation', keep('correlation_results', self._run_price_correlation),
+                ['crawler', 'financial_collector'])
+        dag.add('content_generator', keep('generated_contents', only_new(
+            'content_generator', self._run_advanced_content_generator, [],
+            sources=lambda contents: [{'url': c.metadata.get('url'), 'title': c.metadata.get('source_title', '')}
+                                      for c in contents])),
+                ['crawler', 'fact_checker', 'sentiment_analyzer', 'financial_collector'])
+        dag.add('upload_manager', keep('upload_results', self._run_upload_manager), ['content_generator'])
+        dag.add('notification_system', lambda _: self._run_advanced_notification_system(), ['upload_manager'])
+        dag.add('performance_analysis', lambda _: self._run_performance_analysis(), ['notification_system'])
+        return dag
+    
     async def _run_advanced_crawler(self) -> List[Dict[str, Any]]:
         """고도화된 뉴스 크롤러 실행"""
         try:
@@ -276,11 +318,21 @@ class AdvancedAutoFinanceSystem:
         """금융 데이터 수집기 실행"""
         try:
             async with FinancialDataCollector() as collector:
-                # 주식 데이터 수집
-                stocks = await collector.collect_all_stock_data()
+                if collector.bulk_download:
+                    # 주식/지수 일괄 수집
+                    stocks, indices = await collector.collect_all_market_data()
+                else:
+                    # 주식 데이터 수집
+                    stocks = await collector.collect_all_stock_data()
+                    
+                    # 지수 데이터 수집
+                    indices = await collector.collect_all_index_data()
+                
+                # 기술적 지표 갱신 (최초 일괄 계산 후 시세로 증분 갱신)
+                await collector.update_technical_indicators()
                 
-                # 지수 데이터 수집
-                indices = await collector.collect_all_index_data()
+                # 완성된 일봉을 온라인 상관관계 엔진에 반영
+                await collector.update_correlation_bars()
                 
                 # 데이터 저장
                 collector.save_data()
@@ -302,6 +354,54 @@ class AdvancedAutoFinanceSystem:
             logger.error(f"❌ 금융 데이터 수집기 실행 실패: {e}")
             return {}
     
+    async def _update_feature_store(self, articles: List[Dict[str, Any]]) -> Dict[str, int]:
+        """(종목, 날짜) 피처 저장소 증분 갱신"""
+        try:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, lambda: feature_store.update(articles, refresh=True))
+            self.execution_stats['components']['feature_store'] = result
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 피처 저장소 갱신 실패: {e}")
+            return {}
+    
+    async def _run_price_correlation(self, articles: List[Dict[str, Any]],
+                                     financial_data: Dict[str, Any]) -> Dict[str, Any]:
+        """전 종목 뉴스-주가 시차 상관관계 일괄 분석"""
+        try:
+            if not articles:
+                return {}
+            
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self.correlation_analyzer.analyze_universe_correlation, articles
+            )
+            if not result:
+                return {}
+            
+            # 기사 감정을 온라인 엔진에 반영하고 종목별 롤링 상관관계를 함께 기록
+            result['rolling_correlation'] = await loop.run_in_executor(
+                None, self.correlation_analyzer.update_online_correlation, articles
+            )
+            
+            file_path = "data/price_correlation.json"
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2, default=str)
+            
+            self.execution_stats['components']['price_correlation'] = {
+                'symbols': len(result['symbols']),
+                'lags': result['lags'],
+                'best_lag': result['best_lag']
+            }
+            
+            logger.info(f"✅ 뉴스-주가 상관관계 분석 완료: {len(result['symbols'])}개 종목, 시차 {result['lags']}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"❌ 뉴스-주가 상관관계 분석 실패: {e}")
+            return {}
+    
     async def _run_advanced_content_generator(self, articles: List[Dict[str, Any]], 
                                             fact_check_results: List[Any],
                                             sentiment_results: Dict[str, Any],
@@ -349,19 +449,13 @@ class AdvancedAutoFinanceSystem:
                 requests = []
                 
                 for content in contents:
-                    # 파일 경로 생성
-                    safe_title = "".join(c for c in content.title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                    file_path = f"data/generated/{safe_title[:50]}.md"
-                    
                     request = UploadRequest(
-                        content_id=f"content_{hash(content.title)}",
                         title=content.title,
                         content=content.content,
-                        file_path=file_path,
                         platform="tistory",
                         tags=content.keywords,
                         category="주식뉴스",
-                        metadata={
+                        custom_fields={
                             'sentiment_score': content.sentiment_score,
                             'market_impact': content.market_impact,
                             'seo_score': content.seo_score,
@@ -376,13 +470,15 @@ class AdvancedAutoFinanceSystem:
                 upload_manager.save_results(results)
                 
                 # 컴포넌트 통계 업데이트
+                successful = len([r for r in results if r.get('success')])
                 self.execution_stats['components']['upload_manager'] = {
                     'uploads_attempted': len(results),
-                    'successful_uploads': len([r for r in results if r.success]),
-                    'success_rate': len([r for r in results if r.success]) / len(results) * 100 if results else 0
+                    'successful_uploads': successful,
+                    'replayed_uploads': len([r for r in results if r.get('replayed')]),
+                    'success_rate': successful / len(results) * 100 if results else 0
                 }
                 
-                logger.info(f"✅ 업로드 완료: {len([r for r in results if r.success])}개 성공")
+                logger.info(f"✅ 업로드 완료: {successful}개 성공")
                 return results
                 
         except Exception as e:
@@ -437,7 +533,7 @@ class AdvancedAutoFinanceSystem:
 • 팩트 체크: {len(self.fact_check_results)}개
 • 감정 분석: {len(self.sentiment_results.get('news_sentiments', []))}개
 • 생성된 콘텐츠: {len(self.generated_contents)}개
-• 업로드 성공: {len([r for r in self.upload_results if r.success])}개
+• 업로드 성공: {len([r for r in self.upload_results if r.get('success')])}개
 
 🤖 AI 앙상블 활용:
 • 모델 사용: {len(ai_ensemble.models)}개
@@ -540,7 +636,7 @@ class AdvancedAutoFinanceSystem:
                 },
                 'upload_manager': {
                     'uploads_attempted': len(upload_results),
-                    'successful_uploads': len([r for r in upload_results if r.success])
+                    'successful_uploads': len([r for r in upload_results if r.get('success')])
                 }
             },
             'ai_ensemble_stats': self.execution_stats.get('ai_ensemble_stats', {}),
@@ -597,17 +693,33 @@ class AdvancedAutoFinanceSystem:
     
     async def run_scheduled_execution(self, interval_hours: int = 6):
         """스케줄된 실행"""
-        logger.info(f"⏰ 스케줄된 실행 시작: {interval_hours}시간 간격")
+        delta = PERFORMANCE_CONFIG.get('delta_processing', True)
+        logger.info(f"⏰ 스케줄된 실행 시작: {interval_hours}시간 간격 (델타 처리: {delta})")
         
-        while True:
-            try:
-                await self.run_advanced_pipeline()
-                logger.info(f"✅ 스케줄된 실행 완료. 다음 실행까지 {interval_hours}시간 대기")
-                await asyncio.sleep(interval_hours * 3600)  # 시간을 초로 변환
-                
-            except Exception as e:
-                logger.error(f"❌ 스케줄된 실행 실패: {e}")
-                await asyncio.sleep(300)  # 5분 후 재시도
+        # 파이프라인 실행 사이에도 장중 시세 요약을 대시보드에 계속 게시
+        monitor, monitor_task = None, None
+        if FINANCIAL_CONFIG.get('intraday_monitor', True):
+            monitor = IntradayMonitor(FinancialDataCollector())
+            monitor_task = asyncio.create_task(monitor.run())
+        
+        try:
+            while True:
+                try:
+                    if delta:
+                        processing_state.prune(PERFORMANCE_CONFIG.get('processing_state_retention_days', 30))
+                    await self.run_advanced_pipeline(delta=delta)
+                    logger.info(f"✅ 스케줄된 실행 완료. 다음 실행까지 {interval_hours}시간 대기")
+                    await asyncio.sleep(interval_hours * 3600)  # 시간을 초로 변환
+                    
+                except Exception as e:
+                    logger.error(f"❌ 스케줄된 실행 실패: {e}")
+                    await asyncio.sleep(300)  # 5분 후 재시도
+        
+        finally:
+            if monitor_task is not None:
+                monitor.stop()
+                monitor_task.cancel()
+                await asyncio.gather(monitor_task, return_exceptions=True)
 
 async def main():
     """메인 실행 함수"""
@@ -648,6 +760,8 @@ async def main():
         print(f"\n❌ 시스템 실행 중 오류 발생: {e}")
     
     finally:
+        # 감정 분석 프로세스 풀 종료
+        sentiment_analyzer.close()
         logger.info("🏁 고도화된 Auto Finance 시스템 종료")
 
 if __name__ == "__main__":
@@ -0,0 +1,15 @@
+"""
+🧪 pytest 공통 설정
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+# 모듈 전역 저장소(data/*.db 등)가 작업 트리에 생기지 않도록 임시 디렉터리에서 실행
+os.chdir(tempfile.mkdtemp(prefix='auto_finance_tests_'))
@@ -0,0 +1,83 @@
+"""
+⚡ 헤지 생성 테스트
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('google.generativeai')
+pytest.importorskip('openai')
+pytest.importorskip('anthropic')
+
+from auto_finance.core.ai_ensemble import AIEnsembleSystem, AIResponse
+from auto_finance.core.prompt_builder import count_tokens, token_ledger
+
+PROMPT = '코스피 시장 동향 분석'
+
+def _system(monkeypatch, behaviours, hedge_delay=0.05):
+    """모델별 (지연, 신뢰도 또는 예외) 스텁으로 교체한 앙상블"""
+    system = AIEnsembleSystem()
+    system.models = {name: object() for name in behaviours}
+    system.routing_enabled = False
+    system.model_weights = {name: 1.0 - index * 0.1 for index, name in enumerate(behaviours)}
+    system.ensemble_config['default_hedge_delay'] = hedge_delay
+    system.launched = {}
+    
+    async def fake_generate(name, model, prompt, task_type):
+        system.launched[name] = asyncio.get_running_loop().time()
+        delay, outcome = behaviours[name]
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return AIResponse(name, f'{name} 응답', outcome, delay, 10, 0.01, {})
+    
+    monkeypatch.setattr(system, '_generate_with_model', fake_generate)
+    return system
+
+def test_slow_first_model_triggers_hedge_at_delay(monkeypatch):
+    system = _system(monkeypatch, {'gpt4': (1.0, 0.9), 'claude': (0.01, 0.9)})
+    
+    result = asyncio.run(system.generate_content_hedged(PROMPT))
+    
+    assert result.final_content == 'claude 응답'
+    assert system.launched['claude'] - system.launched['gpt4'] == pytest.approx(0.05, abs=0.04)
+    assert system.stats['hedges_launched'] == 1
+    # 취소된 gpt4 호출의 입력 비용도 합계에 포함
+    cancelled = token_ledger.cost('gpt4', count_tokens(PROMPT), 0)
+    assert cancelled > 0
+    assert result.total_cost == pytest.approx(0.01 + cancelled)
+    assert system.stats['cancelled_cost'] == pytest.approx(cancelled)
+
+def test_first_accepted_response_cancels_others(monkeypatch):
+    system = _system(monkeypatch, {
+        'gemini': (1.0, 0.9), 'gpt4': (1.0, 0.9), 'claude': (0.01, 0.95)
+    })
+    
+    result = asyncio.run(system.generate_content_hedged(PROMPT))
+    
+    assert result.final_content == 'claude 응답'
+    assert [r.model_name for r in result.individual_responses] == ['claude']
+    assert system.stats['hedges_launched'] == 2
+    assert system.stats['cancelled_calls'] == 2
+
+def test_failure_launches_next_model_immediately(monkeypatch):
+    system = _system(monkeypatch, {'gemini': (0.0, RuntimeError('실패')), 'gpt4': (0.01, 0.9)},
+                     hedge_delay=10.0)
+    
+    result = asyncio.run(asyncio.wait_for(system.generate_content_hedged(PROMPT), 1.0))
+    
+    assert result.final_content == 'gpt4 응답'
+    assert system.stats['hedges_launched'] == 0
+    assert system.stats['cancelled_calls'] == 0
+
+def test_all_models_failing_raises(monkeypatch):
+    system = _system(monkeypatch, {
+        'gemini': (0.0, RuntimeError('a')), 'gpt4': (0.01, RuntimeError('b')), 'claude': (0.0, RuntimeError('c'))
+    })
+    
+    with pytest.raises(Exception, match='모든 AI 모델이 실패'):
+        asyncio.run(system.generate_content_hedged(PROMPT))
+    
+    assert set(system.launched) == {'gemini', 'gpt4', 'claude'}
+    assert system.stats['failed_requests'] == 1
@@ -0,0 +1,56 @@
+"""
+🧪 백테스터 테스트
+"""
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from auto_finance.core import backtester as backtester_module
+from auto_finance.core import market_data_provider
+from auto_finance.core.backtester import Backtester, predict_price_arrays
+from auto_finance.core.price_correlation import PriceCorrelationAnalyzer
+from auto_finance.core.price_store import PriceStore
+from auto_finance.tests.test_price_store import FakeProvider
+
+MOVEMENT_CODES = {'상승': 1, '횡보': 0, '하락': -1}
+
+def test_vector_prediction_matches_analyzer_model(monkeypatch):
+    monkeypatch.setattr(market_data_provider, '_provider', FakeProvider())
+    analyzer = PriceCorrelationAnalyzer()
+    sentiment = np.array([0.0, 0.2, 0.5, 0.9, 0.1, 0.0])
+    sentiment_std = np.array([0.5, 0.0, 0.1, 0.8, 0.3, 0.9])
+    news_count = np.array([0, 1, 4, 12, 3, 30])
+    change_percent = np.array([0.0, -50.0, 2.5, 15.0, -44.0, -80.0])
+    
+    movement, predicted, confidence = predict_price_arrays(sentiment, sentiment_std, news_count, change_percent)
+    
+    for i in range(len(sentiment)):
+        current = {'sentiment_score': sentiment[i], 'sentiment_std': sentiment_std[i], 'news_count': news_count[i]}
+        recent = {'change_percent': change_percent[i]}
+        prediction = analyzer._apply_prediction_model(current, recent)
+        
+        assert movement[i] == MOVEMENT_CODES[prediction['predicted_movement']]
+        assert predicted[i] * 100 == pytest.approx(prediction['predicted_change_percent'])
+        assert confidence[i] == pytest.approx(analyzer._calculate_prediction_confidence(current, recent))
+    assert set(movement) == {1, 0, -1}
+
+def test_price_backtest_hit_rate(tmp_path, monkeypatch):
+    store = PriceStore(str(tmp_path / 'prices.db'))
+    closes = [100.0, 101.0, 102.0, 101.0, 102.0, 103.0]
+    days = pd.bdate_range('2024-01-01', periods=len(closes))
+    store.append('TEST', pd.DataFrame({'Open': closes, 'High': closes, 'Low': closes,
+                                       'Close': closes, 'Volume': 1000.0}, index=days))
+    monkeypatch.setattr(backtester_module, 'price_store', store)
+    
+    result = Backtester(workers=1).backtest_price_model(
+        news_data=[], symbols=['TEST'], start=date(2024, 1, 1), end=date(2024, 1, 31)
+    )
+    
+    # 기사가 없는 날은 중립 감정 → 모두 상승 예측, 다음 날 5번 중 4번 상승
+    assert result['predictions'] == 5
+    assert result['hit_rate'] == pytest.approx(0.8)
+    assert result['precision_by_movement']['상승'] == {'predictions': 5, 'hits': 4, 'precision': 0.8}
+    assert result['per_symbol']['TEST']['hit_rate'] == pytest.approx(0.8)
@@ -0,0 +1,94 @@
+"""
+💾 체크포인트 저장소 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from auto_finance.core.checkpoint_store import SCOPE_RUN, CheckpointStore
+
+class Stage:
+    """호출 횟수를 기록하는 단계 함수"""
+    
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = 0
+    
+    async def __call__(self, *inputs):
+        self.calls += 1
+        if self.error:
+            raise self.error
+        return self.result if self.result is not None else list(inputs)
+
+async def _pipeline(store, collect, analyze, publish):
+    articles = await store.run_stage('collect', collect, scope=SCOPE_RUN)
+    analysis = await store.run_stage('analyze', analyze, articles)
+    return await store.run_stage('publish', publish, analysis)
+
+def test_failed_run_resumes_after_last_completed_stage(tmp_path):
+    collect, analyze = Stage(['기사1', '기사2']), Stage({'score': 0.4})
+    
+    store = CheckpointStore(str(tmp_path))
+    run_id = store.start_run('pipeline')
+    with pytest.raises(RuntimeError):
+        asyncio.run(_pipeline(store, collect, analyze, Stage(error=RuntimeError('업로드 실패'))))
+    store.finish_run(False)
+    
+    publish = Stage({'uploaded': 1})
+    resumed = CheckpointStore(str(tmp_path))
+    assert resumed.start_run('pipeline') == run_id
+    assert asyncio.run(_pipeline(resumed, collect, analyze, publish)) == {'uploaded': 1}
+    resumed.finish_run(True)
+    
+    assert (collect.calls, analyze.calls, publish.calls) == (1, 1, 1)
+    assert resumed.get_statistics()['resumed'] == 1
+    assert resumed.manifest['stages']['collect']['reused'] is True
+    assert resumed.manifest['stages']['publish']['reused'] is False
+
+def test_completed_run_is_not_resumed_but_inputs_scope_is_reused(tmp_path):
+    collect, analyze, publish = Stage(['기사1']), Stage({'score': 0.1}), Stage({'uploaded': 1})
+    
+    store = CheckpointStore(str(tmp_path))
+    first = store.start_run('pipeline')
+    asyncio.run(_pipeline(store, collect, analyze, publish))
+    store.finish_run(True)
+    
+    second = store.start_run('pipeline')
+    asyncio.run(_pipeline(store, collect, analyze, publish))
+    
+    assert second != first
+    # 실행 범위 단계는 새 실행에서 다시 수행, 같은 입력의 단계는 재사용
+    assert (collect.calls, analyze.calls, publish.calls) == (2, 1, 1)
+
+def test_invalid_results_are_not_saved(tmp_path):
+    empty = Stage([])
+    store = CheckpointStore(str(tmp_path))
+    store.start_run('pipeline')
+    
+    for _ in range(2):
+        asyncio.run(store.run_stage('collect', empty, 'same-input'))
+    
+    assert empty.calls == 2
+    assert store.manifest['stages']['collect']['status'] == 'incomplete'
+    assert store.stats['not_saved'] == 2
+
+def test_stale_failed_run_starts_fresh(tmp_path):
+    collect = Stage(['어제 기사'])
+    
+    store = CheckpointStore(str(tmp_path), resume_max_age_hours=6)
+    stale = store.start_run('pipeline')
+    asyncio.run(store.run_stage('collect', collect, scope=SCOPE_RUN))
+    store.manifest['created_at'] = (datetime.now() - timedelta(hours=30)).isoformat()
+    store.finish_run(False)
+    
+    fresh = CheckpointStore(str(tmp_path), resume_max_age_hours=6)
+    assert fresh.start_run('pipeline') != stale
+    asyncio.run(fresh.run_stage('collect', collect, scope=SCOPE_RUN))
+    assert collect.calls == 2
+    
+    # 실행 ID를 직접 지정하면 기간과 관계없이 이어받음
+    explicit = CheckpointStore(str(tmp_path), resume_max_age_hours=6)
+    assert explicit.start_run('pipeline', run_id=stale) == stale
@@ -0,0 +1,54 @@
+"""
+🔁 온라인 상관관계 엔진 / 시세 수집기 일봉 반영 테스트
+"""
+
+from datetime import date, datetime
+
+from auto_finance.core import financial_data
+from auto_finance.core.correlation_engine import OnlineCorrelationEngine
+from auto_finance.core.financial_data import FinancialDataCollector, StockData
+from auto_finance.core.price_store import PriceStore
+from auto_finance.tests.test_price_store import FakeProvider
+
+def test_repeated_article_is_counted_once(tmp_path):
+    engine = OnlineCorrelationEngine(span=7, state_path=str(tmp_path / "state.json"))
+    day = date(2024, 3, 4)
+    
+    engine.add_sentiment('A', day, 0.9, 'https://news/1')
+    engine.add_sentiment('A', day, 0.9, 'https://news/1')
+    engine.add_sentiment('A', day, 0.3, 'https://news/2')
+    
+    assert sorted(engine.pending['A'][day.isoformat()].values()) == [0.3, 0.9]
+
+def test_state_round_trip(tmp_path):
+    path = str(tmp_path / "state.json")
+    engine = OnlineCorrelationEngine(span=7, state_path=path)
+    engine.add_bar('A', date(2024, 3, 1), 100.0)
+    engine.add_sentiment('A', date(2024, 3, 4), 0.8, 'u1')
+    engine.save()
+    
+    restored = OnlineCorrelationEngine(span=7, state_path=path)
+    
+    assert restored.last_close == {'A': 100.0}
+    assert restored.pending == {'A': {'2024-03-04': {'u1': 0.8}}}
+
+def test_collector_feeds_only_completed_bars(tmp_path, monkeypatch):
+    provider = FakeProvider(close=100.0)
+    engine = OnlineCorrelationEngine(span=7, state_path=str(tmp_path / "state.json"))
+    monkeypatch.setattr(financial_data, 'price_store', PriceStore(str(tmp_path / "prices.db"), provider=provider))
+    monkeypatch.setattr(financial_data, 'correlation_engine', engine)
+    
+    collector = FinancialDataCollector(provider=provider)
+    collector.stock_symbols = ['A']
+    today = date.today()
+    collector.stock_data['A'] = StockData('A', 'A', 100.0, 0.0, 0.0, 0, None, None, None, None, None,
+                                          datetime.now().isoformat())
+    collector.quote_dates['A'] = today
+    
+    assert collector._feed_correlation_bars() > 0
+    assert engine.last_bar_date['A'] < today.isoformat()
+    
+    # 같은 거래일 재수집 시 제공자 요청 없음
+    calls = len(provider.calls)
+    assert collector._feed_correlation_bars() == 0
+    assert len(provider.calls) == calls
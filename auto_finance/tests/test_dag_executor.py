@@ -0,0 +1,70 @@
+"""
+🕸️ DAG 실행기 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from auto_finance.core.dag_executor import DagExecutor
+
+async def _value(value, delay=0.0):
+    await asyncio.sleep(delay)
+    return value
+
+def test_independent_nodes_run_concurrently_and_feed_inputs():
+    dag = DagExecutor()
+    dag.add('sum', lambda a, b: _value(a + b), inputs=['a', 'b'])
+    dag.add('a', lambda: _value(1, 0.1))
+    dag.add('b', lambda: _value(2, 0.1))
+    
+    results = asyncio.run(dag.run())
+    
+    assert results == {'a': 1, 'b': 2, 'sum': 3}
+    assert dag.total_time < 0.19
+    assert dag.critical_path()[-1] == 'sum'
+
+def test_failure_cancels_running_and_downstream_nodes():
+    async def fail():
+        await asyncio.sleep(0.05)
+        raise RuntimeError('boom')
+    
+    dag = DagExecutor()
+    dag.add('fail', fail)
+    dag.add('slow', lambda: _value('slow', 5))
+    dag.add('after', lambda value: _value(value), inputs=['fail'])
+    
+    with pytest.raises(RuntimeError, match='boom'):
+        asyncio.run(asyncio.wait_for(dag.run(), timeout=2))
+    
+    statuses = {name: node['status'] for name, node in dag.get_summary()['nodes'].items()}
+    assert statuses == {'fail': 'failed', 'slow': 'cancelled', 'after': 'cancelled'}
+    assert dag.results == {}
+
+def test_external_cancellation_cancels_all_nodes():
+    dag = DagExecutor()
+    dag.add('slow', lambda: _value('slow', 5))
+    dag.add('after', lambda value: _value(value), inputs=['slow'])
+    
+    async def cancel_soon():
+        task = asyncio.ensure_future(dag.run())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    
+    asyncio.run(cancel_soon())
+    
+    assert dag.nodes['slow'].status == 'cancelled'
+    assert dag.nodes['after'].status == 'cancelled'
+
+def test_invalid_graphs_are_rejected():
+    cyclic = DagExecutor()
+    cyclic.add('a', lambda b: _value(b), inputs=['b'])
+    cyclic.add('b', lambda a: _value(a), inputs=['a'])
+    with pytest.raises(ValueError, match='순환'):
+        asyncio.run(cyclic.run())
+    
+    missing = DagExecutor().add('a', lambda x: _value(x), inputs=['x'])
+    with pytest.raises(ValueError, match='정의되지'):
+        asyncio.run(missing.run())
@@ -0,0 +1,34 @@
+"""
+🧮 피처 저장소 최신성 테스트
+"""
+
+from datetime import date, timedelta
+
+from auto_finance.core import feature_store as feature_store_module
+from auto_finance.core.feature_store import FeatureStore
+from auto_finance.core.price_store import PriceStore
+from auto_finance.tests.test_price_store import FakeProvider
+
+def test_last_trading_day_skips_weekend():
+    assert FeatureStore.last_trading_day(date(2024, 3, 4)) == date(2024, 3, 1)  # 월 → 금
+    assert FeatureStore.last_trading_day(date(2024, 3, 6)) == date(2024, 3, 5)
+
+def test_stale_rows_are_not_served_as_fresh(tmp_path, monkeypatch):
+    prices = PriceStore(str(tmp_path / "prices.db"), provider=FakeProvider(close=100.0))
+    monkeypatch.setattr(feature_store_module, 'price_store', prices)
+    store = FeatureStore(str(tmp_path / "features.db"), scorer=lambda article: 0.5)
+    
+    # 2주 전까지만 적재된 종목
+    stale_end = date.today() - timedelta(days=14)
+    prices.append('OLD', prices.provider.get_history('OLD', start=stale_end - timedelta(days=30), end=stale_end))
+    store.update_prices(['OLD'])
+    
+    assert store.get_latest('OLD')
+    assert store.get_latest('OLD', fresh=True) == {}
+    
+    # 마지막 거래일까지 적재되면 사용
+    prices.update('NEW', date.today() - timedelta(days=30))
+    store.update_prices(['NEW'])
+    
+    assert store.get_latest('NEW', fresh=True)['symbol'] == 'NEW'
+    assert list(store.get_snapshot(['OLD', 'NEW'], fresh=True)) == ['NEW']
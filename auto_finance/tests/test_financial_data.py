@@ -0,0 +1,132 @@
+"""
+📈 금융 데이터 수집기 테스트
+"""
+
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.core.financial_data import FinancialDataCollector
+from auto_finance.core.market_data_provider import YFinanceProvider
+from auto_finance.tests.test_price_store import FakeProvider
+
+FRIDAY = pd.Timestamp('2026-10-16')
+
+def _minute_bars(opening: float, closing: float, day: pd.Timestamp = FRIDAY) -> pd.DataFrame:
+    index = pd.date_range(day + pd.Timedelta(hours=9), periods=3, freq='1min')
+    closes = np.linspace(opening, closing, 3)
+    return pd.DataFrame({'Open': [opening, *closes[:-1]], 'High': closes, 'Low': closes,
+                         'Close': closes, 'Volume': [100.0, 200.0, 300.0]}, index=index)
+
+class BulkProvider(FakeProvider):
+    """일괄 1분봉과 펀더멘털 호출을 기록하는 제공자"""
+    
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+        self.bulk_calls = []
+        self.fundamental_calls = []
+    
+    def download_intraday(self, symbols):
+        self.bulk_calls.append(list(symbols))
+        return {s: self.frames[s] for s in symbols if s in self.frames}
+    
+    def get_fundamentals(self, symbol):
+        self.fundamental_calls.append(symbol)
+        return {'name': f"{symbol} 이름", 'market_cap': 1e12, 'pe_ratio': 10.0}
+
+class FakeYFinance:
+    def __init__(self, data):
+        self.data = data
+    
+    def download(self, **kwargs):
+        return self.data
+
+def test_yfinance_bulk_frame_is_split_per_symbol():
+    frames = {'AAA': _minute_bars(100, 110), 'BBB': _minute_bars(50, 45)}
+    data = pd.concat(frames, axis=1)
+    data.loc[data.index[0], 'BBB'] = np.nan  # 다른 종목보다 늦게 시작한 종목
+    
+    provider = YFinanceProvider.__new__(YFinanceProvider)
+    provider.yf = FakeYFinance(data)
+    result = provider.download_intraday(['AAA', 'BBB', 'MISSING'])
+    
+    assert set(result) == {'AAA', 'BBB'}
+    assert len(result['AAA']) == 3
+    assert len(result['BBB']) == 2  # 값이 모두 빈 행은 제거
+    assert result['AAA']['Close'].iloc[-1] == 110
+    
+    # 단일 종목이면 컬럼이 MultiIndex가 아님
+    provider.yf = FakeYFinance(frames['AAA'])
+    assert list(provider.download_intraday(['AAA'])) == ['AAA']
+
+def test_bulk_collection_parses_quotes_and_fundamentals():
+    provider = BulkProvider({'BULK1.KS': _minute_bars(100, 110), 'BULK_IDX': _minute_bars(2000, 1980)})
+    collector = FinancialDataCollector(provider=provider)
+    collector.stock_symbols = ['BULK1.KS', 'BULK2.KS']
+    collector.index_symbols = ['BULK_IDX']
+    
+    stocks, indices = asyncio.run(collector.collect_all_market_data())
+    
+    assert provider.bulk_calls == [['BULK1.KS', 'BULK2.KS', 'BULK_IDX']]
+    stock = stocks['BULK1.KS']
+    assert stock.price == 110 and stock.change == 10
+    assert stock.change_percent == 10.0
+    assert stock.volume == 300
+    assert stock.name == 'BULK1.KS 이름' and stock.pe_ratio == 10.0
+    assert 'BULK2.KS' not in stocks
+    assert indices['BULK_IDX'].change_percent == -1.0
+    assert collector.quote_dates == {'BULK1.KS': FRIDAY.date(), 'BULK_IDX': FRIDAY.date()}
+    assert collector.stats['failed_requests'] == 1
+
+def test_fundamentals_cached_until_ttl_expires():
+    provider = BulkProvider({})
+    collector = FinancialDataCollector(provider=provider)
+    collector.fundamentals_ttl = 1
+    
+    async def fetch_twice():
+        return [await collector.get_fundamentals('TTL.KS') for _ in range(2)]
+    
+    first, second = asyncio.run(fetch_twice())
+    assert first == second
+    assert provider.fundamental_calls == ['TTL.KS']
+    
+    time.sleep(1.1)
+    asyncio.run(collector.get_fundamentals('TTL.KS'))
+    assert provider.fundamental_calls == ['TTL.KS', 'TTL.KS']
+
+class MinuteProvider(FakeProvider):
+    """종목별 1분봉 조회(비일괄 경로) 제공자"""
+    
+    def __init__(self, frames):
+        super().__init__()
+        self.frames = frames
+    
+    def get_history(self, symbol, period=None, start=None, end=None, interval="1d"):
+        return self.frames[symbol]
+    
+    def get_fundamentals(self, symbol):
+        return {'name': symbol}
+
+def test_per_symbol_collection_records_quote_trading_date():
+    # 주말 실행에도 마지막 봉 날짜(금요일)가 거래일로 쓰여야 토요일 봉이 추가되지 않음
+    provider = MinuteProvider({'SINGLE.KS': _minute_bars(100, 105), 'SINGLE_IDX': _minute_bars(900, 910)})
+    collector = FinancialDataCollector(provider=provider)
+    collector.stock_symbols = ['SINGLE.KS']
+    collector.index_symbols = ['SINGLE_IDX']
+    
+    asyncio.run(collector.collect_all_stock_data())
+    asyncio.run(collector.collect_all_index_data())
+    
+    assert collector.quote_dates == {'SINGLE.KS': FRIDAY.date(), 'SINGLE_IDX': FRIDAY.date()}
+    assert collector._quote_date('SINGLE.KS') == FRIDAY.date()
+    
+    # 캐시된 시세를 쓰는 새 수집기도 같은 거래일 사용
+    cached = FinancialDataCollector(provider=provider)
+    cached.stock_symbols = ['SINGLE.KS']
+    stocks = asyncio.run(cached.collect_all_stock_data())
+    
+    assert stocks['SINGLE.KS'].price == 105
+    assert cached.quote_dates == {'SINGLE.KS': FRIDAY.date()}
@@ -0,0 +1,109 @@
+"""
+⏱️ 장중 시세 모니터 테스트
+"""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from auto_finance.core.intraday_monitor import BarRingBuffer, IntradayMonitor, MarketBoard
+
+# 2026-10-19(월) 01:00 UTC = 서울 10:00, 뉴욕 전날 21:00
+KRX_OPEN = datetime(2026, 10, 19, 1, 0, tzinfo=timezone.utc)
+# 2026-10-19(월) 14:00 UTC = 뉴욕 10:00 (서머타임), 서울 23:00
+US_OPEN = datetime(2026, 10, 19, 14, 0, tzinfo=timezone.utc)
+WEEKEND = datetime(2026, 10, 17, 2, 0, tzinfo=timezone.utc)
+
+def test_ring_buffer_wraparound_keeps_time_order():
+    buffer = BarRingBuffer(capacity=3)
+    for ts in range(1, 3):
+        buffer.append(ts, ts, ts, ts, ts * 10, 100)
+    
+    assert buffer.to_array()[:, 0].tolist() == [1, 2]
+    
+    for ts in range(3, 6):
+        buffer.append(ts, ts, ts, ts, ts * 10, 100)
+    
+    assert buffer.size == 3
+    assert buffer.to_array()[:, 0].tolist() == [3, 4, 5]
+    assert buffer.to_array()[:, 4].tolist() == [30, 40, 50]
+    assert buffer.last()['close'] == 50
+    assert buffer.last_timestamp == 5
+
+def test_board_top_k_follows_repeated_updates():
+    board = MarketBoard(top_k=2)
+    for symbol, change in {'A': 1.0, 'B': 2.0, 'C': -1.0, 'D': 0.0}.items():
+        board.update_stock(symbol, change)
+    board.update_stock('A', 5.0)
+    board.update_stock('B', -3.0)
+    
+    summary = board.publish()
+    
+    assert summary['stocks']['top_gainers'] == ['A', 'D']
+    assert summary['stocks']['top_losers'] == ['B', 'C']
+    assert board.counts == {'gainers': 1, 'losers': 2, 'unchanged': 1}
+    
+    board.remove_stock('A')
+    assert board.publish()['stocks']['top_gainers'] == ['D', 'C']
+
+def test_board_compacts_stale_heap_entries():
+    board = MarketBoard(top_k=2)
+    for step in range(200):
+        board.update_stock('A', float(step))
+        board.update_stock('B', float(-step))
+        board.update_stock('C', 0.5)
+    
+    # 오래된 버전이 누적되지 않음
+    assert len(board._gainers_heap) <= 4 * max(len(board.changes), board.top_k) + 1
+    assert board.publish()['stocks']['top_gainers'] == ['A', 'C']
+    
+    board._compact()
+    assert len(board._gainers_heap) == len(board._losers_heap) == 3
+    assert board.publish()['stocks']['top_losers'] == ['B', 'C']
+
+class FakeIntradayProvider:
+    def __init__(self):
+        self.requests = []
+        self.frames = {}
+    
+    def download_intraday(self, symbols):
+        self.requests.append(list(symbols))
+        return {s: self.frames[s] for s in symbols if s in self.frames}
+
+class FakeCollector:
+    stock_symbols = ['005930.KS', 'AAPL']
+    index_symbols = ['^KS11']
+    
+    def __init__(self):
+        self.provider = FakeIntradayProvider()
+
+def _bars(start: str, closes) -> pd.DataFrame:
+    index = pd.date_range(start, periods=len(closes), freq='1min')
+    return pd.DataFrame({'Open': closes[0], 'High': closes, 'Low': closes, 'Close': closes,
+                         'Volume': 100}, index=index)
+
+def test_polls_only_open_markets(tmp_path):
+    monitor = IntradayMonitor(FakeCollector(), summary_path=str(tmp_path / 'summary.json'))
+    
+    assert monitor.open_symbols(KRX_OPEN) == ['005930.KS', '^KS11']
+    assert monitor.open_symbols(US_OPEN) == ['AAPL']
+    
+    asyncio.run(monitor.poll_once(WEEKEND))
+    
+    assert monitor.collector.provider.requests == []
+    assert monitor.stats['skipped_polls'] == 1
+    assert not (tmp_path / 'summary.json').exists()
+
+def test_summary_not_republished_without_new_bars(tmp_path):
+    collector = FakeCollector()
+    collector.provider.frames['005930.KS'] = _bars('2026-10-19 09:00', [100.0, 101.0])
+    monitor = IntradayMonitor(collector, summary_path=str(tmp_path / 'summary.json'))
+    
+    first = asyncio.run(monitor.poll_once(KRX_OPEN))
+    second = asyncio.run(monitor.poll_once(KRX_OPEN))
+    
+    assert first['stocks']['top_gainers'] == ['005930.KS']
+    assert second['timestamp'] == first['timestamp']
+    assert monitor.stats['bars_appended'] == 2
+    assert collector.provider.requests == [['005930.KS', '^KS11']] * 2
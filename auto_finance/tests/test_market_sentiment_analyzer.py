@@ -0,0 +1,41 @@
+"""
+📊 일괄 감정 분석 캐시 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from auto_finance.core.market_sentiment_analyzer import MarketSentimentAnalyzer
+
+TEXTS = [
+    '삼성전자 실적 호조로 주가 급등 기대감 확산',
+    '금리 인상 우려에 코스피 하락 마감했다는 소식',
+    '반도체 수출 증가세 지속, 업황 회복 신호 뚜렷',
+    '환율 급등으로 외국인 매도세가 이어지는 상황',
+    '배당 확대 발표 이후 투자 심리 개선되는 모습'
+]
+
+def test_batch_larger_than_cache_returns_all_scores():
+    analyzer = MarketSentimentAnalyzer()
+    analyzer.batch_config.update({'cache_size': 2, 'workers': 1})
+    
+    scores = asyncio.run(analyzer.analyze_texts_batch(TEXTS + TEXTS[:1]))
+    
+    assert len(scores) == 6
+    assert scores[0].compound == scores[5].compound
+    assert len(analyzer._score_cache) == 2
+    
+    # 캐시 적중 + 신규 텍스트가 섞여도 동일
+    again = asyncio.run(analyzer.analyze_texts_batch(TEXTS))
+    assert [s.compound for s in again] == [s.compound for s in scores[:5]]
+
+def test_close_shuts_down_pool():
+    analyzer = MarketSentimentAnalyzer()
+    pool = analyzer._get_pool()
+    
+    analyzer.close()
+    
+    assert analyzer._pool is None
+    with pytest.raises(RuntimeError):
+        pool.submit(len, [])
@@ -0,0 +1,103 @@
+"""
+🧪 모의 LLM 서버 테스트
+"""
+
+import asyncio
+
+import aiohttp
+import pytest
+
+from auto_finance.core.mock_llm_server import MockLLMServer, MockProfile
+
+PROMPT = "코스피 상승 마감 기사 작성"
+
+def _server(rate_limit: int = 0) -> MockLLMServer:
+    profile = MockProfile(latency_mean=0.0, rate_limit_per_minute=rate_limit)
+    return MockLLMServer(port=0, profiles={name: profile for name in MockLLMServer.PROVIDERS})
+
+async def _with_server(server: MockLLMServer, call):
+    await server.start()
+    try:
+        return await call(server)
+    finally:
+        await server.stop()
+
+def test_binds_ephemeral_port_and_rate_limits_each_provider():
+    requests = {
+        'gemini': ('/v1beta/models/gemini-pro:generateContent', {'contents': [{'parts': [{'text': PROMPT}]}]}),
+        'openai': ('/v1/chat/completions', {'model': 'gpt-4', 'messages': [{'role': 'user', 'content': PROMPT}]}),
+        'anthropic': ('/v1/messages', {'model': 'claude', 'max_tokens': 100,
+                                       'messages': [{'role': 'user', 'content': PROMPT}]})
+    }
+    
+    async def call(server):
+        assert server.port != 0
+        statuses = {}
+        async with aiohttp.ClientSession() as session:
+            for provider, (path, payload) in requests.items():
+                for _ in range(2):
+                    async with session.post(server.url + path, json=payload) as response:
+                        statuses.setdefault(provider, []).append(
+                            (response.status, response.headers.get('retry-after')))
+        return statuses, server.get_statistics()
+    
+    statuses, stats = asyncio.run(_with_server(_server(rate_limit=1), call))
+    
+    for provider in requests:
+        (first, _), (second, retry_after) = statuses[provider]
+        assert first == 200
+        assert second == 429 and int(retry_after) >= 1
+        assert stats['providers'][provider]['rate_limited'] == 1
+
+def test_openai_sdk_round_trip_and_rate_limit():
+    openai = pytest.importorskip('openai')
+    
+    async def call(server):
+        client = openai.AsyncOpenAI(api_key='mock', base_url=f"{server.url}/v1", max_retries=0)
+        response = await client.chat.completions.create(
+            model='gpt-4', messages=[{'role': 'user', 'content': PROMPT}], max_tokens=200)
+        with pytest.raises(openai.RateLimitError) as error:
+            await client.chat.completions.create(model='gpt-4', messages=[{'role': 'user', 'content': PROMPT}])
+        return response, error.value
+    
+    response, error = asyncio.run(_with_server(_server(rate_limit=1), call))
+    
+    assert response.choices[0].message.content
+    assert response.usage.prompt_tokens > 0
+    assert int(error.response.headers['retry-after']) >= 1
+
+def test_anthropic_sdk_round_trip_and_rate_limit():
+    anthropic = pytest.importorskip('anthropic')
+    
+    async def call(server):
+        client = anthropic.AsyncAnthropic(api_key='mock', base_url=server.url, max_retries=0)
+        messages = [{'role': 'user', 'content': PROMPT}]
+        response = await client.messages.create(model='claude-3-sonnet-20240229', max_tokens=200,
+                                                messages=messages)
+        with pytest.raises(anthropic.RateLimitError) as error:
+            await client.messages.create(model='claude-3-sonnet-20240229', max_tokens=200, messages=messages)
+        return response, error.value
+    
+    response, error = asyncio.run(_with_server(_server(rate_limit=1), call))
+    
+    assert response.content[0].text
+    assert response.usage.input_tokens > 0
+    assert int(error.response.headers['retry-after']) >= 1
+
+def test_gemini_sdk_round_trip_and_rate_limit():
+    genai = pytest.importorskip('google.generativeai')
+    exceptions = pytest.importorskip('google.api_core.exceptions')
+    
+    async def call(server):
+        genai.configure(api_key='mock', transport='rest', client_options={'api_endpoint': server.url})
+        model = genai.GenerativeModel('gemini-pro')
+        # REST 전송은 동기 호출이므로 서버 이벤트 루프를 막지 않도록 스레드에서 호출
+        response = await asyncio.to_thread(model.generate_content, PROMPT)
+        with pytest.raises(exceptions.TooManyRequests):
+            await asyncio.to_thread(model.generate_content, PROMPT, request_options={'retry': None})
+        return response
+    
+    response = asyncio.run(_with_server(_server(rate_limit=1), call))
+    
+    assert response.text
+    assert response.usage_metadata.prompt_token_count > 0
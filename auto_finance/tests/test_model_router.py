@@ -0,0 +1,56 @@
+"""
+🧭 모델 라우터 테스트
+"""
+
+from auto_finance.core.model_router import ModelRouter
+
+MODELS = ['gemini', 'gpt4', 'claude']
+SPECIALTIES = {
+    'gemini': ['fact_checking', 'summarization'],
+    'gpt4': ['creative_writing', 'analysis'],
+    'claude': ['detailed_analysis', 'reasoning']
+}
+
+def _router(tmp_path, specialties=SPECIALTIES) -> ModelRouter:
+    return ModelRouter(specialties=specialties, state_path=str(tmp_path / 'router.json'))
+
+def test_specialty_prior_selects_single_model(tmp_path):
+    router = _router(tmp_path)
+    
+    assert router.route('fact_checking', MODELS) == ['gemini']
+    assert router.rank('fact_checking', MODELS)[0] == 'gemini'
+
+def test_low_observed_acceptance_moves_route_to_pair(tmp_path):
+    router = _router(tmp_path)
+    for _ in range(router.min_observations):
+        router.record('gemini', 'fact_checking', 1.0, 0.0, confidence=0.3)
+    
+    assert router.quality('gemini', 'fact_checking') == 0.0
+    assert sorted(router.route('fact_checking', MODELS)) == ['claude', 'gpt4']
+    assert router.rank('fact_checking', MODELS)[-1] == 'gemini'
+    assert router.decisions['fact_checking'] == {'claude+gpt4': 1}
+
+def test_cheapest_combo_meeting_quality_target_wins(tmp_path):
+    # 특화 없음 → 단일 모델(0.7)은 목표(0.75) 미달, 모든 쌍(0.91)은 달성
+    router = _router(tmp_path, specialties={})
+    
+    assert router.route('content_generation', MODELS) == ['gemini', 'claude']
+    
+    # claude가 단독으로 목표를 넘어도 더 싼 쌍이 있으면 쌍이 선택됨
+    for _ in range(router.min_observations):
+        router.record('claude', 'content_generation', 1.0, 0.2, confidence=0.9)
+    assert router.quality('claude', 'content_generation') == 1.0
+    assert router.route('content_generation', MODELS) == ['gemini', 'gpt4']
+
+def test_state_round_trip(tmp_path):
+    router = _router(tmp_path)
+    router.record('gemini', 'analysis', 1.5, 0.0, confidence=0.9)
+    router.record('gpt4', 'analysis', 3.0, failed=True)
+    router.route('analysis', MODELS)
+    router.save()
+    
+    restored = _router(tmp_path)
+    
+    assert restored.snapshot() == router.snapshot()
+    assert restored.decisions == router.decisions
+    assert restored.route('analysis', MODELS) == router.route('analysis', MODELS)
@@ -0,0 +1,61 @@
+"""
+🔔 알림 시스템 테스트
+"""
+
+import asyncio
+
+from auto_finance.core.notification_system import NotificationMessage, NotificationSystem
+
+class FakeClient:
+    """전송 대상과 결과를 차례로 돌려주는 채널 클라이언트"""
+    
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.targets = []
+    
+    async def send_message(self, target, *args, **kwargs):
+        self.targets.append(target)
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+def _system(channel, client, config=None):
+    system = NotificationSystem()
+    system.channels = {channel: config or {}}
+    system.clients = {channel: client}
+    system.semaphores = {channel: asyncio.Semaphore(4)}
+    system.retry_delay = 0.0
+    system.max_retries = 2
+    return system
+
+def _message(channel, recipients):
+    return NotificationMessage(title='알림', content='본문', priority='normal', category='system',
+                               channels=[channel], recipients=recipients, metadata={},
+                               created_at='2026-10-19T09:00:00')
+
+def test_email_fallback_reports_message_recipients():
+    client = FakeClient({'success': True})
+    system = _system('email', client, {'to_emails': ['a@example.com', 'b@example.com']})
+    
+    results = asyncio.run(system.send_notification(_message('email', ['default'])))
+    
+    assert client.targets == [['a@example.com', 'b@example.com']]
+    assert [(r.recipient, r.success) for r in results] == [('default', True)]
+
+def test_email_without_addresses_reports_failure():
+    client = FakeClient({'success': True})
+    system = _system('email', client, {'to_emails': []})
+    
+    results = asyncio.run(system.send_notification(_message('email', ['default'])))
+    
+    assert client.targets == []
+    assert [(r.recipient, r.success) for r in results] == [('default', False)]
+
+def test_only_transient_failures_are_retried():
+    forbidden = FakeClient({'success': False, 'error': 'HTTP 403', 'retryable': False})
+    results = asyncio.run(_system('slack', forbidden).send_notification(_message('slack', ['#general'])))
+    assert len(forbidden.targets) == 1
+    assert not results[0].success
+    
+    limited = FakeClient({'success': False, 'error': 'HTTP 429', 'retryable': True}, {'success': True})
+    results = asyncio.run(_system('slack', limited).send_notification(_message('slack', ['#general'])))
+    assert len(limited.targets) == 2
+    assert results[0].success
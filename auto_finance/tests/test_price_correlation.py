@@ -0,0 +1,41 @@
+"""
+📊 시차 상관계수 계산 테스트
+"""
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.core.price_correlation import PriceCorrelationAnalyzer
+
+def _pairwise(x, y):
+    return pd.Series(x).corr(pd.Series(y))
+
+def test_lagged_correlation_matches_pairwise_pearson():
+    rng = np.random.default_rng(0)
+    sentiment = rng.normal(size=(30, 3))
+    returns = 0.5 * sentiment + rng.normal(size=(30, 3))
+    # 감정/수익률 결측 위치가 서로 다름
+    sentiment[rng.random((30, 3)) < 0.3] = np.nan
+    returns[rng.random((30, 3)) < 0.2] = np.nan
+    lags = [0, 1, 2]
+    
+    own, cross, counts = PriceCorrelationAnalyzer._lagged_correlation(sentiment, returns, lags)
+    
+    for i, lag in enumerate(lags):
+        for a in range(3):
+            for b in range(3):
+                expected = _pairwise(sentiment[:30 - lag, a], returns[lag:, b])
+                assert abs(cross[i, a, b] - expected) < 1e-12
+            assert own[i, a] == cross[i, a, a]
+            valid = ~np.isnan(sentiment[:30 - lag, a]) & ~np.isnan(returns[lag:, a])
+            assert counts[i, a] == valid.sum()
+
+def test_constant_or_sparse_series_have_no_correlation():
+    sentiment = np.array([[0.5, 0.1], [0.5, np.nan], [0.5, 0.3], [0.5, np.nan], [0.5, 0.2]])
+    returns = np.array([[0.01, 0.02], [0.02, 0.01], [-0.01, 0.03], [0.03, -0.02], [0.00, 0.01]])
+    
+    own, cross, counts = PriceCorrelationAnalyzer._lagged_correlation(sentiment, returns, [0, 2])
+    
+    assert np.isnan(own[0, 0])  # 감정이 상수
+    assert not np.isnan(own[0, 1])
+    assert np.isnan(own[1, 1])  # 유효 쌍 2개
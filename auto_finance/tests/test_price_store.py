@@ -0,0 +1,71 @@
+"""
+🗃️ PriceStore 증분 수집 테스트
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from auto_finance.core.market_data_provider import MarketDataProvider
+from auto_finance.core.price_store import PriceStore
+
+class FakeProvider(MarketDataProvider):
+    """요청 구간을 기록하고 지정한 종가로 평일 일봉을 돌려주는 제공자"""
+    
+    def __init__(self, close=100.0, listed_from=None):
+        self.close = close
+        self.listed_from = listed_from
+        self.calls = []
+    
+    def get_history(self, symbol, period=None, start=None, end=None, interval="1d"):
+        self.calls.append((start, end))
+        first = max(start, self.listed_from) if self.listed_from else start
+        days = [d for d in pd.date_range(first, end) if d.weekday() < 5] if first <= end else []
+        return pd.DataFrame({
+            'Open': self.close, 'High': self.close, 'Low': self.close,
+            'Close': self.close, 'Volume': 1000.0
+        }, index=pd.DatetimeIndex(days))
+
+def test_todays_bar_is_refreshed(tmp_path):
+    provider = FakeProvider(close=100.0)
+    store = PriceStore(str(tmp_path / "prices.db"), provider=provider)
+    start = date.today() - timedelta(days=10)
+    
+    store.update("TEST", start)
+    last_day = store.read("TEST").index[-1]
+    
+    # 장중 부분 봉이 이후 확정 종가로 바뀌면 다음 갱신에서 덮어써야 함
+    provider.close = 200.0
+    store.update("TEST", start)
+    
+    df = store.read("TEST")
+    assert df.index[-1] == last_day
+    assert df['Close'].iloc[-1] == 200.0
+    assert provider.calls[-1][0] == last_day.date()
+
+def test_start_gap_without_bars_is_not_refetched(tmp_path):
+    # 상장 전 구간은 봉이 없지만 한 번 요청한 뒤에는 다시 요청하지 않아야 함
+    today = date.today()
+    provider = FakeProvider(listed_from=today - timedelta(days=20))
+    store = PriceStore(str(tmp_path / "prices.db"), provider=provider)
+    start = today - timedelta(days=60)
+    
+    store.update("NEW", start)
+    store.update("NEW", start)
+    
+    head_requests = [call for call in provider.calls if call[0] == start]
+    assert len(head_requests) == 1
+    assert all(call[0] >= today - timedelta(days=20) for call in provider.calls[1:])
+
+def test_only_missing_head_range_is_fetched(tmp_path):
+    provider = FakeProvider()
+    store = PriceStore(str(tmp_path / "prices.db"), provider=provider)
+    today = date.today()
+    
+    store.update("TEST", today - timedelta(days=10))
+    provider.calls.clear()
+    store.update("TEST", today - timedelta(days=30))
+    
+    head, tail = provider.calls
+    assert head == (today - timedelta(days=30), today - timedelta(days=11))
+    assert tail[1] == today
@@ -0,0 +1,54 @@
+"""
+🧾 기사 처리 상태 테스트
+"""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+from auto_finance.core.processing_state import ProcessingState
+
+def _article(index, content='본문'):
+    return {'url': f'https://news.example.com/{index}', 'title': f'기사 {index}', 'content': content}
+
+def test_only_new_or_materially_changed_articles_are_pending(tmp_path):
+    state = ProcessingState(str(tmp_path / 'state.db'))
+    articles = [_article(1), _article(2)]
+    state.mark_processed('sentiment', articles)
+    
+    edited = [_article(1, '  본문!! '), _article(2, '다른 본문'), _article(3)]
+    pending, skipped = state.filter_pending('sentiment', edited)
+    
+    assert [a['url'] for a in pending] == ['https://news.example.com/2', 'https://news.example.com/3']
+    assert [a['url'] for a in skipped] == ['https://news.example.com/1']
+    assert state.last_delta['sentiment'] == {'processed': 2, 'skipped': 1, 'changed': 1}
+    # 단계별로 따로 기록
+    assert len(state.filter_pending('fact_checker', articles)[0]) == 2
+
+def test_skipped_articles_survive_prune(tmp_path):
+    state = ProcessingState(str(tmp_path / 'state.db'))
+    still_crawled, dropped = _article(1), _article(2)
+    state.mark_processed('sentiment', [still_crawled, dropped])
+    
+    old = (datetime.now() - timedelta(days=40)).isoformat()
+    with sqlite3.connect(state.db_path) as conn:
+        conn.execute("UPDATE processed_articles SET processed_at = ?", (old,))
+    
+    state.filter_pending('sentiment', [still_crawled])
+    
+    assert state.prune(30) == 1
+    pending, skipped = state.filter_pending('sentiment', [still_crawled, dropped])
+    assert pending == [dropped]
+    assert skipped == [still_crawled]
+
+def test_only_articles_with_results_are_marked(tmp_path):
+    state = ProcessingState(str(tmp_path / 'state.db'))
+    articles = [_article(1), _article(2), {'title': 'URL 없는 기사', 'content': '본문'}]
+    
+    pending, _ = state.filter_pending('fact_checker', articles)
+    # 두 번째 기사는 팩트 체크 실패로 결과가 없음
+    results = [{'url': 'https://news.example.com/1', 'title': '기사 1'}, {'url': '', 'title': 'URL 없는 기사'}]
+    assert state.mark_returned('fact_checker', pending, results) == 2
+    
+    pending, skipped = state.filter_pending('fact_checker', articles)
+    assert pending == [_article(2)]
+    assert len(skipped) == 2
@@ -0,0 +1,67 @@
+"""
+🧾 프롬프트 빌더 테스트
+"""
+
+from auto_finance.core.prompt_builder import compress_body, count_tokens, dedupe_instructions
+
+def test_body_within_budget_is_unchanged():
+    body = "코스피가 상승했다. 외국인이 순매수했다.\n\n정부는 댓글 조작 의혹을 조사한다.\n홍길동 기자"
+    
+    assert compress_body(body, 1000) == body
+
+def test_compression_keeps_paragraphs_and_body_sentences():
+    body = "\n".join([
+        "코스피가 외국인 매수에 상승 마감했다. 반도체 업종이 강세를 보였다.",
+        "",
+        "정부는 댓글 조작 의혹에 대해 조사를 시작했다.",
+        "반도체 업종 강세는 당분간 이어질 전망이다.",
+        "",
+        "홍길동 기자 hong@news.com",
+        "ⓒ 뉴스통신 무단전재 및 재배포 금지",
+        "구독하기 | 좋아요 3"
+    ])
+    budget = count_tokens(body) - 1
+    
+    compressed = compress_body(body, budget)
+    
+    assert compressed == "\n".join([
+        "코스피가 외국인 매수에 상승 마감했다. 반도체 업종이 강세를 보였다.",
+        "",
+        "정부는 댓글 조작 의혹에 대해 조사를 시작했다.",
+        "반도체 업종 강세는 당분간 이어질 전망이다."
+    ])
+
+def test_compression_selects_sentences_under_budget():
+    body = "\n".join(f"삼성전자 실적 문장 {index}번은 반도체 이야기다." for index in range(40))
+    
+    compressed = compress_body(body, 60, title='삼성전자 반도체')
+    
+    assert count_tokens(compressed) <= 60
+    assert compressed.startswith("삼성전자 실적 문장 0번")
+    assert "\n" in compressed
+
+def test_dedupe_keeps_indentation_and_repeated_lines():
+    prompt = """
+            다음 형식으로 답변해주세요:
+            - 근거:
+              - 세부 근거
+            - 근거:
+              - 세부 근거
+            """
+    
+    assert dedupe_instructions(prompt) == "다음 형식으로 답변해주세요:\n- 근거:\n  - 세부 근거\n- 근거:\n  - 세부 근거"
+
+def test_dedupe_removes_repeated_wrapper_block():
+    inner = "제목: 코스피 상승\n\n다음 요구사항을 지켜주세요:\n- 구체적인 데이터 제시"
+    prompt = f"""
+            다음 뉴스 기사를 분석해주세요:
+            
+            {inner}
+            
+            다음 요구사항을 지켜주세요:
+            - 구체적인 데이터 제시
+            """
+    
+    assert dedupe_instructions(prompt) == (
+        "다음 뉴스 기사를 분석해주세요:\n\n제목: 코스피 상승\n\n다음 요구사항을 지켜주세요:\n- 구체적인 데이터 제시"
+    )
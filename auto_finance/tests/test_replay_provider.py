@@ -0,0 +1,42 @@
+"""
+📼 ReplayProvider 날짜 처리 테스트
+"""
+
+from datetime import date
+
+import pandas as pd
+
+from auto_finance.core.market_data_provider import ReplayProvider
+
+def _write(path, index):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rows = '\n'.join(f"{value},1,1,1,1,1" for value in index)
+    path.write_text(f"Date,Open,High,Low,Close,Volume\n{rows}\n", encoding='utf-8')
+
+def test_kst_daily_bars_keep_exchange_dates(tmp_path):
+    _write(tmp_path / 'history' / '005930.KS.csv',
+           ['2024-03-04 00:00:00+09:00', '2024-03-05 00:00:00+09:00'])
+    provider = ReplayProvider(str(tmp_path))
+    
+    hist = provider.get_history('005930.KS', start=date(2024, 3, 4), end=date(2024, 3, 5))
+    
+    assert list(hist.index.date) == [date(2024, 3, 4), date(2024, 3, 5)]
+
+def test_mixed_dst_offsets_are_loaded(tmp_path):
+    # 서머타임 전환으로 오프셋이 섞여 있어도 현지 날짜 유지
+    _write(tmp_path / 'history' / 'AAPL.csv',
+           ['2024-03-08 00:00:00-05:00', '2024-03-11 00:00:00-04:00'])
+    provider = ReplayProvider(str(tmp_path))
+    
+    hist = provider.get_history('AAPL', period='1mo')
+    
+    assert list(hist.index.date) == [date(2024, 3, 8), date(2024, 3, 11)]
+
+def test_intraday_bars_keep_local_time(tmp_path):
+    _write(tmp_path / 'intraday' / '005930.KS.csv',
+           ['2024-03-04 09:00:00+09:00', '2024-03-04 09:01:00+09:00'])
+    provider = ReplayProvider(str(tmp_path))
+    
+    frames = provider.download_intraday(['005930.KS'])
+    
+    assert frames['005930.KS'].index[0] == pd.Timestamp('2024-03-04 09:00:00')
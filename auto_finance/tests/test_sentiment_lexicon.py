@@ -0,0 +1,61 @@
+"""
+📖 감정 사전 테스트
+"""
+
+import json
+
+import pytest
+
+from auto_finance.core.sentiment_lexicon import SentimentLexicon
+
+@pytest.fixture(scope='module')
+def lexicon() -> SentimentLexicon:
+    return SentimentLexicon()
+
+def test_trailing_negator_flips_polarity(lexicon):
+    score = lexicon.score("코스피가 상승하지 않았다")
+    
+    assert score.net == pytest.approx(-1.0)
+    assert score.hits == 1
+
+def test_negation_stops_at_clause_break(lexicon):
+    score = lexicon.score("반도체는 상승, 실적 개선은 없었다")
+    
+    # 쉼표 앞 '상승'은 유지, 뒤 절의 '실적 개선'만 반전
+    assert score.positive == pytest.approx(1.0)
+    assert score.negative == pytest.approx(0.3 + 0.8)
+
+def test_intensifier_scales_following_term(lexicon):
+    assert lexicon.score("대폭 상승").net == pytest.approx(1.6)
+    assert lexicon.score("소폭 하락").net == pytest.approx(-0.5)
+    # 범위를 벗어난 수식어는 적용되지 않음
+    assert lexicon.score("대폭 인상된 가격에도 불구하고 상승").net == pytest.approx(1.0)
+
+def test_compound_phrase_negates_every_preceding_term(lexicon):
+    score = lexicon.score("하락 우려 해소")
+    
+    assert score.positive == pytest.approx(1.0 + 0.8)
+    assert score.negative == 0.0
+    assert score.ratio == 1.0
+
+def test_stem_variants_share_stem_weight(lexicon):
+    assert lexicon.score("주가가 올랐다").net == pytest.approx(1.0)
+    assert lexicon.score("주가가 떨어졌다").net == pytest.approx(-1.0)
+    assert lexicon.score("매출이 줄어든 가운데").net == pytest.approx(-0.5)
+
+def test_from_file_extends_default_lexicon(tmp_path):
+    path = tmp_path / 'lexicon.json'
+    path.write_text(json.dumps({
+        'terms': {'밸류업': 1.2, '하락': -1.5},
+        'negators': ['멈췄'],
+        'intensifiers': {'폭발적': 2.0}
+    }, ensure_ascii=False), encoding='utf-8')
+    
+    lexicon = SentimentLexicon.from_file(str(path))
+    
+    assert lexicon.score("밸류업").net == pytest.approx(1.2)
+    assert lexicon.score("하락").net == pytest.approx(-1.5)
+    assert lexicon.score("상승세가 멈췄다").net == pytest.approx(-1.0)
+    assert lexicon.score("폭발적 성장").net == pytest.approx(1.6)
+    # 기본 사전 유지
+    assert lexicon.score("급등").net == pytest.approx(1.8)
@@ -0,0 +1,36 @@
+"""
+⏱️ 감정 시계열 집계기 테스트
+"""
+
+import time
+
+from auto_finance.core.sentiment_timeseries import SentimentTimeSeries, ROLLING_WINDOWS
+
+def _articles(now):
+    return [
+        {'url': 'https://news/1', 'title': 'a', 'published_at': now - 60, 'symbols': []},
+        {'url': 'https://news/2', 'title': 'b', 'published_at': now - 120, 'symbols': []}
+    ]
+
+def test_recrawled_articles_are_counted_once(tmp_path):
+    timeseries = SentimentTimeSeries(str(tmp_path / "ts.npz"))
+    now = time.time()
+    
+    timeseries.add_articles(_articles(now), [0.5, -0.5])
+    timeseries.add_articles(_articles(now), [0.5, -0.5])
+    
+    assert timeseries.rolling(ROLLING_WINDOWS['1h'], now=now)['count'] == 2
+    assert timeseries.stats['articles_skipped'] == 2
+
+def test_seen_articles_survive_restart(tmp_path):
+    path = str(tmp_path / "ts.npz")
+    now = time.time()
+    timeseries = SentimentTimeSeries(path)
+    timeseries.add_articles(_articles(now), [0.5, -0.5])
+    timeseries.save()
+    
+    restored = SentimentTimeSeries(path)
+    restored.add_articles(_articles(now), [0.5, -0.5])
+    
+    assert restored.rolling(ROLLING_WINDOWS['1h'], now=now)['count'] == 2
+    assert not (tmp_path / "ts.npz.tmp").exists()
@@ -0,0 +1,100 @@
+"""
+🚰 단계 중첩 파이프라인 테스트
+"""
+
+import asyncio
+
+import pytest
+
+from auto_finance.core.stage_pipeline import Stage, StagePipeline
+
+async def _source(items, produced=None):
+    for item in items:
+        if produced is not None:
+            produced.append(item)
+        yield item
+
+def test_bounded_queues_apply_backpressure():
+    produced = []
+    leads = []
+    
+    async def slow(item):
+        # 느린 단계가 처리 중일 때 소스가 앞서 나간 항목 수
+        leads.append(len(produced) - item // 2)
+        await asyncio.sleep(0.001)
+        return item
+    
+    async def double(item):
+        return item * 2
+    
+    pipeline = StagePipeline([
+        Stage('fast', double, queue_size=2),
+        Stage('slow', slow, queue_size=2)
+    ])
+    outputs = asyncio.run(pipeline.run(_source(range(30), produced)))
+    
+    assert sorted(outputs['slow']) == [i * 2 for i in range(30)]
+    for stage in pipeline.stages:
+        assert pipeline.stats[stage.name].max_queue_depth <= stage.queue_size
+    # 소스는 두 큐와 작업자 보유분 이상으로 앞서지 못함
+    assert max(leads) <= 2 + 2 + 3
+
+def test_limit_caps_started_items():
+    calls = []
+    
+    async def handler(item):
+        calls.append(item)
+        return item
+    
+    pipeline = StagePipeline([Stage('llm', handler, concurrency=3, limit=4)])
+    asyncio.run(pipeline.run(_source(range(10))))
+    
+    stats = pipeline.stats['llm']
+    assert stats.started == 4 == len(calls)
+    assert stats.skipped == 6
+    assert stats.received == 10
+
+def test_handler_exception_counts_failed_without_stalling():
+    async def flaky(item):
+        if item % 3 == 0:
+            raise RuntimeError('실패')
+        return item
+    
+    async def passthrough(item):
+        return item
+    
+    pipeline = StagePipeline([
+        Stage('flaky', flaky, concurrency=2, queue_size=1),
+        Stage('next', passthrough)
+    ])
+    outputs = asyncio.run(asyncio.wait_for(pipeline.run(_source(range(9))), 2.0))
+    
+    assert pipeline.stats['flaky'].failed == 3
+    assert sorted(outputs['next']) == [1, 2, 4, 5, 7, 8]
+
+def test_source_exception_cancels_every_worker():
+    cancelled = []
+    
+    async def broken_source():
+        for item in range(3):
+            yield item
+        await asyncio.sleep(0.01)
+        raise RuntimeError('소스 오류')
+    
+    async def hang(item):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(item)
+            raise
+    
+    async def run():
+        pipeline = StagePipeline([Stage('hang', hang, concurrency=3)])
+        with pytest.raises(RuntimeError, match='소스 오류'):
+            await asyncio.wait_for(pipeline.run(broken_source()), 2.0)
+        return [t for t in asyncio.all_tasks() if not t.done() and t is not asyncio.current_task()]
+    
+    leftover = asyncio.run(run())
+    
+    assert sorted(cancelled) == [0, 1, 2]
+    assert leftover == []
@@ -0,0 +1,70 @@
+"""
+🌊 스트리밍 파서 테스트
+"""
+
+import json
+
+from auto_finance.core.streaming_generation import StreamingContentParser
+
+def _feed_all(text: str, size: int) -> StreamingContentParser:
+    parser = StreamingContentParser()
+    for start in range(0, len(text), size):
+        parser.feed(text[start:start + size])
+    return parser
+
+def test_unicode_escapes_decode_across_chunks():
+    content = "# 시장 📈 분석\n코스피 상승 🚀 \"강세\" é"
+    response = json.dumps({'title': '제목', 'content': content})
+    
+    for size in (1, 3, 7, len(response)):
+        parser = _feed_all(response, size)
+        assert parser.content == content
+        assert parser.finish() == {'title': '제목', 'content': content}
+
+def test_lone_surrogate_escape_is_replaced():
+    parser = _feed_all('{"content": "a\\ud83d b\\ude80 c"}', 2)
+    
+    assert parser.content == "a� b� c"
+    parser.content.encode('utf-8')
+
+def test_sections_complete_when_next_heading_arrives():
+    parser = StreamingContentParser()
+    
+    assert parser.feed('{"content": "## A\\n첫 섹션 본문.') == []
+    assert parser.feed('\\n## B\\n둘째') == ['## A\n첫 섹션 본문.']
+    parser.feed(' 섹션."}')
+    parser.finish()
+    
+    assert parser.sections == ['## A\n첫 섹션 본문.', '## B\n둘째 섹션.']
+
+def test_reached_target_only_while_content_is_open():
+    parser = StreamingContentParser(target_words=4)
+    
+    parser.feed('{"content": "하나 둘 셋')
+    assert not parser.reached_target()
+    parser.feed(' 넷 다섯')
+    assert parser.reached_target()
+    parser.feed('", "summary": "요약"}')
+    assert not parser.reached_target()
+    assert not StreamingContentParser().reached_target()
+
+def test_early_stop_trims_to_sentence_and_drops_orphan_heading():
+    parser = StreamingContentParser(target_words=5)
+    parser.feed('{"title": "코스피 \\ud83d\\udcc8", "content": "## A\\n시장이 올랐다. 외국인이 샀다.\\n')
+    parser.feed('## B\\n말 말 말 말')
+    assert parser.reached_target()
+    
+    data = parser.finish(stopped_early=True)
+    
+    assert data == {'content': '## A\n시장이 올랐다. 외국인이 샀다.', 'title': '코스피 📈'}
+    assert 'summary' not in data and 'seo_keywords' not in data
+    assert parser.sections == ['## A\n시장이 올랐다. 외국인이 샀다.']
+    assert parser.get_statistics()['stopped_early'] is True
+
+def test_text_mode_uses_whole_response_as_content():
+    parser = StreamingContentParser()
+    parser.feed('# 제목\n본문 첫 문장.')
+    parser.feed('\n# 다음\n끝.')
+    
+    assert parser.finish() == {'content': '# 제목\n본문 첫 문장.\n# 다음\n끝.'}
+    assert parser.sections == ['# 제목\n본문 첫 문장.', '# 다음\n끝.']
@@ -0,0 +1,44 @@
+"""
+📐 기술적 지표 증분 갱신 테스트
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from auto_finance.core.technical_indicators import TechnicalIndicatorEngine, compute_indicator_matrix
+
+def _frame(closes, last_day):
+    index = pd.DatetimeIndex([last_day - timedelta(days=len(closes) - 1 - i) for i in range(len(closes))])
+    return pd.DataFrame({'Close': closes}, index=index)
+
+def _expected(closes):
+    results = compute_indicator_matrix(np.array([closes], dtype=float))
+    return {name: float(values[0]) for name, values in results.items() if not np.isnan(values[0])}
+
+def test_same_day_quote_replaces_last_bar():
+    closes = list(np.linspace(100, 130, 60))
+    engine = TechnicalIndicatorEngine()
+    engine.fit({'TEST': _frame(closes, date(2024, 3, 1))})
+    
+    latest = engine.update('TEST', 140.0, bar_date=date(2024, 3, 1))
+    
+    expected = _expected(closes[:-1] + [140.0])
+    assert latest.keys() == expected.keys()
+    for name, value in expected.items():
+        assert abs(latest[name] - value) < 1e-9, name
+
+def test_newer_quote_date_appends_bar():
+    closes = list(np.linspace(100, 130, 60))
+    engine = TechnicalIndicatorEngine()
+    engine.fit({'TEST': _frame(closes, date(2024, 3, 1))})
+    
+    # 당일 봉이 저장되기 전이라도 전일 봉을 덮어쓰지 않아야 함
+    engine.update('TEST', 140.0, bar_date=date(2024, 3, 4))
+    latest = engine.update('TEST', 145.0, bar_date=date(2024, 3, 4))
+    
+    expected = _expected(closes + [145.0])
+    for name, value in expected.items():
+        assert abs(latest[name] - value) < 1e-9, name
+    assert engine.states['TEST'].last_date == date(2024, 3, 4)
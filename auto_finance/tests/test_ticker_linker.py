@@ -0,0 +1,34 @@
+"""
+🔗 기사-종목 연결 테스트
+"""
+
+from auto_finance.core.ticker_linker import TickerLinker
+
+SYMBOLS = ['035720.KS', '005930.KS', 'AAPL', '035420.KS']
+
+def _linker():
+    return TickerLinker(symbols=SYMBOLS)
+
+def test_korean_alias_with_particle_matches():
+    linker = _linker()
+    
+    assert linker.link('카카오가 급등했고 삼성전자의 실적도 좋았다')['035720.KS'] == 1
+    assert linker.link('삼성전자의 실적')['005930.KS'] == 1
+    assert linker.link('NAVER는 하락')['035420.KS'] == 1
+
+def test_korean_alias_inside_longer_word_is_ignored():
+    linker = _linker()
+    
+    assert linker.link('카카오뱅크 상장') == {}
+    assert linker.link('파인애플 가격 상승') == {}
+    assert linker.link('XAAPL, AAPLX') == {}
+
+def test_tag_articles_does_not_mutate_inputs():
+    linker = _linker()
+    article = {'title': '애플 신제품 공개', 'content': ''}
+    
+    tagged = linker.tag_articles([article])
+    
+    assert 'symbols' not in article
+    assert tagged[0]['symbols'] == ['AAPL']
+    assert tagged[0] is not article
@@ -0,0 +1,127 @@
+"""
+📮 업로드 큐 테스트
+"""
+
+import asyncio
+import time
+from dataclasses import asdict
+from datetime import datetime
+
+from auto_finance.config.settings import UPLOAD_CONFIG
+from auto_finance.core.mock_llm_server import MockProfile
+from auto_finance.core.mock_tistory_server import MockTistoryServer
+from auto_finance.core.upload_manager import UploadManager, UploadRequest
+from auto_finance.core.upload_queue import DONE, FAILED, PENDING, UploadQueue, idempotency_key
+
+class Handler:
+    """호출된 payload를 기록하는 업로드 처리기"""
+    
+    def __init__(self, error=None):
+        self.error = error
+        self.calls = []
+    
+    async def __call__(self, payload):
+        self.calls.append(payload)
+        if self.error:
+            raise self.error
+        return {'success': True, 'title': payload['title']}
+
+def test_completed_jobs_are_replayed_not_reposted(tmp_path):
+    queue = UploadQueue(str(tmp_path / 'queue.db'))
+    handler = Handler()
+    key = idempotency_key('tistory', '코스피 상승', '본문  내용')
+    assert key == idempotency_key('tistory', '코스피 상승', '본문 내용\n')
+    
+    queue.enqueue(key, 'tistory', '코스피 상승', {'title': '코스피 상승'})
+    first = asyncio.run(queue.process([key], handler))[key]
+    assert queue.enqueue(key, 'tistory', '코스피 상승', {'title': '코스피 상승'}) == DONE
+    second = asyncio.run(queue.process([key], handler))[key]
+    
+    assert len(handler.calls) == 1
+    assert first['success'] and not first.get('replayed')
+    assert second['replayed'] is True
+
+def test_payload_errors_are_not_retried(tmp_path):
+    queue = UploadQueue(str(tmp_path / 'queue.db'))
+    handler = Handler(error=TypeError("unexpected keyword argument 'body'"))
+    queue.enqueue('bad', 'tistory', '잘못된 작업', {'title': '잘못된 작업', 'body': '본문'})
+    
+    result = asyncio.run(queue.process(['bad'], handler, retry_delay=0.01))['bad']
+    
+    assert len(handler.calls) == 1
+    assert result['success'] is False
+    assert queue.get_job('bad')['status'] == FAILED
+
+def test_recover_runs_once_per_queue(tmp_path):
+    queue = UploadQueue(str(tmp_path / 'queue.db'))
+    for key in ('crashed', 'running'):
+        queue.enqueue(key, 'tistory', key, {'title': key})
+    queue._claim('crashed')
+    
+    assert queue.recover() == 1
+    queue._claim('running')
+    assert queue.recover() == 0
+    assert queue.get_job('running')['status'] != PENDING
+    # 새 프로세스(새 큐 인스턴스)에서는 다시 복구
+    assert UploadQueue(str(tmp_path / 'queue.db')).recover() == 1
+
+def test_manager_resumes_only_its_own_platform_jobs(tmp_path):
+    queue = UploadQueue(str(tmp_path / 'queue.db'))
+    # Uploader의 파일 저장 작업 (UploadRequest에 없는 body 필드)
+    file_key = idempotency_key('file', '파일 기사', '본문')
+    queue.enqueue(file_key, 'file', '파일 기사', {'title': '파일 기사', 'body': '본문'})
+    
+    request = UploadRequest(title='티스토리 기사', content='본문', category='주식뉴스', tags=[])
+    manager = UploadManager(queue=queue)
+    results = asyncio.run(manager.upload_multiple_contents([request]))
+    
+    assert results[0]['success'] and results[0]['simulated']
+    assert queue.get_job(file_key)['status'] == PENDING
+    # 시뮬레이션 결과는 실제 티스토리 키로 저장하지 않음
+    assert queue.get_job(idempotency_key('tistory', '티스토리 기사', '본문')) is None
+    assert queue.get_job(idempotency_key('tistory-sim', '티스토리 기사', '본문'))['status'] == DONE
+
+async def _reconcile_run(queue_path, existing_posts, tistory):
+    """이전 시도가 응답 없이 끊긴 작업을 모의 티스토리 서버로 다시 처리"""
+    server = MockTistoryServer(port=0, profile=MockProfile(latency_mean=0.0))
+    await server.start()
+    tistory['api_url'] = server.api_url
+    try:
+        for post_id, (title, content, date) in enumerate(existing_posts, 1):
+            server.posts.append({'id': str(post_id), 'title': title, 'postUrl': f"https://test.tistory.com/{post_id}",
+                                 'date': date})
+            server.contents[str(post_id)] = content
+        
+        queue = UploadQueue(str(queue_path))
+        request = UploadRequest(title='코스피 마감', content='<p>코스피가 상승 마감했다.</p>',
+                                category='주식뉴스', tags=[])
+        key = idempotency_key('tistory', request.title, request.content)
+        queue.enqueue(key, 'tistory', request.title, asdict(request))
+        # 첫 시도가 응답 없이 끊겨 재시도 대기 중인 작업
+        queue._claim(key)
+        queue._fail(key, 'timeout', time.time())
+        
+        async with UploadManager(queue=queue) as manager:
+            result = await manager.upload_content(request)
+        return result, server.get_statistics()
+    finally:
+        await server.stop()
+
+def test_reconcile_requires_matching_time_and_content(tmp_path, monkeypatch):
+    tistory = UPLOAD_CONFIG['platforms']['tistory']
+    for field, value in {'enabled': True, 'access_token': 'test', 'blog_name': 'test', 'api_url': ''}.items():
+        monkeypatch.setitem(tistory, field, value)
+    now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    # 같은 제목의 예전 글과 같은 제목의 다른 글은 이 작업의 게시 결과가 아님 → 다시 게시
+    others = [('코스피 마감', '코스피가 상승 마감했다.', '2020-01-02 15:40:00'),
+              ('코스피 마감', '코스피가 하락 마감했다.', now)]
+    result, stats = asyncio.run(_reconcile_run(tmp_path / 'other.db', others, tistory))
+    assert result['success'] and not result.get('reconciled')
+    assert stats['posts'] == 3
+    
+    # 작업 등록 이후 같은 본문(서식만 다름)으로 게시된 글은 재사용
+    published = [('코스피 마감', '<div><p>코스피가  상승 마감했다.</p></div>', now)]
+    result, stats = asyncio.run(_reconcile_run(tmp_path / 'same.db', published, tistory))
+    assert result['reconciled'] and result['post_id'] == '1'
+    assert stats['posts'] == 1